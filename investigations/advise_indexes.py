@@ -0,0 +1,76 @@
+import argparse
+from lib.backends import get_backend
+from lib.db_sandbox_creator import SandboxCreator
+from lib.drivers import DRIVERS
+from lib.index_advisor import IndexAdvisor
+from lib.scenarios import load_scenarios, select_scenarios
+from investigations.run_scenarios import DEFAULT_SCENARIOS
+
+
+def print_report(report):
+    """
+    Выводит отчет советника по индексам.
+
+    Параметры:
+        - report (list[dict]): Результат IndexAdvisor.evaluate.
+    """
+    for row in report:
+        print(row["query"])
+        for index in row["indexes"] or ["индексы не предложены"]:
+            print(f"    {index}")
+        print(f"    до: {row['before'] * 1000:.3f} мс, после: {row['after'] * 1000:.3f} мс, "
+              f"ускорение: x{row['speedup']:.2f}, используемые индексы: {', '.join(row['used']) or '-'}")
+
+
+def main(argv=None):
+    """
+    Командная строка советника по индексам. Запросы выбранных сценариев проверяются через EXPLAIN в свежей песочнице,
+    предложенные индексы создаются в ней же, после чего замеры повторяются.
+
+    Примеры:
+        python -m investigations.advise_indexes --tag select\n
+        python -m investigations.advise_indexes --name "Селекция с условием" --rows 1000 --keep
+
+    Возвращает:
+        - int: Код возврата.
+    """
+    parser = argparse.ArgumentParser(description="Подбор вторичных индексов для запросов сценариев")
+    parser.add_argument("paths", nargs="*", default=[DEFAULT_SCENARIOS], help="TOML-файлы сценариев или glob-шаблоны")
+    parser.add_argument("--name", action="append", help="Взять запросы сценария с этим названием")
+    parser.add_argument("--tag", action="append", help="Взять запросы сценариев с этим тегом")
+    parser.add_argument("--rows", type=int, default=100, help="LIMIT запросов")
+    parser.add_argument("--warmup", type=int, default=1, help="Количество прогревочных запусков")
+    parser.add_argument("--repeat", type=int, default=5, help="Количество измеряемых запусков")
+    parser.add_argument("--keep", action="store_true", help="Оставить созданные индексы в песочнице")
+    parser.add_argument("--driver", choices=list(DRIVERS), default="connector", help="Драйвер MySQL")
+    parser.add_argument("--host", default="localhost", help="Хост сервера MySQL")
+    parser.add_argument("--user", default="root", help="Имя пользователя MySQL")
+    parser.add_argument("--password", default="123456", help="Пароль пользователя MySQL")
+    parser.add_argument("--original-db", default="my_database", help="База данных, из которой создается песочница")
+    parser.add_argument("--sandbox-db", default="my_index_sandbox", help="Песочница для экспериментов с индексами")
+    args = parser.parse_args(argv)
+
+    scenarios = select_scenarios(load_scenarios(args.paths), names=args.name, tags=args.tag)
+    specs = [query for scenario in scenarios for query in scenario.queries]
+    if not specs:
+        print("Не найдено ни одного запроса.")
+        return 1
+
+    backend = get_backend("mysql", driver=args.driver)
+    # Индексы создаются только в свежей копии, оригинальная база данных не изменяется
+    sandbox = SandboxCreator(args.host, args.user, args.password, args.original_db, args.sandbox_db, backend=backend)
+    sandbox.connect()
+    try:
+        sandbox.drop_sandbox()
+        sandbox.create_sandbox()
+    finally:
+        sandbox.close()
+
+    with IndexAdvisor(args.host, args.user, args.password, args.sandbox_db, backend=backend) as advisor:
+        report = advisor.evaluate(specs, num_rows=args.rows, warmup=args.warmup, repeat=args.repeat, keep=args.keep)
+    print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,44 @@
+import argparse
+from lib.data_generator import DataGenerator
+from lib.dataset_builder import FORMATS, build_dataset
+from lib.distributions import SKEWED
+
+
+def main(argv=None):
+    """
+    Командная строка генерации набора данных в файлы для массовой загрузки.
+
+    Примеры:
+        python -m investigations.build_dataset dataset --guests 1000000 --workers 8\n
+        python -m investigations.build_dataset dataset --guests 10000000 --native-dates --skewed --format csv
+
+    Возвращает:
+        - int: Код возврата.
+    """
+    parser = argparse.ArgumentParser(description="Генерация набора данных в файлы для LOAD DATA")
+    parser.add_argument("directory", help="Каталог набора")
+    parser.add_argument("--guests", type=int, required=True, help="Количество гостей")
+    parser.add_argument("--baristas", type=int, help="Количество бариста (по умолчанию гости / 100)")
+    parser.add_argument("--menu", type=int, help="Количество позиций меню (по умолчанию 25)")
+    parser.add_argument("--order-items", type=int, help="Количество позиций заказов (по умолчанию гости * 1.13)")
+    parser.add_argument("--orders", type=int, help="Количество заказов (по умолчанию равно количеству гостей)")
+    parser.add_argument("--native-dates", action="store_true", help="Даты заказов для колонки DATE")
+    parser.add_argument("--skewed", action="store_true", help="Распределения с горячими ключами (SKEWED)")
+    parser.add_argument("--format", choices=list(FORMATS), default="tsv", help="Формат файлов")
+    parser.add_argument("--shard-rows", type=int, default=1_000_000, help="Наибольшее количество строк в файле")
+    parser.add_argument("--workers", type=int, help="Количество процессов (по умолчанию - количество процессоров)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed генерации")
+    args = parser.parse_args(argv)
+
+    generator = DataGenerator(args.guests, BaristaCount=args.baristas, MenuCount=args.menu,
+                              OrderCount=args.order_items, OrdersCount=args.orders, NativeDates=args.native_dates,
+                              Distributions=SKEWED if args.skewed else None)
+    manifest = build_dataset(args.directory, generator, shard_rows=args.shard_rows, workers=args.workers,
+                             file_format=args.format, seed=args.seed)
+    for table in manifest["tables"]:
+        print(f"{table['name']}: {table['rows']} строк, файлов: {len(table['files'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,61 @@
+import argparse
+from lib.benchmark_store import BenchmarkStore
+from lib.driver_benchmark import WORKLOADS, compare_drivers
+from lib.drivers import DRIVERS
+
+
+def print_report(reports):
+    """
+    Выводит таблицу пропускной способности драйверов.
+
+    Параметры:
+        - reports (list[dict]): Результаты compare_drivers.
+    """
+    print(f"{'Драйвер':<16}" + "".join(f"{workload + ', 1/с':>16}" for workload in WORKLOADS))
+    for report in reports:
+        print(f"{report['driver']:<16}" + "".join(f"{report['throughput'][workload]:>16.0f}" for workload in WORKLOADS))
+    if reports:
+        for workload in WORKLOADS:
+            best = max(reports, key=lambda report: report["throughput"][workload])
+            print(f"Быстрее всех в нагрузке {workload}: {best['driver']}")
+
+
+def main(argv=None):
+    """
+    Командная строка сравнения драйверов MySQL на одинаковых нагрузках: пакетная вставка (insert), чтение всей
+    таблицы (select) и запросы по первичному ключу (point).
+
+    Примеры:
+        python -m investigations.compare_drivers\n
+        python -m investigations.compare_drivers --driver connector-pure --driver connector-c --driver pymysql
+
+    Возвращает:
+        - int: Код возврата.
+    """
+    parser = argparse.ArgumentParser(description="Сравнение драйверов MySQL")
+    parser.add_argument("--driver", action="append", choices=list(DRIVERS), help="Драйвер для сравнения")
+    parser.add_argument("--rows", type=int, default=10000, help="Количество вставляемых и читаемых строк")
+    parser.add_argument("--batch", type=int, default=1000, help="Размер пакета вставки")
+    parser.add_argument("--point-queries", type=int, default=1000, help="Количество запросов по первичному ключу")
+    parser.add_argument("--warmup", type=int, default=1, help="Количество прогревочных запусков")
+    parser.add_argument("--repeat", type=int, default=5, help="Количество измеряемых запусков")
+    parser.add_argument("--store", default="benchmarks.sqlite3", help="Файл хранилища результатов")
+    parser.add_argument("--host", default="localhost", help="Хост сервера MySQL")
+    parser.add_argument("--user", default="root", help="Имя пользователя MySQL")
+    parser.add_argument("--password", default="123456", help="Пароль пользователя MySQL")
+    parser.add_argument("--db-name", default="my_sandbox_database", help="База данных для служебной таблицы")
+    args = parser.parse_args(argv)
+
+    with BenchmarkStore(args.store) as store:
+        reports = compare_drivers(args.driver, store=store, host=args.host, user=args.user, password=args.password,
+                                  db_name=args.db_name, rows=args.rows, batch=args.batch,
+                                  point_queries=args.point_queries, warmup=args.warmup, repeat=args.repeat)
+    if not reports:
+        print("Ни один из выбранных драйверов не установлен.")
+        return 1
+    print_report(reports)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
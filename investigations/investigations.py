@@ -4,228 +4,10 @@ from lib.data_generator import DataGenerator
 from lib.db_data_changer import DatabaseDataChanger
 from lib.graphs_creator import GraphBuilder
 from lib.orm_classes import *
-from lib.timer import generate_time, query_time
-from main import get_max_id
-
-
-def generator_menu(n):
-    """
-    Генератор данных для таблицы "menu".
-
-    Параметры:
-    ----------
-    n : int
-        Количество записей, которые будут сгенерированы.
-
-    Возвращает:
-    -----------
-    generator
-        Генератор, который возвращает сгенерированные данные по одной записи за раз.
-
-    Описание:
-    ---------
-    Эта функция использует класс `DataGenerator` для генерации данных для таблицы "menu". Для каждой записи генерируются следующие поля:
-        - id : идентификатор записи
-        - name : название позиции
-        - prices : цена позиции
-
-    """
-    menu = DataGenerator(n).MenuGenerator(n)
-    for i in range(n):
-        instance_data = {}
-        instance_data["id"] = menu[i].ID
-        instance_data["name"] = menu[i].Name
-        instance_data["prices"] = menu[i].Price
-        yield instance_data
-
-
-def generator_personal_order(n, MenuCount=None):
-    """
-    Генератор данных для таблицы "personal_order".
-
-    Параметры:
-    ----------
-    n : int
-        Количество записей, которые будут сгенерированы.
-    MenuCount : int, optional
-        Количество записей в таблице "menu". Если не указано, используется значение `n`.
-
-    Возвращает:
-    -----------
-    generator
-        Генератор, который возвращает сгенерированные данные по одной записи за раз.
-
-    Описание:
-    ---------
-    Эта функция использует класс `DataGenerator` для генерации данных для таблицы "personal_order". Для каждой записи генерируются следующие поля:
-        - id : идентификатор записи
-        - count : количество заказанных элементов
-        - menu_id : идентификатор позиции в меню
-
-    """
-    if MenuCount is None:
-        menu_n = n
-    else:
-        menu_n = MenuCount
-    personal_order = DataGenerator(n, MenuCount=menu_n).OrderGenerator(n)
-    for i in range(n):
-        instance_data = {}
-        instance_data["id"] = personal_order[i].ID
-        instance_data["count"] = personal_order[i].Count
-        instance_data["menu_id"] = personal_order[i].MenuPosition
-        yield instance_data
-
-
-def generator_orders(n, BaristaCount=None, OrdersCount=None):
-    """
-    Генератор данных для таблицы "orders".
-
-    Параметры:
-    ----------
-    n : int
-        Количество записей, которые будут сгенерированы.
-    BaristaCount : int, optional
-        Количество бариста. Если не указано, используется значение `n`.
-    OrdersCount : int, optional
-        Количество заказов. Если не указано, используется значение `n`.
-
-    Возвращает:
-    -----------
-    generator
-        Генератор, который возвращает сгенерированные данные по одной записи за раз.
-
-    Описание:
-    ---------
-    Эта функция использует класс `DataGenerator` для генерации данных для таблицы "orders". Для каждой записи генерируются следующие поля:
-        - id : идентификатор записи
-        - order_date : дата заказа
-        - barista_id : идентификатор бариста, обслужившего заказ
-        - guest_id : идентификатор гостя, сделавшего заказ
-
-    """
-    if BaristaCount is None:
-        barista_n = n
-    else:
-        barista_n = BaristaCount
-    if OrdersCount is None:
-        orders_n = n
-    else:
-        orders_n = OrdersCount
-    orders = DataGenerator(n, BaristaCount=barista_n, OrdersCount=orders_n).OrdersGenerator(n)
-    for i in range(n):
-        instance_data = {}
-        instance_data["id"] = orders[i].ID
-        instance_data["order_date"] = orders[i].OrderData
-        instance_data["barista_id"] = orders[i].BaristaID
-        instance_data["guest_id"] = orders[i].GuestID
-        yield instance_data
-
-
-def generator_barista(n):
-    """
-    Генератор данных для таблицы "barista".
-
-    Параметры:
-    ----------
-    n : int
-        Количество записей, которые будут сгенерированы.
-
-    Возвращает:
-    -----------
-    generator
-        Генератор, который возвращает сгенерированные данные по одной записи за раз.
-
-    Описание:
-    ---------
-    Эта функция использует класс `DataGenerator` для генерации данных для таблицы "barista". Для каждой записи генерируются следующие поля:
-        - id : идентификатор записи
-        - name : полное имя бариста
-        - work_time : время работы бариста
-
-    """
-
-    barista = DataGenerator(n, BaristaCount=n).BaristaGenerator(n)
-    for i in range(n):
-        instance_data = {}
-        instance_data["id"] = barista[i].ID
-        instance_data["name"] = barista[i].FullName
-        instance_data["work_time"] = barista[i].WorkTime
-        yield instance_data
-
-
-def generator_guest(n):
-    """
-    Генератор данных для таблицы "guest".
-
-    Параметры:
-    ----------
-    n : int
-        Количество записей, которые будут сгенерированы.
-
-    Возвращает:
-    -----------
-    generator
-        Генератор, который возвращает сгенерированные данные по одной записи за раз.
-
-    Описание:
-    ---------
-    Эта функция использует класс `DataGenerator` для генерации данных для таблицы "guest". Для каждой записи генерируются следующие поля:
-        - id : идентификатор записи
-        - name : полное имя гостя
-        - contact_number : контактный номер гостя
-
-    """
-    guest = DataGenerator(n).GuestGenerator(n)
-    for i in range(n):
-        instance_data = {}
-        instance_data["id"] = guest[i].ID
-        instance_data["name"] = guest[i].FullName
-        instance_data["contact_number"] = guest[i].ContactNumber
-        yield instance_data
-
-
-def generator_orders_has_personal_order(n, PersonOrderCount=None, OrdersCount=None):
-    """
-    Генератор данных для таблицы связей "orders_has_personal_order".
-
-    Параметры:
-    ----------
-    n : int
-        Количество записей, которые будут сгенерированы.
-    PersonOrderCount : int, optional
-        Количество записей в таблице "personal_order" (по умолчанию равно `n`).
-    OrdersCount : int, optional
-        Количество записей в таблице "orders" (по умолчанию равно `n`).
-
-    Возвращает:
-    -----------
-    generator
-        Генератор, который возвращает сгенерированные данные по одной записи за раз.
-
-    Описание:
-    ---------
-    Эта функция использует класс `DataGenerator` для генерации данных для таблицы связей "orders_has_personal_order".
-    Для каждой записи генерируются следующие поля:
-        - id : идентификатор записи
-        - personal_order_id : идентификатор персонального заказа
-        - orders_id : идентификатор заказа
-    """
-    if OrdersCount is None:
-        order_n = n
-    else:
-        order_n = OrdersCount
-    if PersonOrderCount is None:
-        person_order_n = n
-    else:
-        person_order_n = PersonOrderCount
-    oho = DataGenerator(n).Orders_has_OrderGenerator(count=person_order_n,
-                                                     existing_order_ids=[i for i in range(1, order_n + 1)])
-    for i in range(person_order_n):
-        instance_data = {}
-        instance_data["id"] = oho[i].ID
-        instance_data["personal_order_id"] = oho[i].OrderID
-        instance_data["orders_id"] = oho[i].OrdersID
-        yield instance_data
+from lib.schema import CHUNK_SIZE, SCHEMA, GenerationContext
+from lib.query_builder import build_query, query_label
+from lib.server_metrics import collect_server_metrics
+from lib.timer import generate_benchmark, query_benchmark
 
 
 def generate_all(guest_count=None, same_lenth_table=False):
@@ -264,9 +46,11 @@ def generate_all(guest_count=None, same_lenth_table=False):
         - Barista
         - Guest
         - Orders
-        - Orders_has_personal_order
+        - Orders_has_Order
 
-    В зависимости от переданных параметров guest_count и same_length_table, генерируются данные с разными количествами записей для каждой таблицы
+    В зависимости от переданных параметров guest_count и same_length_table, генерируются данные с разными количествами записей для каждой таблицы.
+    Все элементы кортежа - ленивые генераторы generate: строки создаются порциями только при обходе,
+    поэтому цикл сохранения не держит в памяти таблицы целиком.
     """
     if guest_count is None and not same_lenth_table:
         menus = generate(Menu, 25)
@@ -274,7 +58,7 @@ def generate_all(guest_count=None, same_lenth_table=False):
         baristas = generate(Barista, 15)
         guests = generate(Guest, 100)
         orders = generate(Orders, 100, BaristaCount=15, OrdersCount=120)
-        ohos = generate(Orders_has_personal_order, 100, PersonOrderCount=120, OrdersCount=100)
+        ohos = generate(Orders_has_Order, 100, PersonOrderCount=120, OrdersCount=100)
         return menus, personal_orders, baristas, guests, orders, ohos
     elif guest_count is not None and not same_lenth_table:
         menus = generate(Menu, 25)
@@ -282,7 +66,7 @@ def generate_all(guest_count=None, same_lenth_table=False):
         baristas = generate(Barista, math.ceil(guest_count / 70))
         guests = generate(Guest, guest_count)
         orders = generate(Orders, guest_count, BaristaCount=math.ceil(guest_count / 70), OrdersCount=guest_count)
-        ohos = generate(Orders_has_personal_order, guest_count,
+        ohos = generate(Orders_has_Order, guest_count,
                         PersonOrderCount=guest_count + math.ceil(guest_count / 7.5), OrdersCount=guest_count)
         return menus, personal_orders, baristas, guests, orders, ohos
     elif guest_count is not None and same_lenth_table:
@@ -291,7 +75,7 @@ def generate_all(guest_count=None, same_lenth_table=False):
         baristas = generate(Barista, guest_count)
         guests = generate(Guest, guest_count)
         orders = generate(Orders, guest_count, BaristaCount=guest_count, OrdersCount=guest_count)
-        ohos = generate(Orders_has_personal_order, guest_count,
+        ohos = generate(Orders_has_Order, guest_count,
                         PersonOrderCount=guest_count, OrdersCount=guest_count)
         return menus, personal_orders, baristas, guests, orders, ohos
     else:
@@ -299,7 +83,8 @@ def generate_all(guest_count=None, same_lenth_table=False):
         return 0
 
 
-def generate(model, n, MenuCount=None, BaristaCount=None, GuestCount=None, OrdersCount=None, PersonOrderCount=None):
+def generate(model, n, MenuCount=None, BaristaCount=None, GuestCount=None, OrdersCount=None, PersonOrderCount=None,
+             chunk_size=CHUNK_SIZE, distributions=None, cache=None, seed=0):
     """
     Генератор данных для модели.
 
@@ -310,15 +95,26 @@ def generate(model, n, MenuCount=None, BaristaCount=None, GuestCount=None, Order
     n : int
         Количество записей, которые будут сгенерированы.
     MenuCount : int, optional
-        Количество записей меню, используемое при генерации данных для модели Personal_Order.
+        Количество записей меню, на которые ссылается Personal_Order.menu_id (по умолчанию `n`).
     BaristaCount : int, optional
-        Количество записей бариста, используемое при генерации данных для модели Orders.
+        Количество записей бариста, на которые ссылается Orders.barista_id (по умолчанию `n`).
     GuestCount : int, optional
-        Количество записей гостя, не используется в текущей реализации.
+        Количество записей гостей, на которые ссылается Orders.guest_id (по умолчанию `n`).
     OrdersCount : int, optional
-        Количество записей заказов, используемое при генерации данных для модели Orders и Orders_has_personal_order.
+        Количество записей заказов, на которые ссылается Orders_has_Order.orders_id (по умолчанию `n`).
     PersonOrderCount : int, optional
-        Количество записей личных заказов, используемое при генерации данных для модели Orders_has_personal_order.
+        Количество записей личных заказов. Для модели Orders_has_Order генерируется по одной связи на личный заказ,
+        поэтому это и количество записей связей (по умолчанию `n`).
+    chunk_size : int, optional
+        Размер порции генерации (по умолчанию CHUNK_SIZE).
+    distributions : dict, optional
+        Распределения значений колонок {'таблица.колонка': распределение} из lib.distributions, например SKEWED
+        (по умолчанию равномерные).
+    cache : DatasetCache, optional
+        Кэш сгенерированных таблиц (lib.dataset_cache). Если указан, таблица генерируется один раз с seed
+        и затем загружается из кэша отображением в память.
+    seed : int, optional
+        Seed генерации через кэш (по умолчанию 0).
 
     Возвращает:
     -----------
@@ -327,31 +123,28 @@ def generate(model, n, MenuCount=None, BaristaCount=None, GuestCount=None, Order
 
     Описание:
     ---------
-    Эта функция генерирует данные для заданной модели, используя соответствующие генераторы данных в зависимости от имени модели.
-    Если имя модели совпадает с одним из предопределенных, вызывается соответствующий генератор данных (например, generator_menu для модели Menu).
-    Для каждой сгенерированной записи создается объект модели с помощью конструктора model(**data), где data - словарь с данными для модели.
+    Таблица модели и генераторы ее колонок берутся из реестра SCHEMA (lib.schema) по имени класса модели.
+    Колонки генерируются векторно порциями по chunk_size строк, и каждая строка порции сразу превращается
+    в объект модели через model.from_row, без промежуточных объектов и словарей. В памяти одновременно
+    находится не больше одной порции.
     """
-    if model.__name__ == "Menu":
-        for data in generator_menu(n):
-            yield model(**data)
-    elif model.__name__ == "Personal_Order":
-        for data in generator_personal_order(n, MenuCount):
-            yield model(**data)
-    elif model.__name__ == "Orders":
-        for data in generator_orders(n, BaristaCount, OrdersCount):
-            yield model(**data)
-    elif model.__name__ == "Barista":
-        for data in generator_barista(n):
-            yield model(**data)
-    elif model.__name__ == "Guest":
-        for data in generator_guest(n):
-            yield model(**data)
-    elif model.__name__ == "Orders_has_personal_order":
-        for data in generator_orders_has_personal_order(n, PersonOrderCount, OrdersCount):
-            yield model(**data)
-
-
-def data_generate_grpah(models, start_row=10, stop_row=10000, step=5):
+    table = SCHEMA.by_model(model.__name__)
+    context = GenerationContext(counts={"menu": MenuCount or n, "barista": BaristaCount or n,
+                                        "guest": GuestCount or n, "orders": OrdersCount or n,
+                                        "personal_order": PersonOrderCount or n},
+                                distributions=distributions)
+    if table.name == "orders_has_order":
+        n = PersonOrderCount or n
+    if cache is None:
+        rows = table.iter_rows(n, context, chunk_size)
+    else:
+        rows = cache.iter_rows(table.name, n, context, seed, chunk_size)
+    for row in rows:
+        yield model.from_row(row)
+
+
+def data_generate_grpah(models, start_row=10, stop_row=10000, step=5, warmup=1, repeat=5, store=None, memory=False,
+                        cache=None):
     """
     Генерирует и строит график сравнения времени генерации данных для заданных моделей.
 
@@ -360,69 +153,99 @@ def data_generate_grpah(models, start_row=10, stop_row=10000, step=5):
         - start_row (int, optional): Начальное количество строк для генерации данных. По умолчанию 10.
         - stop_row (int, optional): Конечное количество строк для генерации данных. По умолчанию 10000.
         - step (int, optional): Шаг для генерации точек данных между start_row и stop_row. По умолчанию 5.
+        - warmup (int, optional): Количество прогревочных запусков для каждой точки. По умолчанию 1.
+        - repeat (int, optional): Количество измеряемых запусков для каждой точки. По умолчанию 5.
+        - store (BenchmarkStore, optional): Хранилище, в которое записывается каждый замер. По умолчанию замеры не сохраняются.
+        - memory (bool, optional): Строить ли рядом второй график пикового потребления памяти. По умолчанию False.
+        - cache (DatasetCache, optional): Кэш сгенерированных таблиц. Если указан, каждая таблица генерируется
+          один раз (в прогревочном запуске), а замеры показывают время загрузки из кэша. По умолчанию None.
 
     Возвращает:
         - None
 
     Эта функция генерирует график с использованием GraphBuilder для сравнения времени, затраченного на генерацию
-    данных для различных моделей.
+    данных для различных моделей. Каждая точка графика - медиана repeat замеров после warmup прогревочных запусков.
+    Пик памяти точки - максимум пиков по всем таблицам, которые генерируются для нее последовательно.
     """
     graph = GraphBuilder(title="Сравнение времени генерации данных", x_label="Количество строк",
                          y_label="Время выполнения")
     name = []
     funcs = []
+    models_str = '_'.join([model.__name__[0] if len(model.__name__.split('_')) == 1 else ''.join(
+        [word[0].upper() for word in model.__name__.split('_')]) for model in models])
+    run_id = store.start_run(f"generate_data_{models_str}") if store else None
+    point_memory = []
+
+    def gen_time(model, n, **kwargs):
+        cache_kwargs = {"cache": cache} if cache is not None else {}
+        result = generate_benchmark(generate, model, n, warmup=warmup, repeat=repeat, memory=memory, **kwargs,
+                                    **cache_kwargs)
+        point_memory.append(result.peak_memory)
+        if store:
+            store.record(run_id, model.__name__, f"generate({model.__name__}, {n}, {kwargs})", n, result)
+        return result.median
 
 
     for model in models:
         if model == Menu:
             name.append('Menu')
-            funcs.append(lambda j: float(generate_time(generate, Menu, j)))
+            funcs.append(lambda j: gen_time(Menu, j))
         elif model == Personal_Order:
             name.append('Personal_order + FK(Menu)')
-            funcs.append(lambda j: float(generate_time(generate, Personal_Order, j, MenuCount=50)) +
-                                   float(generate_time(generate, Menu, 50)))
-        elif model == Orders_has_personal_order:
+            funcs.append(lambda j: gen_time(Personal_Order, j, MenuCount=50) +
+                                   gen_time(Menu, 50))
+        elif model == Orders_has_Order:
             # тут я полагаю надо все таблицы генерировать т.к. у OHPO два FK, у которых в свою очередь один и два FK, что в итоге составляет всю бд
-            name.append('Orders_has_personal_order (all DB)')
+            name.append('Orders_has_Order (all DB)')
             # тут надо посчитать, чтобы все сходилось по цифрам
-            funcs.append(lambda j: float(generate_time(generate, Menu, 50)) +
-                                   float(generate_time(generate, Personal_Order, int(j+j*0.2), MenuCount=50)) +
-                                   float(generate_time(generate, Barista, math.ceil(int(j+j*0.2) / 100))) +
-                                   float(generate_time(generate, Guest, j)) +
-                                   float(generate_time(generate, Orders, j, BaristaCount=math.ceil(int(j+j*0.2) / 100), OrdersCount=int(j+j*0.2))) +
-                                   float(generate_time(generate, Orders_has_personal_order, j, PersonOrderCount=int(j+j*0.2), OrdersCount=j)))
+            funcs.append(lambda j: gen_time(Menu, 50) +
+                                   gen_time(Personal_Order, int(j+j*0.2), MenuCount=50) +
+                                   gen_time(Barista, math.ceil(int(j+j*0.2) / 100)) +
+                                   gen_time(Guest, j) +
+                                   gen_time(Orders, j, BaristaCount=math.ceil(int(j+j*0.2) / 100), OrdersCount=int(j+j*0.2)) +
+                                   gen_time(Orders_has_Order, j, PersonOrderCount=int(j+j*0.2), OrdersCount=j))
 
         elif model == Orders:
             name.append('Orders + FK(Barista) + FK(Guest)')
-            funcs.append(lambda j: float(generate_time(generate, Orders, int(j-j*0.1), BaristaCount=math.ceil(int(j-j*0.1) / 100), OrdersCount=j)) +
-                                   float(generate_time(generate, Guest, int(j - j*0.2))) +
-                                   float(generate_time(generate, Barista, math.ceil(int(j-j*0.1) / 100))))
+            funcs.append(lambda j: gen_time(Orders, int(j-j*0.1), BaristaCount=math.ceil(int(j-j*0.1) / 100), OrdersCount=j) +
+                                   gen_time(Guest, int(j - j*0.2)) +
+                                   gen_time(Barista, math.ceil(int(j-j*0.1) / 100)))
         elif model == Barista:
             name.append('Barista')
-            funcs.append(lambda j: float(generate_time(generate, Barista, j)))
+            funcs.append(lambda j: gen_time(Barista, j))
         elif model == Guest:
             name.append('Guest')
-            funcs.append(lambda j: float(generate_time(generate, Guest, j)))
+            funcs.append(lambda j: gen_time(Guest, j))
 
 
+    memory_graph = GraphBuilder(title="Пиковое потребление памяти при генерации данных", x_label="Количество строк",
+                                y_label="Память, МиБ") if memory else None
+
     for i in range(len(name)):
         x = np.linspace(start_row, stop_row, step)
         x = list(map(int, x))
         y = []
+        y_memory = []
         for j in range(len(x)):
+            point_memory.clear()
             y.append(funcs[i](x[j]))
+            if memory:
+                y_memory.append(max(point_memory) / 2 ** 20)
         graph.add_series(x, y, label=f"{name[i]}")
+        if memory:
+            memory_graph.add_series(x, y_memory, label=f"{name[i]}")
 
-    models_str = '_'.join([model.__name__[0] if len(model.__name__.split('_')) == 1 else ''.join(
-        [word[0].upper() for word in model.__name__.split('_')]) for model in models])
     graph_filename = f"graphs/generate/generate_data_{models_str}.png"
     graph.save(graph_filename)
+    if memory:
+        memory_graph.save(f"graphs/generate/generate_memory_{models_str}.png")
 
     graph.show()
 
 
 def query_graph(name, query_type, table, conditions=None, values=None, num_rows_list=None, join=None, order_by=None,
-                group_by=None, having=None, insert_select=None):
+                group_by=None, having=None, insert_select=None, warmup=1, repeat=5, store=None,
+                server_metrics=False, show=True, db_name="my_sandbox_database", backend=None):
     """
     Строит график времени выполнения запросов для заданной таблицы.
 
@@ -437,81 +260,74 @@ def query_graph(name, query_type, table, conditions=None, values=None, num_rows_
         group_by (list[str], optional): GROUP BY условие для запросов SELECT.
         having (list[str], optional): HAVING условие для запросов SELECT.
         insert_select (list[list[dict]], optional): Условие для INSERT SELECT запросов.
+        warmup (int, optional): Количество прогревочных запусков каждого запроса.
+        repeat (int, optional): Количество измеряемых запусков каждого запроса.
+        store (BenchmarkStore, optional): Хранилище, в которое записывается каждый замер вместе с текстом запроса.
+        server_metrics (bool, optional): Собирать ли серверные метрики (performance_schema, Handler_%, EXPLAIN ANALYZE).
+        show (bool, optional): Показывать ли график на экране после сохранения (по умолчанию True).
+        db_name (str, optional): База данных, в которой выполняются запросы (по умолчанию 'my_sandbox_database').
+        backend (str | Backend, optional): Движок базы данных: 'mysql' (по умолчанию) или 'sqlite'.
+
+    Примечания:
+        Время запроса - медиана repeat замеров, на графике показан 95% доверительный интервал.
+        Изменяющие запросы (INSERT, DELETE) откатываются после каждого запуска, чтобы замеры были воспроизводимы.
+        С server_metrics=True запрос выполняется еще один раз вне замера, а на график добавляется время выполнения
+        на сервере: разница с клиентским временем - это сеть и декодирование результата драйвером.
+        Все запросы сценария выполняются в одном соединении, поэтому его установка не попадает в замеры.
+        Элементы списков conditions, values, join и т.д. могут быть None, если для запроса условие не нужно.
     """
     if num_rows_list is None:
         x = np.linspace(10, 1500, 9)
         num_rows_list = list(map(int, x))
 
     times = []
+    results = []
+    server_times = []
     names = []
-    for num_rows in num_rows_list:
-        for i in range(len(query_type)):
-            if 'SELECT' in query_type[i]:
-                if query_type[i] == 'SELECT':
-                    query = f"SELECT * FROM {table[i]}"
-                else:
-                    query = f"{query_type[i]} FROM {table[i]}"
-                if join:
-                    for j in range(0, len(join[i]), 2):
-                        query += f" JOIN {join[i][j]} ON {join[i][j+1]}"
-                if conditions:
-                    query += f" WHERE {conditions[i]}"
-                if group_by:
-                    query += f" GROUP BY {group_by[i]}"
-                if having:
-                    query += f" HAVING {having[i]}"
-                if order_by:
-                    query += f" ORDER BY {order_by[i]}"
-                query += f" LIMIT {num_rows}"
-            elif 'INSERT' in query_type[i]:
-                if values and len(values[i]) > 0:
-                    columns = list(values[i][0].keys())
-                    max_id = get_max_id(table[i]) + 1
-                    # Тут выводит ошибку, хотя запрос выполняется
-                    # Ошибка при выполнении запроса: 1062 (23000): Duplicate entry '6239' for key 'menu.PRIMARY'
-                    # Но вставка данных происходит и происходит корректно
-                    values_str = ', '.join(
-                        [f"({max_id + j}, {', '.join(map(repr, row.values()))})" for j, row in zip([i for i in range(num_rows)],values[i])])
-                    query = f"INSERT INTO {table[i]} (id, {', '.join(columns)}) VALUES {values_str}"
-                    query += f" LIMIT {num_rows}"
-                elif insert_select and insert_select[i]:
-                    max_id = get_max_id(table[i])
-
-                    target_columns = ', '.join(['id'] + insert_select[i]['target_columns'])
-                    source_columns = ', '.join(
-                        [f"{max_id} + ROW_NUMBER() OVER ()"] + insert_select[i]['source_columns'])
-                    source_table = insert_select[i]['source_table']
-                    query = f"INSERT INTO {table[i]} ({target_columns}) SELECT {source_columns} FROM {source_table}"
-                    if 'conditions' in insert_select[i] and insert_select[i]['conditions']:
-                        query += f" WHERE {insert_select[i]['conditions']}"
-                    query += f" LIMIT {num_rows}"
-                else:
-                    raise ValueError("Не указаны значения для вставки.")
-            elif query_type[i] == 'DELETE':
-                query = f"DELETE FROM {table[i]}"
-                if conditions:
-                    query += f" WHERE {conditions[i]} LIMIT {num_rows}"
-                else:
-                    query += f" LIMIT {num_rows}"
-            else:
-                raise ValueError("Неверный тип запроса. Ожидается 'SELECT', 'INSERT' или 'DELETE'.")
-
-            with DatabaseDataChanger(host="localhost", user="root", password="123456", db_name="my_sandbox_database",
-                                     line_count=100) as db_changer:
+    run_id = store.start_run(name) if store else None
+    with DatabaseDataChanger(host="localhost", user="root", password="123456", db_name=db_name,
+                             line_count=100, backend=backend) as db_changer:
+        if server_metrics and not db_changer.backend.supports_server_metrics:
+            print(f"Серверные метрики для движка {db_changer.backend.name} недоступны.")
+            server_metrics = False
+        for num_rows in num_rows_list:
+            for i in range(len(query_type)):
+                max_id = db_changer.get_max_id(table[i]) if 'INSERT' in query_type[i] else 0
+                query = build_query(query_type[i], table[i], num_rows,
+                                    conditions=conditions[i] if conditions else None,
+                                    values=values[i] if values else None,
+                                    join=join[i] if join else None,
+                                    order_by=order_by[i] if order_by else None,
+                                    group_by=group_by[i] if group_by else None,
+                                    having=having[i] if having else None,
+                                    insert_select=insert_select[i] if insert_select else None,
+                                    max_id=max_id)
 
                 if query.startswith('DELETE'):
-                    db_changer.execute_query("SET @OLD_FOREIGN_KEY_CHECKS = @@FOREIGN_KEY_CHECKS;")
                     # Отключаем проверку внешних ключей
-                    db_changer.execute_query("SET FOREIGN_KEY_CHECKS = 0;")
-
-                execution_time = query_time(db_changer.execute_query, query)
-                print(f'ЗАПРОС(n={num_rows}):  ' + query + '; Время:' + execution_time)
-                times.append(float(execution_time))
-                names.append(query[:-(7+len(str(num_rows)))])
+                    for fk_query in db_changer.backend.foreign_key_checks_sql(False):
+                        db_changer.execute_query(fk_query)
+
+                teardown = None if query.startswith('SELECT') else db_changer.conn.rollback
+                result = query_benchmark(db_changer.execute_query, query, warmup=warmup, repeat=repeat,
+                                         teardown=teardown)
+                print(f'ЗАПРОС(n={num_rows}):  ' + query + '; Время: ' + str(result))
+                if server_metrics:
+                    metrics = collect_server_metrics(db_changer.cursor, query)
+                    if teardown:
+                        teardown()
+                    print(f'    Сервер: {metrics}')
+                    server_times.append(metrics.server_time)
+                times.append(result.median)
+                results.append(result)
+                names.append(query_label(query, num_rows))
+                if store:
+                    store.record(run_id, names[-1], query, num_rows, result)
 
                 if query.startswith('DELETE'):
-                    # Восстанавливаем состояние внешних ключей
-                    db_changer.execute_query("SET FOREIGN_KEY_CHECKS = @OLD_FOREIGN_KEY_CHECKS;")
+                    # Восстанавливаем проверку внешних ключей
+                    for fk_query in db_changer.backend.foreign_key_checks_sql(True):
+                        db_changer.execute_query(fk_query)
 
     graph = GraphBuilder(title="Сравнение времени выполнения запроса", x_label="Количество строк",
                          y_label="Время выполнения")
@@ -519,10 +335,19 @@ def query_graph(name, query_type, table, conditions=None, values=None, num_rows_
     for i in range(len(query_type)):
         x = num_rows_list
         y = []
+        y_low = []
+        y_high = []
         for j in range(len(x)):
-            # 0 1 2 3 4 5 6 7 8 / 9 10 11 12 13 14 15 16 17
-            y.append(times[j + len(x)*i])
-        graph.add_series(x, y, label=f"{table[i]}")
+            # замеры идут по количеству строк: для каждого num_rows все запросы по очереди
+            y.append(times[j*len(query_type) + i])
+            ci_low, ci_high = results[j*len(query_type) + i].ci
+            y_low.append(ci_low)
+            y_high.append(ci_high)
+        graph.add_series(x, y, y_low=y_low, y_high=y_high, label=f"{table[i]}")
+        if server_metrics:
+            y_server = [server_times[j*len(query_type) + i] for j in range(len(x))]
+            if None not in y_server:
+                graph.add_series(x, y_server, label=f"{table[i]} (сервер)")
 
     # x = num_rows_list
     # y = times
@@ -532,7 +357,8 @@ def query_graph(name, query_type, table, conditions=None, values=None, num_rows_
     graph_filename = f"graphs/query/{name}.png"
     graph.save(graph_filename)
 
-    graph.show()
+    if show:
+        graph.show()
 
     return times
 
@@ -581,10 +407,10 @@ if __name__ == "__main__":
     #
     #
     # # Какой гость сколько потратил
-    # query_graph(name='Какой гость сколько потратил', query_type=['SELECT Guest.name AS Guest, SUM(Menu.prices * Personal_order.count) AS Total'], table=['Guest'], join=[['Orders', 'Guest.id = Orders.guest_id', 'Orders_has_personal_order', 'Orders.id = Orders_has_personal_order.orders_id', 'Personal_Order', 'Orders_has_personal_order.personal_order_id = Personal_order.id', 'Menu', 'Personal_Order.menu_id = Menu.id']], group_by=['Guest.name'])
+    # query_graph(name='Какой гость сколько потратил', query_type=['SELECT Guest.name AS Guest, SUM(Menu.prices * Personal_order.count) AS Total'], table=['Guest'], join=[['Orders', 'Guest.id = Orders.guest_id', 'Orders_has_Order', 'Orders.id = Orders_has_Order.orders_id', 'Personal_Order', 'Orders_has_Order.order_id = Personal_order.id', 'Menu', 'Personal_Order.menu_id = Menu.id']], group_by=['Guest.name'])
     #
     # # Позиции меню которые не фигурировали в заказах c апреля по июнь
-    # query_graph(name='Позиции меню которые не фигурировали в заказах c апреля по июнь', query_type=['SELECT Menu.name'], table=['Menu EXCEPT SELECT Menu.name FROM Menu'], join=[['Personal_Order', 'Menu.id = Personal_Order.menu_id', 'Orders_has_personal_order', 'Personal_order.id = Orders_has_personal_order.personal_order_id', 'Orders', 'Orders_has_personal_order.orders_id = Orders.id']], conditions=['Orders.order_date BETWEEN "3-31-2021" AND "7-1-2024"'])
+    # query_graph(name='Позиции меню которые не фигурировали в заказах c апреля по июнь', query_type=['SELECT Menu.name'], table=['Menu EXCEPT SELECT Menu.name FROM Menu'], join=[['Personal_Order', 'Menu.id = Personal_Order.menu_id', 'Orders_has_Order', 'Personal_order.id = Orders_has_Order.order_id', 'Orders', 'Orders_has_Order.orders_id = Orders.id']], conditions=['Orders.order_date BETWEEN "3-31-2021" AND "7-1-2024"'])
     #
     # # Позиции меню, у которых количество заказов меньше 5
     # query_graph(name='Позиции меню, у которых количество заказов меньше 5', query_type=['SELECT Menu.name AS Dish, COUNT(Personal_order.id) AS C'], table=['Menu'], join=[['Personal_order', 'Menu.id = Personal_order.menu_id']], group_by=['Menu.id'], having=['C < 5'], order_by=['C DESC'])
\ No newline at end of file
@@ -0,0 +1,41 @@
+import argparse
+from lib.append_simulator import AppendSimulator
+from lib.db_data_changer import DatabaseDataChanger
+from lib.distributions import SKEWED
+
+
+def main(argv=None):
+    """
+    Командная строка симулятора роста данных: дописывает заказы в существующую базу с заданной скоростью.
+
+    Примеры:
+        python -m investigations.run_append --rate 5000 --duration 60\n
+        python -m investigations.run_append --rate 20000 --duration 300 --native-dates --skewed
+
+    Возвращает:
+        - int: Код возврата.
+    """
+    parser = argparse.ArgumentParser(description="Постоянная дозапись строк с заданной скоростью")
+    parser.add_argument("--rate", type=float, required=True, help="Целевая скорость в строках в секунду")
+    parser.add_argument("--duration", type=float, default=60.0, help="Длительность в секундах")
+    parser.add_argument("--guest-share", type=float, default=0.2, help="Доля визитов новых гостей")
+    parser.add_argument("--basket-mean", type=float, help="Среднее количество позиций в заказе")
+    parser.add_argument("--interval", type=float, default=0.1, help="Целевой интервал между пачками в секундах")
+    parser.add_argument("--native-dates", action="store_true", help="Колонка orders.order_date имеет тип DATE")
+    parser.add_argument("--skewed", action="store_true", help="Распределения с горячими ключами (SKEWED)")
+    parser.add_argument("--host", default="localhost", help="Хост сервера MySQL")
+    parser.add_argument("--user", default="root", help="Имя пользователя MySQL")
+    parser.add_argument("--password", default="123456", help="Пароль пользователя MySQL")
+    parser.add_argument("--db-name", default="my_database", help="База данных")
+    args = parser.parse_args(argv)
+
+    with DatabaseDataChanger(args.host, args.user, args.password, args.db_name, 0, native_dates=args.native_dates,
+                             distributions=SKEWED if args.skewed else None) as changer:
+        simulator = AppendSimulator(changer, guest_share=args.guest_share, basket_mean=args.basket_mean,
+                                    interval=args.interval)
+        print(simulator.run(args.rate, args.duration))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
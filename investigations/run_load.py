@@ -0,0 +1,77 @@
+import argparse
+import os
+from lib.drivers import DRIVERS
+from lib.graphs_creator import GraphBuilder
+from lib.load_generator import LoadGenerator
+from lib.scenarios import load_scenarios, select_scenarios
+from investigations.run_scenarios import DEFAULT_SCENARIOS
+
+
+def load_graph(name, results, show=True):
+    """
+    Строит графики пропускной способности и задержек в зависимости от количества клиентов.
+
+    Параметры:
+        - name (str): Название прогона, используется в именах файлов графиков.
+        - results (list[LoadResult]): Результаты для разных уровней параллельности.
+        - show (bool, optional): Показывать ли графики на экране (по умолчанию True).
+    """
+    clients = [result.clients for result in results]
+
+    throughput = GraphBuilder(title="Пропускная способность", x_label="Количество клиентов", y_label="Запросов в секунду")
+    throughput.add_series(clients, [result.throughput for result in results], label="Все запросы")
+
+    latency = GraphBuilder(title="Задержка под нагрузкой", x_label="Количество клиентов", y_label="Время выполнения")
+    for p in (50, 95, 99):
+        latency.add_series(clients, [result.total.percentile(p) for result in results], label=f"p{p}")
+
+    os.makedirs("graphs/load", exist_ok=True)
+    throughput.save(f"graphs/load/{name}_throughput.png")
+    latency.save(f"graphs/load/{name}_latency.png")
+    if show:
+        throughput.show()
+
+
+def main(argv=None):
+    """
+    Командная строка нагрузочного теста. Смесь запросов собирается из запросов выбранных сценариев,
+    вес запроса задается полем weight (по умолчанию 1).
+
+    Примеры:
+        python -m investigations.run_load --tag select --clients 1 2 4 8 16 --duration 30\n
+        python -m investigations.run_load --name "Удаление n строк из таблицы" --mode process
+
+    Возвращает:
+        - int: Код возврата.
+    """
+    parser = argparse.ArgumentParser(description="Нагрузочный тест с несколькими клиентами")
+    parser.add_argument("paths", nargs="*", default=[DEFAULT_SCENARIOS], help="TOML-файлы сценариев или glob-шаблоны")
+    parser.add_argument("--name", action="append", help="Взять запросы сценария с этим названием")
+    parser.add_argument("--tag", action="append", help="Взять запросы сценариев с этим тегом")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 2, 4, 8], help="Уровни параллельности")
+    parser.add_argument("--duration", type=float, default=10.0, help="Длительность каждого уровня в секундах")
+    parser.add_argument("--warmup", type=float, default=1.0, help="Прогрев каждого уровня в секундах")
+    parser.add_argument("--rows", type=int, default=10, help="LIMIT запросов")
+    parser.add_argument("--mode", choices=["thread", "process"], default="thread", help="Клиенты в потоках или процессах")
+    parser.add_argument("--seed", type=int, default=None, help="Начальное значение генератора случайных чисел")
+    parser.add_argument("--driver", choices=list(DRIVERS), default="connector", help="Драйвер MySQL клиентов")
+    parser.add_argument("--db-name", default="my_sandbox_database", help="База данных для нагрузки")
+    parser.add_argument("--output", default="load", help="Префикс имен файлов графиков")
+    parser.add_argument("--no-show", action="store_true", help="Не показывать графики на экране")
+    args = parser.parse_args(argv)
+
+    scenarios = select_scenarios(load_scenarios(args.paths), names=args.name, tags=args.tag)
+    mix = [spec for scenario in scenarios for spec in scenario.load_mix(args.rows)]
+    if not mix:
+        print("Не найдено ни одного запроса для нагрузки.")
+        return 1
+
+    generator = LoadGenerator("localhost", "root", "123456", args.db_name, mix, duration=args.duration,
+                              warmup=args.warmup, mode=args.mode, seed=args.seed, driver=args.driver)
+    results = generator.scale(args.clients)
+    load_graph(args.output, results, show=not args.no_show)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,182 @@
+import argparse
+import multiprocessing
+import os
+import matplotlib
+from investigations.investigations import query_graph
+from lib.backends import get_backend
+from lib.benchmark_store import BenchmarkStore
+from lib.db_sandbox_pool import SandboxPool
+from lib.drivers import DRIVERS
+from lib.scenarios import load_scenarios, select_scenarios
+
+DEFAULT_SCENARIOS = os.path.join(os.path.dirname(__file__), "scenarios", "*.toml")
+
+# Состояние процесса-исполнителя: его песочница, пул (для восстановления данных) и хранилище результатов
+_worker = {}
+
+
+def run_scenarios(scenarios, store=None, server_metrics=False, show=False, backend=None) -> dict:
+    """
+    Последовательно выполняет сценарии через query_graph.
+
+    Параметры:
+        - scenarios (list[Scenario]): Сценарии для выполнения.
+        - store (BenchmarkStore, optional): Хранилище результатов. Каждый сценарий записывается отдельным запуском.
+        - server_metrics (bool, optional): Собирать ли серверные метрики запросов (по умолчанию False).
+        - show (bool, optional): Показывать ли графики на экране (по умолчанию False).
+        - backend (str | Backend, optional): Движок базы данных (по умолчанию MySQL).
+
+    Возвращает:
+        - dict: Словарь {название сценария: список медиан времени выполнения}.
+
+    Примечания:
+        - Для движка, отличного от MySQL с драйвером по умолчанию, к названию сценария добавляется метка движка
+          в квадратных скобках, чтобы запуски и графики разных движков и драйверов не смешивались.
+    """
+    backend = get_backend(backend)
+    os.makedirs("graphs/query", exist_ok=True)
+    times = {}
+    for scenario in scenarios:
+        print(f"Сценарий: {scenario.name} ({scenario.source})")
+        kwargs = scenario.query_graph_kwargs()
+        if backend.label != "mysql":
+            kwargs["name"] += f" [{backend.label}]"
+        times[scenario.name] = query_graph(**kwargs, store=store, server_metrics=server_metrics, show=show,
+                                           backend=backend)
+    return times
+
+
+def _init_worker(free_sandboxes, pool_kwargs, store_path, server_metrics, driver=None):
+    """
+    Инициализирует процесс-исполнитель: закрепляет за ним одну песочницу и открывает свое соединение с хранилищем.
+    """
+    # Графики в процессах-исполнителях только сохраняются, оконный backend им не нужен
+    matplotlib.use("Agg")
+    _worker["sandbox"] = free_sandboxes.get()
+    _worker["pool"] = SandboxPool(**pool_kwargs)
+    _worker["store"] = BenchmarkStore(store_path) if store_path else None
+    _worker["server_metrics"] = server_metrics
+    _worker["backend"] = get_backend("mysql", driver=driver)
+
+
+def _run_in_sandbox(scenario) -> tuple:
+    """
+    Выполняет сценарий в песочнице процесса и восстанавливает ее таблицы, если сценарий изменял данные.
+
+    Возвращает:
+        - tuple: Название сценария и список медиан времени выполнения.
+    """
+    sandbox_db = _worker["sandbox"]
+    print(f"Сценарий: {scenario.name} ({scenario.source}) -> {sandbox_db}")
+    kwargs = scenario.query_graph_kwargs()
+    if _worker["backend"].label != "mysql":
+        kwargs["name"] += f" [{_worker['backend'].label}]"
+    try:
+        times = query_graph(**kwargs, store=_worker["store"], server_metrics=_worker["server_metrics"], show=False,
+                            db_name=sandbox_db, backend=_worker["backend"])
+    finally:
+        if scenario.mutating:
+            _worker["pool"].reset(sandbox_db, scenario.tables)
+    return scenario.name, times
+
+
+def run_scenarios_parallel(scenarios, pool, store_path=None, server_metrics=False, driver=None) -> dict:
+    """
+    Выполняет сценарии параллельно в отдельных процессах, каждый со своей песочницей из пула.
+
+    Параметры:
+        - scenarios (list[Scenario]): Сценарии для выполнения.
+        - pool (SandboxPool): Пул песочниц. Количество процессов равно его размеру.
+        - store_path (str, optional): Файл хранилища результатов. Каждый процесс открывает собственное соединение.
+        - server_metrics (bool, optional): Собирать ли серверные метрики запросов (по умолчанию False).
+        - driver (str, optional): Драйвер MySQL процессов-исполнителей (см. lib.drivers).
+
+    Возвращает:
+        - dict: Словарь {название сценария: список медиан времени выполнения} в порядке исходных сценариев.
+
+    Примечания:
+        - Песочницы создаются из шаблона до запуска процессов, после изменяющего сценария таблицы, к которым он
+          обращался, восстанавливаются из шаблона, поэтому следующий сценарий в той же песочнице видит исходные данные.
+        - Графики не показываются на экране, а только сохраняются.
+    """
+    os.makedirs("graphs/query", exist_ok=True)
+    pool.prepare()
+    free_sandboxes = multiprocessing.Queue()
+    for sandbox_db in pool.sandboxes:
+        free_sandboxes.put(sandbox_db)
+    pool_kwargs = {"host": pool.host, "user": pool.user, "password": pool.password,
+                   "original_db": pool.original_db_name, "size": pool.size, "template_db": pool.template_db_name,
+                   "prefix": pool.prefix, "workers": pool.workers}
+
+    times = {}
+    with multiprocessing.Pool(pool.size, initializer=_init_worker,
+                              initargs=(free_sandboxes, pool_kwargs, store_path, server_metrics,
+                                        driver)) as workers:
+        for name, scenario_times in workers.imap_unordered(_run_in_sandbox, scenarios):
+            times[name] = scenario_times
+    return {scenario.name: times[scenario.name] for scenario in scenarios}
+
+
+def main(argv=None):
+    """
+    Командная строка запуска сценариев.
+
+    Примеры:
+        python -m investigations.run_scenarios --list\n
+        python -m investigations.run_scenarios --tag select --tag join\n
+        python -m investigations.run_scenarios --workers 4 --original-db my_database\n
+        python -m investigations.run_scenarios --driver pymysql --tag select\n
+        python -m investigations.run_scenarios --backend sqlite --sqlite-dir data --original-db my_database\n
+        python -m investigations.run_scenarios investigations/scenarios/basic.toml --name "Полная селекция из таблицы"
+
+    Возвращает:
+        - int: Код возврата.
+    """
+    parser = argparse.ArgumentParser(description="Запуск сценариев замеров запросов")
+    parser.add_argument("paths", nargs="*", default=[DEFAULT_SCENARIOS], help="TOML-файлы сценариев или glob-шаблоны")
+    parser.add_argument("--name", action="append", help="Запустить только сценарий с этим названием")
+    parser.add_argument("--tag", action="append", help="Запустить только сценарии с этим тегом")
+    parser.add_argument("--store", default="benchmarks.sqlite3", help="Файл хранилища результатов")
+    parser.add_argument("--server-metrics", action="store_true", help="Собирать серверные метрики запросов")
+    parser.add_argument("--show", action="store_true", help="Показывать графики на экране")
+    parser.add_argument("--list", action="store_true", help="Только вывести список выбранных сценариев")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Количество параллельных процессов. Больше 1 - каждый процесс работает в своей песочнице")
+    parser.add_argument("--backend", choices=["mysql", "sqlite"], default="mysql", help="Движок базы данных")
+    parser.add_argument("--sqlite-dir", default=".", help="Каталог файлов баз данных SQLite")
+    parser.add_argument("--driver", choices=list(DRIVERS), default="connector", help="Драйвер MySQL")
+    parser.add_argument("--host", default="localhost", help="Хост сервера MySQL")
+    parser.add_argument("--user", default="root", help="Имя пользователя MySQL")
+    parser.add_argument("--password", default="123456", help="Пароль пользователя MySQL")
+    parser.add_argument("--original-db", default="my_database", help="База данных, из которой создаются песочницы")
+    args = parser.parse_args(argv)
+
+    scenarios = select_scenarios(load_scenarios(args.paths), names=args.name, tags=args.tag)
+    if not scenarios:
+        print("Не найдено ни одного сценария.")
+        return 1
+    if args.list:
+        for scenario in scenarios:
+            print(f"{scenario.name} [{', '.join(scenario.tags)}] - {scenario.source}")
+        return 0
+
+    if args.backend == "sqlite":
+        backend = get_backend("sqlite", directory=args.sqlite_dir)
+    else:
+        backend = get_backend("mysql", driver=args.driver)
+    if args.workers > 1 and not backend.server:
+        print(f"Параллельный запуск для движка {backend.name} не поддерживается, сценарии выполняются по очереди.")
+    elif args.workers > 1:
+        pool = SandboxPool(args.host, args.user, args.password, args.original_db, size=args.workers,
+                           workers=args.workers)
+        run_scenarios_parallel(scenarios, pool, store_path=args.store, server_metrics=args.server_metrics,
+                               driver=args.driver)
+        return 0
+
+    with BenchmarkStore(args.store) as store:
+        run_scenarios(scenarios, store=store, server_metrics=args.server_metrics, show=args.show, backend=backend)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
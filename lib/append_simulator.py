@@ -0,0 +1,227 @@
+import time
+import numpy as np
+from lib.distributions import Basket
+from lib.load_generator import LatencyHistogram
+from lib.schema import SCHEMA, GenerationContext, numpy_rng
+
+# Средний размер заказа по умолчанию - соотношение OrderCount / OrdersCount в DataGenerator (1 + 1 / 7.5)
+DEFAULT_BASKET_MEAN = 1 + 1 / 7.5
+
+# Таблицы, в которые дописываются строки, в порядке вставки: родительские строки раньше ссылок на них
+APPEND_TABLES = ("guest", "orders", "personal_order", "orders_has_order")
+
+
+class AppendResult:
+    """
+    Результат прогона AppendSimulator.
+
+    Атрибуты:
+        - rate (float): Целевая скорость в строках в секунду.
+        - duration (float): Фактическая длительность прогона в секундах.
+        - rows (dict): Количество вставленных строк по таблицам.
+        - batches (LatencyHistogram): Время вставки и фиксации пачек.
+        - errors (int): Количество пачек, завершившихся ошибкой.
+    """
+
+    def __init__(self, rate):
+        """
+        Инициализирует пустой результат.
+
+        Параметры:
+            - rate (float): Целевая скорость в строках в секунду.
+        """
+        self.rate = rate
+        self.duration = 0.0
+        self.rows = {table: 0 for table in APPEND_TABLES}
+        self.batches = LatencyHistogram()
+        self.errors = 0
+
+    @property
+    def total_rows(self) -> int:
+        """Количество вставленных строк во всех таблицах."""
+        return sum(self.rows.values())
+
+    @property
+    def throughput(self) -> float:
+        """Фактическая скорость в строках в секунду."""
+        return self.total_rows / self.duration if self.duration else 0.0
+
+    def __str__(self):
+        stats = self.batches.to_dict()
+        lines = [f"{self.throughput:.1f} строк/с из {self.rate:.1f}; пачек: {stats['count']}, ошибок: {self.errors}; "
+                 f"p50={stats['p50']:.6f} p95={stats['p95']:.6f} p99={stats['p99']:.6f}"]
+        for table, count in self.rows.items():
+            lines.append(f"    {table}: {count} строк")
+        return '\n'.join(lines)
+
+
+class AppendSimulator:
+    """
+    Симулятор постоянного роста данных: с заданной скоростью дописывает в существующую базу новых гостей,
+    заказы, позиции заказов и связи между ними, продолжая id с текущих MAX(id).
+
+    Атрибуты:
+        - changer (DatabaseDataChanger): Открытое соединение с базой; его режим дат и распределения
+          используются при генерации.
+        - guest_share (float): Доля визитов новых гостей. Остальные заказы делают уже существующие гости.
+        - basket_mean (float): Среднее количество позиций в заказе.
+        - interval (float): Целевой интервал между пачками в секундах. Размер пачки подбирается так, чтобы
+          при целевой скорости пачки шли с этим интервалом.
+        - max_ids (dict): Текущие MAX(id) таблиц APPEND_TABLES.
+        - samplers (dict): Выборки существующих id таблиц menu, barista и guest.
+
+    Примечания:
+        - Пачка состоит из нескольких визитов. Визит - новый гость (с вероятностью guest_share), строка orders,
+          1 + Пуассон(basket_mean - 1) позиций personal_order и по одной связи orders_has_order на позицию.
+          Связи всегда ведут к заказам своей пачки, поэтому распределение 'orders_has_order.orders_id'
+          используется только для среднего размера корзины. Пачка вставляется и фиксируется одной транзакцией.
+        - id родительских таблиц читаются в prepare (GetKeySampler с refresh=True), затем выборка гостей
+          расширяется вставленными id без запросов к базе.
+        - После ошибки пачка откатывается, а MAX(id) и выборки перечитываются - например, если в те же таблицы
+          одновременно пишет другой клиент.
+        - Если база не успевает, симулятор не копит отставание паузами, а пишет пачки подряд; фактическая
+          скорость видна в AppendResult.throughput.
+
+    Пример использования:
+        with DatabaseDataChanger('localhost', 'root', '123456', 'my_database', 0) as changer:
+            result = AppendSimulator(changer).run(rate=5000, duration=60)
+            print(result)
+    """
+
+    def __init__(self, changer, guest_share=0.2, basket_mean=None, interval=0.1):
+        """
+        Инициализирует экземпляр AppendSimulator.
+
+        Параметры:
+            - changer (DatabaseDataChanger): Открытое соединение с базой.
+            - guest_share (float, optional): Доля визитов новых гостей (по умолчанию 0.2).
+            - basket_mean (float, optional): Среднее количество позиций в заказе. По умолчанию - mean
+              распределения Basket для 'orders_has_order.orders_id', если оно задано, иначе DEFAULT_BASKET_MEAN.
+            - interval (float, optional): Целевой интервал между пачками в секундах (по умолчанию 0.1).
+
+        Исключения:
+            - ValueError: Если guest_share вне [0, 1] или basket_mean меньше 1.
+        """
+        if not 0 <= guest_share <= 1:
+            raise ValueError("guest_share должен быть в [0, 1]")
+        if basket_mean is None:
+            basket = (changer.distributions or {}).get("orders_has_order.orders_id")
+            basket_mean = basket.mean if isinstance(basket, Basket) else DEFAULT_BASKET_MEAN
+        if basket_mean < 1:
+            raise ValueError("Среднее количество позиций в заказе должно быть не меньше 1")
+        self.changer = changer
+        self.guest_share = guest_share
+        self.basket_mean = basket_mean
+        self.interval = interval
+        self.max_ids = {}
+        self.samplers = {}
+
+    def prepare(self):
+        """
+        Читает MAX(id) дописываемых таблиц и выборки id таблиц, на которые ссылаются новые строки.
+
+        Исключения:
+            - ValueError: Если таблица menu, barista или guest пуста.
+        """
+        self.max_ids = {table: self.changer.get_max_id(table) for table in APPEND_TABLES}
+        self.samplers = {}
+        for table in ("menu", "barista", "guest"):
+            sampler = self.changer.GetKeySampler(table, refresh=True)
+            if sampler is None:
+                raise ValueError(f"Таблица {table} пуста: новым заказам не на что ссылаться")
+            self.samplers[table] = sampler
+
+    def context(self, table, samplers) -> GenerationContext:
+        """
+        Возвращает контекст генерации строк таблицы, продолжающих id после текущего MAX(id).
+        """
+        return GenerationContext(ids=samplers, native_dates=self.changer.native_dates,
+                                 start_id=self.max_ids[table] + 1, distributions=self.changer.distributions)
+
+    def batch(self, visits) -> tuple[dict[str, list[tuple]], dict]:
+        """
+        Генерирует пачку строк для visits заказов, не вставляя ее.
+
+        Параметры:
+            - visits (int): Количество новых заказов.
+
+        Возвращает:
+            - tuple: Строки по таблицам {таблица: [кортеж, ...]} и выборки id после вставки пачки.
+        """
+        rng = numpy_rng()
+        samplers = dict(self.samplers)
+        rows = {"guest": SCHEMA["guest"].generate_rows(int(rng.binomial(visits, self.guest_share)),
+                                                       self.context("guest", samplers))}
+        if rows["guest"]:
+            samplers["guest"] = samplers["guest"].extended(rows["guest"][-1][0])
+        rows["orders"] = SCHEMA["orders"].generate_rows(visits, self.context("orders", samplers))
+        sizes = 1 + rng.poisson(self.basket_mean - 1, size=visits)
+        rows["personal_order"] = SCHEMA["personal_order"].generate_rows(int(sizes.sum()),
+                                                                        self.context("personal_order", samplers))
+        orders_ids = np.repeat([row[0] for row in rows["orders"]], sizes).tolist()
+        first_link = self.max_ids["orders_has_order"] + 1
+        rows["orders_has_order"] = [(first_link + i, item[0], orders_id)
+                                    for i, (item, orders_id) in enumerate(zip(rows["personal_order"], orders_ids))]
+        return rows, samplers
+
+    def push(self, rows) -> bool:
+        """
+        Вставляет пачку одной транзакцией.
+
+        Возвращает:
+            - bool: True, если пачка зафиксирована, False, если она откатана из-за ошибки.
+        """
+        changer = self.changer
+        try:
+            for table in APPEND_TABLES:
+                if rows[table]:
+                    changer.cursor.executemany(SCHEMA[table].insert_sql(changer.backend.placeholder), rows[table])
+            changer.conn.commit()
+            return True
+        except Exception as e:
+            changer.conn.rollback()
+            print(f"Ошибка при добавлении пачки: {e}")
+            return False
+
+    def run(self, rate, duration) -> AppendResult:
+        """
+        Дописывает строки с целевой скоростью в течение заданного времени.
+
+        Параметры:
+            - rate (float): Целевая скорость в строках в секунду (суммарно по всем таблицам).
+            - duration (float): Длительность прогона в секундах.
+
+        Возвращает:
+            - AppendResult: Количество вставленных строк, фактическая скорость и время вставки пачек.
+
+        Исключения:
+            - ValueError: Если rate не положителен или одна из таблиц menu, barista, guest пуста.
+        """
+        if rate <= 0:
+            raise ValueError("Скорость должна быть положительной")
+        self.prepare()
+        rows_per_visit = self.guest_share + 1 + 2 * self.basket_mean
+        visits = max(1, round(rate * self.interval / rows_per_visit))
+        result = AppendResult(rate)
+        start = time.perf_counter()
+        while time.perf_counter() - start < duration:
+            rows, samplers = self.batch(visits)
+            began = time.perf_counter_ns()
+            if self.push(rows):
+                result.batches.record(time.perf_counter_ns() - began)
+                for table in APPEND_TABLES:
+                    result.rows[table] += len(rows[table])
+                    if rows[table]:
+                        self.max_ids[table] = rows[table][-1][0]
+                self.samplers = samplers
+            else:
+                result.errors += 1
+                self.prepare()
+                time.sleep(self.interval)
+            # Ждем момента, к которому при целевой скорости должны быть вставлены уже вставленные строки
+            elapsed = time.perf_counter() - start
+            delay = min(result.total_rows / rate, duration) - elapsed
+            if delay > 0:
+                time.sleep(delay)
+        result.duration = time.perf_counter() - start
+        return result
@@ -0,0 +1,332 @@
+import os
+import re
+import sqlite3
+from datetime import date
+from lib.drivers import get_driver
+
+# DELETE ... LIMIT n: SQLite без SQLITE_ENABLE_UPDATE_DELETE_LIMIT не поддерживает LIMIT в DELETE
+DELETE_LIMIT_PATTERN = re.compile(r"^DELETE FROM (\w+)(?: WHERE (.*))? LIMIT (\d+)$", re.S)
+# INSERT ... VALUES (...) LIMIT n: LIMIT у INSERT со списком значений не нужен ни одному движку
+INSERT_VALUES_LIMIT_PATTERN = re.compile(r"^(INSERT INTO .* VALUES .*) LIMIT \d+$", re.S)
+
+
+class Backend:
+    """
+    Базовый класс движка базы данных: подключение, диалект DDL, плейсхолдеры и особенности выполнения запросов.
+
+    Атрибуты:
+        - name (str): Имя движка.
+        - placeholder (str): Плейсхолдер параметров запроса.
+        - server (bool): Является ли движок сервером с несколькими базами данных.
+        - supports_partitioning (bool): Поддерживает ли движок секционирование таблиц.
+        - supports_server_metrics (bool): Доступны ли performance_schema, Handler_% и EXPLAIN ANALYZE (server_metrics).
+        - supports_table_swap (bool): Можно ли заменить таблицу теневой копией через CREATE TABLE ... LIKE
+          и атомарный RENAME TABLE нескольких таблиц.
+        - Error (type): Базовый класс исключений драйвера.
+    """
+    name = None
+    placeholder = "%s"
+    server = True
+    supports_partitioning = False
+    supports_server_metrics = False
+    supports_table_swap = False
+    Error = Exception
+
+    @property
+    def label(self) -> str:
+        """Метка движка для названий запусков и графиков."""
+        return self.name
+
+    def connect(self, host, user, password, database=None):
+        """
+        Открывает соединение с базой данных.
+
+        Параметры:
+            - host (str): Хост сервера.
+            - user (str): Имя пользователя.
+            - password (str): Пароль.
+            - database (str, optional): Имя базы данных. Без него серверный движок подключается без текущей базы.
+
+        Возвращает:
+            - Соединение DB-API.
+        """
+        raise NotImplementedError
+
+    def use_database(self, conn, database):
+        """
+        Делает базу данных текущей для соединения.
+        """
+        raise NotImplementedError
+
+    def create_database_sql(self, database, charset=None) -> str | None:
+        """
+        Возвращает запрос создания базы данных или None, если база создается при подключении.
+        """
+        raise NotImplementedError
+
+    def create_table_sql(self, table, definitions, indexes=(), partition=None) -> list[str]:
+        """
+        Возвращает запросы создания таблицы.
+
+        Параметры:
+            - table (str): Имя таблицы.
+            - definitions (list[str]): Колонки и ограничения в синтаксисе MySQL (например, 'id INT AUTO_INCREMENT',
+              'PRIMARY KEY (id)', 'FOREIGN KEY(menu_id) REFERENCES menu(id)', 'INDEX (menu_id)').
+            - indexes (list[Index], optional): Вторичные индексы.
+            - partition (RangePartition, optional): Секционирование.
+
+        Возвращает:
+            - list[str]: Запросы в порядке выполнения.
+        """
+        raise NotImplementedError
+
+    def truncate_sql(self, table) -> str:
+        """
+        Возвращает запрос удаления всех строк таблицы.
+        """
+        return f"TRUNCATE TABLE {table}"
+
+    def foreign_key_checks_sql(self, enabled) -> list[str]:
+        """
+        Возвращает запросы, включающие или отключающие проверку внешних ключей в текущем соединении.
+        """
+        return []
+
+    def error_code(self, err) -> int | None:
+        """
+        Возвращает код ошибки MySQL из исключения драйвера или None, если у исключения его нет.
+        """
+        return getattr(err, 'errno', None)
+
+    def translate(self, query) -> str:
+        """
+        Переводит запрос, построенный в синтаксисе MySQL, на диалект движка.
+        """
+        return query
+
+    def fetch_result(self, cursor) -> tuple:
+        """
+        Читает результат последнего запроса.
+
+        Возвращает:
+            - tuple: Строки результата и имена колонок или (None, None), если запрос не возвращает строк.
+        """
+        if cursor.description is None:
+            return None, None
+        return cursor.fetchall(), [column[0] for column in cursor.description]
+
+
+class MySQLBackend(Backend):
+    """
+    Движок MySQL. По умолчанию работает через mysql.connector с настройками по умолчанию, как классы библиотеки
+    до появления движков.
+
+    Атрибуты:
+        - driver (Driver): Клиентская библиотека MySQL (см. lib.drivers).
+
+    Пример использования:
+        backend = MySQLBackend(driver="pymysql")
+        with DatabaseDataPusher('localhost', 'root', '123456', 'my_database', 1500, backend=backend) as pusher:
+            pusher.PushGenerateData()
+    """
+    name = "mysql"
+    placeholder = "%s"
+    server = True
+    supports_partitioning = True
+    supports_server_metrics = True
+    supports_table_swap = True
+
+    def __init__(self, driver=None):
+        """
+        Инициализирует экземпляр MySQLBackend.
+
+        Параметры:
+            - driver (str | Driver, optional): Драйвер: 'connector' (по умолчанию), 'connector-pure', 'connector-c',
+              'pymysql' или 'mysqlclient'.
+        """
+        self.driver = get_driver(driver)
+
+    @property
+    def Error(self) -> type:
+        return self.driver.Error
+
+    @property
+    def label(self) -> str:
+        return self.name if self.driver.name == "connector" else f"{self.name}/{self.driver.name}"
+
+    def connect(self, host, user, password, database=None):
+        kwargs = {"host": host, "user": user, "password": password}
+        if database is not None:
+            kwargs["database"] = database
+        return self.driver.connect(**kwargs)
+
+    def use_database(self, conn, database):
+        self.driver.use_database(conn, database)
+
+    def error_code(self, err) -> int | None:
+        return self.driver.error_code(err)
+
+    def create_database_sql(self, database, charset=None) -> str:
+        query = f"CREATE DATABASE IF NOT EXISTS {database}"
+        if charset:
+            query += f" DEFAULT CHARACTER SET '{charset}'"
+        return query
+
+    def create_table_sql(self, table, definitions, indexes=(), partition=None) -> list[str]:
+        definitions = list(definitions) + [index.definition() for index in indexes]
+        query = f"CREATE TABLE IF NOT EXISTS {table} (\n    " + ",\n    ".join(definitions) + "\n)"
+        if partition:
+            query += f" {partition.clause()}"
+        return [query]
+
+    def foreign_key_checks_sql(self, enabled) -> list[str]:
+        return [f"SET FOREIGN_KEY_CHECKS = {1 if enabled else 0}"]
+
+    def fetch_result(self, cursor) -> tuple:
+        if not self.driver.has_rows(cursor):
+            return None, None
+        return cursor.fetchall(), self.driver.column_names(cursor)
+
+
+class SQLiteBackend(Backend):
+    """
+    Встроенный движок SQLite: каждая база данных - файл <directory>/<имя базы>.sqlite3, сервер не нужен.
+
+    Атрибуты:
+        - directory (str): Каталог файлов баз данных.
+
+    Примечания:
+        - DDL переводится из синтаксиса MySQL: INT AUTO_INCREMENT -> INTEGER, вторичные индексы создаются
+          отдельными CREATE INDEX, секционирование не поддерживается.
+        - DELETE ... LIMIT n выполняется как DELETE ... WHERE rowid IN (SELECT rowid ... LIMIT n).
+        - Проверка внешних ключей в SQLite по умолчанию выключена, поэтому отключать ее перед DELETE не нужно.
+        - Даты datetime.date сохраняются строками ISO 'YYYY-MM-DD', которые сравниваются в правильном порядке.
+
+    Пример использования:
+        backend = SQLiteBackend("data")
+        with DatabaseCreator('my_database', 'root', '123456', backend=backend) as db_creator:
+            db_creator.Database_Creation()
+    """
+    name = "sqlite"
+    placeholder = "?"
+    server = False
+    supports_partitioning = False
+    supports_server_metrics = False
+    supports_table_swap = False
+    Error = sqlite3.Error
+
+    def __init__(self, directory="."):
+        """
+        Инициализирует экземпляр SQLiteBackend.
+
+        Параметры:
+            - directory (str, optional): Каталог файлов баз данных (по умолчанию текущий).
+        """
+        self.directory = directory
+
+    def path(self, database) -> str:
+        """
+        Возвращает путь к файлу базы данных.
+        """
+        return os.path.join(self.directory, f"{database}.sqlite3")
+
+    def connect(self, host, user, password, database=None):
+        # Хост, пользователь и пароль у встроенной базы не используются
+        if database is None:
+            raise ValueError("Для SQLite необходимо указать имя базы данных.")
+        os.makedirs(self.directory, exist_ok=True)
+        sqlite3.register_adapter(date, date.isoformat)
+        return sqlite3.connect(self.path(database))
+
+    def use_database(self, conn, database):
+        # Соединение SQLite всегда открыто на одном файле, переключаться не на что
+        pass
+
+    def create_database_sql(self, database, charset=None) -> None:
+        return None
+
+    def create_table_sql(self, table, definitions, indexes=(), partition=None) -> list[str]:
+        columns = []
+        statements = []
+        for definition in definitions:
+            match = re.match(r"(UNIQUE )?INDEX (?:(\w+) )?\((.*)\)$", definition)
+            if match:
+                unique, name, index_columns = match.groups()
+                name = name or f"idx_{table}_{'_'.join(c.strip() for c in index_columns.split(','))}"
+                statements.append(f"CREATE {unique or ''}INDEX IF NOT EXISTS {name} ON {table} ({index_columns})")
+            else:
+                columns.append(re.sub(r"\bINT AUTO_INCREMENT\b", "INTEGER", definition, flags=re.I))
+        for index in indexes:
+            statements.append(f"CREATE {'UNIQUE ' if index.unique else ''}INDEX IF NOT EXISTS {index.name} "
+                              f"ON {table} ({', '.join(index.columns)})")
+        query = f"CREATE TABLE IF NOT EXISTS {table} (\n    " + ",\n    ".join(columns) + "\n)"
+        return [query] + statements
+
+    def truncate_sql(self, table) -> str:
+        return f"DELETE FROM {table}"
+
+    def translate(self, query) -> str:
+        match = DELETE_LIMIT_PATTERN.match(query)
+        if match:
+            table, conditions, limit = match.groups()
+            where = f" WHERE {conditions}" if conditions else ""
+            return f"DELETE FROM {table} WHERE rowid IN (SELECT rowid FROM {table}{where} LIMIT {limit})"
+        match = INSERT_VALUES_LIMIT_PATTERN.match(query)
+        if match:
+            return match.group(1)
+        return query
+
+    def clone_database(self, source, target):
+        """
+        Копирует базу данных целиком встроенным механизмом резервного копирования SQLite.
+
+        Параметры:
+            - source (str): Имя исходной базы данных.
+            - target (str): Имя новой базы данных. Существующая база перезаписывается.
+        """
+        src = self.connect(None, None, None, source)
+        dst = self.connect(None, None, None, target)
+        try:
+            src.backup(dst)
+        finally:
+            src.close()
+            dst.close()
+
+    def database_exists(self, database) -> bool:
+        """
+        Проверяет, существует ли файл базы данных.
+        """
+        return os.path.exists(self.path(database))
+
+    def drop_database(self, database):
+        """
+        Удаляет файл базы данных, если он существует.
+        """
+        if self.database_exists(database):
+            os.remove(self.path(database))
+
+
+BACKENDS = {"mysql": MySQLBackend, "sqlite": SQLiteBackend}
+
+
+def get_backend(backend=None, **kwargs) -> Backend:
+    """
+    Возвращает экземпляр движка.
+
+    Параметры:
+        - backend (str | Backend | None): Имя движка ('mysql', 'sqlite'), готовый экземпляр или None (MySQL).
+        - **kwargs: Параметры конструктора движка, например driver для MySQL или directory для SQLite.
+
+    Возвращает:
+        - Backend: Экземпляр движка.
+
+    Исключения:
+        - ValueError: Если имя движка неизвестно.
+    """
+    if isinstance(backend, Backend):
+        return backend
+    if backend is None:
+        backend = "mysql"
+    if backend not in BACKENDS:
+        raise ValueError(f"Неизвестный движок: {backend}. Доступны: {', '.join(BACKENDS)}")
+    return BACKENDS[backend](**kwargs)
@@ -0,0 +1,357 @@
+import math
+import os
+import statistics
+import time
+import tracemalloc
+
+# Критические значения t-распределения Стьюдента для двустороннего 95% доверительного интервала (df = 1..30)
+T_CRITICAL_95 = [12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+                 2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+                 2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042]
+
+
+def percentile(values, p) -> float:
+    """
+    Вычисляет перцентиль с линейной интерполяцией между соседними значениями.
+
+    Параметры:
+        - values (list): Список чисел.
+        - p (float): Перцентиль от 0 до 100.
+
+    Возвращает:
+        - float: Значение перцентиля.
+    """
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return float(ordered[0])
+    position = (len(ordered) - 1) * p / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def reject_outliers(values, k=1.5) -> list:
+    """
+    Отбрасывает выбросы по правилу Тьюки: значения вне [Q1 - k*IQR, Q3 + k*IQR].
+
+    Параметры:
+        - values (list): Список чисел.
+        - k (float, optional): Множитель межквартильного размаха (по умолчанию 1.5).
+
+    Возвращает:
+        - list: Значения без выбросов в исходном порядке. Если значений меньше четырех, возвращаются все.
+    """
+    if len(values) < 4:
+        return list(values)
+    q1 = percentile(values, 25)
+    q3 = percentile(values, 75)
+    iqr = q3 - q1
+    return [value for value in values if q1 - k * iqr <= value <= q3 + k * iqr]
+
+
+def confidence_interval(values) -> tuple[float, float]:
+    """
+    Вычисляет 95% доверительный интервал среднего по t-распределению Стьюдента.
+
+    Параметры:
+        - values (list): Список чисел.
+
+    Возвращает:
+        - tuple[float, float]: Нижняя и верхняя границы интервала. Для одного значения границы совпадают с ним.
+    """
+    mean = statistics.fmean(values)
+    if len(values) < 2:
+        return mean, mean
+    df = len(values) - 1
+    t = T_CRITICAL_95[df - 1] if df <= len(T_CRITICAL_95) else 1.96
+    margin = t * statistics.stdev(values) / math.sqrt(len(values))
+    return mean - margin, mean + margin
+
+
+def current_rss():
+    """
+    Возвращает текущий размер резидентной памяти процесса (RSS).
+
+    Возвращает:
+        - int | None: RSS в байтах или None, если /proc/self/statm недоступен (например, не в Linux).
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def measure_memory(func, *args, **kwargs) -> tuple:
+    """
+    Выполняет функцию один раз и измеряет потребление памяти.
+
+    Параметры:
+        - func (function): Измеряемая функция.
+        - *args: Позиционные аргументы функции.
+        - **kwargs: Именованные аргументы функции.
+
+    Возвращает:
+        - tuple: Пиковый объем памяти, выделенной Python во время выполнения (tracemalloc), и прирост RSS в байтах.
+          Прирост RSS равен None, если RSS недоступен.
+
+    Примечания:
+        - Если tracemalloc уже был запущен, он не останавливается, сбрасывается только пиковое значение.
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    rss_before = current_rss()
+    try:
+        func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+        rss_after = current_rss()
+    finally:
+        if started:
+            tracemalloc.stop()
+    rss_delta = rss_after - rss_before if rss_before is not None and rss_after is not None else None
+    return peak - baseline, rss_delta
+
+
+class BenchmarkResult:
+    """
+    Результат многократного измерения времени выполнения функции.
+
+    Все статистики возвращаются в секундах и считаются по замерам, оставшимся после отбрасывания выбросов.
+
+    Атрибуты:
+        - samples_ns (list[int]): Замеры в наносекундах после отбрасывания выбросов.
+        - raw_samples_ns (list[int]): Все замеры в наносекундах.
+        - warmup (int): Количество прогревочных запусков.
+        - repeat (int): Количество измеряемых запусков.
+        - peak_memory (int | None): Пиковый объем памяти, выделенной во время запуска, в байтах (если измерялся).
+        - rss_delta (int | None): Прирост RSS процесса за запуск в байтах (если измерялся).
+
+    Пример использования:
+        result = benchmark(sorted, list(range(1000)), warmup=2, repeat=20)\n
+        print(result.median, result.p95, result.ci)
+    """
+
+    def __init__(self, raw_samples_ns, warmup, repeat, outliers_rejected=True, peak_memory=None, rss_delta=None):
+        """
+        Инициализирует экземпляр BenchmarkResult.
+
+        Параметры:
+            - raw_samples_ns (list[int]): Все замеры в наносекундах.
+            - warmup (int): Количество прогревочных запусков.
+            - repeat (int): Количество измеряемых запусков.
+            - outliers_rejected (bool, optional): Отбрасывать ли выбросы при расчете статистик (по умолчанию True).
+            - peak_memory (int, optional): Пиковый объем выделенной памяти в байтах.
+            - rss_delta (int, optional): Прирост RSS в байтах.
+        """
+        self.raw_samples_ns = list(raw_samples_ns)
+        self.samples_ns = reject_outliers(self.raw_samples_ns) if outliers_rejected else list(self.raw_samples_ns)
+        self.warmup = warmup
+        self.repeat = repeat
+        self.peak_memory = peak_memory
+        self.rss_delta = rss_delta
+
+    @property
+    def samples(self) -> list[float]:
+        """Замеры в секундах после отбрасывания выбросов."""
+        return [sample / 1e9 for sample in self.samples_ns]
+
+    @property
+    def outliers(self) -> int:
+        """Количество отброшенных выбросов."""
+        return len(self.raw_samples_ns) - len(self.samples_ns)
+
+    @property
+    def min(self) -> float:
+        """Минимальное время в секундах."""
+        return min(self.samples)
+
+    @property
+    def max(self) -> float:
+        """Максимальное время в секундах."""
+        return max(self.samples)
+
+    @property
+    def mean(self) -> float:
+        """Среднее время в секундах."""
+        return statistics.fmean(self.samples)
+
+    @property
+    def median(self) -> float:
+        """Медиана времени в секундах."""
+        return statistics.median(self.samples)
+
+    @property
+    def stddev(self) -> float:
+        """Стандартное отклонение в секундах."""
+        return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+    @property
+    def p95(self) -> float:
+        """95-й перцентиль в секундах."""
+        return percentile(self.samples, 95)
+
+    @property
+    def p99(self) -> float:
+        """99-й перцентиль в секундах."""
+        return percentile(self.samples, 99)
+
+    @property
+    def ci(self) -> tuple[float, float]:
+        """95% доверительный интервал среднего."""
+        return confidence_interval(self.samples)
+
+    def to_dict(self) -> dict:
+        """
+        Возвращает статистики измерения в виде словаря.
+
+        Возвращает:
+            - dict: Словарь со статистиками в секундах и параметрами запуска.
+        """
+        ci_low, ci_high = self.ci
+        return {
+            "min": self.min, "median": self.median, "mean": self.mean, "max": self.max,
+            "stddev": self.stddev, "p95": self.p95, "p99": self.p99,
+            "ci_low": ci_low, "ci_high": ci_high,
+            "warmup": self.warmup, "repeat": self.repeat, "outliers": self.outliers,
+            "peak_memory": self.peak_memory, "rss_delta": self.rss_delta
+        }
+
+    def __str__(self):
+        ci_low, ci_high = self.ci
+        text = (f"median={self.median:.10f} min={self.min:.10f} p95={self.p95:.10f} p99={self.p99:.10f} "
+                f"stddev={self.stddev:.10f} ci95=[{ci_low:.10f}, {ci_high:.10f}] "
+                f"(n={len(self.samples_ns)}, выбросов={self.outliers})")
+        if self.peak_memory is not None:
+            text += f" peak_memory={self.peak_memory / 2 ** 20:.2f}MiB"
+        if self.rss_delta is not None:
+            text += f" rss_delta={self.rss_delta / 2 ** 20:.2f}MiB"
+        return text
+
+
+def benchmark(func, *args, warmup=1, repeat=5, outliers_rejected=True, setup=None, teardown=None, memory=False,
+              **kwargs) -> BenchmarkResult:
+    """
+    Многократно измеряет время выполнения функции с прогревом.
+
+    Параметры:
+        - func (function): Измеряемая функция.
+        - *args: Позиционные аргументы функции.
+        - warmup (int, optional): Количество прогревочных запусков, которые не учитываются (по умолчанию 1).
+        - repeat (int, optional): Количество измеряемых запусков (по умолчанию 5).
+        - outliers_rejected (bool, optional): Отбрасывать ли выбросы при расчете статистик (по умолчанию True).
+        - setup (function, optional): Функция, вызываемая перед каждым запуском вне измеряемого интервала.
+        - teardown (function, optional): Функция, вызываемая после каждого запуска вне измеряемого интервала,
+          например откат транзакции для изменяющих запросов.
+        - memory (bool, optional): Измерять ли пиковую память и прирост RSS (по умолчанию False).
+        - **kwargs: Именованные аргументы функции.
+
+    Возвращает:
+        - BenchmarkResult: Результат измерения.
+
+    Примечания:
+        - tracemalloc замедляет выполнение в разы, поэтому память измеряется в отдельном запуске после замеров времени.
+
+    Исключения:
+        - ValueError: Если repeat меньше 1.
+    """
+    if repeat < 1:
+        raise ValueError("repeat должен быть не меньше 1")
+
+    samples = []
+    for i in range(warmup + repeat):
+        if setup:
+            setup()
+        start = time.perf_counter_ns()
+        func(*args, **kwargs)
+        elapsed = time.perf_counter_ns() - start
+        if teardown:
+            teardown()
+        if i >= warmup:
+            samples.append(elapsed)
+
+    peak_memory = rss_delta = None
+    if memory:
+        if setup:
+            setup()
+        peak_memory, rss_delta = measure_memory(func, *args, **kwargs)
+        if teardown:
+            teardown()
+
+    return BenchmarkResult(samples, warmup, repeat, outliers_rejected, peak_memory, rss_delta)
+
+
+def _incomplete_beta_fraction(a, b, x) -> float:
+    """
+    Вычисляет цепную дробь для регуляризованной неполной бета-функции (метод Лентца).
+    """
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1, a - 1
+    c, d = 1.0, 1 - qab * x / qap
+    d = 1 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 201):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1 + aa * d
+        d = 1 / (d if abs(d) > tiny else tiny)
+        c = 1 + aa / c
+        c = c if abs(c) > tiny else tiny
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1 + aa * d
+        d = 1 / (d if abs(d) > tiny else tiny)
+        c = 1 + aa / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-12:
+            break
+    return h
+
+
+def incomplete_beta(a, b, x) -> float:
+    """
+    Регуляризованная неполная бета-функция I_x(a, b).
+
+    Параметры:
+        - a (float), b (float): Параметры распределения.
+        - x (float): Точка от 0 до 1.
+
+    Возвращает:
+        - float: Значение I_x(a, b).
+    """
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log(1 - x))
+    if x < (a + 1) / (a + b + 2):
+        return front * _incomplete_beta_fraction(a, b, x) / a
+    return 1 - front * _incomplete_beta_fraction(b, a, 1 - x) / b
+
+
+def welch_t_test(a, b) -> tuple[float, float]:
+    """
+    Двусторонний t-тест Уэлча для двух выборок с разными дисперсиями.
+
+    Параметры:
+        - a (list): Первая выборка.
+        - b (list): Вторая выборка.
+
+    Возвращает:
+        - tuple[float, float]: Значение t-статистики и p-value.
+          Если в выборке меньше двух значений или обе дисперсии нулевые, p-value равен 1.0 при равных средних и 0.0 иначе.
+    """
+    mean_a, mean_b = statistics.fmean(a), statistics.fmean(b)
+    if len(a) < 2 or len(b) < 2:
+        return 0.0, 1.0
+    var_a, var_b = statistics.variance(a) / len(a), statistics.variance(b) / len(b)
+    if var_a + var_b == 0:
+        return 0.0, 1.0 if mean_a == mean_b else 0.0
+    t = (mean_a - mean_b) / math.sqrt(var_a + var_b)
+    df = (var_a + var_b) ** 2 / (var_a ** 2 / (len(a) - 1) + var_b ** 2 / (len(b) - 1))
+    p_value = incomplete_beta(df / 2, 0.5, df / (df + t * t))
+    return t, p_value
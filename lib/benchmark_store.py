@@ -0,0 +1,239 @@
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+from lib.benchmark import welch_t_test
+
+
+def git_revision() -> str:
+    """
+    Возвращает хеш текущего коммита git.
+
+    Возвращает:
+        - str: Хеш коммита или 'unknown', если git недоступен. Для репозитория с незакоммиченными
+          изменениями к хешу добавляется суффикс '-dirty'.
+    """
+    try:
+        revision = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True,
+                               check=True).stdout.strip()
+        return f"{revision}-dirty" if dirty else revision
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def machine_fingerprint() -> str:
+    """
+    Возвращает отпечаток машины, на которой выполняются замеры.
+
+    Возвращает:
+        - str: Первые 16 символов SHA-256 от имени хоста, архитектуры, процессора, числа ядер, ОС и версии Python.
+    """
+    description = "|".join([platform.node(), platform.machine(), platform.processor(), str(os.cpu_count()),
+                            platform.system(), platform.release(), platform.python_version()])
+    return hashlib.sha256(description.encode()).hexdigest()[:16]
+
+
+class BenchmarkStore:
+    """
+    Локальное хранилище результатов замеров в SQLite с поиском регрессий между запусками.
+
+    Каждый запуск (run) хранит время создания, ревизию git и отпечаток машины, каждый результат -
+    название серии, текст запроса, количество строк, все замеры в наносекундах и основные статистики.
+
+    Атрибуты:
+        - path (str): Путь к файлу базы данных SQLite.
+        - conn (sqlite3.Connection): Соединение с базой данных.
+
+    Пример использования:
+        with BenchmarkStore() as store:
+            run_id = store.start_run('select_menu')\n
+            store.record(run_id, 'menu', 'SELECT * FROM menu LIMIT 10', 10, result)
+    """
+
+    def __init__(self, path="benchmarks.sqlite3"):
+        """
+        Открывает (и при необходимости создает) хранилище результатов.
+
+        Параметры:
+            - path (str, optional): Путь к файлу базы данных (по умолчанию 'benchmarks.sqlite3').
+        """
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                git_revision TEXT NOT NULL,
+                machine TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id INTEGER NOT NULL REFERENCES runs(id),
+                name TEXT NOT NULL,
+                query TEXT,
+                rows INTEGER,
+                samples_ns TEXT NOT NULL,
+                median REAL NOT NULL,
+                p95 REAL NOT NULL,
+                stddev REAL NOT NULL
+            );
+        ''')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Фиксирует изменения и закрывает соединение с хранилищем.
+        """
+        if self.conn:
+            self.conn.commit()
+            self.conn.close()
+            self.conn = None
+
+    def start_run(self, name) -> int:
+        """
+        Регистрирует новый запуск замеров.
+
+        Параметры:
+            - name (str): Название запуска, например название графика.
+
+        Возвращает:
+            - int: Идентификатор запуска.
+        """
+        cursor = self.conn.execute(
+            "INSERT INTO runs (name, created_at, git_revision, machine) VALUES (?, ?, ?, ?)",
+            (name, datetime.datetime.now().isoformat(timespec="seconds"), git_revision(), machine_fingerprint())
+        )
+        self.conn.commit()
+        return cursor.lastrowid
+
+    def record(self, run_id, name, query, rows, result):
+        """
+        Сохраняет результат одного замера.
+
+        Параметры:
+            - run_id (int): Идентификатор запуска.
+            - name (str): Название серии.
+            - query (str): Текст запроса или описание измеряемой операции.
+            - rows (int): Количество строк.
+            - result (BenchmarkResult): Результат измерения.
+        """
+        self.conn.execute(
+            "INSERT INTO results (run_id, name, query, rows, samples_ns, median, p95, stddev) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (run_id, name, query, rows, json.dumps(result.samples_ns), result.median, result.p95, result.stddev)
+        )
+        self.conn.commit()
+
+    def list_runs(self) -> list[tuple]:
+        """
+        Возвращает все запуски.
+
+        Возвращает:
+            - list[tuple]: Кортежи (id, name, created_at, git_revision, machine) в порядке создания.
+        """
+        return self.conn.execute("SELECT id, name, created_at, git_revision, machine FROM runs ORDER BY id").fetchall()
+
+    def get_samples(self, run_id) -> dict:
+        """
+        Возвращает замеры запуска, сгруппированные по серии, запросу и количеству строк.
+
+        Параметры:
+            - run_id (int): Идентификатор запуска.
+
+        Возвращает:
+            - dict: Словарь {(name, query, rows): [замеры в наносекундах]}.
+        """
+        samples = {}
+        for name, query, rows, samples_ns in self.conn.execute(
+                "SELECT name, query, rows, samples_ns FROM results WHERE run_id = ? ORDER BY id", (run_id,)):
+            samples.setdefault((name, query, rows), []).extend(json.loads(samples_ns))
+        return samples
+
+    def compare(self, base_run_id, new_run_id, alpha=0.05, threshold=0.05) -> list[dict]:
+        """
+        Сравнивает два запуска и находит статистически значимые регрессии.
+
+        Параметры:
+            - base_run_id (int): Идентификатор базового запуска.
+            - new_run_id (int): Идентификатор нового запуска.
+            - alpha (float, optional): Уровень значимости t-теста Уэлча (по умолчанию 0.05).
+            - threshold (float, optional): Минимальное относительное изменение медианы, которое считается значимым (по умолчанию 5%).
+
+        Возвращает:
+            - list[dict]: Для каждой общей точки - название, запрос, строки, медианы в секундах, относительное изменение,
+              p-value и статус ('regression', 'improvement' или 'unchanged').
+
+        Примечания:
+            - Изменение считается регрессией, только если различие статистически значимо И медиана выросла больше чем на threshold.
+        """
+        base = self.get_samples(base_run_id)
+        new = self.get_samples(new_run_id)
+        comparison = []
+        for key in base:
+            if key not in new:
+                continue
+            base_median = statistics.median(base[key]) / 1e9
+            new_median = statistics.median(new[key]) / 1e9
+            change = (new_median - base_median) / base_median if base_median else 0.0
+            _, p_value = welch_t_test(base[key], new[key])
+            status = "unchanged"
+            if p_value < alpha and abs(change) > threshold:
+                status = "regression" if change > 0 else "improvement"
+            name, query, rows = key
+            comparison.append({"name": name, "query": query, "rows": rows, "base_median": base_median,
+                               "new_median": new_median, "change": change, "p_value": p_value, "status": status})
+        return comparison
+
+
+def main(argv=None):
+    """
+    Командная строка хранилища результатов.
+
+    Примеры:
+        python -m lib.benchmark_store list\n
+        python -m lib.benchmark_store compare 1 2 --alpha 0.01
+
+    Возвращает:
+        - int: Код возврата: 1, если при сравнении найдены регрессии, иначе 0.
+    """
+    parser = argparse.ArgumentParser(description="Хранилище результатов замеров")
+    parser.add_argument("--db", default="benchmarks.sqlite3", help="Путь к файлу хранилища")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list", help="Список запусков")
+    compare_parser = subparsers.add_parser("compare", help="Сравнить два запуска")
+    compare_parser.add_argument("base", type=int, help="Идентификатор базового запуска")
+    compare_parser.add_argument("new", type=int, help="Идентификатор нового запуска")
+    compare_parser.add_argument("--alpha", type=float, default=0.05, help="Уровень значимости")
+    compare_parser.add_argument("--threshold", type=float, default=0.05, help="Минимальное относительное изменение")
+    args = parser.parse_args(argv)
+
+    with BenchmarkStore(args.db) as store:
+        if args.command == "list":
+            for run in store.list_runs():
+                print(" | ".join(map(str, run)))
+            return 0
+
+        regressions = 0
+        for row in store.compare(args.base, args.new, args.alpha, args.threshold):
+            if row["status"] == "regression":
+                regressions += 1
+            print(f"[{row['status']}] {row['name']} (n={row['rows']}): {row['base_median']:.10f} -> "
+                  f"{row['new_median']:.10f} ({row['change']:+.1%}, p={row['p_value']:.4f})")
+        print(f"Найдено регрессий: {regressions}")
+        return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,7 +1,10 @@
 import math
 import random
-import string
+from datetime import date
+import numpy as np
 from lib.helper_classes import *
+from lib.schema import DATES_START, DATES_STOP, SCHEMA, FullName, GenerationContext, OrderDate, PhoneNumber, \
+    Serial
 
 
 class DataGenerator:
@@ -16,13 +19,21 @@ class DataGenerator:
     - OrderCount (int): Количество заказов. Если не указано, вычисляется как сумма GuestCount и
       округленное вверх значение отношения GuestCount к 7.5.
     - OrdersCount (int): Альтернативное количество заказов, если указано. Иначе равно GuestCount.
+    - NativeDates (bool): Генерировать ли даты заказов объектами datetime.date для колонки DATE
+      вместо строк 'MM-DD-YYYY'. По умолчанию False.
+    - Distributions (dict): Распределения значений колонок {'таблица.колонка': распределение} из lib.distributions,
+      например lib.distributions.SKEWED. По умолчанию все значения равномерные.
+    - Cache (DatasetCache): Кэш сгенерированных таблиц на диске. Если указан, таблицы генерируются один раз
+      с seed Seed и затем загружаются из кэша. По умолчанию None - данные генерируются при каждом вызове.
+    - Seed (int): Seed генерации таблиц через кэш. По умолчанию 0.
 
     Пример использования:\n
         generator = DataGenerator(GuestCount=200)
         # Создание объекта generator с заданным GuestCount, а другие параметры вычисляются автоматически.
     """
 
-    def __init__(self, GuestCount, BaristaCount=None, MenuCount=None, OrderCount=None, OrdersCount=None):
+    def __init__(self, GuestCount, BaristaCount=None, MenuCount=None, OrderCount=None, OrdersCount=None,
+                 NativeDates=False, Distributions=None, Cache=None, Seed=0):
         if not isinstance(GuestCount, int):
             raise TypeError("GuestCount должен быть целым числом")
         if not isinstance(BaristaCount, int) and BaristaCount is not None:
@@ -43,13 +54,53 @@ class DataGenerator:
         else:
             self.MenuCount = 25
         if OrderCount is not None:
-            self.OrdersCount = OrdersCount
+            self.OrderCount = OrderCount
         else:
             self.OrderCount = self.GuestCount + math.ceil(self.GuestCount / 7.5)
         if OrdersCount is not None:
             self.OrdersCount = OrdersCount
         else:
             self.OrdersCount = self.GuestCount
+        self.NativeDates = NativeDates
+        self.Distributions = dict(Distributions or {})
+        self.Cache = Cache
+        self.Seed = Seed
+        # Проверяем распределения сразу, а не при первой генерации
+        self.context()
+
+    def context(self) -> GenerationContext:
+        """
+        Метод context класса DataGenerator, который возвращает состояние генерации для таблиц реестра SCHEMA.
+
+        Возвращает:\n
+        - GenerationContext: Количество строк по таблицам, на которые ссылаются внешние ключи, и режим дат.
+
+        Пример использования:\n
+            generator = DataGenerator(GuestCount=100)\n
+            rows = SCHEMA["orders"].generate_rows(10, generator.context())
+            # Генерация 10 строк таблицы orders с id бариста и гостей из текущих размеров таблиц.
+        """
+        return GenerationContext(counts={"menu": self.MenuCount, "barista": self.BaristaCount,
+                                         "guest": self.GuestCount, "personal_order": self.OrderCount,
+                                         "orders": self.OrdersCount},
+                                 native_dates=self.NativeDates, distributions=self.Distributions)
+
+    def rows(self, table, count, context=None) -> list[tuple]:
+        """
+        Метод rows класса DataGenerator, который генерирует строки таблицы реестра SCHEMA или загружает их из кэша.
+
+        Аргументы:\n
+        - table (str): Имя таблицы.
+        - count (int): Количество строк.
+        - context (GenerationContext, optional): Состояние генерации. По умолчанию self.context().
+
+        Возвращает:\n
+        - list[tuple]: Строки в порядке колонок таблицы.
+        """
+        context = context or self.context()
+        if self.Cache is None:
+            return SCHEMA[table].generate_rows(count, context)
+        return list(self.Cache.iter_rows(table, count, context, self.Seed))
 
     def Data_Generator(self) -> tuple[list[Menu], list[Order], list[Orders_has_Order], list[Orders], list[Barista], list[Guest]]:
         """
@@ -96,13 +147,10 @@ class DataGenerator:
             menu_items = generator.MenuGenerator(count=10)\n
             # Генерация 10 позиций в меню.
         """
-
         if count is None:
             count = self.MenuCount
-        IDs = self.IDGenerator(count)
-        Names = self.MenuNamesGenerator(count)
-        Prices = self.PriceGenerator(count)
-        return [Menu(IDs[i], Names[i], Prices[i]) for i in range(count)]
+        return [Menu(*row) for row in self.rows("menu", count)]
+
 
     def IDGenerator(self, count) -> list[int]:
         """
@@ -119,8 +167,8 @@ class DataGenerator:
             ids = generator.IDGenerator(count=10)\n
             # Генерация 10 уникальных идентификаторов.
         """
+        return Serial().generate(count)
 
-        return [i for i in range(1, count + 1)]
 
     def MenuNamesGenerator(self, count) -> list[str]:
         """
@@ -137,9 +185,8 @@ class DataGenerator:
             names = generator.MenuNamesGenerator(count=10)\n
             # Генерация 10 случайных имен для меню.
         """
+        return SCHEMA["menu"].column("name").generator.generate(count)
 
-        return [(''.join(random.choice(string.ascii_lowercase) for _ in range(random.randrange(4, 10)))) for _ in
-                range(count)]
 
     def PriceGenerator(self, count) -> list[int]:
         """
@@ -156,8 +203,8 @@ class DataGenerator:
             prices = generator.PriceGenerator(count=10)\n
             # Генерация 10 случайных цен для меню.
         """
+        return SCHEMA["menu"].column("prices").generator.generate(count)
 
-        return [random.randrange(159, 500, 20) for _ in range(count)]
 
     def OrderGenerator(self, count=None) -> list[Order]:
         """
@@ -174,13 +221,10 @@ class DataGenerator:
             orders = generator.OrderGenerator(count=20)\n
             # Генерация 20 заказов.
         """
-
         if count is None:
             count = self.OrderCount
-        IDs = self.IDGenerator(count)
-        Counts = self.CountGenerator(count)
-        MenuIDs = self.IDGeneratorMenuInOrder(count)
-        return [Order(IDs[i], Counts[i], MenuIDs[i]) for i in range(count)]
+        return [Order(*row) for row in self.rows("personal_order", count)]
+
 
     def CountGenerator(self, count) -> list[int]:
         """
@@ -197,7 +241,8 @@ class DataGenerator:
             counts = generator.CountGenerator(count=20)\n
             # Генерация 20 случайных кол-во товара в заказе.
         """
-        return [random.randrange(1, 4) for _ in range(count)]
+        return SCHEMA["personal_order"].column("count").generator.generate(count)
+
 
     def IDGeneratorMenuInOrder(self, count) -> list[int]:
         """
@@ -214,8 +259,8 @@ class DataGenerator:
             menu_ids = generator.IDGeneratorMenuInOrder(count=20)\n
             # Генерация 20 случайных идентификаторов меню для заказов.
         """
-        MenuIDs = self.IDGenerator(self.MenuCount)
-        return [random.choice(MenuIDs) for _ in range(count)]
+        return SCHEMA["personal_order"].generate_column("menu_id", count, self.context())
+
 
     def BaristaGenerator(self, count=None) -> list[Barista]:
         """
@@ -234,10 +279,8 @@ class DataGenerator:
         """
         if count is None:
             count = self.BaristaCount
-        IDs = self.IDGenerator(count)
-        FullNames = self.FullNamesGeneartor(count)
-        WorkTime = self.WorkTimeGenerator(count)
-        return [Barista(IDs[i], FullNames[i], WorkTime[i]) for i in range(count)]
+        return [Barista(*row) for row in self.rows("barista", count)]
+
 
     def FullNamesGeneartor(self, count) -> list[str]:
         """
@@ -254,17 +297,8 @@ class DataGenerator:
             full_names = generator.FullNamesGeneartor(count=10)\n
             # Генерация 10 случайных полных имен.
         """
-        Names = [(''.join(random.choice(string.ascii_lowercase) for _ in range(random.randrange(4, 9)))) for _ in
-                 range(count)]
-        Surnames = [(''.join(random.choice(string.ascii_lowercase) for _ in range(random.randrange(6, 13)))) for _ in
-                    range(count)]
-        Midnames = [(''.join(random.choice(string.ascii_lowercase) for _ in range(random.randrange(7, 15)))) for _ in
-                    range(count)]
-        for i in range(len(Names)):
-            Names[i] = Names[i][0].upper() + Names[i][1:]
-            Surnames[i] = Surnames[i][0].upper() + Surnames[i][1:]
-            Midnames[i] = Midnames[i][0].upper() + Midnames[i][1:]
-        return [f'{Surnames[i]} {Names[i]} {Midnames[i]}' for i in range(count)]
+        return FullName().generate(count)
+
 
     def WorkTimeGenerator(self, count) -> list[int]:
         """
@@ -281,8 +315,8 @@ class DataGenerator:
             work_times = generator.WorkTimeGenerator(count=10)\n
             # Генерация 10 случайных значений рабочего времени для бариста.
         """
+        return SCHEMA["barista"].column("work_time").generator.generate(count)
 
-        return [random.randrange(80, 280, 8) for _ in range(count)]
 
     def GuestGenerator(self, count=None) -> list[Guest]:
         """
@@ -299,13 +333,10 @@ class DataGenerator:
             guests = generator.GuestGenerator(count=10)\n
             # Генерация данных для 10 посетителей.
         """
-
         if count is None:
             count = self.GuestCount
-        IDs = self.IDGenerator(count)
-        FullNames = self.FullNamesGeneartor(count)
-        CNumber = self.ContactNumberGenerator(count)
-        return [Guest(IDs[i], FullNames[i], CNumber[i]) for i in range(count)]
+        return [Guest(*row) for row in self.rows("guest", count)]
+
 
     def ContactNumberGenerator(self, count) -> list[str]:
         """
@@ -322,11 +353,8 @@ class DataGenerator:
             contact_numbers = generator.ContactNumberGenerator(count=10)\n
             # Генерация данных для 10 контактных номеров.
         """
+        return PhoneNumber().generate(count)
 
-        return ["+7(" + str(random.randrange(900, 997)) + ")" + str(random.randrange(0, 9)) + str(
-            random.randrange(0, 9)) + str(random.randrange(0, 9)) + "-" + str(random.randrange(0, 9)) + str(
-            random.randrange(0, 9)) + "-" + str(random.randrange(0, 9)) + str(random.randrange(0, 9)) for _ in
-                range(count)]
 
     def OrdersGenerator(self, count=None) -> list[Orders]:
         """
@@ -337,20 +365,17 @@ class DataGenerator:
 
         Возвращает:\n
         - list[Orders]: Список объектов Orders, каждый из которых представляет собой заказ с уникальным идентификатором(ID), датой(OrdersDate), кодом-бариста(BaristaID) и кодом-гостя(GuestID).
+          Если NativeDates=True, даты - объекты datetime.date.
 
         Пример использования:
             generator = DataGenerator(GuestCount=100)\n
             orders = generator.OrdersGenerator(count=20)\n
             # Генерация данных для 20 заказов.
         """
-
         if count is None:
             count = self.OrdersCount
-        IDs = self.IDGenerator(count)
-        Dates = self.DatesGenerator(count)
-        BaristaIDs = self.IDGeneratorBaristaInOrders(count)
-        GuestIDs = self.IDGeneratorGuestInOrders(count)
-        return [Orders(IDs[i], Dates[i], BaristaIDs[i], GuestIDs[i]) for i in range(count)]
+        return [Orders(*row) for row in self.rows("orders", count)]
+
 
     def IDGeneratorBaristaInOrders(self, count) -> list[int]:
         """
@@ -367,9 +392,8 @@ class DataGenerator:
             barista_ids = generator.IDGeneratorBaristaInOrders(count=20)\n
             # Генерация данных для 20 заказов с случайными идентификаторами бариста.
         """
+        return SCHEMA["orders"].generate_column("barista_id", count, self.context())
 
-        BaristaIDs = self.IDGenerator(self.BaristaCount)
-        return [random.choice(BaristaIDs) for _ in range(count)]
 
     def IDGeneratorGuestInOrders(self, count) -> list[int]:
         """
@@ -386,8 +410,8 @@ class DataGenerator:
             guest_ids = generator.IDGeneratorGuestInOrders(count=20)\n
             # Генерация данных для 20 заказов с случайными идентификаторами посетителей.
         """
-        GuestIDs = self.IDGenerator(self.GuestCount)
-        return [random.choice(GuestIDs) for _ in range(count)]
+        return SCHEMA["orders"].generate_column("guest_id", count, self.context())
+
 
     def DatesGenerator(self, count) -> list[str]:
         """
@@ -404,21 +428,66 @@ class DataGenerator:
             dates = generator.DatesGenerator(count=20)\n
             # Генерация списка из 20 случайных дат.
         """
-        return [str(random.randrange(1, 13)) + "-" + str(random.randrange(1, 31)) + "-2024" for _ in range(count)]
+        return OrderDate().strings(count)
+
+
+    def OrdinalDatesGenerator(self, count, start=DATES_START, stop=DATES_STOP) -> np.ndarray:
+        """
+        Метод OrdinalDatesGenerator класса DataGenerator, который генерирует случайные даты заказов номерами дней.
+
+        Аргументы:\n
+        - count (int): Количество дат, которые необходимо сгенерировать.
+        - start (date, optional): Первая возможная дата. По умолчанию DATES_START.
+        - stop (date, optional): Дата, следующая за последней возможной. По умолчанию DATES_STOP.
+
+        Возвращает:\n
+        - np.ndarray: Массив datetime64[D] - количество дней от 1970-01-01.
+
+        Примечания:\n
+        - Даты генерируются одним векторным вызовом numpy, а не по одной, поэтому все даты корректны
+          (нет 30 февраля) и равномерно распределены по дням.
+        - Генератор numpy инициализируется из модуля random, поэтому random.seed делает результат воспроизводимым.
+
+        Пример использования:
+            generator = DataGenerator(GuestCount=100)\n
+            days = generator.OrdinalDatesGenerator(count=20)\n
+            # Генерация массива из 20 случайных дат 2024 года.
+        """
+        return OrderDate(start, stop).ordinal(count)
+
+
+    def NativeDatesGenerator(self, count) -> list[date]:
+        """
+        Метод NativeDatesGenerator класса DataGenerator, который генерирует случайные даты заказов для колонки DATE.
+
+        Аргументы:\n
+        - count (int): Количество дат, которые необходимо сгенерировать.
+
+        Возвращает:\n
+        - list[date]: Список объектов datetime.date, которые драйвер передает в MySQL как значения DATE.
+
+        Пример использования:
+            generator = DataGenerator(GuestCount=100, NativeDates=True)\n
+            dates = generator.NativeDatesGenerator(count=20)\n
+            # Генерация списка из 20 случайных дат.
+        """
+        return OrderDate().dates(count)
+
 
     def Orders_has_OrderGenerator(self, count=None, existing_order_ids=None) -> list[Orders_has_Order]:
         """
-        Метод Orders_has_OrderGenerator класса DataGenerator, который генерирует данные для таблицы "Orders_has_personal_order".
+        Метод Orders_has_OrderGenerator класса DataGenerator, который генерирует данные для таблицы "orders_has_order".
 
         Аргументы:\n
         - count (int, optional): Количество записей. По умолчанию равно self.OrderCount.
-        - existing_order_ids (list, optional): Список существующих идентификаторов заказов.
+        - existing_order_ids (KeySampler | list, optional): Существующие идентификаторы заказов: выборка по диапазону
+          id (см. DatabaseDataPusher.GetKeySampler) или список.
 
         Возвращает:\n
         - list[Orders_has_Order]: Список объектов Orders_has_Order, каждый из которых представляет собой связь заказа и единицы заказа с уникальным идентификатором(ID), кодом-единицы-заказа(OrderID) и кодом-заказа(OrdersID).
 
         Примечания:\n
-        - Если параметр existing_order_ids не указан, сгенерируются случайные идентификаторы для связей.
+        - Если параметр existing_order_ids не указан, идентификаторы заказов выбираются из 1..self.OrdersCount.
         - Каждая связь (Orders_has_Order) связывает два заказа.
 
         Пример использования:
@@ -427,17 +496,13 @@ class DataGenerator:
             orders_has_order = generator.Orders_has_OrderGenerator(existing_order_ids=[order.id for order in orders])\n
             # Генерация списка связей между заказами, используя идентификаторы существующих заказов.
         """
-
         if count is None:
             count = self.OrderCount
-        if existing_order_ids is None:
-            existing_order_ids = []
-        IDs = self.IDGenerator(count)
-        order_ids = random.choices(existing_order_ids, k=count)
-        t = [Orders_has_Order(IDs[i], IDs[i], order_ids[i]) for i in range(count)]
-        # for itm in t:
-        #     print(itm.to_turple())
-        return t
+        context = self.context()
+        if existing_order_ids is not None:
+            context.ids["orders"] = existing_order_ids
+        return [Orders_has_Order(*row) for row in self.rows("orders_has_order", count, context)]
+
 
 
     def OrderIDGenerator(self, count) -> list[int]:
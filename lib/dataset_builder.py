@@ -0,0 +1,203 @@
+import csv
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import random
+from datetime import date
+from lib.dataset_cache import describe
+from lib.db_creator import DatabaseCreator
+from lib.schema import CHUNK_SIZE, GENERATOR_VERSION, SCHEMA
+
+MANIFEST_FILE = "manifest.json"
+
+# Диалекты файлов и соответствующие им параметры LOAD DATA. TSV совпадает с форматом LOAD DATA по умолчанию,
+# CSV - с выгрузкой большинства инструментов.
+FORMATS = {
+    "tsv": {
+        "dialect": {"delimiter": "\t", "quoting": csv.QUOTE_NONE, "escapechar": "\\", "lineterminator": "\n"},
+        "load_options": "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n'",
+    },
+    "csv": {
+        "dialect": {"delimiter": ",", "quoting": csv.QUOTE_MINIMAL, "quotechar": '"', "lineterminator": "\n"},
+        "load_options": "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' LINES TERMINATED BY '\\n'",
+    },
+}
+
+# Экранирование TSV формата LOAD DATA по умолчанию (ESCAPED BY '\\')
+TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n"})
+
+
+def table_counts(generator) -> dict[str, int]:
+    """
+    Возвращает количество строк по таблицам реестра SCHEMA для параметров DataGenerator: по одной связи
+    orders_has_order на каждую позицию personal_order, как в Orders_has_OrderGenerator.
+    """
+    return {"menu": generator.MenuCount, "barista": generator.BaristaCount, "guest": generator.GuestCount,
+            "personal_order": generator.OrderCount, "orders": generator.OrdersCount,
+            "orders_has_order": generator.OrderCount}
+
+
+def format_value(value, file_format="csv"):
+    """
+    Приводит значение колонки к виду, который понимает LOAD DATA: даты - к ISO 'YYYY-MM-DD'.
+
+    Примечания:
+        - В TSV значение возвращается готовой строкой поля: None - как \\N (NULL для LOAD DATA),
+          обратная косая черта, табуляция и перевод строки экранируются.
+        - В CSV None записывается пустым полем.
+    """
+    if file_format == "tsv":
+        if value is None:
+            return "\\N"
+        return str(format_value(value)).translate(TSV_ESCAPES)
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def write_shard(task) -> dict:
+    """
+    Генерирует одну часть таблицы и записывает ее в файл. Выполняется в процессе-исполнителе.
+
+    Параметры:
+        - task (dict): Описание части: каталог, формат, таблица, номер части, первая строка, количество строк,
+          контекст генерации, seed и размер порции.
+
+    Возвращает:
+        - dict: Запись манифеста о файле: путь относительно каталога, количество строк, первый id, размер и sha256.
+
+    Примечания:
+        - Часть генерируется с random.seed('seed:таблица:номер части'), поэтому содержимое файла не зависит
+          от количества процессов и порядка их выполнения. Состояние модуля random восстанавливается.
+        - id продолжают нумерацию с первой строки части, а внешние ключи выбираются по размерам таблиц
+          из контекста, поэтому части разных таблиц не зависят друг от друга.
+        - Порции внутри части продолжают друг друга (GenerationContext.state), а часть начинает распределения,
+          зависящие от положения строки, заново - например, корзины Basket с приблизительного номера заказа.
+    """
+    table = SCHEMA[task["table"]]
+    path = os.path.join(task["table"], f"{task['table']}.{task['shard']:04d}.{task['format']}")
+    full_path = os.path.join(task["directory"], path)
+    context = task["context"].shifted(task["start"])
+    # Собственное состояние распределений: содержимое части не должно зависеть от того, какие части
+    # этот процесс сгенерировал до нее
+    context.state = {}
+    state = random.getstate()
+    random.seed(f"{task['seed']}:{task['table']}:{task['shard']}")
+    try:
+        with open(full_path, "w", encoding="utf-8", newline="") as file:
+            rows = table.iter_rows(task["count"], context, task["chunk_size"])
+            if task["format"] == "tsv":
+                # csv.writer экранировал бы и обратную косую черту в \\N, поэтому строки TSV собираются напрямую
+                for row in rows:
+                    file.write("\t".join(format_value(value, "tsv") for value in row) + "\n")
+            else:
+                writer = csv.writer(file, **FORMATS[task["format"]]["dialect"])
+                for row in rows:
+                    writer.writerow([format_value(value) for value in row])
+    finally:
+        random.setstate(state)
+    digest = hashlib.sha256()
+    with open(full_path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return {"table": task["table"], "shard": task["shard"], "path": path, "rows": task["count"],
+            "first_id": context.start_id, "bytes": os.path.getsize(full_path), "sha256": digest.hexdigest()}
+
+
+def load_sql(directory, table, path, file_format) -> str:
+    """
+    Возвращает запрос LOAD DATA LOCAL INFILE для файла части с явным списком колонок.
+    """
+    columns = ", ".join(SCHEMA[table].column_names)
+    infile = os.path.abspath(os.path.join(directory, path)).replace("\\", "/")
+    return (f"LOAD DATA LOCAL INFILE '{infile}' INTO TABLE {table} "
+            f"{FORMATS[file_format]['load_options']} ({columns})")
+
+
+def build_dataset(directory, generator, shard_rows=1_000_000, workers=None, file_format="tsv", seed=0,
+                  chunk_size=CHUNK_SIZE) -> dict:
+    """
+    Генерирует все таблицы реестра SCHEMA в файлы для массовой загрузки: каждая таблица делится на части
+    по shard_rows строк, части пишутся параллельно в отдельных процессах. В каталог записывается
+    манифест со схемой, параметрами генерации и запросами загрузки.
+
+    Параметры:
+        - directory (str): Каталог набора. Файлы частей пишутся в подкаталоги по таблицам.
+        - generator (DataGenerator): Параметры генерации: размеры таблиц, режим дат и распределения.
+        - shard_rows (int, optional): Наибольшее количество строк в одном файле (по умолчанию 1 000 000).
+        - workers (int, optional): Количество процессов (по умолчанию - количество процессоров).
+          При workers=1 части пишутся в текущем процессе.
+        - file_format (str, optional): Формат файлов: 'tsv' (по умолчанию) или 'csv'.
+        - seed (int, optional): Seed генерации (по умолчанию 0). Одинаковые параметры и seed дают одинаковые файлы.
+        - chunk_size (int, optional): Размер порции генерации строк (по умолчанию CHUNK_SIZE).
+
+    Возвращает:
+        - dict: Манифест набора, тот же, что записан в manifest.json.
+
+    Исключения:
+        - ValueError: Неизвестный формат или shard_rows меньше 1.
+
+    Примечания:
+        - Схема в манифесте - запросы DatabaseCreator.schema_sql с режимом дат генератора, поэтому файлы
+          загружаются в таблицы, созданные DatabaseCreator, без преобразований. Даты NativeDates
+          записываются в ISO-формате для колонки DATE, строковые даты - как есть.
+        - Таблицы в манифесте идут в порядке создания; загрузка в этом порядке не нарушает внешних ключей.
+        - Манифест записывается последним, поэтому каталог без manifest.json - недописанный набор.
+
+    Пример использования:
+        manifest = build_dataset("dataset", DataGenerator(10_000_000, NativeDates=True), workers=8)
+        # mysql --local-infile=1 my_database -e "<запрос из manifest['tables'][i]['files'][j]['load_sql']>"
+    """
+    if file_format not in FORMATS:
+        raise ValueError(f"Неизвестный формат файлов: {file_format}. Доступны: {', '.join(FORMATS)}")
+    if shard_rows < 1:
+        raise ValueError("shard_rows должен быть не меньше 1")
+    context = generator.context()
+    counts = table_counts(generator)
+    if os.path.exists(os.path.join(directory, MANIFEST_FILE)):
+        os.remove(os.path.join(directory, MANIFEST_FILE))
+    tasks = []
+    for table in SCHEMA:
+        os.makedirs(os.path.join(directory, table.name), exist_ok=True)
+        for shard in range(math.ceil(counts[table.name] / shard_rows)):
+            start = shard * shard_rows
+            tasks.append({"directory": directory, "format": file_format, "table": table.name, "shard": shard,
+                          "start": start, "count": min(shard_rows, counts[table.name] - start),
+                          "context": context, "seed": seed, "chunk_size": chunk_size})
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        files = [write_shard(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(min(workers, len(tasks))) as pool:
+            files = list(pool.imap_unordered(write_shard, tasks))
+    files.sort(key=lambda entry: (entry["table"], entry["shard"]))
+
+    creator = DatabaseCreator(None, None, None, native_dates=generator.NativeDates)
+    manifest = {
+        "generator_version": GENERATOR_VERSION,
+        "params": describe({"seed": seed, "shard_rows": shard_rows, "native_dates": generator.NativeDates,
+                            "distributions": generator.Distributions}),
+        "format": file_format,
+        "dialect": {key: value for key, value in FORMATS[file_format]["dialect"].items() if key != "quoting"},
+        "schema": creator.schema_sql(),
+        "tables": [{"name": table.name, "rows": counts[table.name], "columns": table.column_names,
+                    "definitions": table.definitions(generator.NativeDates),
+                    "foreign_keys": [list(key) for key in table.foreign_keys],
+                    "files": [dict(entry, load_sql=load_sql(directory, table.name, entry["path"], file_format))
+                              for entry in files if entry["table"] == table.name]}
+                   for table in SCHEMA],
+    }
+    with open(os.path.join(directory, MANIFEST_FILE), "w", encoding="utf-8") as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def load_manifest(directory) -> dict:
+    """
+    Читает манифест набора из каталога.
+    """
+    with open(os.path.join(directory, MANIFEST_FILE), encoding="utf-8") as file:
+        return json.load(file)
@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+import random
+import shutil
+import numpy as np
+from lib.schema import CHUNK_SIZE, GENERATOR_VERSION, SCHEMA, GenerationContext
+
+META_FILE = "meta.json"
+
+
+def describe(value):
+    """
+    Приводит параметры генерации к виду, пригодному для JSON: объекты - к имени класса и атрибутам,
+    массивы numpy - к хешу содержимого.
+
+    Параметры:
+        - value: Значение параметра (число, строка, словарь, список, распределение, KeySampler и т.д.).
+    """
+    if isinstance(value, dict):
+        return {str(key): describe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [describe(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return hashlib.sha256(value.tobytes()).hexdigest()
+    if hasattr(value, "__dict__"):
+        return {"type": type(value).__name__, **describe(vars(value))}
+    return value
+
+
+def to_array(values) -> np.ndarray:
+    """
+    Превращает значения колонки в массив numpy фиксированной ширины, который можно отобразить в память:
+    int64 для чисел, datetime64[D] для дат, Unicode фиксированной длины для строк.
+    """
+    array = np.asarray(values)
+    if array.dtype == object:
+        array = np.asarray(values, dtype="datetime64[D]")
+    return array
+
+
+class DatasetCache:
+    """
+    Кэш сгенерированных таблиц на диске. Каждая таблица хранится каталогом с колонками в файлах .npy,
+    которые загружаются отображением в память без копирования.
+
+    Атрибуты:
+        - directory (str): Каталог кэша.
+        - max_bytes (int): Предельный размер кэша. При превышении удаляются давно не использованные наборы.
+
+    Примечания:
+        - Ключ набора - таблица, количество строк, параметры генерации (размеры родительских таблиц, режим дат,
+          распределения, начальный id), seed и GENERATOR_VERSION. При изменении генераторов GENERATOR_VERSION
+          увеличивается, и старые наборы перестают совпадать.
+        - Набор генерируется с random.seed(seed), поэтому при промахе результат тот же, что при попадании.
+          Состояние модуля random после генерации восстанавливается.
+        - Время последнего использования - время изменения meta.json, оно обновляется при каждой загрузке.
+
+    Пример использования:
+        cache = DatasetCache("dataset_cache", max_bytes=2 * 1024 ** 3)
+        columns = cache.load("orders", 1_000_000, GenerationContext(counts={"barista": 100, "guest": 10000}))
+    """
+
+    def __init__(self, directory="dataset_cache", max_bytes=2 * 1024 ** 3):
+        """
+        Инициализирует экземпляр DatasetCache.
+
+        Параметры:
+            - directory (str, optional): Каталог кэша (по умолчанию 'dataset_cache').
+            - max_bytes (int, optional): Предельный размер кэша в байтах (по умолчанию 2 ГиБ).
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, table, count, context=None, seed=0) -> str:
+        """
+        Возвращает имя каталога набора: таблица, количество строк и хеш параметров.
+        """
+        context = context or GenerationContext()
+        params = {"table": table, "count": count, "seed": seed, "version": GENERATOR_VERSION,
+                  "counts": context.counts, "ids": context.ids, "native_dates": context.native_dates,
+                  "start_id": context.start_id, "distributions": context.distributions}
+        digest = hashlib.sha256(json.dumps(describe(params), sort_keys=True, default=str).encode()).hexdigest()
+        return f"{table}-{count}-{digest[:16]}"
+
+    def load(self, table, count, context=None, seed=0) -> dict[str, np.ndarray]:
+        """
+        Возвращает колонки набора, генерируя и сохраняя его при промахе.
+
+        Параметры:
+            - table (str): Таблица реестра SCHEMA.
+            - count (int): Количество строк.
+            - context (GenerationContext, optional): Параметры генерации.
+            - seed (int, optional): Seed генерации (по умолчанию 0).
+
+        Возвращает:
+            - dict[str, np.ndarray]: Колонки {имя: массив}, отображенные в память только для чтения.
+        """
+        path = os.path.join(self.directory, self.key(table, count, context, seed))
+        if not os.path.exists(os.path.join(path, META_FILE)):
+            self.store(path, table, count, context, seed)
+            self.evict(keep=path)
+        os.utime(os.path.join(path, META_FILE))
+        return {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+                for name in SCHEMA[table].column_names}
+
+    def iter_rows(self, table, count, context=None, seed=0, chunk_size=CHUNK_SIZE):
+        """
+        Отдает строки набора кортежами, преобразуя в объекты Python по порциям из chunk_size строк.
+        """
+        columns = list(self.load(table, count, context, seed).values())
+        for start in range(0, count, chunk_size):
+            yield from zip(*(column[start:start + chunk_size].tolist() for column in columns))
+
+    def store(self, path, table, count, context=None, seed=0):
+        """
+        Генерирует набор и записывает его во временный каталог, который затем переименовывается в path,
+        чтобы параллельные запуски не увидели недописанный набор.
+        """
+        state = random.getstate()
+        random.seed(seed)
+        try:
+            columns = SCHEMA[table].generate_columns(count, context)
+        finally:
+            random.setstate(state)
+        temporary = f"{path}.tmp-{os.getpid()}"
+        os.makedirs(temporary, exist_ok=True)
+        for name, values in columns.items():
+            np.save(os.path.join(temporary, f"{name}.npy"), to_array(values))
+        with open(os.path.join(temporary, META_FILE), "w", encoding="utf-8") as file:
+            json.dump({"table": table, "count": count, "seed": seed, "version": GENERATOR_VERSION}, file)
+        try:
+            os.rename(temporary, path)
+        except OSError:
+            # Набор уже сохранен другим процессом
+            shutil.rmtree(temporary, ignore_errors=True)
+
+    def entries(self) -> list[tuple[str, int, float]]:
+        """
+        Возвращает наборы кэша: (каталог, размер в байтах, время последнего использования).
+        """
+        result = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            meta = os.path.join(path, META_FILE)
+            if os.path.isfile(meta):
+                size = sum(entry.stat().st_size for entry in os.scandir(path))
+                result.append((path, size, os.path.getmtime(meta)))
+        return result
+
+    def size(self) -> int:
+        """
+        Возвращает суммарный размер наборов в байтах.
+        """
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, max_bytes=None, keep=None):
+        """
+        Удаляет давно не использованные наборы, пока размер кэша больше max_bytes.
+
+        Параметры:
+            - max_bytes (int, optional): Предельный размер (по умолчанию self.max_bytes).
+            - keep (str, optional): Каталог набора, который не удаляется, даже если он один больше предела.
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self.entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= max_bytes:
+                break
+            if path == keep:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        """
+        Удаляет все наборы кэша.
+        """
+        self.evict(max_bytes=0)
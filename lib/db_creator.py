@@ -1,5 +1,6 @@
-import mysql.connector
-from mysql.connector import errorcode
+from lib.backends import get_backend
+from lib.drivers import errorcode
+from lib.schema import SCHEMA
 
 class DatabaseCreator:
     """
@@ -10,11 +11,17 @@ class DatabaseCreator:
     - user (str): Имя пользователя базы данных.
     - password (str): Пароль пользователя базы данных.
     - host (str): Адрес хоста базы данных.
+    - indexes (dict): Вторичные индексы по таблицам {таблица: [Index, ...]}.
+    - partitioning (dict): Секционирование по таблицам {таблица: RangePartition}.
+    - native_dates (bool): Создавать ли колонку orders.order_date с типом DATE вместо VARCHAR(255).
+    - partitioned_tables (set): Таблицы, которые были созданы секционированными.
+    - backend (Backend): Движок базы данных (MySQL по умолчанию или SQLite).
     - conn (mysql.connector.connection_cext.CMySQLConnection): Объект соединения с базой данных.
     - cursor (mysql.connector.cursor_cext.CMySQLCursor): Объект курсора для выполнения SQL-запросов.
 
     """
-    def __init__(self, db_name, user, password, host='localhost'):
+    def __init__(self, db_name, user, password, host='localhost', indexes=None, partitioning=None, native_dates=False,
+                 backend=None):
         """
         Инициализирует экземпляр DatabaseCreator.
 
@@ -23,11 +30,23 @@ class DatabaseCreator:
         - user (str): Имя пользователя базы данных.
         - password (str): Пароль пользователя базы данных.
         - host (str): Адрес хоста базы данных (по умолчанию 'localhost').
+        - indexes (dict, optional): Вторичные индексы {таблица: [Index, ...]} (классы из lib.orm_classes),
+          например {'menu': [Index('idx_menu_prices', ['prices'])]}.
+        - partitioning (dict, optional): Секционирование {таблица: RangePartition},
+          например {'orders': RangePartition('order_date', by='month', start='2021-01', stop='2025-01')}.
+        - native_dates (bool, optional): Создавать ли orders.order_date с типом DATE (по умолчанию False).
+          Нужен для секционирования orders по дате и индексного поиска по диапазону дат.
+        - backend (str | Backend, optional): Движок базы данных: 'mysql' (по умолчанию), 'sqlite' или экземпляр Backend.
         """
         self.db_name = db_name
         self.user = user
         self.password = password
         self.host = host
+        self.indexes = indexes or {}
+        self.partitioning = partitioning or {}
+        self.native_dates = native_dates
+        self.partitioned_tables = set()
+        self.backend = get_backend(backend)
         self.conn = None
         self.cursor = None
 
@@ -45,18 +64,16 @@ class DatabaseCreator:
             mysql.connector.Error: Возникает при ошибке подключения к базе данных.
         """
         try:
-            self.conn = mysql.connector.connect(
-                user=self.user,
-                password=self.password,
-                host=self.host
-            )
+            # Серверный движок подключается без базы и создает ее, встроенный сразу открывает файл базы
+            self.conn = self.backend.connect(self.host, self.user, self.password,
+                                             None if self.backend.server else self.db_name)
             self.cursor = self.conn.cursor()
             self.create_database()
-            self.conn.database = self.db_name
-        except mysql.connector.Error as err:
-            if err.errno == errorcode.ER_BAD_DB_ERROR:
+            self.backend.use_database(self.conn, self.db_name)
+        except self.backend.Error as err:
+            if self.backend.error_code(err) == errorcode.ER_BAD_DB_ERROR:
                 self.create_database()
-                self.conn.database = self.db_name
+                self.backend.use_database(self.conn, self.db_name)
             else:
                 print(err)
                 exit(1)
@@ -95,16 +112,91 @@ class DatabaseCreator:
         Примечания:
             Метод использует соединение и курсор, созданные при инициализации класса.
             По умолчанию устанавливается кодировка 'utf8' для базы данных.
+            Встроенному движку (SQLite) создавать базу не нужно - файл создается при подключении.
 
         """
+        query = self.backend.create_database_sql(self.db_name, charset='utf8')
+        if query is None:
+            return
         try:
-            self.cursor.execute(
-                f"CREATE DATABASE IF NOT EXISTS {self.db_name} DEFAULT CHARACTER SET 'utf8'"
-            )
-        except mysql.connector.Error as err:
+            self.cursor.execute(query)
+        except self.backend.Error as err:
             print(f"Ошибка при создании БД: {err}")
             raise
 
+    def create_table(self, table, columns, foreign_keys=()):
+        """
+        Создает таблицу с первичным ключом id, внешними ключами, вторичными индексами и секционированием.
+
+        Параметры:
+            - table (str): Имя таблицы.
+            - columns (list[str]): Описания колонок, например ['id INT AUTO_INCREMENT', 'name VARCHAR(255) NOT NULL'].
+            - foreign_keys (list[tuple], optional): Пары (колонка, таблица), на поле id которой ссылается колонка.
+
+        Примечания:
+            - Запросы строит table_sql.
+        """
+        for query in self.table_sql(table, columns, foreign_keys):
+            self.cursor.execute(query)
+
+    def table_sql(self, table, columns, foreign_keys=()) -> list[str]:
+        """
+        Возвращает запросы создания таблицы с первичным ключом id, внешними ключами, вторичными индексами
+        и секционированием, не выполняя их.
+
+        Параметры:
+            - table (str): Имя таблицы.
+            - columns (list[str]): Описания колонок, например ['id INT AUTO_INCREMENT', 'name VARCHAR(255) NOT NULL'].
+            - foreign_keys (list[tuple], optional): Пары (колонка, таблица), на поле id которой ссылается колонка.
+
+        Примечания:
+            - Индексы и секционирование берутся из атрибутов `indexes` и `partitioning`.
+            - Колонка секционирования должна иметь тип DATE или DATETIME, иначе секционирование пропускается.
+            - У секционированной таблицы первичный ключ дополняется колонкой секционирования. Внешние ключи
+              секционированной таблицы и ссылки на нее InnoDB не поддерживает, поэтому вместо них создаются
+              обычные индексы на колонках.
+        """
+        partition = self.partitioning.get(table)
+        if partition and not self.backend.supports_partitioning:
+            print(f"Секционирование таблицы {table} пропущено: движок {self.backend.name} его не поддерживает.")
+            partition = None
+        if partition and not any(column.split()[0] == partition.column and column.split()[1].upper().startswith('DATE')
+                                 for column in columns):
+            print(f"Секционирование таблицы {table} пропущено: колонка {partition.column} должна иметь тип DATE.")
+            partition = None
+
+        primary_key = ['id', partition.column] if partition else ['id']
+        definitions = list(columns) + [f"PRIMARY KEY ({', '.join(primary_key)})"]
+        for column, reference in foreign_keys:
+            if partition or reference in self.partitioned_tables:
+                definitions.append(f"INDEX ({column})")
+            else:
+                definitions.append(f"FOREIGN KEY({column}) REFERENCES {reference}(id)")
+        if partition:
+            self.partitioned_tables.add(table)
+        return self.backend.create_table_sql(table, definitions, self.indexes.get(table, []), partition)
+
+    def schema_sql(self) -> list[str]:
+        """
+        Возвращает запросы создания всех таблиц реестра SCHEMA в порядке создания, не выполняя их.
+
+        Примечания:
+            - Соединение с сервером не нужно, поэтому запросы можно сохранить вместе с набором данных
+              и выполнить позже на других серверах.
+        """
+        return [query for table in SCHEMA
+                for query in self.table_sql(table.name, table.definitions(self.native_dates), table.foreign_keys)]
+
+    def create_schema_table(self, name):
+        """
+        Создает таблицу реестра SCHEMA: колонки и внешние ключи берутся из описания таблицы.
+
+        Параметры:
+            - name (str): Имя таблицы реестра.
+        """
+        table = SCHEMA[name]
+        self.create_table(table.name, table.definitions(self.native_dates), table.foreign_keys)
+
     def Database_Creation(self):
         """
         Создает необходимые таблицы в базе данных, выводя прогресс создания.
@@ -144,14 +236,7 @@ class DatabaseCreator:
         В таблице используется автоинкрементируемый первичный ключ для идентификации записей.
 
         """
-
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS menu (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                name VARCHAR(255) NOT NULL,
-                prices INT NOT NULL
-            )
-        ''')
+        self.create_schema_table('menu')
 
     def OrderGenerator(self):
         """
@@ -166,15 +251,7 @@ class DatabaseCreator:
 
         В таблице используется автоинкрементируемый первичный ключ для идентификации записей.
         """
-
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS personal_order (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                count INT NOT NULL,
-                menu_id INT NOT NULL,
-                FOREIGN KEY(menu_id) REFERENCES menu(id)
-            )
-        ''')
+        self.create_schema_table('personal_order')
 
     def Orders_has_OrderGenerator(self):
         """
@@ -190,15 +267,7 @@ class DatabaseCreator:
 
         В таблице используется автоинкрементируемый первичный ключ для идентификации записей.
         """
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS orders_has_order (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                order_id INT NOT NULL,
-                orders_id INT NOT NULL,
-                FOREIGN KEY(order_id) REFERENCES personal_order(id),
-                FOREIGN KEY(orders_id) REFERENCES orders(id)
-            )
-        ''')
+        self.create_schema_table('orders_has_order')
 
     def OrdersGenerator(self):
         """
@@ -207,7 +276,7 @@ class DatabaseCreator:
         Примечания:
             Таблица "orders" содержит следующие поля:\n
             - id: INT, автоинкрементируемый первичный ключ.\n
-            - order_date: VARCHAR(255), обязательное поле для даты заказа.\n
+            - order_date: VARCHAR(255) или DATE при native_dates=True, обязательное поле для даты заказа.\n
             - barista_id: INT, обязательное поле для идентификатора баристы.\n
             Содержит внешний ключ, связывающийся с полем id из таблицы "barista".\n
             - guest_id: INT, обязательное поле для идентификатора посетителя.\n
@@ -215,17 +284,7 @@ class DatabaseCreator:
 
         В таблице используется автоинкрементируемый первичный ключ для идентификации записей.
         """
-
-        self.cursor.execute('''
-           CREATE TABLE IF NOT EXISTS orders (
-               id INT AUTO_INCREMENT PRIMARY KEY,
-               order_date VARCHAR(255) NOT NULL,
-               barista_id INT NOT NULL,
-               guest_id INT NOT NULL,
-               FOREIGN KEY(barista_id) REFERENCES barista(id),
-               FOREIGN KEY(guest_id) REFERENCES guest(id)
-           )
-       ''')
+        self.create_schema_table('orders')
 
     def BaristaGenerator(self):
         """
@@ -239,14 +298,7 @@ class DatabaseCreator:
 
         В таблице используется автоинкрементируемый первичный ключ для идентификации записей.
         """
-
-        self.cursor.execute('''
-           CREATE TABLE IF NOT EXISTS barista (
-               id INT AUTO_INCREMENT PRIMARY KEY,
-               name VARCHAR(255) NOT NULL,
-               work_time INT NOT NULL
-           )
-        ''')
+        self.create_schema_table('barista')
 
     def GuestGenerator(self):
         """
@@ -260,12 +312,5 @@ class DatabaseCreator:
 
         В таблице используется автоинкрементируемый первичный ключ для идентификации записей.
         """
-
-        self.cursor.execute('''
-           CREATE TABLE IF NOT EXISTS guest (
-               id INT AUTO_INCREMENT PRIMARY KEY,
-               name VARCHAR(255) NOT NULL,
-               contact_number VARCHAR(255) NOT NULL
-           )
-       ''')
+        self.create_schema_table('guest')
 
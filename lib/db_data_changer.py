@@ -1,5 +1,9 @@
 from lib.db_data_pusher import DatabaseDataPusher
 
+# Суффиксы теневой копии и прежней таблицы при замене данных с переименованием
+SHADOW_SUFFIX = "__shadow"
+OLD_SUFFIX = "__old"
+
 class DatabaseDataChanger(DatabaseDataPusher):
     """
     Класс DatabaseDataChanger предоставляет функциональность для вставки, управления и изменения данных в базе данных MySQL.
@@ -8,7 +12,7 @@ class DatabaseDataChanger(DatabaseDataPusher):
         Наследует все атрибуты и методы класса DatabaseDataPusher.
 
     Методы:
-        __init__(host, user, password, db_name, line_count):
+        __init__(host, user, password, db_name, line_count, native_dates=False, backend=None):
             Инициализирует экземпляр DatabaseDataChanger.
             Принимает параметры:
                 host (str): Адрес хоста базы данных.
@@ -16,6 +20,8 @@ class DatabaseDataChanger(DatabaseDataPusher):
                 password (str): Пароль пользователя базы данных.
                 db_name (str): Имя базы данных.
                 line_count (int): Количество строк.
+                native_dates (bool): Генерировать ли даты заказов для колонки DATE.
+                backend (str | Backend): Движок базы данных ('mysql' по умолчанию или 'sqlite').
 
         clear_table(table_name):
             Удаляет все данные из указанной таблицы.
@@ -24,14 +30,29 @@ class DatabaseDataChanger(DatabaseDataPusher):
             Исключения:
                 В случае ошибки выводит сообщение об ошибке.
 
-        replace_table_data(table_name, count=None):
+        replace_table_data(table_name, count=None, swap=False):
             Заменяет все данные в указанной таблице новыми сгенерированными данными.
             Параметры:
                 table_name (str): Имя таблицы.
                 count (int, optional): Количество данных для генерации (по умолчанию None).
+                swap (bool, optional): Загрузить данные в теневую копию и подменить таблицу переименованием.
             Исключения:
                 В случае ошибки выводит сообщение об ошибке.
 
+        swap_table_data(table_name, count=None):
+            Заполняет теневую копию таблицы без вторичных индексов, строит индексы и атомарно подменяет таблицу.
+            Параметры:
+                table_name (str): Имя таблицы.
+                count (int, optional): Количество данных для генерации (по умолчанию None).
+            Исключения:
+                Пробрасывает ошибку, удалив теневую копию.
+
+        get_secondary_indexes(table_name):
+            Возвращает вторичные индексы таблицы из information_schema.
+
+        get_foreign_keys(table_name):
+            Возвращает внешние ключи таблицы и внешние ключи других таблиц, ссылающиеся на нее.
+
         get_method_lambda(method_name):
             Возвращает лямбда-функцию для вызова метода генерации данных в зависимости от имени таблицы.
             Параметры:
@@ -65,7 +86,8 @@ class DatabaseDataChanger(DatabaseDataPusher):
     """
 
 
-    def __init__(self, host, user, password, db_name, line_count):
+    def __init__(self, host, user, password, db_name, line_count, native_dates=False, backend=None,
+                 distributions=None):
         """
         Инициализирует экземпляр DatabaseDataChanger.
 
@@ -75,11 +97,14 @@ class DatabaseDataChanger(DatabaseDataPusher):
             - password (str): Пароль пользователя базы данных.
             - db_name (str): Имя базы данных.
             - line_count (int): Количество строк.
+            - native_dates (bool, optional): Генерировать ли даты заказов для колонки DATE (по умолчанию False).
+            - backend (str | Backend, optional): Движок базы данных ('mysql' по умолчанию или 'sqlite').
+            - distributions (dict, optional): Распределения значений колонок из lib.distributions.
 
         Примечания:
-            - Вызывает конструктор родительского класса DatabaseDataPusher с передачей параметров host, user, password, db_name и line_count.
+            - Вызывает конструктор родительского класса DatabaseDataPusher с передачей параметров host, user, password, db_name, line_count, native_dates, backend и distributions.
         """
-        super().__init__(host, user, password, db_name, line_count)
+        super().__init__(host, user, password, db_name, line_count, native_dates, backend, distributions)
 
     def clear_table(self, table_name):
         """
@@ -91,46 +116,61 @@ class DatabaseDataChanger(DatabaseDataPusher):
         Примечания:
             - В начале временно отключает проверку внешних ключей (SET FOREIGN_KEY_CHECKS = 0).
             - После удаления данных включает проверку внешних ключей (SET FOREIGN_KEY_CHECKS = 1).
+            - В SQLite вместо TRUNCATE выполняется DELETE, а проверка внешних ключей не переключается.
 
         В случае ошибки выводит сообщение об ошибке и ее описание.
         """
 
+        self.key_samplers.pop(table_name, None)
         try:
-            self.cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
-            self.cursor.execute(f"TRUNCATE TABLE {table_name}")
-            self.cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+            for query in self.backend.foreign_key_checks_sql(False):
+                self.cursor.execute(query)
+            self.cursor.execute(self.backend.truncate_sql(table_name))
+            for query in self.backend.foreign_key_checks_sql(True):
+                self.cursor.execute(query)
             self.conn.commit()
             print(f"Все данные из таблицы '{table_name}' успешно удалены.")
         except Exception as e:
             print(f"Ошибка при удалении данных из таблицы '{table_name}':", e)
 
 
-    def replace_table_data(self, table_name, count=None):
+    def replace_table_data(self, table_name, count=None, swap=False):
         """
         Заменяет все данные в указанной таблице новыми сгенерированными данными.
 
         Параметры:
             - table_name (str): Имя таблицы, в которой будут заменены данные.
             - count (int, optional): Количество новых записей, которые необходимо сгенерировать (по умолчанию None).
+            - swap (bool, optional): Загрузить данные в теневую копию и подменить ею таблицу (см. swap_table_data).
+              По умолчанию False - таблица очищается и заполняется на месте.
 
         Примечания:
             - Перед заменой данных вызывает метод clear_table(table_name) для удаления всех существующих данных.
+              Пока идет загрузка, таблица пуста или заполнена частично.
             - Использует метод get_method_lambda(table_name) для получения функции генерации данных в зависимости от имени таблицы.
             - Вызывает полученную функцию для генерации новых данных и их вставки в таблицу.
+            - С swap=True прежние данные видны до самой подмены. Если движок не поддерживает подмену таблиц
+              (supports_table_swap), таблица очищается и заполняется на месте.
             - Выводит сообщение об успешной замене данных в таблице после выполнения операции.
 
         В случае ошибки выводит сообщение об ошибке и ее описание.
         """
+        if swap and not self.backend.supports_table_swap:
+            print(f"Подмена таблицы для движка {self.backend.name} не поддерживается, таблица '{table_name}' очищается.")
+            swap = False
 
         try:
-            # Удаляем все существующие данные
-            self.clear_table(table_name)
+            if swap:
+                self.swap_table_data(table_name, count)
+            else:
+                # Удаляем все существующие данные
+                self.clear_table(table_name)
 
-            # Получаем лямбда-функцию для генерации данных
-            generate_data_function = self.get_method_lambda(table_name)
+                # Получаем лямбда-функцию для генерации данных
+                generate_data_function = self.get_method_lambda(table_name)
 
-            # Генерируем новые данные и сразу их вставляем
-            generate_data_function(count)
+                # Генерируем новые данные и сразу их вставляем
+                generate_data_function(count)
 
 
             print(f"Все данные в таблице '{table_name}' успешно заменены.")
@@ -138,6 +178,122 @@ class DatabaseDataChanger(DatabaseDataPusher):
             print(f"Ошибка при замене данных в таблице '{table_name}':", e)
 
 
+    def swap_table_data(self, table_name, count=None):
+        """
+        Заменяет данные таблицы через теневую копию: копия заполняется без вторичных индексов, затем индексы
+        строятся одним ALTER TABLE, и копия подменяет таблицу одним RENAME TABLE.
+
+        Параметры:
+            - table_name (str): Имя таблицы.
+            - count (int, optional): Количество новых записей (по умолчанию None).
+
+        Примечания:
+            - Копия создается CREATE TABLE ... LIKE: те же колонки, первичный ключ и секционирование. Вторичные
+              индексы удаляются до загрузки и строятся после нее сортировкой, что быстрее обновления индексов
+              на каждой вставке.
+            - CREATE TABLE ... LIKE не копирует внешние ключи, поэтому они добавляются после загрузки
+              с отключенной проверкой внешних ключей, без повторной проверки всех строк.
+            - RENAME TABLE table TO table__old, table__shadow TO table подменяет таблицу атомарно: запросы видят
+              либо прежние, либо новые данные. Внешние ключи других таблиц после подмены пересоздаются
+              со ссылкой на новую таблицу, затем прежняя таблица удаляется.
+            - Ошибка вставки в копию пробрасывается (см. DatabaseDataPusher.PushRows). Перед подменой количество
+              строк копии сверяется с count, а без count - проверяется, что копия не пуста.
+            - При ошибке теневая копия удаляется, а исходная таблица остается нетронутой.
+
+        Исключения:
+            - Пробрасывает ошибку драйвера или генерации после удаления теневой копии.
+        """
+        shadow, old = f"{table_name}{SHADOW_SUFFIX}", f"{table_name}{OLD_SUFFIX}"
+        indexes = self.get_secondary_indexes(table_name)
+        foreign_keys = self.get_foreign_keys(table_name)
+        own_keys = [key for key in foreign_keys if key[1] == table_name]
+        child_keys = [key for key in foreign_keys if key[1] != table_name]
+
+        self.cursor.execute(f"DROP TABLE IF EXISTS {shadow}, {old}")
+        self.cursor.execute(f"CREATE TABLE {shadow} LIKE {table_name}")
+        try:
+            if indexes:
+                self.cursor.execute(f"ALTER TABLE {shadow} " + ", ".join(f"DROP INDEX {name}" for name, _, _ in indexes))
+
+            previous = self.targets
+            self.targets = {**previous, table_name: shadow}
+            try:
+                self.get_method_lambda(table_name)(count)
+            finally:
+                self.targets = previous
+            # Генератор может ничего не вставить без ошибки (например, связи при пустой orders)
+            self.cursor.execute(f"SELECT COUNT(*) FROM {shadow}")
+            loaded = self.cursor.fetchone()[0]
+            if not loaded or (count is not None and loaded != count):
+                raise ValueError(f"В теневую таблицу {shadow} загружено строк: {loaded}, "
+                                 f"ожидалось: {count or 'больше 0'}")
+
+            if indexes:
+                self.cursor.execute(f"ALTER TABLE {shadow} " + ", ".join(
+                    f"ADD {'UNIQUE ' if unique else ''}INDEX {name} ({', '.join(columns)})"
+                    for name, unique, columns in indexes))
+            for query in self.backend.foreign_key_checks_sql(False):
+                self.cursor.execute(query)
+            if own_keys:
+                self.cursor.execute(f"ALTER TABLE {shadow} " + ", ".join(
+                    f"ADD FOREIGN KEY ({', '.join(columns)}) REFERENCES {reference}({', '.join(referenced)})"
+                    for _, _, columns, reference, referenced in own_keys))
+        except Exception:
+            self.cursor.execute(f"DROP TABLE IF EXISTS {shadow}")
+            for query in self.backend.foreign_key_checks_sql(True):
+                self.cursor.execute(query)
+            raise
+
+        self.cursor.execute(f"RENAME TABLE {table_name} TO {old}, {shadow} TO {table_name}")
+        for name, child, columns, _, referenced in child_keys:
+            self.cursor.execute(f"ALTER TABLE {child} DROP FOREIGN KEY {name}, ADD FOREIGN KEY "
+                                f"({', '.join(columns)}) REFERENCES {table_name}({', '.join(referenced)})")
+        self.cursor.execute(f"DROP TABLE {old}")
+        for query in self.backend.foreign_key_checks_sql(True):
+            self.cursor.execute(query)
+        self.conn.commit()
+        self.key_samplers.pop(table_name, None)
+
+    def get_secondary_indexes(self, table_name):
+        """
+        Возвращает вторичные индексы таблицы.
+
+        Параметры:
+            - table_name (str): Имя таблицы.
+
+        Возвращает:
+            - list[tuple]: Индексы (имя, уникальный ли, [колонки в порядке индекса]).
+        """
+        self.cursor.execute(f"SELECT INDEX_NAME, NON_UNIQUE, COLUMN_NAME FROM information_schema.STATISTICS "
+                            f"WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = '{table_name}' "
+                            f"AND INDEX_NAME <> 'PRIMARY' ORDER BY INDEX_NAME, SEQ_IN_INDEX")
+        indexes = {}
+        for name, non_unique, column in self.cursor.fetchall():
+            indexes.setdefault(name, (name, not non_unique, []))[2].append(column)
+        return list(indexes.values())
+
+    def get_foreign_keys(self, table_name):
+        """
+        Возвращает внешние ключи таблицы и внешние ключи других таблиц, ссылающиеся на нее.
+
+        Параметры:
+            - table_name (str): Имя таблицы.
+
+        Возвращает:
+            - list[tuple]: Ключи (имя ограничения, таблица, [колонки], таблица ссылки, [колонки ссылки]).
+        """
+        self.cursor.execute(f"SELECT CONSTRAINT_NAME, TABLE_NAME, COLUMN_NAME, REFERENCED_TABLE_NAME, "
+                            f"REFERENCED_COLUMN_NAME FROM information_schema.KEY_COLUMN_USAGE "
+                            f"WHERE TABLE_SCHEMA = DATABASE() AND REFERENCED_TABLE_NAME IS NOT NULL "
+                            f"AND (TABLE_NAME = '{table_name}' OR REFERENCED_TABLE_NAME = '{table_name}') "
+                            f"ORDER BY TABLE_NAME, CONSTRAINT_NAME, ORDINAL_POSITION")
+        keys = {}
+        for name, table, column, reference, referenced in self.cursor.fetchall():
+            key = keys.setdefault((table, name), (name, table, [], reference, []))
+            key[2].append(column)
+            key[4].append(referenced)
+        return list(keys.values())
+
     def get_method_lambda(self, method_name):
         """
         Возвращает лямбда-функцию для вызова метода генерации данных в зависимости от имени метода.
@@ -166,15 +322,20 @@ class DatabaseDataChanger(DatabaseDataPusher):
         Выполняет произвольный SQL-запрос к базе данных.
 
         Параметры:
-            - query (str): SQL-запрос, который нужно выполнить.
+            - query (str): SQL-запрос, который нужно выполнить. Запрос в синтаксисе MySQL переводится
+              на диалект движка (например, DELETE ... LIMIT для SQLite).
 
         Возвращает:
             - list or None: Результат выполнения SQL-запроса в виде списка кортежей или None в случае ошибки.
 
+        Примечания:
+            - Запрос, отличный от SELECT, может изменить любую таблицу, поэтому сбрасывает все выборки key_samplers.
         """
+        if not query.lstrip().upper().startswith('SELECT'):
+            self.key_samplers.clear()
         try:
             # Выполняем SQL-запрос
-            self.cursor.execute(query)
+            self.cursor.execute(self.backend.translate(query))
             # Получаем результат выполнения запроса
             result = self.cursor.fetchall()
             return result
@@ -1,6 +1,7 @@
-import mysql.connector
-from mysql.connector import errorcode
+from lib.backends import get_backend
 from lib.data_generator import DataGenerator
+from lib.drivers import errorcode
+from lib.schema import SCHEMA, KeySampler
 
 
 class DatabaseDataPusher:
@@ -13,12 +14,21 @@ class DatabaseDataPusher:
         - user (str): Имя пользователя для подключения к базе данных.
         - password (str): Пароль для подключения к базе данных.
         - line_count (int): Количество строк для генерации данных.
-        - data (DataGenerator): Экземпляр генератора данных.
+        - native_dates (bool): Генерировать ли даты заказов объектами datetime.date для колонки DATE.
+        - distributions (dict): Распределения значений колонок {'таблица.колонка': распределение} для генератора данных.
+        - data (DataGenerator): Экземпляр генератора данных, создается при первом обращении.
+        - targets (dict): Перенаправление вставки {таблица: таблица, в которую фактически вставляются строки},
+          например в теневую копию при замене данных. По умолчанию пусто.
+        - key_samplers (dict): Выборки id, построенные GetKeySampler, {таблица: KeySampler}. Сбрасываются
+          при изменении таблицы через методы класса.
+        - backend (Backend): Движок базы данных (MySQL по умолчанию или SQLite).
         - conn (mysql.connector.Connection): Соединение с базой данных.
         - cursor (mysql.connector.Cursor): Курсор для выполнения SQL-запросов.
     """
+    backend = get_backend()
 
-    def __init__(self, host, user, password, db_name, line_count):
+    def __init__(self, host, user, password, db_name, line_count, native_dates=False, backend=None,
+                 distributions=None):
         """
         Инициализирует экземпляр DatabaseDataPusher.
 
@@ -28,16 +38,42 @@ class DatabaseDataPusher:
             - password (str): Пароль для подключения к базе данных.
             - db_name (str): Имя базы данных.
             - line_count (int): Количество строк для генерации данных.
+            - native_dates (bool, optional): Генерировать ли даты заказов объектами datetime.date, которые драйвер
+              передает как значения DATE (по умолчанию False - строки 'MM-DD-YYYY' для VARCHAR).
+            - backend (str | Backend, optional): Движок базы данных: 'mysql' (по умолчанию), 'sqlite' или экземпляр Backend.
+            - distributions (dict, optional): Распределения значений колонок из lib.distributions, например SKEWED
+              (по умолчанию равномерные).
         """
         self.host = host
         self.user = user
         self.password = password
         self.db_name = db_name
         self.line_count = line_count
-        self.data = DataGenerator(line_count)
+        self.native_dates = native_dates
+        self.distributions = distributions
+        self.backend = get_backend(backend)
+        self._data = None
+        self.targets = {}
+        self.key_samplers = {}
         self.conn = None
         self.cursor = None
 
+    @property
+    def data(self) -> DataGenerator:
+        """
+        Генератор данных, создаваемый при первом обращении.
+
+        Примечания:
+            - Соединения, которые только выполняют запросы (например, в замерах query_graph), генератор не создают.
+        """
+        if self._data is None:
+            self._data = DataGenerator(self.line_count, NativeDates=self.native_dates, Distributions=self.distributions)
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+
     def __enter__(self):
         """
         Устанавливает соединение с базой данных и создает курсор.
@@ -46,18 +82,14 @@ class DatabaseDataPusher:
             - DatabaseDataPusher: Текущий экземпляр класса DatabaseDataPusher.
         """
         try:
-            self.conn = mysql.connector.connect(
-                host=self.host,
-                user=self.user,
-                password=self.password,
-                database=self.db_name
-            )
+            self.conn = self.backend.connect(self.host, self.user, self.password, self.db_name)
             self.cursor = self.conn.cursor()
             # print(f"Успешное соединение с БД: {self.db_name} для сохранения сгенерированных данных.")
-        except mysql.connector.Error as err:
-            if err.errno == errorcode.ER_ACCESS_DENIED_ERROR:
+        except self.backend.Error as err:
+            errno = self.backend.error_code(err)
+            if errno == errorcode.ER_ACCESS_DENIED_ERROR:
                 print("Ошибка в указанных параметрах.")
-            elif err.errno == errorcode.ER_BAD_DB_ERROR:
+            elif errno == errorcode.ER_BAD_DB_ERROR:
                 print(f"БД {self.db_name} не найдена.")
             else:
                 print(err)
@@ -85,27 +117,50 @@ class DatabaseDataPusher:
         Параметры:
             - table (str): Имя таблицы.
         """
+        self.key_samplers.pop(table, None)
         try:
             self.cursor.execute(f"DELETE FROM {table};")
         except Exception as e:
             print("Ошибка при удалении данных:", e)
 
-    def PushData(self, table, data):
+    def PushRows(self, table, rows):
         """
-        Вставляет данные в указанную таблицу.
+        Вставляет строки-кортежи в указанную таблицу одним executemany.
 
         Параметры:
             - table (str): Имя таблицы.
-            - data (list): Список объектов, представляющих данные для вставки.
+            - rows (list[tuple]): Строки в порядке колонок таблицы.
+
+        Примечания:
+            - Для таблиц реестра SCHEMA запрос содержит явный список колонок, поэтому порядок значений
+              в кортеже сверяется с реестром, а не с порядком колонок на сервере.
+            - Если таблица есть в targets, строки вставляются в указанную там таблицу, а ошибка вставки
+              не только выводится, но и пробрасывается, чтобы прервать подмену таблицы неполной копией.
         """
+        self.key_samplers.pop(table, None)
         try:
-            data_tuples = [entry.to_turple() for entry in data]
-
-            self.cursor.executemany(f"INSERT INTO {table} VALUES ({', '.join(['%s'] * len(data_tuples[0]))})",
-                                    data_tuples)
+            target = self.targets.get(table, table)
+            if table in SCHEMA:
+                query = SCHEMA[table].insert_sql(self.backend.placeholder, target)
+            else:
+                placeholders = ', '.join([self.backend.placeholder] * len(rows[0]))
+                query = f"INSERT INTO {target} VALUES ({placeholders})"
+            self.cursor.executemany(query, rows)
             self.conn.commit()
         except Exception as e:
             print("Ошибка при добавлении данных:", e)
+            if table in self.targets:
+                raise
+
+    def PushData(self, table, data):
+        """
+        Вставляет данные в указанную таблицу.
+
+        Параметры:
+            - table (str): Имя таблицы.
+            - data (list): Список объектов, представляющих данные для вставки.
+        """
+        self.PushRows(table, [entry.to_turple() for entry in data])
 
 
     def PushGenerateData(self, menuCount=None, guestCount=None, baristaCount=None, orderCount=None, ordersCount=None,
@@ -186,21 +241,67 @@ class DatabaseDataPusher:
         Параметры:
             - ohoCount (int, optional): Количество записей для таблицы orders_has_order.
         """
-        # Сначала получаем существующие идентификаторы заказов из таблицы orders
-        existing_order_ids = self.GetExistingOrderIDs()
+        # Сначала получаем диапазон и пропуски идентификаторов заказов из таблицы orders
+        order_ids = self.GetKeySampler("orders")
+        if order_ids is None:
+            print("Таблица orders пуста: связи заказов не сгенерированы.")
+            return
 
-        # Затем генерируем данные для таблицы orders_has_order, используя существующие идентификаторы
-        orders_has_order_data = self.data.Orders_has_OrderGenerator(ohoCount, existing_order_ids)
+        # Затем генерируем данные для таблицы orders_has_order, выбирая идентификаторы из диапазона
+        orders_has_order_data = self.data.Orders_has_OrderGenerator(ohoCount, order_ids)
 
         # Вставляем сгенерированные данные в таблицу orders_has_order
         self.PushData("orders_has_order", orders_has_order_data)
 
+    def GetKeySampler(self, table, refresh=False):
+        """
+        Строит выборку существующих id таблицы по MIN(id)/MAX(id) и пропускам, не читая все id.
+
+        Параметры:
+            - table (str): Имя родительской таблицы.
+            - refresh (bool, optional): Перечитать выборку, даже если она уже построена (по умолчанию False).
+
+        Возвращает:
+            - KeySampler | None: Выборка id или None, если таблица пуста.
+
+        Примечания:
+            - MIN(id) и MAX(id) читаются по первичному ключу, а COUNT(*) просматривает индекс таблицы целиком.
+              Если COUNT(*) совпадает с MAX(id) - MIN(id) + 1, id идут без пропусков и других запросов нет.
+            - Иначе двумя самосоединениями, каждое из которых тоже просматривает всю таблицу, читаются только
+              границы пропусков. Передается O(количества пропусков) строк вместо всех id, но время запросов
+              растет с размером таблицы.
+            - Поэтому выборка запоминается в key_samplers и повторные вызовы запросов не выполняют. Вставка
+              и удаление через методы класса сбрасывают выборку таблицы; если таблицу меняют другие
+              соединения, передайте refresh=True.
+        """
+        if not refresh and table in self.key_samplers:
+            return self.key_samplers[table]
+        self.cursor.execute(f"SELECT COUNT(*), MIN(id), MAX(id) FROM {table}")
+        count, min_id, max_id = self.cursor.fetchone()
+        if not count:
+            sampler = None
+        elif count == max_id - min_id + 1:
+            sampler = KeySampler(min_id, max_id)
+        else:
+            self.cursor.execute(f"SELECT t.id + 1 FROM {table} t LEFT JOIN {table} n ON n.id = t.id + 1 "
+                                f"WHERE n.id IS NULL AND t.id < {max_id} ORDER BY t.id")
+            starts = [row[0] for row in self.cursor.fetchall()]
+            self.cursor.execute(f"SELECT t.id - 1 FROM {table} t LEFT JOIN {table} p ON p.id = t.id - 1 "
+                                f"WHERE p.id IS NULL AND t.id > {min_id} ORDER BY t.id")
+            ends = [row[0] for row in self.cursor.fetchall()]
+            sampler = KeySampler.from_gaps(min_id, max_id, list(zip(starts, ends)))
+        self.key_samplers[table] = sampler
+        return sampler
+
     def GetExistingOrderIDs(self):
         """
         Получает существующие идентификаторы заказов из таблицы orders.
 
         Возвращает:
             - list: Список существующих идентификаторов заказов.
+
+        Примечания:
+            - Читает все id таблицы. Для выборки внешних ключей используйте GetKeySampler.
         """
         query = "SELECT id FROM orders"
         self.cursor.execute(query)
@@ -1,5 +1,9 @@
-import mysql.connector
-from mysql.connector import errorcode
+from concurrent.futures import ThreadPoolExecutor
+from lib.backends import get_backend
+from lib.drivers import errorcode
+
+# Корневые таблицы выборки по умолчанию: сущности схемы кафе, из которых выводятся остальные строки
+DEFAULT_SAMPLE_ROOTS = ("guest", "orders")
 
 
 class SandboxCreator:
@@ -12,10 +16,16 @@ class SandboxCreator:
         - password (str): Пароль для подключения к базе данных.
         - original_db_name (str): Имя оригинальной базы данных.
         - sandbox_db_name (str): Имя базы данных песочницы.
-        - conn (mysql.connector.Connection): Соединение с базой данных.
-        - cursor (mysql.connector.Cursor): Курсор для выполнения SQL-запросов.
+        - workers (int): Количество потоков для параллельного копирования данных таблиц.
+        - sample_percent (float or None): Процент строк корневых таблиц, копируемых в песочницу. None - копировать все строки.
+        - sample_roots (list or None): Корневые таблицы для выборки подмножества.
+        - seed (int or None): Зерно генератора случайных чисел для воспроизводимой выборки.
+        - backend (Backend): Движок базы данных. Для SQLite песочница - копия файла исходной базы.
+        - conn: Соединение DB-API с базой данных, открытое через движок.
+        - cursor: Курсор для выполнения SQL-запросов.
     """
-    def __init__(self, host, user, password, original_db, sandbox_db):
+    def __init__(self, host, user, password, original_db, sandbox_db, workers=1, sample_percent=None,
+                 sample_roots=None, seed=None, backend=None):
         """
         Инициализирует экземпляр SandboxCreator.
 
@@ -25,12 +35,23 @@ class SandboxCreator:
             - password (str): Пароль для подключения к базе данных.
             - original_db (str): Имя оригинальной базы данных.
             - sandbox_db (str): Имя базы данных песочницы.
+            - workers (int, optional): Количество потоков для параллельного копирования данных (по умолчанию 1).
+            - sample_percent (float, optional): Процент строк корневых таблиц для копирования (по умолчанию копируются все строки).
+            - sample_roots (list, optional): Корневые таблицы выборки, например ['orders'].
+              По умолчанию - DEFAULT_SAMPLE_ROOTS (guest и orders).
+            - seed (int, optional): Зерно для воспроизводимой выборки (по умолчанию выборка случайна).
+            - backend (str | Backend, optional): Движок базы данных: 'mysql' (по умолчанию), 'sqlite' или экземпляр Backend.
         """
         self.host = host
         self.user = user
         self.password = password
         self.original_db_name = original_db
         self.sandbox_db_name = sandbox_db
+        self.workers = workers
+        self.sample_percent = sample_percent
+        self.sample_roots = sample_roots
+        self.seed = seed
+        self.backend = get_backend(backend)
         self.conn = None
         self.cursor = None
 
@@ -43,7 +64,10 @@ class SandboxCreator:
        """
         self.connect()
         self.create_sandbox()
-        self.conn.database = self.sandbox_db_name
+        if self.backend.server:
+            self.backend.use_database(self.conn, self.sandbox_db_name)
+        else:
+            self.connect(self.sandbox_db_name)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -57,24 +81,27 @@ class SandboxCreator:
         Устанавливает соединение с базой данных и создает курсор.
 
         Параметры:
-            - db_name (str, optional): Имя базы данных для подключения. Если не указано, используется значение по умолчанию.
+            - db_name (str, optional): Имя базы данных для подключения. Если не указано, используется значение по умолчанию
+              (для SQLite - исходная база данных).
+
+        Примечания:
+            - Ранее открытые соединение и курсор закрываются перед созданием новых.
 
         Исключения:
-            - mysql.connector.Error: Ошибка подключения к базе данных, например, неверные параметры или база данных не найдена.
+            - backend.Error: Ошибка драйвера движка при подключении к базе данных, например, неверные параметры или база данных не найдена.
         """
+        self.close()
+        if not self.backend.server:
+            db_name = db_name or self.original_db_name
         try:
-            self.conn = mysql.connector.connect(
-                host=self.host,
-                user=self.user,
-                password=self.password,
-                database=db_name
-            )
+            self.conn = self.backend.connect(self.host, self.user, self.password, db_name)
             self.cursor = self.conn.cursor()
             print(f"Успешное соединение с БД: {db_name} - для создания песочницы")
-        except mysql.connector.Error as err:
-            if err.errno == errorcode.ER_ACCESS_DENIED_ERROR:
+        except self.backend.Error as err:
+            errno = self.backend.error_code(err)
+            if errno == errorcode.ER_ACCESS_DENIED_ERROR:
                 print("Ошибка в указанных параметрах.")
-            elif err.errno == errorcode.ER_BAD_DB_ERROR:
+            elif errno == errorcode.ER_BAD_DB_ERROR:
                 print(f"БД {db_name} не найдена.")
             else:
                 print(err)
@@ -86,8 +113,10 @@ class SandboxCreator:
         """
         if self.cursor:
             self.cursor.close()
+            self.cursor = None
         if self.conn:
             self.conn.close()
+            self.conn = None
 
     def create_sandbox(self):
         """
@@ -98,101 +127,284 @@ class SandboxCreator:
             - Если база данных уже существует, выводит соответствующее сообщение.
             - Если произошла ошибка при создании базы данных, выводит сообщение об ошибке.
             - После успешного создания базы данных вызывается метод `copy_tables` для копирования таблиц.
+            - Для SQLite файл исходной базы копируется целиком встроенным резервным копированием,
+              выборка подмножества (`sample_percent`) не поддерживается.
         """
+        if not self.backend.server:
+            if self.sample_percent is not None:
+                print("Выборка подмножества для SQLite не поддерживается, копируется вся база данных.")
+            self.backend.clone_database(self.original_db_name, self.sandbox_db_name)
+            print(f"Песочница {self.sandbox_db_name} успешно создана.")
+            return
         try:
             self.cursor.execute(f"CREATE DATABASE {self.sandbox_db_name}")
             print(f"Песочница {self.sandbox_db_name} успешно создана.")
-        except mysql.connector.Error as err:
-            if err.errno == errorcode.ER_DB_CREATE_EXISTS:
+        except self.backend.Error as err:
+            if self.backend.error_code(err) == errorcode.ER_DB_CREATE_EXISTS:
                 print(f"Песочница {self.sandbox_db_name} уже существует.")
             else:
-                print(err.msg)
+                print(err)
+
+        self.copy_tables(self.workers)
+
+    def sandbox_exists(self) -> bool:
+        """
+        Проверяет, существует ли база данных песочницы.
+
+        Возвращает:
+            - bool: True, если база данных с именем `self.sandbox_db_name` существует.
+        """
+        if not self.backend.server:
+            return self.backend.database_exists(self.sandbox_db_name)
+        self.cursor.execute(
+            "SELECT SCHEMA_NAME FROM information_schema.SCHEMATA WHERE SCHEMA_NAME = %s",
+            (self.sandbox_db_name,)
+        )
+        return self.cursor.fetchone() is not None
+
+    def drop_sandbox(self):
+        """
+        Удаляет базу данных песочницы, если она существует.
+        """
+        if self.backend.server:
+            self.cursor.execute(f"DROP DATABASE IF EXISTS {self.sandbox_db_name}")
+        else:
+            self.backend.drop_database(self.sandbox_db_name)
+        print(f"Песочница {self.sandbox_db_name} удалена.")
+
+    def reset_sandbox(self, tables=None):
+        """
+        Возвращает данные песочницы к состоянию исходной базы данных без пересоздания таблиц.
 
-        self.copy_tables()
+        Параметры:
+            - tables (list, optional): Таблицы, которые нужно восстановить. По умолчанию восстанавливаются все таблицы.
 
-    def get_table_dependencies(self) -> dict:
+        Примечания:
+            - Таблицы очищаются через TRUNCATE и заполняются заново запросом `INSERT ... SELECT`
+              при отключенной проверке внешних ключей.
+            - Если изменялась только часть таблиц, достаточно передать их в `tables`.
+            - Для SQLite песочница копируется из исходной базы заново целиком.
+        """
+        if not self.backend.server:
+            self.backend.clone_database(self.original_db_name, self.sandbox_db_name)
+            return
+        if tables is None:
+            tables = list(self.get_table_dependencies())
+
+        self.cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+        for table_name in tables:
+            self.cursor.execute(f"TRUNCATE TABLE {self.sandbox_db_name}.{table_name}")
+            self.copy_table_data(table_name)
+        self.cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+        self.conn.commit()
+
+    def get_foreign_keys(self) -> list[tuple[str, str, str, str]]:
+        """
+        Получает описание всех внешних ключей исходной базы данных одним запросом.\n
+
+        Метаданные читаются из `information_schema.KEY_COLUMN_USAGE` текущим соединением,
+        без переподключения к исходной базе данных и без `SHOW CREATE TABLE` для каждой таблицы.
+
+        Возвращает:
+            - list[tuple[str, str, str, str]]: Список кортежей (таблица, столбец, таблица-родитель, столбец-родитель).
+        """
+        self.cursor.execute(
+            "SELECT TABLE_NAME, COLUMN_NAME, REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME "
+            "FROM information_schema.KEY_COLUMN_USAGE "
+            "WHERE TABLE_SCHEMA = %s AND REFERENCED_TABLE_NAME IS NOT NULL",
+            (self.original_db_name,)
+        )
+        return [tuple(row) for row in self.cursor.fetchall()]
+
+    def get_table_dependencies(self, foreign_keys=None) -> dict:
         """
         Определяет зависимости таблиц в базе данных.\n
 
-        Подключается к исходной базе данных, получает список всех таблиц и анализирует их
-        для определения зависимостей. Зависимости определяются по наличию упоминаний других
-        таблиц в SQL-запросах на создание таблиц.
+        Получает список таблиц исходной базы данных и строит зависимости по реальным внешним ключам,
+        прочитанным методом `get_foreign_keys()`.
+
+        Параметры:
+            - foreign_keys (list, optional): Уже прочитанные внешние ключи. По умолчанию читаются методом `get_foreign_keys()`.
 
         Возвращает:
-            - dict: Словарь, где ключи - это имена таблиц, а значения - списки зависимых таблиц.
+            - dict: Словарь, где ключи - это имена таблиц, а значения - списки таблиц, на которые они ссылаются.
 
         Примечания:
-            - Подключается к базе данных, имя которой указано в `self.original_db_name`.
-            - Для каждой таблицы выполняет запрос "SHOW CREATE TABLE", чтобы получить SQL-запрос
-              создания таблицы и анализирует его на наличие имен других таблиц.
-            - Если имя другой таблицы найдено в SQL-запросе и оно не совпадает с текущим именем
-              таблицы, то оно добавляется в список зависимостей.
-        """
-        self.connect(self.original_db_name)
-        self.cursor.execute("SHOW TABLES")
+            - Используется текущее соединение, имя исходной базы данных передается явно.
+            - Ссылка таблицы на саму себя и ссылки на таблицы других баз данных не считаются зависимостями.
+        """
+        self.cursor.execute(f"SHOW TABLES FROM {self.original_db_name}")
         tables = [table[0] for table in self.cursor.fetchall()]
 
         dependencies = {table: [] for table in tables}
 
-        for table in tables:
-            self.cursor.execute(f"SHOW CREATE TABLE {table}")
-            create_table_stmt = self.cursor.fetchone()[1]
+        if foreign_keys is None:
+            foreign_keys = self.get_foreign_keys()
 
-            for other_table in tables:
-                if other_table in create_table_stmt and other_table != table:
-                    dependencies[table].append(other_table)
+        for table, _, referenced_table, _ in foreign_keys:
+            if (table in dependencies and referenced_table in dependencies and referenced_table != table
+                    and referenced_table not in dependencies[table]):
+                dependencies[table].append(referenced_table)
 
         return dependencies
 
-    def copy_tables(self):
+    def copy_tables(self, workers=1):
         """
            Копирует таблицы из исходной базы данных в песочницу с учетом их зависимостей.\n
 
-           Определяет зависимости таблиц, упорядочивает их в правильном порядке и копирует данные
-           из каждой таблицы исходной базы данных в соответствующую таблицу в базе данных песочницы.
+           Все операции выполняются на одном соединении: структура таблиц создается при отключенной
+           проверке внешних ключей, а данные копируются на стороне сервера запросом `INSERT ... SELECT`.
+
+           Параметры:
+               - workers (int, optional): Количество потоков для параллельного копирования данных (по умолчанию 1).
 
            Алгоритм:
                1. Определяет зависимости таблиц с помощью метода `get_table_dependencies()`.
-               2. Разрешает зависимости таблиц, чтобы определить правильный порядок копирования.
-               3. Для каждой таблицы:
-                   - Подключается к исходной базе данных.
-                   - Получает SQL-запрос создания таблицы.
-                   - Подключается к базе данных песочницы.
-                   - Создает таблицу в базе данных песочницы.
-                   - Подключается к исходной базе данных.
-                   - Копирует данные из исходной таблицы в соответствующую таблицу в песочнице.
-               4. Подключается к базе данных песочницы.
+               2. Разрешает зависимости таблиц, чтобы определить порядок копирования.
+               3. Отключает проверку внешних ключей и создает все таблицы в песочнице.
+               4. Копирует данные каждой таблицы запросом `INSERT ... SELECT`.
+               5. Включает проверку внешних ключей и делает песочницу текущей базой данных соединения.
 
            Примечания:
-               - Для каждой таблицы сначала создается таблица в песочнице с использованием SQL-запроса
-                 создания таблицы, полученного из исходной базы данных.
-               - Затем данные из исходной таблицы копируются в новую таблицу в песочнице.
-               - В конце метод устанавливает подключение к базе данных песочницы.
+               - При workers > 1 данные копируются параллельно по уровням зависимостей (см. `resolve_dependency_levels`),
+                 каждый поток использует свое соединение.
+               - Если задан `sample_percent`, вместо полного копирования вызывается `copy_subset`.
            """
-        dependencies = self.get_table_dependencies()
-        ordered_tables = self.resolve_dependencies(dependencies)
+        foreign_keys = self.get_foreign_keys() if self.sample_percent is not None else None
+        dependencies = self.get_table_dependencies(foreign_keys)
+        levels = self.resolve_dependency_levels(dependencies)
+        ordered_tables = [table for level in levels for table in level]
 
+        self.cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+        create_table_stmts = []
         for table_name in ordered_tables:
-            self.connect(self.original_db_name)
-            self.cursor.execute(f"SHOW CREATE TABLE {table_name}")
-            create_table_stmt = self.cursor.fetchone()[1]
+            self.cursor.execute(f"SHOW CREATE TABLE {self.original_db_name}.{table_name}")
+            create_table_stmts.append(self.cursor.fetchone()[1])
 
-            self.connect(self.sandbox_db_name)
+        self.backend.use_database(self.conn, self.sandbox_db_name)
+        for create_table_stmt in create_table_stmts:
             self.cursor.execute(create_table_stmt)
 
-            self.connect(self.original_db_name)
-            self.cursor.execute(f"INSERT INTO {self.sandbox_db_name}.{table_name} SELECT * FROM {self.original_db_name}.{table_name}")
+        if self.sample_percent is not None:
+            self.copy_subset(ordered_tables, foreign_keys)
+        elif workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for level in levels:
+                    list(executor.map(self.copy_table_data_in_new_connection, level))
+        else:
+            for table_name in ordered_tables:
+                self.copy_table_data(table_name)
+
+        self.cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+        self.conn.commit()
+
+    def copy_table_data(self, table_name, cursor=None):
+        """
+        Копирует данные таблицы из исходной базы данных в песочницу на стороне сервера.
+
+        Параметры:
+            - table_name (str): Имя таблицы.
+            - cursor (optional): Курсор для выполнения запроса. По умолчанию используется `self.cursor`.
+        """
+        cursor = cursor or self.cursor
+        cursor.execute(
+            f"INSERT INTO {self.sandbox_db_name}.{table_name} SELECT * FROM {self.original_db_name}.{table_name}"
+        )
+
+    def copy_subset(self, ordered_tables, foreign_keys):
+        """
+        Копирует в песочницу согласованное подмножество данных исходной базы данных.\n
+
+        Из корневых таблиц выбирается `sample_percent` процентов строк, после чего в песочницу попадают
+        ровно те строки остальных таблиц, которые нужны для ссылочной целостности.
+
+        Параметры:
+            - ordered_tables (list): Таблицы в порядке разрешения зависимостей (родители раньше потомков).
+            - foreign_keys (list): Внешние ключи в формате `get_foreign_keys()`.
+
+        Алгоритм:
+            1. Из корневых таблиц копируется случайная выборка строк (`RAND(seed + i) < sample_percent / 100`,
+               где i - номер корневой таблицы, чтобы выборки разных таблиц не совпадали по позициям строк).
+            2. Таблицы, транзитивно ссылающиеся на корневые, заполняются строками, которые ссылаются
+               на уже скопированные строки (например, orders_has_order для выбранных orders).
+            3. Таблицы обходятся от потомков к родителям, и для каждой ссылки в песочницу добавляются
+               недостающие строки родительской таблицы (barista, guest, personal_order, menu).
+
+        Примечания:
+            - Выполняется при отключенной проверке внешних ключей, все запросы выполняются на стороне сервера.
+            - Для повторяемой выборки задайте `seed`.
+
+        Исключения:
+            - ValueError: Если `sample_roots` не задан, а в базе нет таблиц DEFAULT_SAMPLE_ROOTS.
+        """
+        roots = self.sample_roots
+        if roots is None:
+            roots = [table for table in ordered_tables if table.lower() in DEFAULT_SAMPLE_ROOTS]
+            if not roots:
+                raise ValueError(f"В базе нет таблиц {', '.join(DEFAULT_SAMPLE_ROOTS)}: укажите sample_roots явно")
+
+        for index, table_name in enumerate(roots):
+            rand = f"RAND({int(self.seed) + index})" if self.seed is not None else "RAND()"
+            self.cursor.execute(
+                f"INSERT INTO {self.sandbox_db_name}.{table_name} SELECT * FROM {self.original_db_name}.{table_name} "
+                f"WHERE {rand} < {float(self.sample_percent) / 100}"
+            )
 
-            self.conn.commit()
+        # Потомки корневых таблиц: берем только строки, ссылающиеся на выбранные строки
+        filled = set(roots)
+        for table_name in ordered_tables:
+            if table_name in filled:
+                continue
+            conditions = [
+                f"{column} IN (SELECT {referenced_column} FROM {self.sandbox_db_name}.{referenced_table})"
+                for table, column, referenced_table, referenced_column in foreign_keys
+                if table == table_name and referenced_table in filled and referenced_table != table_name
+            ]
+            if conditions:
+                self.cursor.execute(
+                    f"INSERT INTO {self.sandbox_db_name}.{table_name} SELECT * FROM {self.original_db_name}.{table_name} "
+                    f"WHERE {' AND '.join(conditions)}"
+                )
+                filled.add(table_name)
+
+        # Родители: добираем строки, на которые ссылаются уже скопированные строки
+        for table_name in reversed(ordered_tables):
+            for table, column, referenced_table, referenced_column in foreign_keys:
+                if table == table_name and referenced_table != table_name:
+                    self.cursor.execute(
+                        f"INSERT IGNORE INTO {self.sandbox_db_name}.{referenced_table} "
+                        f"SELECT * FROM {self.original_db_name}.{referenced_table} "
+                        f"WHERE {referenced_column} IN (SELECT {column} FROM {self.sandbox_db_name}.{table_name})"
+                    )
+
+    def copy_table_data_in_new_connection(self, table_name):
+        """
+        Копирует данные таблицы в отдельном соединении. Используется при параллельном копировании.
+
+        Параметры:
+            - table_name (str): Имя таблицы.
 
-        self.connect(self.sandbox_db_name)
+        Примечания:
+            - Соединения драйвера нельзя разделять между потоками, поэтому каждый поток открывает свое
+              через тот же движок и драйвер, что и основное соединение.
+        """
+        conn = self.backend.connect(self.host, self.user, self.password)
+        try:
+            cursor = conn.cursor()
+            for query in self.backend.foreign_key_checks_sql(False):
+                cursor.execute(query)
+            self.copy_table_data(table_name, cursor)
+            conn.commit()
+            cursor.close()
+        finally:
+            conn.close()
 
     def resolve_dependencies(self, dependencies) -> list:
         """
         Разрешает зависимости таблиц и определяет правильный порядок для их копирования.\n
 
-        Этот метод использует алгоритм обхода графа с рекурсией для определения порядка,
-        в котором таблицы должны быть скопированы, чтобы учесть их зависимости.
+        Порядок строится итеративной топологической сортировкой (алгоритм Кана) по уровням,
+        полученным методом `resolve_dependency_levels`.
 
         Параметры:
             - dependencies (dict): Словарь, где ключи - это имена таблиц, а значения - списки имен таблиц, от которых они зависят.
@@ -202,49 +414,58 @@ class SandboxCreator:
 
         Исключения:
             - Exception: Если обнаружена циклическая зависимость между таблицами.
-
-        Алгоритм:
-            1. Инициализирует списки `resolved` для хранения таблиц без неудовлетворенных зависимостей и `unresolved` для хранения таблиц с неудовлетворенными зависимостями.
-            2. Определяет внутреннюю рекурсивную функцию `resolve`, которая:
-                - Добавляет таблицу в `unresolved` если она еще не в `resolved`.
-                - Для каждой зависимости таблицы вызывает `resolve` рекурсивно.
-                - Добавляет таблицу в `resolved` и удаляет из `unresolved` после обработки всех зависимостей.
-            3. Обходит каждую таблицу в `dependencies`, вызывая `resolve` для каждой таблицы.
-            4. Возвращает список `resolved` как результат.
-
-        Примечание:
-            - В случае обнаружения циклической зависимости выбрасывается исключение с сообщением об ошибке.
         """
-        resolved = []
-        unresolved = []
-
-        def resolve(table):
-            """
-            Рекурсивно разрешает зависимости таблиц.
-
-            Рекурсивно обходит зависимости таблицы и добавляет их в список resolved,
-            убеждаясь при этом, что нет циклических зависимостей.
+        return [table for level in self.resolve_dependency_levels(dependencies) for table in level]
 
-            Параметры:
-                - table (str): Название таблицы, для которой разрешаются зависимости.
+    def resolve_dependency_levels(self, dependencies) -> list[list]:
+        """
+        Разбивает таблицы на уровни, которые можно копировать параллельно.\n
 
-            Исключения:
-                - Exception: Возникает, если обнаружена циклическая зависимость между таблицами.
+        На нулевом уровне находятся таблицы без зависимостей, на каждом следующем - таблицы,
+        все зависимости которых лежат на предыдущих уровнях. Таблицы одного уровня не зависят друг от друга.
 
-            """
-            if table not in resolved:
-                unresolved.append(table)
-                for dep in dependencies[table]:
-                    if dep not in resolved:
-                        if dep in unresolved:
-                            raise Exception(f"Обнаружена циклическая зависимость: {table} -> {dep}")
-                        resolve(dep)
-                resolved.append(table)
-                unresolved.remove(table)
+        Параметры:
+            - dependencies (dict): Словарь, где ключи - это имена таблиц, а значения - списки имен таблиц, от которых они зависят.
 
-        for table in dependencies:
-            resolve(table)
+        Возвращает:
+            - list[list]: Список уровней, каждый уровень - список имен таблиц в порядке их следования в `dependencies`.
 
-        return resolved
+        Исключения:
+            - Exception: Если обнаружена циклическая зависимость между таблицами.
 
+        Алгоритм:
+            1. Для каждой таблицы считает количество неразрешенных зависимостей и строит обратные ребра.
+            2. Таблицы с нулевым количеством зависимостей образуют текущий уровень.
+            3. Для таблиц, зависящих от таблиц текущего уровня, уменьшает счетчик; обнулившиеся образуют следующий уровень.
+            4. Если после обхода остались таблицы, между ними есть цикл.
 
+        Примечание:
+            - Зависимости от таблиц, отсутствующих в `dependencies`, и ссылки таблицы на саму себя игнорируются.
+        """
+        remaining = {}
+        dependents = {table: [] for table in dependencies}
+        for table, deps in dependencies.items():
+            deps = {dep for dep in deps if dep in dependencies and dep != table}
+            remaining[table] = len(deps)
+            for dep in deps:
+                dependents[dep].append(table)
+
+        levels = []
+        level = [table for table in dependencies if remaining[table] == 0]
+        resolved_count = 0
+        while level:
+            levels.append(level)
+            resolved_count += len(level)
+            next_level = set()
+            for table in level:
+                for dependent in dependents[table]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        next_level.add(dependent)
+            level = [table for table in dependencies if table in next_level]
+
+        if resolved_count != len(dependencies):
+            cycle = [table for table in dependencies if remaining[table] > 0]
+            raise Exception(f"Обнаружена циклическая зависимость между таблицами: {', '.join(cycle)}")
+
+        return levels
@@ -0,0 +1,207 @@
+import queue
+from contextlib import contextmanager
+from lib.db_sandbox_creator import SandboxCreator
+
+
+class SandboxPool:
+    """
+    Пул заранее подготовленных песочниц, клонируемых из шаблонной базы данных.
+
+    Шаблон - это однократно заполненная копия оригинальной базы данных. Новые песочницы создаются
+    копированием шаблона на стороне сервера, а не повторным чтением оригинальной базы данных.
+    Песочницы выдаются во временное пользование методом `lease` и после `release` возвращаются
+    к состоянию шаблона, поэтому следующему пользователю не нужно ждать создания новой песочницы.
+
+    Атрибуты:
+        - host (str): Хост для подключения к базе данных.
+        - user (str): Имя пользователя для подключения к базе данных.
+        - password (str): Пароль для подключения к базе данных.
+        - original_db_name (str): Имя оригинальной базы данных.
+        - template_db_name (str): Имя шаблонной базы данных.
+        - prefix (str): Префикс имен песочниц пула.
+        - size (int): Количество песочниц в пуле.
+        - workers (int): Количество потоков для параллельного копирования таблиц.
+        - refresh_template (bool): Пересоздавать ли шаблон, даже если он уже существует.
+        - sandboxes (list): Имена всех песочниц пула.
+
+    Пример использования:
+        with SandboxPool('localhost', 'root', '123456', 'my_database', size=2) as pool:
+            with pool.sandbox(dirty_tables=['menu']) as sandbox_db:
+                ...
+    """
+
+    def __init__(self, host, user, password, original_db, size=1, template_db=None, prefix=None, workers=1,
+                 refresh_template=False):
+        """
+        Инициализирует экземпляр SandboxPool.
+
+        Параметры:
+            - host (str): Хост для подключения к базе данных.
+            - user (str): Имя пользователя для подключения к базе данных.
+            - password (str): Пароль для подключения к базе данных.
+            - original_db (str): Имя оригинальной базы данных.
+            - size (int, optional): Количество песочниц в пуле (по умолчанию 1).
+            - template_db (str, optional): Имя шаблонной базы данных (по умолчанию '<original_db>_template').
+            - prefix (str, optional): Префикс имен песочниц (по умолчанию '<original_db>_sandbox').
+            - workers (int, optional): Количество потоков для параллельного копирования таблиц (по умолчанию 1).
+            - refresh_template (bool, optional): Пересоздать шаблон из оригинальной базы данных (по умолчанию False).
+        """
+        self.host = host
+        self.user = user
+        self.password = password
+        self.original_db_name = original_db
+        self.template_db_name = template_db or f"{original_db}_template"
+        self.prefix = prefix or f"{original_db}_sandbox"
+        self.size = size
+        self.workers = workers
+        self.refresh_template = refresh_template
+        self.sandboxes = [f"{self.prefix}_{i}" for i in range(size)]
+        self._free = queue.Queue()
+
+    def __enter__(self):
+        """
+        Подготавливает шаблон и все песочницы пула при входе в контекст.
+
+        Возвращает:
+            - SandboxPool: Текущий экземпляр класса SandboxPool.
+        """
+        self.prepare()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        При выходе из контекста песочницы не удаляются, чтобы их можно было переиспользовать при следующем запуске.
+        """
+        pass
+
+    def creator(self, source_db, target_db) -> SandboxCreator:
+        """
+        Создает SandboxCreator для копирования `source_db` в `target_db` и подключается к серверу.
+
+        Параметры:
+            - source_db (str): Имя базы данных - источника.
+            - target_db (str): Имя базы данных - приемника.
+
+        Возвращает:
+            - SandboxCreator: Подключенный экземпляр SandboxCreator.
+        """
+        creator = SandboxCreator(self.host, self.user, self.password, source_db, target_db, workers=self.workers)
+        creator.connect()
+        return creator
+
+    def prepare_template(self):
+        """
+        Создает шаблонную базу данных из оригинальной, если шаблона нет или требуется его обновление.
+
+        Примечания:
+            - Существующий шаблон переиспользуется без копирования данных, если `refresh_template` равен False.
+        """
+        creator = self.creator(self.original_db_name, self.template_db_name)
+        try:
+            if self.refresh_template or not creator.sandbox_exists():
+                creator.drop_sandbox()
+                creator.create_sandbox()
+            else:
+                print(f"Шаблон {self.template_db_name} уже существует и будет переиспользован.")
+        finally:
+            creator.close()
+
+    def provision(self, sandbox_db):
+        """
+        Создает песочницу из шаблона либо возвращает существующую песочницу к состоянию шаблона.
+
+        Параметры:
+            - sandbox_db (str): Имя песочницы.
+        """
+        creator = self.creator(self.template_db_name, sandbox_db)
+        try:
+            if creator.sandbox_exists() and not self.refresh_template:
+                creator.reset_sandbox()
+            else:
+                creator.drop_sandbox()
+                creator.create_sandbox()
+        finally:
+            creator.close()
+
+    def prepare(self):
+        """
+        Подготавливает шаблон и все песочницы пула и помечает песочницы как свободные.
+        """
+        self.prepare_template()
+        for sandbox_db in self.sandboxes:
+            self.provision(sandbox_db)
+            self._free.put(sandbox_db)
+
+    def lease(self, timeout=None) -> str:
+        """
+        Выдает свободную песочницу во временное пользование.
+
+        Параметры:
+            - timeout (float, optional): Максимальное время ожидания свободной песочницы в секундах. По умолчанию ждет бесконечно.
+
+        Возвращает:
+            - str: Имя выданной песочницы.
+
+        Исключения:
+            - TimeoutError: Если за `timeout` секунд не освободилась ни одна песочница.
+        """
+        try:
+            return self._free.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"Нет свободных песочниц в пуле {self.prefix}")
+
+    def reset(self, sandbox_db, dirty_tables=None):
+        """
+        Восстанавливает данные песочницы из шаблона.
+
+        Параметры:
+            - sandbox_db (str): Имя песочницы.
+            - dirty_tables (list, optional): Таблицы, которые изменялись. По умолчанию восстанавливаются все таблицы.
+              Пустой список означает, что песочница не изменялась и восстанавливать ничего не нужно.
+        """
+        if dirty_tables is None or dirty_tables:
+            creator = self.creator(self.template_db_name, sandbox_db)
+            try:
+                creator.reset_sandbox(dirty_tables)
+            finally:
+                creator.close()
+
+    def release(self, sandbox_db, dirty_tables=None):
+        """
+        Возвращает песочницу в пул, предварительно восстанавливая ее данные из шаблона.
+
+        Параметры:
+            - sandbox_db (str): Имя песочницы.
+            - dirty_tables (list, optional): Таблицы, которые изменялись (см. reset).
+        """
+        self.reset(sandbox_db, dirty_tables)
+        self._free.put(sandbox_db)
+
+    @contextmanager
+    def sandbox(self, dirty_tables=None, timeout=None):
+        """
+        Контекстный менеджер, выдающий песочницу и возвращающий ее в пул при выходе.
+
+        Параметры:
+            - dirty_tables (list, optional): Таблицы, которые будут изменены внутри контекста.
+            - timeout (float, optional): Максимальное время ожидания свободной песочницы в секундах.
+
+        Возвращает:
+            - str: Имя выданной песочницы.
+        """
+        sandbox_db = self.lease(timeout)
+        try:
+            yield sandbox_db
+        finally:
+            self.release(sandbox_db, dirty_tables)
+
+    def drop_all(self):
+        """
+        Удаляет все песочницы пула и шаблонную базу данных.
+        """
+        for sandbox_db in self.sandboxes + [self.template_db_name]:
+            creator = self.creator(self.original_db_name, sandbox_db)
+            try:
+                creator.drop_sandbox()
+            finally:
+                creator.close()
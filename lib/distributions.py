@@ -0,0 +1,197 @@
+import math
+import numpy as np
+
+# Множитель перестановки рангов в Zipf(scatter=True): большое нечетное число (2^32 / золотое сечение)
+SCATTER_MULTIPLIER = 2654435761
+
+
+class KeyDistribution:
+    """
+    Распределение значений внешнего ключа: смещения id в диапазоне [0, span) родительской таблицы.
+
+    Все распределения генерируют значения одним векторным вызовом numpy без таблиц размером с родительскую
+    таблицу, поэтому стоимость выборки - O(количества значений) и при 100 млн строк.
+    """
+
+    def offsets(self, rng, span, count, start=0, state=None) -> np.ndarray:
+        """
+        Генерирует смещения id.
+
+        Параметры:
+            - rng (np.random.Generator): Генератор случайных чисел.
+            - span (int): Количество id родительской таблицы.
+            - count (int): Количество значений.
+            - start (int, optional): Номер первой строки порции в таблице (для распределений, зависящих
+              от положения строки).
+            - state (dict, optional): Состояние генерации, общее для порций одной таблицы
+              (GenerationContext.state), - для распределений, продолжающих предыдущую порцию.
+
+        Возвращает:
+            - np.ndarray: Смещения в диапазоне [0, span).
+        """
+        raise NotImplementedError
+
+
+class Uniform(KeyDistribution):
+    """
+    Равномерное распределение: каждая родительская строка выбирается с одинаковой вероятностью.
+    """
+
+    def offsets(self, rng, span, count, start=0, state=None) -> np.ndarray:
+        return rng.integers(0, span, size=count)
+
+
+class Zipf(KeyDistribution):
+    """
+    Степенное распределение популярности: строка ранга k выбирается с вероятностью, пропорциональной 1 / k^s.
+
+    Атрибуты:
+        - s (float): Показатель степени. 0 - равномерно, около 1 - классический закон Ципфа, больше 1 - сильнее
+          выражены горячие ключи.
+        - scatter (bool): Разбросать ли горячие ключи по диапазону id. По умолчанию самые популярные - первые id,
+          то есть горячие строки лежат рядом на одних страницах; со scatter=True ранги переставляются
+          умножением по модулю, и горячие строки оказываются на разных страницах.
+
+    Примечания:
+        - Ранги выбираются обратной функцией непрерывного степенного распределения на [1, span + 1),
+          поэтому не нужна таблица вероятностей размером span.
+    """
+
+    def __init__(self, s=1.1, scatter=False):
+        if s < 0:
+            raise ValueError("Показатель s должен быть неотрицательным")
+        self.s = s
+        self.scatter = scatter
+
+    def ranks(self, rng, span, count) -> np.ndarray:
+        """
+        Генерирует ранги от 0 (самый популярный) до span - 1.
+        """
+        u = rng.random(count)
+        if self.s == 1:
+            x = np.power(span + 1.0, u)
+        else:
+            power = 1.0 - self.s
+            x = np.power(1.0 + u * ((span + 1.0) ** power - 1.0), 1.0 / power)
+        return np.minimum(x.astype(np.int64) - 1, span - 1)
+
+    def offsets(self, rng, span, count, start=0, state=None) -> np.ndarray:
+        ranks = self.ranks(rng, span, count)
+        if not self.scatter:
+            return ranks
+        multiplier = SCATTER_MULTIPLIER % span or 1
+        while math.gcd(multiplier, span) != 1:
+            multiplier += 1
+        return (ranks + 1) * multiplier % span
+
+
+class Repeat(KeyDistribution):
+    """
+    Постоянные посетители: доля rate значений приходится на небольшую группу первых id (постоянных гостей),
+    остальные распределены равномерно по всей таблице.
+
+    Атрибуты:
+        - rate (float): Доля повторных визитов постоянных гостей.
+        - regulars (float): Доля постоянных гостей среди всех гостей.
+    """
+
+    def __init__(self, rate=0.6, regulars=0.1):
+        if not 0 <= rate <= 1 or not 0 < regulars <= 1:
+            raise ValueError("rate должен быть в [0, 1], regulars - в (0, 1]")
+        self.rate = rate
+        self.regulars = regulars
+
+    def offsets(self, rng, span, count, start=0, state=None) -> np.ndarray:
+        regular_count = max(1, math.ceil(span * self.regulars))
+        regular = rng.random(count) < self.rate
+        return np.where(regular, rng.integers(0, regular_count, size=count), rng.integers(0, span, size=count))
+
+
+class Basket(KeyDistribution):
+    """
+    Размер корзины: строки связей идут группами подряд на один родительский id, размер группы -
+    1 + Пуассон(mean - 1). Так у orders_has_order.orders_id получается несколько позиций на заказ.
+
+    Атрибуты:
+        - mean (float): Средний размер корзины (не меньше 1).
+
+    Примечания:
+        - Порция продолжает последнюю корзину предыдущей порции, если та сохранена в state и закончилась
+          на строке start: недобранная корзина дополняется, следующие заказы идут подряд. Поэтому при
+          генерации порциями (Table.iter_rows) заказы идут подряд по всем порциям.
+        - Без сохраненного состояния (первая порция или независимо генерируемые части build_dataset)
+          нумерация начинается с заказа int(start / mean) - это лишь оценка, и на границе такой части
+          возможен пропуск или повтор нескольких заказов.
+        - Если строк больше, чем вмещают корзины всех заказов, нумерация начинается с начала диапазона.
+    """
+
+    def __init__(self, mean=2.0):
+        if mean < 1:
+            raise ValueError("Средний размер корзины должен быть не меньше 1")
+        self.mean = mean
+
+    def offsets(self, rng, span, count, start=0, state=None) -> np.ndarray:
+        # Последняя начатая корзина и количество строк, которых ей не хватает
+        basket, left = int(start / self.mean) - 1, 0
+        if state is not None and self in state and state[self][0] == start:
+            _, basket, left = state[self]
+        sizes = np.array([left], dtype=np.int64)
+        while sizes.sum() < count:
+            sizes = np.concatenate([sizes, 1 + rng.poisson(self.mean - 1, size=math.ceil(count / self.mean) + 16)])
+        if state is not None:
+            ends = np.cumsum(sizes)
+            last = int(np.searchsorted(ends, count))
+            state[self] = (start + count, basket + last, int(ends[last]) - count)
+        baskets = np.repeat(np.arange(len(sizes)), sizes)[:count]
+        return (basket + baskets) % span
+
+
+class Seasonality:
+    """
+    Сезонность дат заказов: вес дня - произведение веса дня недели и веса месяца.
+
+    Атрибуты:
+        - weekdays (np.ndarray): Веса дней недели с понедельника по воскресенье.
+        - months (np.ndarray): Веса месяцев с января по декабрь.
+
+    Пример использования:
+        Seasonality(weekdays=(1, 1, 1, 1, 1.2, 1.6, 1.4), months=(1.3, 1.2, 1, 1, 0.9, 0.8, 0.7, 0.7, 1, 1.1, 1.2, 1.4))
+    """
+
+    def __init__(self, weekdays=(1, 1, 1, 1, 1.2, 1.6, 1.4), months=(1,) * 12):
+        if len(weekdays) != 7 or len(months) != 12:
+            raise ValueError("Нужно 7 весов дней недели и 12 весов месяцев")
+        self.weekdays = np.asarray(weekdays, dtype=float)
+        self.months = np.asarray(months, dtype=float)
+
+    def days(self, rng, start, stop, count) -> np.ndarray:
+        """
+        Генерирует даты в диапазоне [start, stop) с весами сезонности.
+
+        Параметры:
+            - rng (np.random.Generator): Генератор случайных чисел.
+            - start (date): Первая возможная дата.
+            - stop (date): Дата, следующая за последней возможной.
+            - count (int): Количество дат.
+
+        Возвращает:
+            - np.ndarray: Массив datetime64[D].
+        """
+        days = np.arange(np.datetime64(start, 'D'), np.datetime64(stop, 'D'))
+        # 1970-01-01 - четверг, поэтому понедельник - (номер дня + 3) % 7 == 0
+        weekday = (days.astype(np.int64) + 3) % 7
+        month = days.astype('datetime64[M]').astype(np.int64) % 12
+        cumulative = np.cumsum(self.weekdays[weekday] * self.months[month])
+        return days[np.searchsorted(cumulative, rng.random(count) * cumulative[-1], side='right')]
+
+
+# Набор распределений для нагрузок с горячими ключами: популярные позиции меню, постоянные гости,
+# пиковые выходные и несколько позиций в заказе. Средний размер корзины близок к соотношению
+# OrderCount / OrdersCount в DataGenerator по умолчанию, чтобы позиции покрывали все заказы.
+SKEWED = {
+    "personal_order.menu_id": Zipf(1.1),
+    "orders.barista_id": Zipf(0.8),
+    "orders.guest_id": Repeat(0.6, 0.1),
+    "orders.order_date": Seasonality(),
+    "orders_has_order.orders_id": Basket(1.15),
+}
@@ -0,0 +1,135 @@
+from lib.benchmark import benchmark
+from lib.drivers import DRIVERS, get_driver
+
+# Служебная таблица замеров: создается в указанной базе данных и удаляется после замеров
+BENCH_TABLE = "driver_benchmark"
+BENCH_TABLE_SQL = (f"CREATE TABLE IF NOT EXISTS {BENCH_TABLE} "
+                   f"(id INT PRIMARY KEY, name VARCHAR(45) NOT NULL, prices INT NOT NULL)")
+INSERT_SQL = f"INSERT INTO {BENCH_TABLE} (id, name, prices) VALUES (%s, %s, %s)"
+SELECT_SQL = f"SELECT id, name, prices FROM {BENCH_TABLE}"
+POINT_SELECT_SQL = f"SELECT id, name, prices FROM {BENCH_TABLE} WHERE id = %s"
+WORKLOADS = ("insert", "select", "point")
+
+
+def benchmark_rows(rows) -> list[tuple]:
+    """
+    Возвращает одинаковый для всех драйверов набор строк служебной таблицы.
+
+    Параметры:
+        - rows (int): Количество строк.
+
+    Возвращает:
+        - list[tuple]: Строки (id, name, prices).
+    """
+    return [(i, f"Позиция меню {i}", 100 + i % 500) for i in range(1, rows + 1)]
+
+
+def insert_rows(conn, cursor, data, batch):
+    """
+    Вставляет строки пакетами через executemany и фиксирует транзакцию.
+    """
+    for start in range(0, len(data), batch):
+        cursor.executemany(INSERT_SQL, data[start:start + batch])
+    conn.commit()
+
+
+def select_rows(cursor) -> list:
+    """
+    Читает всю служебную таблицу одним запросом.
+    """
+    cursor.execute(SELECT_SQL)
+    return cursor.fetchall()
+
+
+def point_selects(cursor, ids):
+    """
+    Выполняет по одному запросу по первичному ключу на каждый id: нагрузка, в которой преобладают накладные расходы
+    драйвера на запрос, как в замерах query_graph.
+    """
+    for row_id in ids:
+        cursor.execute(POINT_SELECT_SQL, (row_id,))
+        cursor.fetchall()
+
+
+def benchmark_driver(driver, host, user, password, db_name, rows=10000, batch=1000, point_queries=1000, warmup=1,
+                     repeat=5) -> dict:
+    """
+    Замеряет одинаковые нагрузки вставки и чтения через один драйвер.
+
+    Параметры:
+        - driver (str | Driver): Драйвер MySQL.
+        - host (str): Хост сервера MySQL.
+        - user (str): Имя пользователя.
+        - password (str): Пароль.
+        - db_name (str): База данных, в которой создается служебная таблица.
+        - rows (int, optional): Количество вставляемых и читаемых строк (по умолчанию 10000).
+        - batch (int, optional): Размер пакета executemany (по умолчанию 1000).
+        - point_queries (int, optional): Количество запросов по первичному ключу (по умолчанию 1000).
+        - warmup (int, optional): Количество прогревочных запусков (по умолчанию 1).
+        - repeat (int, optional): Количество измеряемых запусков (по умолчанию 5).
+
+    Возвращает:
+        - dict: driver (имя драйвера), results ({нагрузка: BenchmarkResult}), counts ({нагрузка: количество строк
+          или запросов за запуск}) и throughput ({нагрузка: строк или запросов в секунду по медиане}).
+
+    Примечания:
+        - Перед каждым замером вставки таблица очищается, чтение и точечные запросы выполняются по заполненной таблице.
+    """
+    driver = get_driver(driver)
+    data = benchmark_rows(rows)
+    ids = [row[0] for row in data[:point_queries]]
+    conn = driver.connect(host=host, user=user, password=password, database=db_name)
+    cursor = conn.cursor()
+
+    def truncate():
+        cursor.execute(f"TRUNCATE TABLE {BENCH_TABLE}")
+        conn.commit()
+
+    try:
+        cursor.execute(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+        cursor.execute(BENCH_TABLE_SQL)
+        results = {"insert": benchmark(insert_rows, conn, cursor, data, batch, warmup=warmup, repeat=repeat,
+                                       setup=truncate)}
+        results["select"] = benchmark(select_rows, cursor, warmup=warmup, repeat=repeat)
+        results["point"] = benchmark(point_selects, cursor, ids, warmup=warmup, repeat=repeat)
+        cursor.execute(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+    finally:
+        cursor.close()
+        conn.close()
+
+    counts = {"insert": len(data), "select": len(data), "point": len(ids)}
+    throughput = {workload: counts[workload] / results[workload].median if results[workload].median else 0.0
+                  for workload in WORKLOADS}
+    return {"driver": driver.name, "results": results, "counts": counts, "throughput": throughput}
+
+
+def compare_drivers(drivers=None, store=None, **kwargs) -> list[dict]:
+    """
+    Замеряет одинаковые нагрузки через несколько драйверов.
+
+    Параметры:
+        - drivers (list[str], optional): Имена драйверов. По умолчанию все известные.
+        - store (BenchmarkStore, optional): Хранилище результатов. Все драйверы записываются в один запуск,
+          серия - имя драйвера, запрос - название нагрузки.
+        - **kwargs: Параметры benchmark_driver (host, user, password, db_name, rows, batch, point_queries,
+          warmup, repeat).
+
+    Возвращает:
+        - list[dict]: Результаты benchmark_driver для установленных драйверов в порядке drivers.
+
+    Примечания:
+        - Неустановленные драйверы пропускаются с сообщением.
+    """
+    reports = []
+    run_id = store.start_run("Сравнение драйверов MySQL") if store else None
+    for name in drivers or list(DRIVERS):
+        driver = get_driver(name)
+        if not driver.available():
+            print(f"Драйвер {driver.name} недоступен, пропускаем.")
+            continue
+        report = benchmark_driver(driver, **kwargs)
+        reports.append(report)
+        if store:
+            for workload, result in report["results"].items():
+                store.record(run_id, driver.name, workload, report["counts"][workload], result)
+    return reports
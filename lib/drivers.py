@@ -0,0 +1,185 @@
+import importlib
+import mysql.connector
+# Коды ошибок сервера MySQL: одинаковы для всех драйверов и сравниваются с Driver.error_code
+from mysql.connector import errorcode
+
+
+class Driver:
+    """
+    Клиентская библиотека MySQL: подключение, класс исключений и разбор результата курсора.
+
+    Все драйверы реализуют DB-API 2.0 с плейсхолдером %s, поэтому запросы библиотеки для них одинаковы.
+    Необязательные драйверы импортируются при первом использовании.
+
+    Атрибуты:
+        - name (str): Имя драйвера.
+        - module_name (str): Импортируемый модуль.
+        - package (str): Пакет pip, из которого устанавливается модуль.
+    """
+    name = None
+    module_name = None
+    package = None
+
+    @property
+    def module(self):
+        """
+        Модуль драйвера.
+
+        Исключения:
+            - ImportError: Если драйвер не установлен.
+        """
+        try:
+            return importlib.import_module(self.module_name)
+        except ImportError as e:
+            raise ImportError(f"Драйвер {self.name} не установлен: pip install {self.package}") from e
+
+    @property
+    def Error(self) -> type:
+        """Базовый класс исключений драйвера."""
+        return self.module.MySQLError
+
+    def available(self) -> bool:
+        """
+        Проверяет, можно ли использовать драйвер в текущем окружении.
+        """
+        try:
+            self.module
+        except ImportError:
+            return False
+        return True
+
+    def connect(self, **kwargs):
+        """
+        Открывает соединение.
+
+        Параметры:
+            - **kwargs: host, user, password и необязательный database.
+
+        Возвращает:
+            - Соединение DB-API.
+        """
+        return self.module.connect(**kwargs)
+
+    def use_database(self, conn, database):
+        """
+        Делает базу данных текущей для соединения.
+        """
+        conn.select_db(database)
+
+    def error_code(self, err) -> int | None:
+        """
+        Возвращает код ошибки MySQL из исключения драйвера.
+        """
+        return err.args[0] if err.args and isinstance(err.args[0], int) else None
+
+    def has_rows(self, cursor) -> bool:
+        """
+        Проверяет, вернул ли последний запрос строки.
+        """
+        return cursor.description is not None
+
+    def column_names(self, cursor) -> list[str]:
+        """
+        Возвращает имена колонок результата последнего запроса.
+        """
+        return [column[0] for column in cursor.description]
+
+
+class ConnectorDriver(Driver):
+    """
+    Драйвер mysql-connector-python.
+
+    Атрибуты:
+        - use_pure (bool | None): True - протокол на чистом Python, False - C-расширение,
+          None - выбор самого коннектора (соединение открывается с настройками по умолчанию).
+    """
+    module_name = "mysql.connector"
+    package = "mysql-connector-python"
+
+    def __init__(self, use_pure=None):
+        """
+        Инициализирует экземпляр ConnectorDriver.
+
+        Параметры:
+            - use_pure (bool, optional): Реализация протокола (по умолчанию выбирает коннектор).
+        """
+        self.use_pure = use_pure
+        self.name = {None: "connector", True: "connector-pure", False: "connector-c"}[use_pure]
+
+    @property
+    def module(self):
+        return mysql.connector
+
+    @property
+    def Error(self) -> type:
+        return mysql.connector.Error
+
+    def available(self) -> bool:
+        return self.use_pure is not False or mysql.connector.HAVE_CEXT
+
+    def connect(self, **kwargs):
+        if self.use_pure is not None:
+            kwargs["use_pure"] = self.use_pure
+        return mysql.connector.connect(**kwargs)
+
+    def use_database(self, conn, database):
+        conn.database = database
+
+    def error_code(self, err) -> int | None:
+        return getattr(err, 'errno', None)
+
+    def has_rows(self, cursor) -> bool:
+        return cursor.with_rows
+
+    def column_names(self, cursor) -> list[str]:
+        return cursor.column_names
+
+
+class PyMySQLDriver(Driver):
+    """
+    Драйвер PyMySQL (чистый Python).
+    """
+    name = "pymysql"
+    module_name = "pymysql"
+    package = "PyMySQL"
+
+
+class MySQLClientDriver(Driver):
+    """
+    Драйвер mysqlclient (MySQLdb, обертка над libmysqlclient на C).
+    """
+    name = "mysqlclient"
+    module_name = "MySQLdb"
+    package = "mysqlclient"
+
+
+DRIVERS = {
+    "connector": lambda: ConnectorDriver(),
+    "connector-pure": lambda: ConnectorDriver(use_pure=True),
+    "connector-c": lambda: ConnectorDriver(use_pure=False),
+    "pymysql": PyMySQLDriver,
+    "mysqlclient": MySQLClientDriver
+}
+
+
+def get_driver(driver=None) -> Driver:
+    """
+    Возвращает экземпляр драйвера MySQL.
+
+    Параметры:
+        - driver (str | Driver | None): Имя драйвера ('connector', 'connector-pure', 'connector-c', 'pymysql',
+          'mysqlclient'), готовый экземпляр или None (mysql-connector с настройками по умолчанию).
+
+    Возвращает:
+        - Driver: Экземпляр драйвера.
+
+    Исключения:
+        - ValueError: Если имя драйвера неизвестно.
+    """
+    if isinstance(driver, Driver):
+        return driver
+    if driver is None:
+        driver = "connector"
+    if driver not in DRIVERS:
+        raise ValueError(f"Неизвестный драйвер: {driver}. Доступны: {', '.join(DRIVERS)}")
+    return DRIVERS[driver]()
@@ -35,7 +35,7 @@ class GraphBuilder:
         self.colors = ['red', 'orange', 'yellow', 'green', 'blue', 'purple']
         self.line_count = 0
 
-    def add_series(self, x_data, y_data, label):
+    def add_series(self, x_data, y_data, label, y_low=None, y_high=None):
         """
         Добавляет серию данных на график.
 
@@ -43,11 +43,18 @@ class GraphBuilder:
             - x_data (list): Данные для оси X.
             - y_data (list): Данные для оси Y.
             - label (str): Название графика.
+            - y_low (list, optional): Нижние границы разброса значений (например, доверительного интервала).
+            - y_high (list, optional): Верхние границы разброса значений.
+
+        Примечания:
+            - Если переданы y_low и y_high, разброс отображается полупрозрачной полосой цвета линии.
         """
         color = self.colors[self.line_count % len(self.colors)]
         line_style = self.lines_styles[self.line_count % len(self.lines_styles)]
         marker = self.markers[self.line_count % len(self.markers)] if len(x_data) < 10 else None
         self.ax.plot(x_data, y_data, label=label, color=color, linestyle=line_style, marker=marker)
+        if y_low is not None and y_high is not None:
+            self.ax.fill_between(x_data, y_low, y_high, color=color, alpha=0.2)
         self.line_count += 1
 
     def build(self):
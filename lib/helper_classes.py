@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, date
 
 
 class Guest:
@@ -101,7 +101,7 @@ class Orders:
 
     Атрибуты:\n
     - ID (int): Идентификатор заказа.
-    - OrderData (str): Дата заказа.
+    - OrderData (str or date): Дата заказа: строка 'MM-DD-YYYY' или datetime.date для колонки DATE.
     - BaristaID (int): Идентификатор бариста, который принял заказ.
     - GuestID (int): Идентификатор гостя, который сделал заказ.
     Методы:\n
@@ -123,8 +123,8 @@ class Orders:
     def __init__(self, a, b, c, d):
         if not isinstance(a, int):
             raise TypeError("ID должен быть целым числом")
-        if not isinstance(b, str):
-            raise TypeError("Дата заказа должна быть строкой")
+        if not isinstance(b, (str, date)):
+            raise TypeError("Дата заказа должна быть строкой или датой")
         if not isinstance(c, int):
             raise TypeError("Код-бариста должен быть целым числом")
         if not isinstance(d, int):
@@ -140,7 +140,7 @@ class Orders:
         self.BaristaID = c
         self.GuestID = d
 
-    def to_turple(self) -> tuple[int, str, int, int]:
+    def to_turple(self) -> tuple[int, str | date, int, int]:
         """
         Возвращает кортеж с данными текущего объекта Orders.
 
@@ -191,9 +191,10 @@ class Orders_has_Order:
         Преобразует данные связи между заказом и его позициями в кортеж.
 
         Возвращает:
-            - tuple[int, int, int]: Кортеж, содержащий ID, OrdersID и OrderID.
+            - tuple[int, int, int]: Кортеж, содержащий ID, OrderID и OrdersID в порядке столбцов таблицы
+              orders_has_order (id, order_id, orders_id).
         """
-        return (self.ID, self.OrdersID, self.OrderID)
+        return (self.ID, self.OrderID, self.OrdersID)
 
 
 class Order:
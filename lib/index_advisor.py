@@ -0,0 +1,479 @@
+import re
+from lib.backends import get_backend
+from lib.drivers import errorcode
+from lib.query_builder import build_query
+from lib.timer import query_benchmark
+
+# Сравнение вида [таблица.]колонка <оператор> <правый операнд>
+PREDICATE_PATTERN = re.compile(
+    r"(?:(\w+)\.)?(\w+)\s*(>=|<=|<>|!=|=|>|<|\bNOT\s+LIKE\b|\bLIKE\b|\bBETWEEN\b|\bIN\b)\s*(\"[^\"]*\"|'[^']*'|\S+)?",
+    re.IGNORECASE
+)
+# Ссылка на колонку вида таблица.колонка
+QUALIFIED_COLUMN_PATTERN = re.compile(r"\b(\w+)\.(\w+)\b")
+
+# Типы доступа EXPLAIN, при которых таблица читается целиком
+FULL_SCAN_ACCESS_TYPES = ("ALL", "index")
+
+# Максимальное количество колонок в предлагаемом индексе
+MAX_INDEX_COLUMNS = 4
+
+
+class IndexCandidate:
+    """
+    Предлагаемый вторичный индекс.
+
+    Атрибуты:
+        - table (str): Имя таблицы.
+        - columns (list[str]): Колонки индекса в порядке следования.
+        - reason (str): Почему индекс предложен.
+    """
+
+    def __init__(self, table, columns, reason=""):
+        """
+        Инициализирует экземпляр IndexCandidate.
+
+        Параметры:
+            - table (str): Имя таблицы.
+            - columns (list[str]): Колонки индекса.
+            - reason (str, optional): Пояснение.
+        """
+        self.table = table
+        self.columns = list(columns)
+        self.reason = reason
+
+    @property
+    def name(self) -> str:
+        """Имя индекса: idx_<таблица>_<колонки>."""
+        return f"idx_{self.table}_{'_'.join(self.columns)}".lower()[:64]
+
+    @property
+    def create_sql(self) -> str:
+        """Запрос создания индекса."""
+        return f"CREATE INDEX {self.name} ON {self.table} ({', '.join(self.columns)})"
+
+    @property
+    def drop_sql(self) -> str:
+        """Запрос удаления индекса."""
+        return f"DROP INDEX {self.name} ON {self.table}"
+
+    def __eq__(self, other):
+        return (isinstance(other, IndexCandidate) and self.table.lower() == other.table.lower()
+                and [c.lower() for c in self.columns] == [c.lower() for c in other.columns])
+
+    def __hash__(self):
+        return hash((self.table.lower(), tuple(c.lower() for c in self.columns)))
+
+    def __repr__(self):
+        return f"IndexCandidate({self.table}({', '.join(self.columns)}))"
+
+
+def predicate_columns(conditions, default_table) -> list[tuple]:
+    """
+    Извлекает колонки из условия WHERE и классифицирует предикаты.
+
+    Параметры:
+        - conditions (str): Условие WHERE.
+        - default_table (str): Таблица, к которой относятся колонки без префикса.
+
+    Возвращает:
+        - list[tuple]: Кортежи (таблица, колонка, вид), где вид - 'eq' (=, IN), 'range' (<, >, BETWEEN, LIKE без
+          ведущего %) или 'scan' (LIKE с ведущим %, <>, NOT LIKE - B-tree индекс не сужает поиск).
+    """
+    columns = []
+    for table, column, operator, operand in PREDICATE_PATTERN.findall(conditions or ""):
+        if column.isdigit():
+            continue
+        operator = ' '.join(operator.upper().split())
+        if operator in ('=', 'IN'):
+            kind = 'eq'
+        elif operator in ('<>', '!=', 'NOT LIKE'):
+            kind = 'scan'
+        elif operator == 'LIKE':
+            kind = 'scan' if operand.strip("'\"").startswith('%') else 'range'
+        else:
+            kind = 'range'
+        columns.append((table or default_table, column, kind))
+    return columns
+
+
+def join_columns(join) -> list[tuple]:
+    """
+    Извлекает колонки условий JOIN.
+
+    Параметры:
+        - join (list[str]): Пары [таблица, условие, ...], как в query_graph.
+
+    Возвращает:
+        - list[tuple]: Кортежи (таблица, колонка) для обеих сторон каждого условия.
+    """
+    columns = []
+    for j in range(1, len(join or []), 2):
+        columns.extend(QUALIFIED_COLUMN_PATTERN.findall(join[j]))
+    return columns
+
+
+def list_columns(clause, default_table) -> list[tuple]:
+    """
+    Извлекает колонки из списка GROUP BY или ORDER BY.
+
+    Параметры:
+        - clause (str): Список колонок через запятую, возможно с ASC/DESC.
+        - default_table (str): Таблица для колонок без префикса.
+
+    Возвращает:
+        - list[tuple]: Кортежи (таблица, колонка).
+    """
+    columns = []
+    for item in (clause or "").split(','):
+        words = item.split()
+        if not words:
+            continue
+        table, _, column = words[0].rpartition('.')
+        if re.fullmatch(r"\w+", column):
+            columns.append((table or default_table, column))
+    return columns
+
+
+def propose_indexes(spec) -> list[IndexCandidate]:
+    """
+    Предлагает индексы для запроса по его структуре (без обращения к серверу).
+
+    Параметры:
+        - spec (dict): Описание запроса, как в сценариях: type, table, conditions, join, group_by, order_by.
+
+    Возвращает:
+        - list[IndexCandidate]: Кандидаты для каждой таблицы запроса.
+
+    Примечания:
+        - Колонки индекса упорядочиваются по правилу "сначала равенства, затем одна колонка диапазона";
+          если диапазона нет, после равенств добавляются колонки GROUP BY/ORDER BY, чтобы избежать сортировки.
+        - Для колонок условий JOIN предлагаются отдельные индексы (внутренняя таблица соединения).
+        - Если SELECT перечисляет колонки таблицы явно, они добавляются в конец индекса, делая его покрывающим.
+    """
+    table = spec["table"].split()[0]
+    predicates = predicate_columns(spec.get("conditions"), table)
+    ordering = list_columns(spec.get("group_by"), table) or list_columns(spec.get("order_by"), table)
+    selected = QUALIFIED_COLUMN_PATTERN.findall(spec["type"]) if spec["type"] != 'SELECT' else []
+
+    tables = list(dict.fromkeys([table] + [t for t, _, _ in predicates] + [t for t, _ in ordering]))
+    candidates = []
+    for current in tables:
+        def same(name):
+            return name.lower() == current.lower()
+
+        equalities = [c for t, c, kind in predicates if same(t) and kind == 'eq']
+        ranges = [c for t, c, kind in predicates if same(t) and kind == 'range']
+        columns = list(dict.fromkeys(equalities))
+        ranges = [c for c in ranges if c not in columns]
+        if ranges:
+            columns.append(ranges[0])
+            reason = "условие WHERE"
+        else:
+            columns += [c for t, c in ordering if same(t) and c not in columns]
+            reason = "условие WHERE и GROUP BY/ORDER BY" if equalities else "GROUP BY/ORDER BY"
+        if not columns:
+            continue
+        covering = [c for t, c in selected if same(t) and c not in columns]
+        if covering and len(columns) + len(covering) <= MAX_INDEX_COLUMNS:
+            columns += covering
+            reason += ", покрывающий"
+        candidates.append(IndexCandidate(current, columns[:MAX_INDEX_COLUMNS], reason))
+
+    for joined_table, column in join_columns(spec.get("join")):
+        candidates.append(IndexCandidate(joined_table, [column], "условие JOIN"))
+    return list(dict.fromkeys(candidates))
+
+
+class IndexAdvisor:
+    """
+    Советник по индексам: проверяет запросы через EXPLAIN, предлагает вторичные и покрывающие индексы,
+    создает их и измеряет ускорение.
+
+    Индексы создаются в базе данных `db_name`, поэтому ее следует указывать на песочницу, а не на оригинал.
+
+    Атрибуты:
+        - host (str): Хост для подключения к базе данных.
+        - user (str): Имя пользователя для подключения к базе данных.
+        - password (str): Пароль для подключения к базе данных.
+        - db_name (str): Имя базы данных (песочницы).
+        - backend (Backend): Движок MySQL с выбранным драйвером (см. lib.drivers).
+        - conn: Соединение DB-API с базой данных.
+        - cursor: Курсор для выполнения SQL-запросов.
+
+    Пример использования:
+        with IndexAdvisor('localhost', 'root', '123456', 'my_index_sandbox') as advisor:
+            for row in advisor.evaluate(specs):
+                print(row)
+    """
+
+    def __init__(self, host, user, password, db_name, backend=None):
+        """
+        Инициализирует экземпляр IndexAdvisor.
+
+        Параметры:
+            - host (str): Хост для подключения к базе данных.
+            - user (str): Имя пользователя для подключения к базе данных.
+            - password (str): Пароль для подключения к базе данных.
+            - db_name (str): Имя базы данных (песочницы).
+            - backend (str | Backend, optional): Движок MySQL, например get_backend('mysql', driver='pymysql')
+              (по умолчанию MySQL через mysql.connector).
+        """
+        self.host = host
+        self.user = user
+        self.password = password
+        self.db_name = db_name
+        self.backend = get_backend(backend)
+        self.conn = None
+        self.cursor = None
+
+    def __enter__(self):
+        """
+        Устанавливает соединение с базой данных и создает курсор.
+
+        Возвращает:
+            - IndexAdvisor: Текущий экземпляр класса IndexAdvisor.
+        """
+        try:
+            self.conn = self.backend.connect(self.host, self.user, self.password, self.db_name)
+            self.cursor = self.conn.cursor()
+        except self.backend.Error as err:
+            errno = self.backend.error_code(err)
+            if errno == errorcode.ER_ACCESS_DENIED_ERROR:
+                print("Ошибка в указанных параметрах.")
+            elif errno == errorcode.ER_BAD_DB_ERROR:
+                print(f"БД {self.db_name} не найдена.")
+            else:
+                print(err)
+            exit(1)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Закрывает соединение с базой данных.
+        """
+        if self.conn:
+            self.conn.commit()
+            self.cursor.close()
+            self.conn.close()
+
+    def execute_query(self, query):
+        """
+        Выполняет запрос и читает его результат.
+
+        Параметры:
+            - query (str): SQL-запрос.
+
+        Возвращает:
+            - list: Строки результата (пустой список для запросов, не возвращающих строк).
+        """
+        self.cursor.execute(query)
+        rows, _ = self.backend.fetch_result(self.cursor)
+        return rows or []
+
+    def explain(self, query) -> list[dict]:
+        """
+        Выполняет EXPLAIN для запроса.
+
+        Параметры:
+            - query (str): SQL-запрос.
+
+        Возвращает:
+            - list[dict]: Строки плана в виде словарей {колонка EXPLAIN: значение}.
+        """
+        self.cursor.execute(f"EXPLAIN {query}")
+        names = [column[0] for column in self.cursor.description]
+        return [dict(zip(names, row)) for row in self.cursor.fetchall()]
+
+    def table_columns(self, table) -> set[str]:
+        """
+        Возвращает имена колонок таблицы в нижнем регистре.
+
+        Параметры:
+            - table (str): Имя таблицы.
+
+        Возвращает:
+            - set[str]: Имена колонок.
+        """
+        self.cursor.execute(
+            "SELECT COLUMN_NAME FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s",
+            (self.db_name, table)
+        )
+        return {row[0].lower() for row in self.cursor.fetchall()}
+
+    def existing_indexes(self, table) -> dict:
+        """
+        Возвращает существующие индексы таблицы (включая первичный ключ и индексы внешних ключей).
+
+        Параметры:
+            - table (str): Имя таблицы.
+
+        Возвращает:
+            - dict: Словарь {имя индекса: колонки в нижнем регистре в порядке следования}. Первичный ключ - 'PRIMARY'.
+        """
+        self.cursor.execute(f"SHOW INDEX FROM {table}")
+        names = [column[0] for column in self.cursor.description]
+        indexes = {}
+        for row in self.cursor.fetchall():
+            row = dict(zip(names, row))
+            indexes.setdefault(row["Key_name"], []).append((row["Seq_in_index"], row["Column_name"].lower()))
+        return {name: [column for _, column in sorted(columns)] for name, columns in indexes.items()}
+
+    def filter_candidates(self, candidates) -> list[IndexCandidate]:
+        """
+        Отбрасывает колонки, которых нет в таблице, и кандидатов, уже покрытых существующими индексами
+        или начинающихся с первичного ключа.
+
+        Параметры:
+            - candidates (list[IndexCandidate]): Кандидаты.
+
+        Возвращает:
+            - list[IndexCandidate]: Кандидаты, которые имеет смысл создавать.
+
+        Примечания:
+            - Индекс считается покрытым, если его колонки являются началом уже существующего индекса.
+            - Таблицы InnoDB кластеризованы по первичному ключу, поэтому индекс, начинающийся с него, не нужен.
+        """
+        result = []
+        for candidate in candidates:
+            try:
+                columns = self.table_columns(candidate.table)
+                existing = self.existing_indexes(candidate.table)
+            except self.backend.Error as e:
+                print(f"Ошибка при чтении метаданных таблицы {candidate.table}: {e}")
+                continue
+            candidate.columns = [column for column in candidate.columns if column.lower() in columns]
+            wanted = [column.lower() for column in candidate.columns]
+            primary = existing.get("PRIMARY")
+            if not wanted or (primary and wanted[:len(primary)] == primary):
+                continue
+            if not any(index[:len(wanted)] == wanted for index in existing.values()):
+                result.append(candidate)
+        return result
+
+    def advise(self, spec, num_rows=10) -> list[IndexCandidate]:
+        """
+        Предлагает индексы для запроса, если EXPLAIN показывает полный просмотр, сортировку или временную таблицу.
+
+        Параметры:
+            - spec (dict): Описание запроса.
+            - num_rows (int, optional): LIMIT запроса (по умолчанию 10).
+
+        Возвращает:
+            - list[IndexCandidate]: Предлагаемые индексы. Пустой список, если план уже использует индексы.
+        """
+        query = build_query(spec["type"], spec["table"], num_rows, conditions=spec.get("conditions"),
+                            join=spec.get("join"), order_by=spec.get("order_by"), group_by=spec.get("group_by"),
+                            having=spec.get("having"))
+        plan = self.explain(query)
+        needs_index = any(row.get("type") in FULL_SCAN_ACCESS_TYPES
+                          or "filesort" in (row.get("Extra") or "") or "temporary" in (row.get("Extra") or "")
+                          for row in plan)
+        if not needs_index:
+            return []
+        return self.filter_candidates(propose_indexes(spec))
+
+    def apply(self, candidates):
+        """
+        Создает индексы.
+
+        Параметры:
+            - candidates (list[IndexCandidate]): Индексы для создания.
+        """
+        for candidate in candidates:
+            try:
+                self.cursor.execute(candidate.create_sql)
+                print(f"Создан индекс: {candidate.create_sql}")
+            except self.backend.Error as e:
+                print(f"Ошибка при создании индекса {candidate.name}: {e}")
+
+    def drop(self, candidates):
+        """
+        Удаляет ранее созданные индексы.
+
+        Параметры:
+            - candidates (list[IndexCandidate]): Индексы для удаления.
+        """
+        for candidate in candidates:
+            try:
+                self.cursor.execute(candidate.drop_sql)
+            except self.backend.Error as e:
+                print(f"Ошибка при удалении индекса {candidate.name}: {e}")
+
+    def measure(self, query, warmup=1, repeat=5) -> float:
+        """
+        Измеряет медиану времени выполнения запроса, откатывая изменяющие запросы.
+
+        Параметры:
+            - query (str): SQL-запрос.
+            - warmup (int, optional): Количество прогревочных запусков.
+            - repeat (int, optional): Количество измеряемых запусков.
+
+        Возвращает:
+            - float: Медиана времени в секундах.
+
+        Примечания:
+            - Как в query_graph, DELETE выполняется с отключенной проверкой внешних ключей, иначе удаление строк,
+              на которые ссылаются другие таблицы, завершается ошибкой ER_ROW_IS_REFERENCED.
+        """
+        teardown = None if query.startswith('SELECT') else self.conn.rollback
+        if not query.startswith('DELETE'):
+            return query_benchmark(self.execute_query, query, warmup=warmup, repeat=repeat, teardown=teardown).median
+        for statement in self.backend.foreign_key_checks_sql(False):
+            self.cursor.execute(statement)
+        try:
+            return query_benchmark(self.execute_query, query, warmup=warmup, repeat=repeat, teardown=teardown).median
+        finally:
+            for statement in self.backend.foreign_key_checks_sql(True):
+                self.cursor.execute(statement)
+
+    def evaluate(self, specs, num_rows=100, warmup=1, repeat=5, keep=False) -> list[dict]:
+        """
+        Предлагает индексы для всех запросов, создает их и сравнивает время выполнения до и после.
+
+        Параметры:
+            - specs (list[dict]): Описания запросов. INSERT-запросы пропускаются.
+            - num_rows (int, optional): LIMIT запросов (по умолчанию 100).
+            - warmup (int, optional): Количество прогревочных запусков.
+            - repeat (int, optional): Количество измеряемых запусков.
+            - keep (bool, optional): Оставить ли созданные индексы после замеров (по умолчанию удаляются).
+
+        Возвращает:
+            - list[dict]: Для каждого запроса: query, before, after (секунды), speedup, предложенные индексы
+              (indexes) и индексы, которые план использует после их создания (used).
+
+        Примечания:
+            - Запрос, завершившийся ошибкой MySQL (например, JOIN с несуществующей таблицей), пропускается
+              с сообщением, остальные запросы замеряются как обычно.
+        """
+        measured = []
+        for spec in specs:
+            if 'INSERT' in spec["type"]:
+                continue
+            query = build_query(spec["type"], spec["table"], num_rows, conditions=spec.get("conditions"),
+                                join=spec.get("join"), order_by=spec.get("order_by"), group_by=spec.get("group_by"),
+                                having=spec.get("having"))
+            try:
+                measured.append((query, self.measure(query, warmup, repeat), self.advise(spec, num_rows)))
+            except self.backend.Error as e:
+                self.conn.rollback()
+                print(f"Запрос пропущен из-за ошибки: {query}: {e}")
+        created = list(dict.fromkeys(candidate for _, _, proposal in measured for candidate in proposal))
+        self.apply(created)
+        try:
+            report = []
+            for query, time_before, proposal in measured:
+                try:
+                    time_after = self.measure(query, warmup, repeat)
+                    used = [row.get("key") for row in self.explain(query) if row.get("key")]
+                except self.backend.Error as e:
+                    self.conn.rollback()
+                    print(f"Запрос пропущен из-за ошибки: {query}: {e}")
+                    continue
+                report.append({"query": query, "before": time_before, "after": time_after,
+                               "speedup": time_before / time_after if time_after else float('inf'),
+                               "indexes": [candidate.create_sql for candidate in proposal], "used": used})
+        finally:
+            if not keep:
+                self.drop(created)
+        return report
@@ -0,0 +1,363 @@
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from lib.drivers import get_driver
+from lib.query_builder import build_query
+
+# Шаг id между клиентами для INSERT, чтобы параллельные вставки не конфликтовали по первичному ключу.
+# С фиксацией (commit=True) клиент может вставить не больше ID_STRIDE строк в таблицу без пересечения с соседним
+ID_STRIDE = 1_000_000
+
+
+class LatencyHistogram:
+    """
+    Логарифмическая гистограмма задержек с объединением и расчетом перцентилей.
+
+    Каждая степень двойки наносекунд делится на `SUB_BUCKETS` корзин, поэтому относительная погрешность
+    перцентилей не превышает ~19% при постоянном объеме памяти независимо от количества замеров.
+
+    Атрибуты:
+        - buckets (dict): Словарь {номер корзины: количество замеров}.
+        - count (int): Общее количество замеров.
+        - total_ns (int): Сумма всех замеров в наносекундах.
+        - min_ns (int | None): Минимальный замер.
+        - max_ns (int | None): Максимальный замер.
+    """
+
+    SUB_BUCKETS = 4
+
+    def __init__(self):
+        """
+        Инициализирует пустую гистограмму.
+        """
+        self.buckets = {}
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = None
+
+    def record(self, value_ns):
+        """
+        Добавляет замер.
+
+        Параметры:
+            - value_ns (int): Задержка в наносекундах.
+        """
+        index = int(math.log2(max(value_ns, 1)) * self.SUB_BUCKETS)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total_ns += value_ns
+        self.min_ns = value_ns if self.min_ns is None else min(self.min_ns, value_ns)
+        self.max_ns = value_ns if self.max_ns is None else max(self.max_ns, value_ns)
+
+    def merge(self, other):
+        """
+        Добавляет к гистограмме замеры другой гистограммы.
+
+        Параметры:
+            - other (LatencyHistogram): Гистограмма, например другого клиента.
+        """
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total_ns += other.total_ns
+        if other.min_ns is not None:
+            self.min_ns = other.min_ns if self.min_ns is None else min(self.min_ns, other.min_ns)
+            self.max_ns = other.max_ns if self.max_ns is None else max(self.max_ns, other.max_ns)
+
+    def percentile(self, p) -> float:
+        """
+        Возвращает перцентиль задержки в секундах (верхнюю границу корзины, ограниченную максимумом).
+
+        Параметры:
+            - p (float): Перцентиль от 0 до 100.
+
+        Возвращает:
+            - float: Задержка в секундах или 0.0 для пустой гистограммы.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(2 ** ((index + 1) / self.SUB_BUCKETS), self.max_ns) / 1e9
+        return self.max_ns / 1e9
+
+    @property
+    def mean(self) -> float:
+        """Средняя задержка в секундах."""
+        return self.total_ns / self.count / 1e9 if self.count else 0.0
+
+    def to_dict(self) -> dict:
+        """
+        Возвращает основные статистики гистограммы.
+
+        Возвращает:
+            - dict: count, mean, p50, p95, p99 и max (в секундах).
+        """
+        return {"count": self.count, "mean": self.mean, "p50": self.percentile(50), "p95": self.percentile(95),
+                "p99": self.percentile(99), "max": (self.max_ns or 0) / 1e9}
+
+
+class LoadResult:
+    """
+    Результат нагрузочного прогона при одном уровне параллельности.
+
+    Атрибуты:
+        - clients (int): Количество параллельных клиентов.
+        - duration (float): Длительность измеряемой части прогона в секундах.
+        - histograms (dict): Словарь {метка запроса: LatencyHistogram} успешных запросов.
+        - errors (dict): Словарь {метка запроса: количество ошибок}.
+    """
+
+    def __init__(self, clients, duration):
+        """
+        Инициализирует пустой результат.
+
+        Параметры:
+            - clients (int): Количество параллельных клиентов.
+            - duration (float): Длительность измеряемой части прогона в секундах.
+        """
+        self.clients = clients
+        self.duration = duration
+        self.histograms = {}
+        self.errors = {}
+
+    def add_client(self, histograms, errors):
+        """
+        Добавляет статистику одного клиента.
+
+        Параметры:
+            - histograms (dict): Гистограммы клиента по меткам запросов.
+            - errors (dict): Количество ошибок клиента по меткам запросов.
+        """
+        for label, histogram in histograms.items():
+            self.histograms.setdefault(label, LatencyHistogram()).merge(histogram)
+        for label, count in errors.items():
+            self.errors[label] = self.errors.get(label, 0) + count
+
+    @property
+    def total(self) -> LatencyHistogram:
+        """Гистограмма всех успешных запросов."""
+        total = LatencyHistogram()
+        for histogram in self.histograms.values():
+            total.merge(histogram)
+        return total
+
+    @property
+    def throughput(self) -> float:
+        """Количество успешных запросов в секунду."""
+        return self.total.count / self.duration if self.duration else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        """Доля запросов, завершившихся ошибкой."""
+        errors = sum(self.errors.values())
+        attempts = self.total.count + errors
+        return errors / attempts if attempts else 0.0
+
+    def __str__(self):
+        total = self.total.to_dict()
+        lines = [f"Клиентов: {self.clients}; {self.throughput:.1f} запросов/с; ошибок: {self.error_rate:.2%}; "
+                 f"p50={total['p50']:.6f} p95={total['p95']:.6f} p99={total['p99']:.6f}"]
+        for label in sorted(set(self.histograms) | set(self.errors)):
+            stats = self.histograms.get(label, LatencyHistogram()).to_dict()
+            lines.append(f"    {label}: {stats['count']} запросов, ошибок {self.errors.get(label, 0)}, "
+                         f"p50={stats['p50']:.6f} p95={stats['p95']:.6f} p99={stats['p99']:.6f}")
+        return '\n'.join(lines)
+
+
+def query_mix_label(spec) -> str:
+    """
+    Возвращает метку запроса из смеси: явную метку или '<тип> <таблица>'.
+
+    Параметры:
+        - spec (dict): Описание запроса.
+
+    Возвращает:
+        - str: Метка запроса.
+    """
+    return spec.get("label") or f"{spec['type']} {spec['table']}"
+
+
+def run_client(connection_kwargs, mix, duration, client_index=0, seed=None, warmup=0.0, commit=False,
+               driver=None) -> tuple:
+    """
+    Выполняет случайную смесь запросов в одном соединении в течение заданного времени.
+
+    Параметры:
+        - connection_kwargs (dict): Параметры подключения (host, user, password, database).
+        - mix (list[dict]): Запросы смеси. Каждый запрос - аргументы build_query (type, table, conditions, values,
+          join, order_by, group_by, having, insert_select) плюс weight (вес, по умолчанию 1), num_rows
+          (LIMIT, по умолчанию 10) и необязательная метка label.
+        - duration (float): Длительность измеряемой части в секундах.
+        - client_index (int, optional): Номер клиента, от него зависят id вставляемых строк и seed.
+        - seed (int, optional): Начальное значение генератора случайных чисел.
+        - warmup (float, optional): Время прогрева в секундах, запросы в котором не учитываются.
+        - commit (bool, optional): Фиксировать изменяющие запросы. По умолчанию они откатываются, чтобы данные не менялись.
+          При фиксации каждая следующая вставка в таблицу нумерует строки после уже вставленных, поэтому
+          ее id не совпадают с зафиксированными.
+        - driver (str, optional): Драйвер MySQL (см. lib.drivers). По умолчанию mysql.connector.
+
+    Возвращает:
+        - tuple: Словарь {метка: LatencyHistogram} и словарь {метка: количество ошибок}.
+    """
+    driver = get_driver(driver)
+    rng = random.Random(None if seed is None else seed + client_index)
+    weights = [spec.get("weight", 1) for spec in mix]
+    histograms = {}
+    errors = {}
+    conn = driver.connect(**connection_kwargs)
+    cursor = conn.cursor()
+    try:
+        max_ids = {}
+        for spec in mix:
+            if 'INSERT' in spec["type"] and spec["table"] not in max_ids:
+                cursor.execute(f"SELECT MAX(id) FROM {spec['table']}")
+                max_ids[spec["table"]] = (cursor.fetchone()[0] or 0) + client_index * ID_STRIDE
+
+        def build(spec):
+            return build_query(spec["type"], spec["table"], spec.get("num_rows", 10),
+                               conditions=spec.get("conditions"), values=spec.get("values"), join=spec.get("join"),
+                               order_by=spec.get("order_by"), group_by=spec.get("group_by"),
+                               having=spec.get("having"), insert_select=spec.get("insert_select"),
+                               max_id=max_ids.get(spec["table"], 0))
+
+        queries = [build(spec) for spec in mix]
+        labels = [query_mix_label(spec) for spec in mix]
+
+        start = time.perf_counter()
+        measure_from = start + warmup
+        deadline = measure_from + duration
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            i = rng.choices(range(len(mix)), weights)[0]
+            began = time.perf_counter_ns()
+            try:
+                cursor.execute(queries[i])
+                if driver.has_rows(cursor):
+                    cursor.fetchall()
+                if not queries[i].startswith('SELECT'):
+                    if commit:
+                        conn.commit()
+                    else:
+                        conn.rollback()
+                elapsed = time.perf_counter_ns() - began
+                if now >= measure_from:
+                    histograms.setdefault(labels[i], LatencyHistogram()).record(elapsed)
+                if commit and 'INSERT' in mix[i]["type"]:
+                    # Зафиксированные строки заняли id, следующие вставки в таблицу нумеруются после них
+                    table = mix[i]["table"]
+                    max_ids[table] += mix[i].get("num_rows", 10)
+                    queries = [build(spec) if spec["table"] == table else query for spec, query in zip(mix, queries)]
+            except driver.Error:
+                conn.rollback()
+                if now >= measure_from:
+                    errors[labels[i]] = errors.get(labels[i], 0) + 1
+    finally:
+        cursor.close()
+        conn.close()
+    return histograms, errors
+
+
+class LoadGenerator:
+    """
+    Многоклиентский генератор нагрузки для измерения пропускной способности.
+
+    Каждый клиент открывает собственное соединение и в течение `duration` секунд выполняет случайную смесь
+    запросов той же формы, что строит query_graph. Клиенты запускаются в потоках или в процессах
+    (процессы не упираются в GIL при разборе результатов на стороне клиента).
+
+    Атрибуты:
+        - connection_kwargs (dict): Параметры подключения к базе данных.
+        - mix (list[dict]): Запросы смеси (см. run_client).
+        - duration (float): Длительность измерения для каждого уровня параллельности в секундах.
+        - warmup (float): Время прогрева в секундах.
+        - mode (str): 'thread' или 'process'.
+        - seed (int | None): Начальное значение генератора случайных чисел.
+        - commit (bool): Фиксировать ли изменяющие запросы.
+        - driver (str | None): Драйвер MySQL клиентов.
+
+    Пример использования:
+        mix = [{'type': 'SELECT', 'table': 'Menu', 'weight': 8}, {'type': 'DELETE', 'table': 'Guest', 'weight': 2}]\n
+        generator = LoadGenerator('localhost', 'root', '123456', 'my_sandbox_database', mix, duration=10)\n
+        for result in generator.scale([1, 2, 4, 8]):
+            print(result)
+    """
+
+    def __init__(self, host, user, password, db_name, mix, duration=10.0, warmup=1.0, mode='thread', seed=None,
+                 commit=False, driver=None):
+        """
+        Инициализирует экземпляр LoadGenerator.
+
+        Параметры:
+            - host (str): Хост для подключения к базе данных.
+            - user (str): Имя пользователя для подключения к базе данных.
+            - password (str): Пароль для подключения к базе данных.
+            - db_name (str): Имя базы данных.
+            - mix (list[dict]): Запросы смеси.
+            - duration (float, optional): Длительность измерения в секундах (по умолчанию 10).
+            - warmup (float, optional): Время прогрева в секундах (по умолчанию 1).
+            - mode (str, optional): 'thread' (по умолчанию) или 'process'.
+            - seed (int, optional): Начальное значение генератора случайных чисел.
+            - commit (bool, optional): Фиксировать ли изменяющие запросы (по умолчанию False - откат).
+            - driver (str, optional): Драйвер MySQL (см. lib.drivers). Передается по имени, чтобы клиенты-процессы
+              создавали его сами.
+
+        Исключения:
+            - ValueError: Если смесь пуста или указан неизвестный режим.
+        """
+        if not mix:
+            raise ValueError("Смесь запросов пуста")
+        if mode not in ('thread', 'process'):
+            raise ValueError("mode должен быть 'thread' или 'process'")
+        self.connection_kwargs = {"host": host, "user": user, "password": password, "database": db_name}
+        self.mix = list(mix)
+        self.duration = duration
+        self.warmup = warmup
+        self.mode = mode
+        self.seed = seed
+        self.commit = commit
+        self.driver = driver
+
+    def run(self, clients) -> LoadResult:
+        """
+        Выполняет нагрузочный прогон с заданным количеством параллельных клиентов.
+
+        Параметры:
+            - clients (int): Количество клиентов.
+
+        Возвращает:
+            - LoadResult: Результат прогона.
+        """
+        executor_class = ThreadPoolExecutor if self.mode == 'thread' else ProcessPoolExecutor
+        result = LoadResult(clients, self.duration)
+        with executor_class(max_workers=clients) as executor:
+            futures = [executor.submit(run_client, self.connection_kwargs, self.mix, self.duration, i, self.seed,
+                                       self.warmup, self.commit, self.driver)
+                       for i in range(clients)]
+            for future in futures:
+                result.add_client(*future.result())
+        return result
+
+    def scale(self, levels) -> list[LoadResult]:
+        """
+        Выполняет прогоны для нескольких уровней параллельности.
+
+        Параметры:
+            - levels (list[int]): Количества клиентов, например [1, 2, 4, 8].
+
+        Возвращает:
+            - list[LoadResult]: Результаты в порядке уровней.
+        """
+        results = []
+        for clients in levels:
+            result = self.run(clients)
+            print(result)
+            results.append(result)
+        return results
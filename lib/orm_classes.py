@@ -1,6 +1,7 @@
-import mysql.connector
-import mysql.connector
 import re
+from datetime import date
+from lib.backends import get_backend
+from lib.schema import SCHEMA
 
 
 class Field:
@@ -165,6 +166,32 @@ class FloatField(Field):
         super().__init__("FLOAT", primary_key, foreign_key, min_value=min_value, max_value=max_value)
 
 
+class DateField(Field):
+    """
+    Класс представляет поле даты (DATE) в схеме базы данных.
+
+    Наследует от класса Field.
+
+    Атрибуты:
+        - field_type (str): Тип поля (в данном случае 'DATE').
+        - primary_key (bool): Является ли поле первичным ключом.
+        - foreign_key (str or None): Ссылка на внешний ключ, если поле является внешним ключом.
+        - constraints (dict): Дополнительные ограничения поля.
+
+    Пример использования:
+       - field = DateField()
+    """
+    def __init__(self, primary_key=False, foreign_key=None):
+        """
+        Инициализирует экземпляр класса DateField.
+
+        Параметры:
+            - primary_key (bool, optional): Является ли поле первичным ключом (по умолчанию False).
+            - foreign_key (str, optional): Ссылка на внешний ключ, если поле является внешним ключом.
+        """
+        super().__init__("DATE", primary_key, foreign_key)
+
+
 class ForeignKey(Field):
     """
     Класс представляет внешний ключ в схеме базы данных.
@@ -231,6 +258,119 @@ class ManyToManyField:
         self.to = to
 
 
+class Index:
+    """
+    Класс представляет вторичный (в том числе составной) индекс таблицы.
+
+    Атрибуты:
+        - name (str): Имя индекса.
+        - columns (list[str]): Колонки индекса в порядке следования.
+        - unique (bool): Является ли индекс уникальным.
+
+    Пример:
+        - index = Index('idx_menu_prices', ['prices', 'name'])
+    """
+    def __init__(self, name, columns, unique=False):
+        """
+        Инициализирует экземпляр класса Index.
+
+        Параметры:
+            - name (str): Имя индекса.
+            - columns (list[str]): Колонки индекса.
+            - unique (bool, optional): Является ли индекс уникальным (по умолчанию False).
+        """
+        self.name = name
+        self.columns = list(columns)
+        self.unique = unique
+
+    def definition(self) -> str:
+        """
+        Возвращает описание индекса для CREATE TABLE.
+
+        Возвращает:
+            - str: Например, 'INDEX idx_menu_prices (prices, name)'.
+        """
+        return f"{'UNIQUE ' if self.unique else ''}INDEX {self.name} ({', '.join(self.columns)})"
+
+
+class RangePartition:
+    """
+    Класс представляет секционирование таблицы по диапазонам значений колонки даты (PARTITION BY RANGE).
+
+    Атрибуты:
+        - column (str): Колонка секционирования, должна иметь тип DATE или DATETIME.
+        - by (str): Размер секции: 'month' или 'year'.
+        - start (str or None): Начало первой секции: 'YYYY-MM' для месяцев, 'YYYY' для лет.
+        - stop (str or None): Конец последней секции (не включительно) в том же формате.
+
+    Примечания:
+        - Строки вне [start, stop) попадают в секцию pmax (VALUES LESS THAN MAXVALUE), поэтому вставка не падает.
+        - InnoDB не поддерживает внешние ключи у секционированных таблиц и ссылки на них, а первичный ключ должен
+          включать колонку секционирования. Эти ограничения учитываются при создании таблиц.
+
+    Пример:
+        - partition = RangePartition('order_date', by='month', start='2021-01', stop='2025-01')
+    """
+    PERIODS = ("month", "year")
+
+    def __init__(self, column, by="month", start=None, stop=None):
+        """
+        Инициализирует экземпляр класса RangePartition.
+
+        Параметры:
+            - column (str): Колонка секционирования.
+            - by (str, optional): Размер секции: 'month' (по умолчанию) или 'year'.
+            - start (str, optional): Начало первой секции.
+            - stop (str, optional): Конец последней секции (не включительно).
+
+        Исключения:
+            - ValueError: Если указан неизвестный размер секции.
+        """
+        if by not in self.PERIODS:
+            raise ValueError(f"Неизвестный размер секции: {by}. Ожидается 'month' или 'year'.")
+        self.column = column
+        self.by = by
+        self.start = start
+        self.stop = stop
+
+    def expression(self) -> str:
+        """
+        Возвращает выражение секционирования: YEAR(col) * 100 + MONTH(col) для месяцев или YEAR(col) для лет.
+        """
+        if self.by == "month":
+            return f"YEAR({self.column}) * 100 + MONTH({self.column})"
+        return f"YEAR({self.column})"
+
+    def bounds(self) -> list[tuple[str, int]]:
+        """
+        Возвращает секции диапазона [start, stop).
+
+        Возвращает:
+            - list[tuple[str, int]]: Пары (имя секции, верхняя граница VALUES LESS THAN).
+              Например, для месяца 2021-01 - ('p202101', 202102).
+        """
+        if not self.start or not self.stop:
+            return []
+        if self.by == "year":
+            return [(f"p{year}", year + 1) for year in range(int(self.start), int(self.stop))]
+        year, month = map(int, self.start.split("-"))
+        stop = tuple(map(int, self.stop.split("-")))
+        bounds = []
+        while (year, month) < stop:
+            next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+            bounds.append((f"p{year}{month:02d}", next_year * 100 + next_month))
+            year, month = next_year, next_month
+        return bounds
+
+    def clause(self) -> str:
+        """
+        Возвращает предложение PARTITION BY RANGE для CREATE TABLE.
+        """
+        partitions = [f"PARTITION {name} VALUES LESS THAN ({bound})" for name, bound in self.bounds()]
+        partitions.append("PARTITION pmax VALUES LESS THAN MAXVALUE")
+        return f"PARTITION BY RANGE ({self.expression()}) ({', '.join(partitions)})"
+
+
 class ModelMeta(type):
     """
     Метакласс для определения моделей в ORM системе.
@@ -261,21 +401,29 @@ class ModelMeta(type):
             return super().__new__(cls, name, bases, attrs)
 
         docstring = attrs.get("__doc__", "")
-        columns, many_to_many = cls.parse_docstring(docstring)
-        attrs["_meta"] = {"columns": columns, "many_to_many": many_to_many}
+        columns, many_to_many, indexes, partitioning = cls.parse_docstring(docstring)
+        attrs["_meta"] = {"columns": columns, "many_to_many": many_to_many, "indexes": indexes,
+                          "partitioning": partitioning}
 
         return super().__new__(cls, name, bases, attrs)
 
     @staticmethod
     def parse_docstring(docstring):
         """
-        Парсит docstring модели и извлекает информацию о полях и связях.
+        Парсит docstring модели и извлекает информацию о полях, связях, индексах и секционировании.
 
         Параметры:
             - docstring (str): Docstring модели.
 
         Возвращает:
-            - tuple: Кортеж, содержащий словарь колонок (columns) и список связей многие-ко-многим (many_to_many).
+            - tuple: Кортеж, содержащий словарь колонок (columns), список связей многие-ко-многим (many_to_many),
+              список вторичных индексов (indexes) и секционирование (partitioning, RangePartition или None).
+
+        Примечания:
+            - Индекс описывается строкой '<имя индекса>: Index(<колонка>, <колонка>, ...)',
+              уникальный - 'UniqueIndex(...)'.
+            - Секционирование описывается строкой
+              '<любое имя>: RangePartition(<колонка>, by=month, start=2021-01, stop=2025-01)'.
 
         Пример:
             Для docstring:\n
@@ -286,10 +434,12 @@ class ModelMeta(type):
             related_models: ManyToManyField(to='RelatedModel')\n
             "\n
             Возвращает ({'id': IntegerField(primary_key=True), 'name': CharField(max_length=50),
-            'related_model': ForeignKey(to='RelatedModel')}, [('related_models', 'RelatedModel')])
+            'related_model': ForeignKey(to='RelatedModel')}, [('related_models', 'RelatedModel')], [], None)
         """
         columns = {}
         many_to_many = []
+        indexes = []
+        partitioning = None
         for line in docstring.strip().split("\n"):
             match = re.match(r"(\w+):\s*(\w+)(?:\((.*?)\))?", line.strip())
             if match:
@@ -306,12 +456,22 @@ class ModelMeta(type):
                     columns[name] = CharField(max_length, primary_key="primary_key=True" in (params or ""), **constraints)
                 elif field_type == "FloatField":
                     columns[name] = FloatField()
+                elif field_type == "DateField":
+                    columns[name] = DateField()
                 elif field_type == "ForeignKey":
                     foreign_key = params.split("=")[-1]
                     columns[name] = ForeignKey(foreign_key)
                 elif field_type == "ManyToManyField":
                     many_to_many.append((name, params.split("=")[-1]))
-        return columns, many_to_many
+                elif field_type in ("Index", "UniqueIndex", "RangePartition"):
+                    args = [arg.strip() for arg in (params or "").split(",") if arg.strip()]
+                    positional = [arg for arg in args if "=" not in arg]
+                    options = dict(arg.replace(" ", "").split("=", 1) for arg in args if "=" in arg)
+                    if field_type == "RangePartition":
+                        partitioning = RangePartition(positional[0], **options)
+                    else:
+                        indexes.append(Index(name, positional, unique=field_type == "UniqueIndex"))
+        return columns, many_to_many, indexes, partitioning
 
 
 class Model(metaclass=ModelMeta):
@@ -323,6 +483,7 @@ class Model(metaclass=ModelMeta):
             - host (str): Хост базы данных.
             - user (str): Пользователь базы данных.
             - password (str): Пароль пользователя базы данных.
+            - backend (Backend): Движок базы данных. Для SQLite: Model.backend = get_backend('sqlite').
 
         Атрибуты экземпляра:
             - _data (dict): Словарь для хранения значений полей модели.
@@ -331,6 +492,7 @@ class Model(metaclass=ModelMeta):
     host = "localhost"
     user = "root"
     password = "123456"
+    backend = get_backend()
 
     def __init__(self, **kwargs):
         """
@@ -355,6 +517,29 @@ class Model(metaclass=ModelMeta):
             else:
                 raise AttributeError(f"Invalid attribute: {key}")
 
+    @classmethod
+    def from_row(cls, row):
+        """
+        Создает экземпляр модели из кортежа значений в порядке колонок без проверки ограничений полей.
+
+        Параметры:
+            - row (tuple): Значения колонок в порядке объявления полей модели.
+
+        Возвращает:
+            - Model: Экземпляр модели.
+
+        Примечания:
+            - Предназначен для строк, которые уже соответствуют схеме: сгенерированных по реестру lib.schema
+              или прочитанных из базы. В отличие от конструктора, не создает промежуточный словарь аргументов
+              и не вызывает validate_field для каждого поля.
+
+        Пример:
+            menu = Menu.from_row((1, "Латте", 200))
+        """
+        instance = cls.__new__(cls)
+        instance._data = dict(zip(cls._meta["columns"], row))
+        return instance
+
     def validate_field(self, key, value, field):
         """
         Проверяет значение поля на соответствие ограничениям, определённым в классе поля.
@@ -381,6 +566,8 @@ class Model(metaclass=ModelMeta):
             3) Для FloatField:
                 * Если значение меньше min_value.
                 * Если значение больше max_value.
+            4) Для DateField:
+                * Если значение не является датой (datetime.date).
         """
         if isinstance(field, IntegerField):
             if field.constraints.get('min_value') is not None and value < field.constraints['min_value']:
@@ -400,6 +587,9 @@ class Model(metaclass=ModelMeta):
                 raise ValueError(f"Поле '{key}' должно быть больше или равно {field.constraints['min_value']}")
             if field.constraints.get('max_value') is not None and value > field.constraints['max_value']:
                 raise ValueError(f"Поле '{key}' должно быть меньше или равно {field.constraints['max_value']}")
+        elif isinstance(field, DateField):
+            if not isinstance(value, date):
+                raise ValueError(f"Поле '{key}' должно быть датой")
 
     def __getattr__(self, item):
         """
@@ -424,6 +614,21 @@ class Model(metaclass=ModelMeta):
             return self._data[item]
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{item}'")
 
+    def __repr__(self):
+        """
+        Возвращает представление экземпляра модели в виде вызова конструктора, например
+        "Menu(id=1, name='Латте', prices=200)".
+        """
+        values = ", ".join(f"{name}={self._data.get(name)!r}" for name in self._meta["columns"])
+        return f"{self.__class__.__name__}({values})"
+
+    def __str__(self):
+        """
+        Возвращает многострочное представление экземпляра модели с полями в порядке объявления.
+        """
+        values = ",\n".join(f'\t"{name}": {self._data.get(name)}' for name in self._meta["columns"])
+        return f"{self.__class__.__name__}:\n[\n{values}\n]"
+
     def __setattr__(self, key, value):
         """
        Устанавливает значение атрибута, если он существует в _meta["columns"].
@@ -459,7 +664,7 @@ class Model(metaclass=ModelMeta):
 
         Исключения:
         -----------
-        mysql.connector.Error: Вызывается, если возникает ошибка при выполнении SQL-запроса.
+        backend.Error: Исключение драйвера движка Model.backend. Вызывается, если возникает ошибка при выполнении SQL-запроса.
 
         Пример использования:
         ---------------------
@@ -467,22 +672,13 @@ class Model(metaclass=ModelMeta):
         """
         conn = None
         try:
-            conn = mysql.connector.connect(
-                host=cls.host,
-                user=cls.user,
-                password=cls.password,
-                database=cls.db_name
-            )
+            conn = cls.backend.connect(cls.host, cls.user, cls.password, cls.db_name)
             cursor = conn.cursor()
-            cursor.execute(query, params)
-            if cursor.with_rows:
-                result = cursor.fetchall()
-                column_names = cursor.column_names
-            else:
-                result, column_names = None, None
+            cursor.execute(query, params or ())
+            result, column_names = cls.backend.fetch_result(cursor)
             conn.commit()
             return result, column_names
-        except mysql.connector.Error as err:
+        except cls.backend.Error as err:
             print(f"Ошибка: {err}")
         finally:
             if conn:
@@ -499,23 +695,24 @@ class Model(metaclass=ModelMeta):
 
         Исключения:
         -----------
-        mysql.connector.Error:
+        backend.Error:
             Вызывается, если возникает ошибка при создании базы данных.
 
         Пример использования:
         ---------------------
         Model.create_database()
        """
+        query = cls.backend.create_database_sql(cls.db_name)
+        if query is None:
+            # Встроенная база создается при первом подключении
+            return
+        conn = None
         try:
-            conn = mysql.connector.connect(
-                host=cls.host,
-                user=cls.user,
-                password=cls.password
-            )
+            conn = cls.backend.connect(cls.host, cls.user, cls.password)
             cursor = conn.cursor()
-            cursor.execute(f"CREATE DATABASE IF NOT EXISTS {cls.db_name}")
+            cursor.execute(query)
             conn.commit()
-        except mysql.connector.Error as err:
+        except cls.backend.Error as err:
             print(f"Ошибка при создании базы данных: {err}")
         finally:
             if conn:
@@ -532,18 +729,25 @@ class Model(metaclass=ModelMeta):
 
            Примечания:
            -----------
-           - Метод создает таблицу на основе атрибутов модели, включая поля, первичные и внешние ключи.
+           - Метод создает таблицу на основе атрибутов модели, включая поля, первичные и внешние ключи,
+             вторичные индексы и секционирование.
+           - У секционированной таблицы первичный ключ дополняется колонкой секционирования, а внешние ключи
+             этой таблицы и ссылки на нее не создаются - InnoDB их не поддерживает.
            - Также создает таблицы для связей Many-to-Many, если таковые имеются.
 
            Исключения:
            -----------
-           mysql.connector.Error:
+           backend.Error:
                Вызывается, если возникает ошибка при выполнении запроса к базе данных.
 
            Пример использования:
            ---------------------
             Model.create_table()
            """
+        partitioning = cls._meta.get("partitioning")
+        if partitioning and not cls.backend.supports_partitioning:
+            print(f"Секционирование таблицы {cls.__name__.lower()} пропущено: движок {cls.backend.name} его не поддерживает.")
+            partitioning = None
         columns = []
         primary_keys = []
         for name, field in cls._meta["columns"].items():
@@ -551,18 +755,43 @@ class Model(metaclass=ModelMeta):
             if field.primary_key:
                 primary_keys.append(name)
             if field.foreign_key:
-                columns.append(f"FOREIGN KEY ({name}) REFERENCES {field.foreign_key}(id)")
+                if partitioning or cls.is_partitioned(field.foreign_key):
+                    print(f"Внешний ключ {cls.__name__.lower()}.{name} пропущен: секционированные таблицы "
+                          f"не поддерживают внешние ключи.")
+                else:
+                    columns.append(f"FOREIGN KEY ({name}) REFERENCES {field.foreign_key}(id)")
+        if partitioning and primary_keys and partitioning.column not in primary_keys:
+            primary_keys.append(partitioning.column)
         if primary_keys:
             columns.append(f"PRIMARY KEY ({', '.join(primary_keys)})")
-        columns_sql = ", ".join(columns)
 
-        query = f"CREATE TABLE IF NOT EXISTS {cls.__name__.lower()} ({columns_sql})"
-        cls.execute_query(query)
+        for query in cls.backend.create_table_sql(cls.__name__.lower(), columns, cls._meta.get("indexes", []),
+                                                  partitioning):
+            cls.execute_query(query)
 
         # Создание таблиц для Many-to-Many связей
         for field_name, related_model_name in cls._meta["many_to_many"]:
             cls.create_many_to_many_table(field_name, related_model_name)
 
+    @classmethod
+    def is_partitioned(cls, table_name) -> bool:
+        """
+        Проверяет, описано ли у модели с данным именем таблицы секционирование.
+
+        Параметры:
+        ----------
+        table_name : str
+            Имя таблицы (имя модели без учета регистра).
+
+        Возвращает:
+        -----------
+        bool: True, если модель найдена среди наследников Model и секционирована.
+        """
+        for subclass in Model.__subclasses__():
+            if subclass.__name__.lower() == str(table_name).strip("'\"").lower():
+                return subclass._meta.get("partitioning") is not None
+        return False
+
     @classmethod
     def create_all_tables(cls):
         """
@@ -579,7 +808,7 @@ class Model(metaclass=ModelMeta):
 
         Исключения:
         -----------
-        mysql.connector.Error:
+        backend.Error:
             Вызывается, если возникает ошибка при выполнении запроса к базе данных.
 
         Пример использования:
@@ -611,7 +840,7 @@ class Model(metaclass=ModelMeta):
 
           Исключения:
           -----------
-          mysql.connector.Error:
+          backend.Error:
               Вызывается, если возникает ошибка при выполнении запроса к базе данных.
 
           Пример использования:
@@ -620,16 +849,16 @@ class Model(metaclass=ModelMeta):
           """
         table_name = f"{cls.__name__.lower()}_has_{related_model_name}"
         print(table_name)
-        query = f"""
-        CREATE TABLE IF NOT EXISTS {table_name} (
-            id INTEGER PRIMARY KEY AUTO_INCREMENT,
-            {cls.__name__.lower()}_id INTEGER,
-            {related_model_name}_id INTEGER,
-            FOREIGN KEY ({cls.__name__.lower()}_id) REFERENCES {cls.__name__.lower()}(id),
-            FOREIGN KEY ({related_model_name}_id) REFERENCES {related_model_name}(id)
-        )
-        """
-        cls.execute_query(query)
+        definitions = [
+            "id INT AUTO_INCREMENT",
+            f"{cls.__name__.lower()}_id INTEGER",
+            f"{related_model_name}_id INTEGER",
+            "PRIMARY KEY (id)",
+            f"FOREIGN KEY ({cls.__name__.lower()}_id) REFERENCES {cls.__name__.lower()}(id)",
+            f"FOREIGN KEY ({related_model_name}_id) REFERENCES {related_model_name}(id)"
+        ]
+        for query in cls.backend.create_table_sql(table_name, definitions):
+            cls.execute_query(query)
 
     def save(self):
         """
@@ -643,7 +872,7 @@ class Model(metaclass=ModelMeta):
 
         Исключения:
         -----------
-        mysql.connector.Error:
+        backend.Error:
             Вызывается, если возникает ошибка при выполнении запроса к базе данных.
 
         Пример использования:
@@ -657,7 +886,7 @@ class Model(metaclass=ModelMeta):
             columns.append(name)
             values.append(getattr(self, name))
         columns_sql = ", ".join(columns)
-        placeholders = ", ".join(["%s"] * len(values))
+        placeholders = ", ".join([self.backend.placeholder] * len(values))
 
         query = f"INSERT INTO {self.__class__.__name__.lower()} ({columns_sql}) VALUES ({placeholders})"
         self.execute_query(query, values)
@@ -679,7 +908,7 @@ class Model(metaclass=ModelMeta):
 
          Исключения:
          -----------
-         mysql.connector.Error:
+         backend.Error:
              Вызывается, если возникает ошибка при выполнении запроса к базе данных.
 
          Пример использования:
@@ -715,7 +944,7 @@ class Model(metaclass=ModelMeta):
 
         Исключения:
         -----------
-        mysql.connector.Error:
+        backend.Error:
             Вызывается, если возникает ошибка при выполнении запроса к базе данных.
 
         Пример использования:
@@ -725,7 +954,7 @@ class Model(metaclass=ModelMeta):
         conditions = []
         values = []
         for key, value in kwargs.items():
-            conditions.append(f"{key}=%s")
+            conditions.append(f"{key}={cls.backend.placeholder}")
             values.append(value)
         conditions_sql = " AND ".join(conditions)
 
@@ -736,81 +965,13 @@ class Model(metaclass=ModelMeta):
         return None
 
 
-# Определение моделей
-class Menu(Model):
-    """
-    id: IntegerField(primary_key=True)    \n
-    name: CharField(max_length=100)    \n
-    prices: FloatField(min_value=1, max_value=1000)    \n
-    """
-    def __repr__(self):
-        return f"Menu(id={self.id}, name='{self.name}', prices={self.prices})"
-
-    def __str__(self):
-        return f'Menu:\n[\n\t"id": {self.id},\n\t"name": {self.name},\n\t"prices": {self.prices}\n]'
-
-
-class Barista(Model):
-    """
-    id: IntegerField(primary_key=True)    \n
-    name: CharField(max_length=255, words_count=3)    \n
-    work_time: IntegerField(min_value=0, max_value=160)    \n
-    """
-    def __repr__(self):
-        return f"Barista(id={self.id}, name='{self.name}', work_time={self.work_time})"
-
-    def __str__(self):
-        return f'Barista:\n[\n\t"id": {self.id},\n\t"name": {self.name},\n\t"work_time": {self.work_time}\n]'
-
-
-class Guest(Model):
-    """
-    id: IntegerField(primary_key=True)    \n
-    name: CharField(max_length=255, words_count=3)    \n
-    contact_number: CharField(max_length=16)    \n
-    """
-    def __repr__(self):
-        return f"Guest(id={self.id}, name='{self.name}', contact_number='{self.contact_number}')"
-
-    def __str__(self):
-        return f'Guest:\n[\n\t"id": {self.id},\n\t"name": {self.name},\n\t"contact_number": {self.contact_number}\n]'
-
-
-class Personal_Order(Model):
-    """
-    id: IntegerField(primary_key=True)    \n
-    count: IntegerField(min_value=1, max_value=5)    \n
-    menu_id: ForeignKey(to=Menu)    \n
-    """
-    def __repr__(self):
-        return f"Personal_Order(id={self.id}, count={self.count}, menu_id={self.menu_id})"
-
-    def __str__(self):
-        return f'Personal_Order:\n[\n\t"id": {self.id},\n\t"count": {self.count},\n\t"menu_id": {self.menu_id}\n]'
-
-
-class Orders(Model):
-    """
-    id: IntegerField(primary_key=True)    \n
-    order_date: CharField(max_length=10)    \n
-    guest_id: ForeignKey(to=Guest)    \n
-    barista_id: ForeignKey(to=Barista)    \n
-    """
-    def __repr__(self):
-        return f"Orders(id={self.id}, order_date='{self.order_date}', guest_id={self.guest_id}, barista_id={self.barista_id})"
-
-    def __str__(self):
-        return f'Orders:\n[\n\t"id": {self.id},\n\t"order_date": {self.order_date},\n\t"guest_id": {self.guest_id},\n\t"barista_id": {self.barista_id}\n]'
-
-
-class Orders_has_personal_order(Model):
-    """
-    id: IntegerField(primary_key=True)
-    personal_order_id: ForeignKey(to=Personal_order)
-    orders_id: ForeignKey(to=Orders)
-    """
-    def __repr__(self):
-        return f"Orders_has_personal_order(id={self.id}, personal_order_id={self.personal_order_id}, orders_id={self.orders_id})"
-
-    def __str__(self):
-        return f'Orders_has_personal_order:\n[\n\t"id": {self.id},\n\t"personal_order_id": {self.personal_order_id},\n\t"orders_id": {self.orders_id}\n]'
+# Определение моделей: поля и индексы берутся из реестра таблиц lib.schema, общего с генератором данных,
+# DatabaseCreator и DatabaseDataPusher
+Menu = SCHEMA["menu"].model(Model, module=__name__)
+Barista = SCHEMA["barista"].model(Model, module=__name__)
+Guest = SCHEMA["guest"].model(Model, module=__name__)
+Personal_Order = SCHEMA["personal_order"].model(Model, module=__name__)
+Orders = SCHEMA["orders"].model(Model, module=__name__)
+Orders_has_Order = SCHEMA["orders_has_order"].model(Model, module=__name__)
+# Прежнее имя модели связей: таблица orders_has_personal_order в базе не создается
+Orders_has_personal_order = Orders_has_Order
@@ -0,0 +1,85 @@
+def build_query(query_type, table, num_rows, conditions=None, values=None, join=None, order_by=None, group_by=None,
+                having=None, insert_select=None, max_id=0) -> str:
+    """
+    Строит SQL-запрос одного шага замеров query_graph.
+
+    Параметры:
+        - query_type (str): Тип запроса ('SELECT', 'INSERT', 'DELETE') или начало SELECT-запроса со списком полей,
+          например 'SELECT Menu.id, COUNT(*)'.
+        - table (str): Имя таблицы.
+        - num_rows (int): Количество строк (LIMIT).
+        - conditions (str, optional): Условие для WHERE в запросах SELECT и DELETE.
+        - values (list[dict], optional): Значения для вставки в запросе INSERT.
+        - join (list[str], optional): Пары [таблица, условие, таблица, условие, ...] для JOIN.
+        - order_by (str, optional): ORDER BY условие для SELECT.
+        - group_by (str, optional): GROUP BY условие для SELECT.
+        - having (str, optional): HAVING условие для SELECT.
+        - insert_select (dict, optional): Описание INSERT ... SELECT с ключами target_columns, source_columns,
+          source_table и необязательным conditions.
+        - max_id (int, optional): Текущий максимальный id таблицы, от которого нумеруются вставляемые строки.
+
+    Возвращает:
+        - str: SQL-запрос, заканчивающийся на ' LIMIT <num_rows>'.
+
+    Исключения:
+        - ValueError: Если для INSERT не указаны значения или тип запроса неизвестен.
+    """
+    if 'SELECT' in query_type:
+        if query_type == 'SELECT':
+            query = f"SELECT * FROM {table}"
+        else:
+            query = f"{query_type} FROM {table}"
+        if join:
+            for j in range(0, len(join), 2):
+                query += f" JOIN {join[j]} ON {join[j+1]}"
+        if conditions:
+            query += f" WHERE {conditions}"
+        if group_by:
+            query += f" GROUP BY {group_by}"
+        if having:
+            query += f" HAVING {having}"
+        if order_by:
+            query += f" ORDER BY {order_by}"
+        query += f" LIMIT {num_rows}"
+    elif 'INSERT' in query_type:
+        if values and len(values) > 0:
+            columns = list(values[0].keys())
+            # Тут выводит ошибку, хотя запрос выполняется
+            # Ошибка при выполнении запроса: 1062 (23000): Duplicate entry '6239' for key 'menu.PRIMARY'
+            # Но вставка данных происходит и происходит корректно
+            values_str = ', '.join(
+                [f"({max_id + 1 + j}, {', '.join(map(repr, row.values()))})" for j, row in zip(range(num_rows), values)])
+            query = f"INSERT INTO {table} (id, {', '.join(columns)}) VALUES {values_str}"
+            query += f" LIMIT {num_rows}"
+        elif insert_select:
+            target_columns = ', '.join(['id'] + insert_select['target_columns'])
+            source_columns = ', '.join([f"{max_id} + ROW_NUMBER() OVER ()"] + insert_select['source_columns'])
+            source_table = insert_select['source_table']
+            query = f"INSERT INTO {table} ({target_columns}) SELECT {source_columns} FROM {source_table}"
+            if insert_select.get('conditions'):
+                query += f" WHERE {insert_select['conditions']}"
+            query += f" LIMIT {num_rows}"
+        else:
+            raise ValueError("Не указаны значения для вставки.")
+    elif query_type == 'DELETE':
+        query = f"DELETE FROM {table}"
+        if conditions:
+            query += f" WHERE {conditions}"
+        query += f" LIMIT {num_rows}"
+    else:
+        raise ValueError("Неверный тип запроса. Ожидается 'SELECT', 'INSERT' или 'DELETE'.")
+    return query
+
+
+def query_label(query, num_rows) -> str:
+    """
+    Возвращает подпись серии на графике - запрос без завершающего ' LIMIT <num_rows>'.
+
+    Параметры:
+        - query (str): SQL-запрос, построенный build_query.
+        - num_rows (int): Количество строк, подставленное в LIMIT.
+
+    Возвращает:
+        - str: Запрос без LIMIT.
+    """
+    return query[:-(7 + len(str(num_rows)))]
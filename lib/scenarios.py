@@ -0,0 +1,221 @@
+import glob
+import tomllib
+from lib.data_generator import DataGenerator
+
+# Генераторы значений для INSERT-запросов: values = { generator = "Menu", count = 1500 }
+VALUE_GENERATORS = {
+    "Menu": lambda count: [{'name': f'{menu.Name}', 'prices': menu.Price}
+                           for menu in DataGenerator(count).MenuGenerator(count)],
+    "Barista": lambda count: [{'name': f'{barista.FullName}', 'work_time': barista.WorkTime}
+                              for barista in DataGenerator(count).BaristaGenerator(count)],
+    "Guest": lambda count: [{'name': f'{guest.FullName}', 'contact_number': guest.ContactNumber}
+                            for guest in DataGenerator(count).GuestGenerator(count)]
+}
+
+SCENARIO_KEYS = {"name", "tags", "num_rows", "warmup", "repeat", "query"}
+QUERY_KEYS = {"type", "table", "conditions", "values", "join", "order_by", "group_by", "having", "insert_select",
+              "weight"}
+
+
+class Scenario:
+    """
+    Сценарий замеров query_graph, описанный в TOML-файле.
+
+    Атрибуты:
+        - name (str): Название сценария, оно же имя файла графика.
+        - tags (list[str]): Теги для выбора подмножества сценариев.
+        - queries (list[dict]): Запросы сценария с ключами type, table и необязательными conditions, values, join,
+          order_by, group_by, having, insert_select и weight (вес запроса в смеси нагрузочного теста).
+        - num_rows (list[int] | None): Количество строк для каждой точки графика.
+        - warmup (int): Количество прогревочных запусков.
+        - repeat (int): Количество измеряемых запусков.
+        - source (str): Файл, из которого загружен сценарий.
+
+    Пример файла:
+        [[scenario]]
+        name = "Полная селекция из таблиц"
+        tags = ["select"]
+        num_rows = { start = 10, stop = 111, step = 10 }
+
+        [[scenario.query]]
+        type = "SELECT"
+        table = "Menu"
+    """
+
+    def __init__(self, name, queries, tags=None, num_rows=None, warmup=1, repeat=5, source=None):
+        """
+        Инициализирует экземпляр Scenario.
+
+        Параметры:
+            - name (str): Название сценария.
+            - queries (list[dict]): Запросы сценария.
+            - tags (list[str], optional): Теги сценария.
+            - num_rows (list[int] | dict, optional): Список количеств строк или диапазон {start, stop, step}.
+            - warmup (int, optional): Количество прогревочных запусков (по умолчанию 1).
+            - repeat (int, optional): Количество измеряемых запусков (по умолчанию 5).
+            - source (str, optional): Файл, из которого загружен сценарий.
+
+        Исключения:
+            - ValueError: Если сценарий или один из его запросов описан некорректно.
+        """
+        if not name:
+            raise ValueError(f"У сценария не указано название ({source})")
+        if not queries:
+            raise ValueError(f"В сценарии '{name}' нет запросов")
+        for query in queries:
+            unknown = set(query) - QUERY_KEYS
+            if unknown:
+                raise ValueError(f"Неизвестные поля запроса в сценарии '{name}': {', '.join(sorted(unknown))}")
+            if "type" not in query or "table" not in query:
+                raise ValueError(f"У запроса в сценарии '{name}' должны быть указаны type и table")
+        if isinstance(num_rows, dict):
+            num_rows = list(range(num_rows["start"], num_rows["stop"], num_rows.get("step", 1)))
+        self.name = name
+        self.tags = list(tags or [])
+        self.queries = list(queries)
+        self.num_rows = num_rows
+        self.warmup = warmup
+        self.repeat = repeat
+        self.source = source
+
+    @property
+    def tables(self) -> list[str]:
+        """Таблицы, к которым обращаются запросы сценария, без повторов."""
+        return list(dict.fromkeys(query["table"] for query in self.queries))
+
+    @property
+    def mutating(self) -> bool:
+        """Изменяет ли сценарий данные (есть ли в нем запросы, отличные от SELECT)."""
+        return any(not query["type"].lstrip().upper().startswith('SELECT') for query in self.queries)
+
+    def column(self, key) -> list | None:
+        """
+        Возвращает значения поля по всем запросам сценария в виде параллельного списка для query_graph.
+
+        Параметры:
+            - key (str): Имя поля запроса.
+
+        Возвращает:
+            - list | None: Значения поля (None для запросов без него) или None, если поле не задано ни у одного запроса.
+        """
+        column = [query.get(key) for query in self.queries]
+        return column if any(value is not None for value in column) else None
+
+    def query_graph_kwargs(self) -> dict:
+        """
+        Преобразует сценарий в именованные аргументы query_graph.
+
+        Возвращает:
+            - dict: Аргументы name, query_type, table, conditions, values, num_rows_list, join, order_by, group_by,
+              having, insert_select, warmup и repeat.
+
+        Исключения:
+            - ValueError: Если указан неизвестный генератор значений.
+        """
+        values = self.column("values")
+        if values:
+            values = [self.generate_values(value) for value in values]
+        return {
+            "name": self.name,
+            "query_type": self.column("type"),
+            "table": self.column("table"),
+            "conditions": self.column("conditions"),
+            "values": values,
+            "num_rows_list": self.num_rows,
+            "join": self.column("join"),
+            "order_by": self.column("order_by"),
+            "group_by": self.column("group_by"),
+            "having": self.column("having"),
+            "insert_select": self.column("insert_select"),
+            "warmup": self.warmup,
+            "repeat": self.repeat
+        }
+
+    def load_mix(self, num_rows=10) -> list[dict]:
+        """
+        Преобразует запросы сценария в смесь для LoadGenerator.
+
+        Параметры:
+            - num_rows (int, optional): LIMIT для каждого запроса (по умолчанию 10).
+
+        Возвращает:
+            - list[dict]: Запросы с подставленными значениями для INSERT, количеством строк и меткой.
+        """
+        mix = []
+        for query in self.queries:
+            spec = dict(query, num_rows=num_rows, label=f"{self.name}: {query['type']} {query['table']}")
+            if "values" in spec:
+                spec["values"] = self.generate_values(spec["values"])
+            mix.append(spec)
+        return mix
+
+    @staticmethod
+    def generate_values(value) -> list | None:
+        """
+        Возвращает значения для INSERT: явный список строк или строки, созданные генератором.
+
+        Параметры:
+            - value (list[dict] | dict | None): Список строк либо {generator = "<модель>", count = <количество>}.
+
+        Возвращает:
+            - list | None: Список словарей {колонка: значение}.
+
+        Исключения:
+            - ValueError: Если указан неизвестный генератор.
+        """
+        if not isinstance(value, dict):
+            return value
+        generator = VALUE_GENERATORS.get(value.get("generator"))
+        if generator is None:
+            raise ValueError(f"Неизвестный генератор значений: {value.get('generator')}. "
+                             f"Доступны: {', '.join(VALUE_GENERATORS)}")
+        return generator(value.get("count", 1500))
+
+
+def load_scenarios(paths) -> list[Scenario]:
+    """
+    Загружает сценарии из TOML-файлов.
+
+    Параметры:
+        - paths (list[str]): Пути к файлам или glob-шаблоны.
+
+    Возвращает:
+        - list[Scenario]: Сценарии в порядке файлов и их описания в файлах.
+
+    Исключения:
+        - ValueError: Если в файле есть неизвестные поля сценария или два сценария с одинаковым названием.
+    """
+    scenarios = []
+    names = set()
+    for pattern in paths:
+        for path in sorted(glob.glob(pattern)) or [pattern]:
+            with open(path, "rb") as file:
+                document = tomllib.load(file)
+            for entry in document.get("scenario", []):
+                unknown = set(entry) - SCENARIO_KEYS
+                if unknown:
+                    raise ValueError(f"Неизвестные поля сценария в {path}: {', '.join(sorted(unknown))}")
+                scenario = Scenario(entry.get("name"), entry.get("query"), tags=entry.get("tags"),
+                                    num_rows=entry.get("num_rows"), warmup=entry.get("warmup", 1),
+                                    repeat=entry.get("repeat", 5), source=path)
+                if scenario.name in names:
+                    raise ValueError(f"Сценарий '{scenario.name}' описан несколько раз")
+                names.add(scenario.name)
+                scenarios.append(scenario)
+    return scenarios
+
+
+def select_scenarios(scenarios, names=None, tags=None) -> list[Scenario]:
+    """
+    Выбирает подмножество сценариев по названиям и тегам.
+
+    Параметры:
+        - scenarios (list[Scenario]): Все сценарии.
+        - names (list[str], optional): Названия сценариев. Если не указаны, подходят все.
+        - tags (list[str], optional): Теги. Сценарий подходит, если у него есть хотя бы один из тегов.
+
+    Возвращает:
+        - list[Scenario]: Подходящие сценарии в исходном порядке.
+    """
+    return [scenario for scenario in scenarios
+            if (not names or scenario.name in names) and (not tags or set(tags) & set(scenario.tags))]
@@ -0,0 +1,677 @@
+import random
+import re
+import string
+from datetime import date
+import numpy as np
+from lib.distributions import KeyDistribution, Seasonality, Uniform
+
+# Диапазон дат заказов [начало, конец) для режима DATE
+DATES_START = date(2024, 1, 1)
+DATES_STOP = date(2025, 1, 1)
+# Размер порции строк при потоковой генерации: колонки порции генерируются векторно, а в памяти одновременно
+# находится не больше одной порции
+CHUNK_SIZE = 10000
+# Версия генераторов значений: увеличивается при любом изменении генерируемых данных, чтобы сохраненные
+# наборы (lib.dataset_cache) с прежними значениями перестали совпадать
+GENERATOR_VERSION = 1
+
+
+def numpy_rng() -> np.random.Generator:
+    """
+    Возвращает генератор numpy, инициализированный из модуля random, поэтому random.seed делает векторную
+    генерацию воспроизводимой.
+    """
+    return np.random.default_rng(random.getrandbits(64))
+
+
+class GenerationContext:
+    """
+    Состояние генерации строк, общее для всех таблиц: размеры таблиц, на которые ссылаются внешние ключи,
+    и режим дат.
+
+    Атрибуты:
+        - counts (dict): Количество строк по таблицам {таблица: количество}. По нему выбираются значения
+          внешних ключей (id от 1 до количества строк).
+        - ids (dict): Существующие id по таблицам {таблица: KeySampler или [id, ...]}, например прочитанные
+          из базы. Имеют приоритет над counts.
+        - native_dates (bool): Генерировать ли даты объектами datetime.date для колонки DATE.
+        - start_id (int): Первый id последовательных колонок.
+        - distributions (dict): Распределения значений колонок {'таблица.колонка': распределение} из
+          lib.distributions. Колонки без распределения генерируются равномерно.
+        - state (dict): Состояние распределений, общее для порций одной генерации: копии shifted ссылаются
+          на тот же словарь, поэтому следующая порция продолжает предыдущую (например, корзины Basket).
+    """
+
+    def __init__(self, counts=None, ids=None, native_dates=False, start_id=1, distributions=None, state=None):
+        """
+        Инициализирует экземпляр GenerationContext.
+
+        Параметры:
+            - counts (dict, optional): Количество строк по таблицам.
+            - ids (dict, optional): Существующие id по таблицам (KeySampler или список).
+            - native_dates (bool, optional): Генерировать ли даты объектами datetime.date (по умолчанию False).
+            - start_id (int, optional): Первый id последовательных колонок (по умолчанию 1).
+            - distributions (dict, optional): Распределения значений колонок {'таблица.колонка': распределение}.
+            - state (dict, optional): Состояние распределений (по умолчанию новый пустой словарь).
+
+        Исключения:
+            - ValueError: Если колонки распределения нет в реестре или она не поддерживает такое распределение.
+        """
+        self.counts = dict(counts or {})
+        self.ids = dict(ids or {})
+        self.native_dates = native_dates
+        self.start_id = start_id
+        self.distributions = dict(distributions or {})
+        self.state = {} if state is None else state
+        for key, distribution in self.distributions.items():
+            table, _, column = key.partition(".")
+            SCHEMA[table].column(column).check_distribution(distribution)
+
+    def shifted(self, offset) -> "GenerationContext":
+        """
+        Возвращает копию контекста, в которой последовательные id начинаются на offset позже.
+        Состояние распределений у копии общее с исходным контекстом.
+
+        Параметры:
+            - offset (int): Сдвиг первого id - количество уже сгенерированных строк.
+        """
+        return GenerationContext(self.counts, self.ids, self.native_dates, self.start_id + offset, self.distributions,
+                                 self.state)
+
+
+class ColumnGenerator:
+    """
+    Генератор значений одного типа колонки. Реализуется один раз на тип и используется всеми таблицами
+    с колонками этого типа.
+
+    Атрибуты:
+        - model_options (str): Дополнительные параметры поля модели ORM, например 'words_count=3'.
+        - distributions (tuple): Классы распределений из lib.distributions, которые принимает generate.
+    """
+    model_options = ""
+    distributions = ()
+
+    def generate(self, count, context=None, distribution=None) -> list:
+        """
+        Генерирует значения колонки.
+
+        Параметры:
+            - count (int): Количество значений.
+            - context (GenerationContext, optional): Состояние генерации.
+            - distribution (optional): Распределение значений; передается только генераторам, у которых
+              он указан в distributions.
+
+        Возвращает:
+            - list: Значения колонки.
+        """
+        raise NotImplementedError
+
+
+class Serial(ColumnGenerator):
+    """
+    Последовательные id: start_id, start_id + 1, ...
+    """
+
+    def generate(self, count, context=None) -> list[int]:
+        start = context.start_id if context else 1
+        return list(range(start, start + count))
+
+
+class RandomInt(ColumnGenerator):
+    """
+    Случайные целые числа random.randrange(start, stop, step).
+
+    Атрибуты:
+        - start (int): Нижняя граница.
+        - stop (int): Верхняя граница (не включается).
+        - step (int): Шаг.
+    """
+
+    def __init__(self, start, stop, step=1):
+        self.start = start
+        self.stop = stop
+        self.step = step
+
+    def generate(self, count, context=None) -> list[int]:
+        return [random.randrange(self.start, self.stop, self.step) for _ in range(count)]
+
+
+class RandomWord(ColumnGenerator):
+    """
+    Случайные слова из строчных латинских букв длиной от min_length до max_length (не включая).
+    """
+
+    def __init__(self, min_length, max_length):
+        self.min_length = min_length
+        self.max_length = max_length
+
+    def generate(self, count, context=None) -> list[str]:
+        return [(''.join(random.choice(string.ascii_lowercase) for _ in range(random.randrange(self.min_length,
+                                                                                            self.max_length))))
+                for _ in range(count)]
+
+
+class FullName(ColumnGenerator):
+    """
+    Полные имена в формате "Фамилия Имя Отчество" из случайных слов с заглавной буквы.
+    """
+    model_options = "words_count=3"
+
+    def generate(self, count, context=None) -> list[str]:
+        names = [word.capitalize() for word in RandomWord(4, 9).generate(count)]
+        surnames = [word.capitalize() for word in RandomWord(6, 13).generate(count)]
+        midnames = [word.capitalize() for word in RandomWord(7, 15).generate(count)]
+        return [f'{surnames[i]} {names[i]} {midnames[i]}' for i in range(count)]
+
+
+class PhoneNumber(ColumnGenerator):
+    """
+    Контактные номера формата "+7(XXX)YYY-YY-YY", где XXX - число от 900 до 997, Y - цифра от 0 до 9.
+    """
+
+    def generate(self, count, context=None) -> list[str]:
+        return ["+7(" + str(random.randrange(900, 997)) + ")" + str(random.randrange(0, 9)) + str(
+            random.randrange(0, 9)) + str(random.randrange(0, 9)) + "-" + str(random.randrange(0, 9)) + str(
+            random.randrange(0, 9)) + "-" + str(random.randrange(0, 9)) + str(random.randrange(0, 9)) for _ in
+                range(count)]
+
+
+class OrderDate(ColumnGenerator):
+    """
+    Даты заказов: строки 'MM-DD-YYYY' или, в режиме native_dates, объекты datetime.date из [start, stop).
+
+    Атрибуты:
+        - start (date): Первая возможная дата режима DATE.
+        - stop (date): Дата, следующая за последней возможной.
+
+    Примечания:
+        - С распределением Seasonality даты обоих режимов выбираются из [start, stop) с весами дней недели
+          и месяцев; строки тогда имеют вид 'M-D-YYYY' и всегда являются корректными датами.
+    """
+    distributions = (Seasonality,)
+
+    def __init__(self, start=DATES_START, stop=DATES_STOP):
+        self.start = start
+        self.stop = stop
+
+    def generate(self, count, context=None, distribution=None) -> list:
+        if distribution is not None:
+            days = distribution.days(numpy_rng(), self.start, self.stop, count)
+            if context and context.native_dates:
+                return days.tolist()
+            return [f"{day.month}-{day.day}-{day.year}" for day in days.tolist()]
+        if context and context.native_dates:
+            return self.dates(count)
+        return self.strings(count)
+
+    def strings(self, count) -> list[str]:
+        """
+        Генерирует даты строками 'MM-DD-YYYY'.
+        """
+        return [str(random.randrange(1, 13)) + "-" + str(random.randrange(1, 31)) + "-2024" for _ in range(count)]
+
+    def ordinal(self, count) -> np.ndarray:
+        """
+        Генерирует даты одним векторным вызовом numpy.
+
+        Возвращает:
+            - np.ndarray: Массив datetime64[D].
+
+        Примечания:
+            - Генератор numpy инициализируется из модуля random, поэтому random.seed делает результат воспроизводимым.
+        """
+        low = np.datetime64(self.start, 'D').astype(np.int64)
+        high = np.datetime64(self.stop, 'D').astype(np.int64)
+        return numpy_rng().integers(low, high, size=count).astype('datetime64[D]')
+
+    def dates(self, count) -> list[date]:
+        """
+        Генерирует даты объектами datetime.date.
+        """
+        return self.ordinal(count).tolist()
+
+
+class KeySampler:
+    """
+    Равномерная выборка существующих id родительской таблицы по диапазону [min_id, max_id] без списка всех id.
+
+    Атрибуты:
+        - min_id (int): Наименьший id.
+        - max_id (int): Наибольший id.
+        - present (np.ndarray | None): Битовая карта присутствия id диапазона (np.packbits, бит i - id min_id + i)
+          или None, если id идут без пропусков.
+
+    Примечания:
+        - Для плотных id значения выбираются прямо из диапазона одним векторным вызовом numpy.
+        - При пропусках кандидаты из диапазона, попавшие в пропуск, отбрасываются и выбираются заново,
+          поэтому выборка остается равномерной по существующим id. Битовая карта занимает (max_id - min_id) / 8 байт:
+          12.5 МБ для 100 млн id против гигабайтов для списка.
+        - Стоимость выборки - O(количества значений), а не O(размера родительской таблицы).
+        - Генератор numpy инициализируется из модуля random, поэтому random.seed делает результат воспроизводимым.
+
+    Пример использования:
+        sampler = KeySampler.from_gaps(1, 100_000_000, [(500, 999)])
+        orders_ids = sampler.sample(1000)
+    """
+
+    def __init__(self, min_id, max_id, present=None):
+        if max_id < min_id:
+            raise ValueError(f"Пустой диапазон id: [{min_id}, {max_id}]")
+        self.min_id = min_id
+        self.max_id = max_id
+        self.present = present
+
+    @property
+    def span(self) -> int:
+        """Количество id в диапазоне [min_id, max_id]."""
+        return self.max_id - self.min_id + 1
+
+    @property
+    def dense(self) -> bool:
+        """Идут ли id без пропусков."""
+        return self.present is None
+
+    @classmethod
+    def from_gaps(cls, min_id, max_id, gaps=()) -> "KeySampler":
+        """
+        Создает выборку по диапазону и списку пропусков.
+
+        Параметры:
+            - min_id (int): Наименьший существующий id.
+            - max_id (int): Наибольший существующий id.
+            - gaps (list[tuple[int, int]], optional): Пропуски (первый отсутствующий id, последний отсутствующий id).
+        """
+        if not gaps:
+            return cls(min_id, max_id)
+        # Карта строится сразу упакованной: по байту на 8 id, без промежуточного массива на каждый id
+        present = np.full((max_id - min_id) // 8 + 1, 0xFF, dtype=np.uint8)
+        for first, last in gaps:
+            first, last = first - min_id, last - min_id
+            head, tail = first >> 3, last >> 3
+            head_mask = np.uint8(0xFF << (8 - (first & 7)) & 0xFF)
+            tail_mask = np.uint8(0xFF >> ((last & 7) + 1))
+            if head == tail:
+                present[head] &= head_mask | tail_mask
+            else:
+                present[head] &= head_mask
+                present[head + 1:tail] = 0
+                present[tail] &= tail_mask
+        return cls(min_id, max_id, present)
+
+    @classmethod
+    def from_ids(cls, ids) -> "KeySampler":
+        """
+        Создает выборку по явному списку существующих id.
+        """
+        ids = np.unique(np.asarray(ids, dtype=np.int64))
+        if not len(ids):
+            raise ValueError("Пустой список id")
+        min_id, max_id = int(ids[0]), int(ids[-1])
+        if len(ids) == max_id - min_id + 1:
+            return cls(min_id, max_id)
+        present = np.zeros(max_id - min_id + 1, dtype=bool)
+        present[ids - min_id] = True
+        return cls(min_id, max_id, np.packbits(present))
+
+    def extended(self, max_id) -> "KeySampler":
+        """
+        Возвращает выборку, в которую добавлены id (self.max_id, max_id] - например, только что вставленные строки.
+
+        Примечания:
+            - Существующая битовая карта копируется, новые id отмечаются присутствующими без запросов к базе.
+        """
+        if max_id <= self.max_id:
+            return self
+        if self.dense:
+            return KeySampler(self.min_id, max_id)
+        present = np.full((max_id - self.min_id) // 8 + 1, 0xFF, dtype=np.uint8)
+        present[:len(self.present)] = self.present
+        # Биты последнего байта после прежнего max_id были дополнением, теперь это новые id
+        last = self.max_id - self.min_id
+        present[last >> 3] |= np.uint8(0xFF >> ((last & 7) + 1))
+        return KeySampler(self.min_id, max_id, present)
+
+    def contains(self, offsets) -> np.ndarray:
+        """
+        Проверяет по битовой карте, существуют ли id min_id + offsets.
+        """
+        return (self.present[offsets >> 3] >> (7 - (offsets & 7))) & 1 == 1
+
+    def sample(self, count, distribution=None, start=0, state=None) -> list[int]:
+        """
+        Выбирает count случайных существующих id с возвращением.
+
+        Параметры:
+            - count (int): Количество id.
+            - distribution (KeyDistribution, optional): Распределение смещений id в диапазоне (по умолчанию Uniform).
+            - start (int, optional): Номер первой строки порции - для распределений, зависящих от положения строки.
+            - state (dict, optional): Состояние распределений (GenerationContext.state).
+
+        Примечания:
+            - Значения распределения, попавшие в пропуски, заменяются равномерно выбранными существующими id.
+        """
+        rng = numpy_rng()
+        offsets = (distribution or Uniform()).offsets(rng, self.span, count, start, state)
+        if self.dense:
+            return (offsets + self.min_id).tolist()
+        result = offsets[self.contains(offsets)]
+        while len(result) < count:
+            # С запасом на отбрасываемые кандидаты, чтобы обычно хватало одного прохода
+            offsets = rng.integers(0, self.span, size=2 * (count - len(result)) + 16)
+            result = np.concatenate([result, offsets[self.contains(offsets)]])
+        return (result[:count] + self.min_id).tolist()
+
+
+class Reference(ColumnGenerator):
+    """
+    Значения внешнего ключа: случайные id строк таблицы table.
+
+    Атрибуты:
+        - table (str): Таблица, на которую ссылается колонка.
+
+    Примечания:
+        - Если в контексте есть явные id таблицы (KeySampler или список), значения выбираются из них,
+          иначе из 1..counts[table] без построения списка id.
+        - Распределение (KeyDistribution) задает смещения в диапазоне id, для списка - позиции в списке.
+    """
+    distributions = (KeyDistribution,)
+
+    def __init__(self, table):
+        self.table = table
+
+    def generate(self, count, context=None, distribution=None) -> list[int]:
+        context = context or GenerationContext()
+        start = context.start_id - 1
+        if self.table in context.ids:
+            ids = context.ids[self.table]
+            if isinstance(ids, KeySampler):
+                return ids.sample(count, distribution, start, context.state)
+            if distribution is None:
+                return random.choices(ids, k=count)
+            offsets = distribution.offsets(numpy_rng(), len(ids), count, start, context.state)
+            return np.asarray(ids)[offsets].tolist()
+        if self.table not in context.counts:
+            raise ValueError(f"Не указано количество строк таблицы {self.table}, на которую ссылается внешний ключ")
+        return KeySampler(1, context.counts[self.table]).sample(count, distribution, start, context.state)
+
+
+class Column:
+    """
+    Колонка таблицы реестра.
+
+    Атрибуты:
+        - name (str): Имя колонки.
+        - sql_type (str): Тип колонки в синтаксисе MySQL.
+        - generator (ColumnGenerator): Генератор значений.
+        - references (str | None): Таблица, на id которой ссылается колонка.
+        - native_type (str | None): Тип колонки в режиме native_dates (например, DATE вместо VARCHAR(255)).
+        - primary_key (bool): Является ли колонка первичным ключом.
+    """
+
+    def __init__(self, name, sql_type, generator, references=None, native_type=None, primary_key=False):
+        self.name = name
+        self.sql_type = sql_type
+        self.generator = generator
+        self.references = references
+        self.native_type = native_type
+        self.primary_key = primary_key
+
+    def check_distribution(self, distribution):
+        """
+        Проверяет, что генератор колонки принимает распределение.
+
+        Исключения:
+            - ValueError: Если генератор колонки не поддерживает распределения такого типа.
+        """
+        if not isinstance(distribution, self.generator.distributions):
+            raise ValueError(f"Колонка {self.name} не поддерживает распределение {type(distribution).__name__}")
+
+    def type(self, native_dates=False) -> str:
+        """
+        Возвращает тип колонки с учетом режима дат.
+        """
+        return self.native_type if native_dates and self.native_type else self.sql_type
+
+    def definition(self, native_dates=False) -> str:
+        """
+        Возвращает описание колонки для CREATE TABLE.
+        """
+        if self.primary_key:
+            return f"{self.name} {self.type(native_dates)}"
+        return f"{self.name} {self.type(native_dates)} NOT NULL"
+
+    def model_field(self, native_dates=False) -> str:
+        """
+        Возвращает описание поля модели ORM в формате docstring ModelMeta.
+        """
+        sql_type = self.type(native_dates)
+        if self.references:
+            return f"ForeignKey(to={self.references})"
+        if self.primary_key:
+            return "IntegerField(primary_key=True)"
+        if sql_type.startswith("VARCHAR"):
+            max_length = re.search(r"\d+", sql_type).group()
+            options = [f"max_length={max_length}"]
+            if self.generator.model_options:
+                options.append(self.generator.model_options)
+            return f"CharField({', '.join(options)})"
+        if sql_type == "DATE":
+            return "DateField()"
+        return "IntegerField()"
+
+
+class Table:
+    """
+    Таблица реестра: колонки, вторичные индексы модели и имя класса модели ORM.
+
+    Атрибуты:
+        - name (str): Имя таблицы.
+        - columns (list[Column]): Колонки в порядке хранения (он же порядок кортежей строк).
+        - model_name (str): Имя класса модели ORM.
+        - indexes (list[tuple]): Вторичные индексы модели (имя, [колонки]).
+    """
+
+    def __init__(self, name, columns, model_name, indexes=()):
+        self.name = name
+        self.columns = list(columns)
+        self.model_name = model_name
+        self.indexes = list(indexes)
+
+    @property
+    def column_names(self) -> list[str]:
+        """Имена колонок в порядке кортежей строк."""
+        return [column.name for column in self.columns]
+
+    @property
+    def foreign_keys(self) -> list[tuple[str, str]]:
+        """Пары (колонка, таблица) для колонок, ссылающихся на id другой таблицы."""
+        return [(column.name, column.references) for column in self.columns if column.references]
+
+    def column(self, name) -> Column:
+        """
+        Возвращает колонку по имени.
+
+        Исключения:
+            - KeyError: Если колонки нет.
+        """
+        for column in self.columns:
+            if column.name == name:
+                return column
+        raise KeyError(f"В таблице {self.name} нет колонки {name}")
+
+    def definitions(self, native_dates=False) -> list[str]:
+        """
+        Возвращает описания колонок для CREATE TABLE (без первичного и внешних ключей).
+        """
+        return [column.definition(native_dates) for column in self.columns]
+
+    def insert_sql(self, placeholder="%s", target=None) -> str:
+        """
+        Возвращает запрос вставки одной строки с явным списком колонок.
+
+        Параметры:
+            - placeholder (str, optional): Плейсхолдер движка (по умолчанию '%s').
+            - target (str, optional): Таблица, в которую вставляются строки с колонками этой таблицы,
+              например теневая копия (по умолчанию - сама таблица).
+        """
+        return (f"INSERT INTO {target or self.name} ({', '.join(self.column_names)}) "
+                f"VALUES ({', '.join([placeholder] * len(self.columns))})")
+
+    def generate_columns(self, count, context=None) -> dict[str, list]:
+        """
+        Генерирует значения по колонкам.
+
+        Параметры:
+            - count (int): Количество строк.
+            - context (GenerationContext, optional): Состояние генерации.
+
+        Возвращает:
+            - dict: Словарь {колонка: список значений} в порядке колонок.
+        """
+        context = context or GenerationContext()
+        return {column.name: self.generate_column(column.name, count, context) for column in self.columns}
+
+    def generate_column(self, name, count, context=None) -> list:
+        """
+        Генерирует значения одной колонки с распределением из контекста, если оно задано.
+
+        Параметры:
+            - name (str): Имя колонки.
+            - count (int): Количество значений.
+            - context (GenerationContext, optional): Состояние генерации.
+        """
+        context = context or GenerationContext()
+        column = self.column(name)
+        distribution = context.distributions.get(f"{self.name}.{name}")
+        if distribution is None:
+            return column.generator.generate(count, context)
+        return column.generator.generate(count, context, distribution)
+
+    def generate_rows(self, count, context=None) -> list[tuple]:
+        """
+        Генерирует строки кортежами в порядке колонок - в том виде, в котором их принимает executemany.
+        """
+        return list(zip(*self.generate_columns(count, context).values()))
+
+    def iter_rows(self, count, context=None, chunk_size=CHUNK_SIZE):
+        """
+        Генерирует строки кортежами порциями по chunk_size: колонки порции генерируются целиком,
+        а строки отдаются по одной.
+
+        Параметры:
+            - count (int): Количество строк.
+            - context (GenerationContext, optional): Состояние генерации.
+            - chunk_size (int, optional): Размер порции (по умолчанию CHUNK_SIZE).
+
+        Примечания:
+            - Последовательные id продолжаются между порциями, поэтому результат совпадает с generate_rows,
+              но в памяти одновременно находится не больше одной порции.
+        """
+        context = context or GenerationContext()
+        for start in range(0, count, chunk_size):
+            yield from self.generate_rows(min(chunk_size, count - start), context.shifted(start))
+
+    def generate_dicts(self, count, context=None):
+        """
+        Генерирует строки словарями {колонка: значение} по одной - в том виде, в котором их принимает модель ORM.
+        """
+        names = self.column_names
+        for row in self.iter_rows(count, context):
+            yield dict(zip(names, row))
+
+    def model_docstring(self, native_dates=False) -> str:
+        """
+        Возвращает docstring модели ORM, из которого ModelMeta строит поля и индексы.
+        """
+        lines = [f"{column.name}: {column.model_field(native_dates)}" for column in self.columns]
+        lines += [f"{name}: Index({', '.join(columns)})" for name, columns in self.indexes]
+        return "\n" + "\n".join(lines) + "\n"
+
+    def model(self, base, native_dates=False, module=None) -> type:
+        """
+        Создает класс модели ORM для таблицы.
+
+        Параметры:
+            - base (type): Базовый класс моделей (lib.orm_classes.Model).
+            - native_dates (bool, optional): Описывать ли колонки дат полями DateField.
+            - module (str, optional): Модуль, которому принадлежит класс.
+
+        Возвращает:
+            - type: Класс модели с именем model_name, таблица которой совпадает с таблицей реестра.
+        """
+        attrs = {"__doc__": self.model_docstring(native_dates), "__module__": module or base.__module__}
+        return type(base)(self.model_name, (base,), attrs)
+
+
+class Schema:
+    """
+    Реестр таблиц. Порядок регистрации - порядок создания таблиц: каждая таблица идет после тех,
+    на которые ссылаются ее внешние ключи.
+
+    Пример использования:
+        table = SCHEMA["menu"]
+        cursor.executemany(table.insert_sql(), table.generate_rows(100))
+    """
+
+    def __init__(self, tables):
+        self.tables = {table.name: table for table in tables}
+
+    def __getitem__(self, name) -> Table:
+        return self.tables[name]
+
+    def __contains__(self, name) -> bool:
+        return name in self.tables
+
+    def __iter__(self):
+        return iter(self.tables.values())
+
+    def __len__(self):
+        return len(self.tables)
+
+    def by_model(self, model_name) -> Table:
+        """
+        Возвращает таблицу по имени класса модели ORM.
+
+        Исключения:
+            - KeyError: Если таблицы с такой моделью нет.
+        """
+        for table in self:
+            if table.model_name == model_name:
+                return table
+        raise KeyError(f"В реестре нет модели {model_name}")
+
+
+SCHEMA = Schema([
+    Table("menu", [
+        Column("id", "INT AUTO_INCREMENT", Serial(), primary_key=True),
+        Column("name", "VARCHAR(255)", RandomWord(4, 10)),
+        Column("prices", "INT", RandomInt(159, 500, 20)),
+    ], "Menu", indexes=[("idx_menu_prices", ["prices"])]),
+    Table("barista", [
+        Column("id", "INT AUTO_INCREMENT", Serial(), primary_key=True),
+        Column("name", "VARCHAR(255)", FullName()),
+        Column("work_time", "INT", RandomInt(80, 280, 8)),
+    ], "Barista", indexes=[("idx_barista_work_time", ["work_time"])]),
+    Table("guest", [
+        Column("id", "INT AUTO_INCREMENT", Serial(), primary_key=True),
+        Column("name", "VARCHAR(255)", FullName()),
+        Column("contact_number", "VARCHAR(255)", PhoneNumber()),
+    ], "Guest"),
+    Table("personal_order", [
+        Column("id", "INT AUTO_INCREMENT", Serial(), primary_key=True),
+        Column("count", "INT", RandomInt(1, 4)),
+        Column("menu_id", "INT", Reference("menu"), references="menu"),
+    ], "Personal_Order"),
+    Table("orders", [
+        Column("id", "INT AUTO_INCREMENT", Serial(), primary_key=True),
+        Column("order_date", "VARCHAR(255)", OrderDate(), native_type="DATE"),
+        Column("barista_id", "INT", Reference("barista"), references="barista"),
+        Column("guest_id", "INT", Reference("guest"), references="guest"),
+    ], "Orders", indexes=[("idx_orders_barista_date", ["barista_id", "order_date"])]),
+    # Одна связь на позицию заказа: order_id совпадает с id строки personal_order
+    Table("orders_has_order", [
+        Column("id", "INT AUTO_INCREMENT", Serial(), primary_key=True),
+        Column("order_id", "INT", Serial(), references="personal_order"),
+        Column("orders_id", "INT", Reference("orders"), references="orders"),
+    ], "Orders_has_Order"),
+])
@@ -0,0 +1,167 @@
+import re
+
+# Разбор строки плана EXPLAIN ANALYZE: (actual time=<первая строка>..<все строки> rows=<строк> loops=<циклов>)
+ACTUAL_TIME_PATTERN = re.compile(r"actual time=([\d.]+)\.\.([\d.]+) rows=([\d.]+) loops=(\d+)")
+
+HANDLER_STATUS_QUERY = "SHOW SESSION STATUS LIKE 'Handler_%'"
+
+STATEMENT_HISTORY_QUERY = (
+    "SELECT TIMER_WAIT, LOCK_TIME, ROWS_EXAMINED, ROWS_SENT, ROWS_AFFECTED, CREATED_TMP_TABLES, "
+    "SORT_ROWS, NO_INDEX_USED FROM performance_schema.events_statements_history "
+    "WHERE THREAD_ID = PS_CURRENT_THREAD_ID() AND SQL_TEXT NOT LIKE 'SHOW SESSION STATUS%' "
+    "ORDER BY EVENT_ID DESC LIMIT 1"
+)
+
+
+class ServerMetrics:
+    """
+    Метрики выполнения запроса на стороне сервера MySQL.
+
+    Все времена хранятся в секундах. Поля, которые не удалось получить (например, если performance_schema
+    отключена или EXPLAIN ANALYZE не поддерживает тип запроса), равны None.
+
+    Атрибуты:
+        - server_time (float): Время выполнения запроса на сервере по performance_schema (TIMER_WAIT).
+        - lock_time (float): Время ожидания блокировок.
+        - rows_examined (int): Количество просмотренных сервером строк.
+        - rows_sent (int): Количество строк, отправленных клиенту.
+        - rows_affected (int): Количество измененных строк.
+        - tmp_tables (int): Количество созданных временных таблиц.
+        - sort_rows (int): Количество отсортированных строк.
+        - no_index_used (bool): Выполнялся ли полный просмотр таблицы без индекса.
+        - handlers (dict): Ненулевые приращения счетчиков Handler_% за время выполнения запроса.
+        - explain (str): План выполнения из EXPLAIN ANALYZE.
+        - explain_time (float): Время выполнения корневого узла плана EXPLAIN ANALYZE.
+    """
+
+    def __init__(self):
+        """
+        Инициализирует пустой набор метрик.
+        """
+        self.server_time = None
+        self.lock_time = None
+        self.rows_examined = None
+        self.rows_sent = None
+        self.rows_affected = None
+        self.tmp_tables = None
+        self.sort_rows = None
+        self.no_index_used = None
+        self.handlers = {}
+        self.explain = None
+        self.explain_time = None
+
+    def to_dict(self) -> dict:
+        """
+        Возвращает метрики в виде словаря.
+
+        Возвращает:
+            - dict: Словарь со всеми метриками, кроме текста плана.
+        """
+        return {
+            "server_time": self.server_time, "lock_time": self.lock_time, "rows_examined": self.rows_examined,
+            "rows_sent": self.rows_sent, "rows_affected": self.rows_affected, "tmp_tables": self.tmp_tables,
+            "sort_rows": self.sort_rows, "no_index_used": self.no_index_used, "handlers": dict(self.handlers),
+            "explain_time": self.explain_time
+        }
+
+    def __str__(self):
+        parts = []
+        if self.server_time is not None:
+            parts.append(f"server={self.server_time:.10f} lock={self.lock_time:.10f} "
+                         f"examined={self.rows_examined} sent={self.rows_sent} affected={self.rows_affected}")
+            if self.no_index_used:
+                parts.append("без индекса")
+        if self.explain_time is not None:
+            parts.append(f"explain={self.explain_time:.10f}")
+        if self.handlers:
+            parts.append(' '.join(f"{name}={value}" for name, value in self.handlers.items()))
+        return ' '.join(parts) if parts else "нет серверных метрик"
+
+
+def parse_explain_analyze(plan) -> float | None:
+    """
+    Извлекает время выполнения корневого узла из плана EXPLAIN ANALYZE.
+
+    Параметры:
+        - plan (str): Текст плана в формате TREE.
+
+    Возвращает:
+        - float | None: Время в секундах (время всех строк, умноженное на количество циклов) или None, если
+          план не содержит фактического времени.
+    """
+    match = ACTUAL_TIME_PATTERN.search(plan or "")
+    if not match:
+        return None
+    return float(match.group(2)) * int(match.group(4)) / 1000
+
+
+def handler_status(cursor) -> dict:
+    """
+    Читает счетчики Handler_% текущей сессии.
+
+    Параметры:
+        - cursor: Курсор DB-API соединения, в котором выполняется запрос (любой драйвер из lib.drivers).
+
+    Возвращает:
+        - dict: Словарь {имя счетчика: значение}.
+    """
+    cursor.execute(HANDLER_STATUS_QUERY)
+    return {name: int(value) for name, value in cursor.fetchall()}
+
+
+def collect_server_metrics(cursor, query, explain=True) -> ServerMetrics:
+    """
+    Выполняет запрос один раз и собирает серверные метрики его выполнения.
+
+    Параметры:
+        - cursor: Курсор DB-API соединения, в котором выполняется запрос (любой драйвер из lib.drivers).
+        - query (str): SQL-запрос.
+        - explain (bool, optional): Выполнять ли дополнительно EXPLAIN ANALYZE для SELECT-запросов (по умолчанию True).
+
+    Возвращает:
+        - ServerMetrics: Собранные метрики.
+
+    Примечания:
+        - Счетчики Handler_% читаются до и после запроса. Собственный вклад SHOW STATUS измеряется
+          двумя последовательными вызовами и вычитается.
+        - Изменяющий запрос действительно выполняется, откат транзакции остается за вызывающим кодом.
+        - Требуется MySQL 8.0.18+ (EXPLAIN ANALYZE, PS_CURRENT_THREAD_ID) и включенный
+          консьюмер events_statements_history.
+
+    В случае ошибки выводит сообщение и возвращает метрики, которые удалось собрать.
+    """
+    metrics = ServerMetrics()
+    try:
+        first = handler_status(cursor)
+        before = handler_status(cursor)
+        overhead = {name: before[name] - first.get(name, 0) for name in before}
+
+        cursor.execute(query)
+        if cursor.description is not None:
+            cursor.fetchall()
+
+        after = handler_status(cursor)
+        metrics.handlers = {name: after[name] - before.get(name, 0) - overhead.get(name, 0)
+                            for name in after
+                            if after[name] - before.get(name, 0) - overhead.get(name, 0) > 0}
+
+        cursor.execute(STATEMENT_HISTORY_QUERY)
+        row = cursor.fetchone()
+        if row:
+            (timer_wait, lock_time, metrics.rows_examined, metrics.rows_sent, metrics.rows_affected,
+             metrics.tmp_tables, metrics.sort_rows, no_index_used) = row
+            metrics.server_time = timer_wait / 1e12
+            metrics.lock_time = lock_time / 1e12
+            metrics.no_index_used = bool(no_index_used)
+    except Exception as e:
+        print(f"Ошибка при сборе серверных метрик: {e}")
+
+    if explain and query.lstrip().upper().startswith('SELECT'):
+        try:
+            cursor.execute(f"EXPLAIN ANALYZE {query}")
+            metrics.explain = '\n'.join(row[0] for row in cursor.fetchall())
+            metrics.explain_time = parse_explain_analyze(metrics.explain)
+        except Exception as e:
+            print(f"Ошибка при выполнении EXPLAIN ANALYZE: {e}")
+
+    return metrics
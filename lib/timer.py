@@ -1,4 +1,5 @@
 import timeit
+from lib.benchmark import benchmark, BenchmarkResult
 
 
 def query_time(generation_func, query) -> str:
@@ -54,3 +55,53 @@ def generate_time(generation_func, model, n, **kwargs) -> str:
             pass
 
     return format(timeit.timeit(wrapped_func, setup=setup, number=1), '.10f')
+
+
+def query_benchmark(generation_func, query, warmup=1, repeat=5, outliers_rejected=True, teardown=None,
+                    memory=False) -> BenchmarkResult:
+    """
+    Многократно измеряет время выполнения SQL-запроса с прогревом и статистикой.
+
+    Параметры:
+        - generation_func (function): Функция, выполняющая SQL-запрос.
+        - query (str): SQL-запрос для выполнения.
+        - warmup (int, optional): Количество прогревочных запусков (по умолчанию 1).
+        - repeat (int, optional): Количество измеряемых запусков (по умолчанию 5).
+        - outliers_rejected (bool, optional): Отбрасывать ли выбросы (по умолчанию True).
+        - teardown (function, optional): Функция, вызываемая после каждого запуска вне замера,
+          например откат транзакции для INSERT и DELETE.
+        - memory (bool, optional): Измерять ли пиковую память и прирост RSS на стороне клиента (по умолчанию False).
+
+    Возвращает:
+        - BenchmarkResult: Результат измерения (min/median/p95/p99/stddev/доверительный интервал).
+    """
+    return benchmark(generation_func, query, warmup=warmup, repeat=repeat, outliers_rejected=outliers_rejected,
+                     teardown=teardown, memory=memory)
+
+
+def generate_benchmark(generation_func, model, n, warmup=1, repeat=5, outliers_rejected=True, memory=False,
+                       **kwargs) -> BenchmarkResult:
+    """
+    Многократно измеряет время генерации данных с прогревом и статистикой.
+
+    Параметры:
+        - generation_func (function): Функция генерации данных.
+        - model (class): Класс модели, для которой генерируются данные.
+        - n (int): Количество генерируемых данных.
+        - warmup (int, optional): Количество прогревочных запусков (по умолчанию 1).
+        - repeat (int, optional): Количество измеряемых запусков (по умолчанию 5).
+        - outliers_rejected (bool, optional): Отбрасывать ли выбросы (по умолчанию True).
+        - memory (bool, optional): Измерять ли пиковую память и прирост RSS при генерации (по умолчанию False).
+        - **kwargs: Дополнительные параметры для функции генерации.
+
+    Возвращает:
+        - BenchmarkResult: Результат измерения.
+
+    Примечания:
+        - В отличие от generate_time, импорт модулей не попадает в замер.
+    """
+    def consume():
+        for _ in generation_func(model, n, **kwargs):
+            pass
+
+    return benchmark(consume, warmup=warmup, repeat=repeat, outliers_rejected=outliers_rejected, memory=memory)
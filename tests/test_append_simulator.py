@@ -0,0 +1,100 @@
+import random
+import unittest
+from unittest.mock import MagicMock
+from lib.append_simulator import AppendResult, AppendSimulator
+from lib.backends import get_backend
+from lib.distributions import SKEWED
+from lib.schema import KeySampler
+
+
+class TestAppendSimulator(unittest.TestCase):
+    """
+    Юнит-тесты для модуля append_simulator. Соединение с базой заменено MagicMock.
+    """
+
+    def setUp(self):
+        self.max_ids = {"guest": 50, "orders": 70, "personal_order": 80, "orders_has_order": 90}
+        self.changer = MagicMock()
+        self.changer.native_dates = False
+        self.changer.distributions = None
+        self.changer.backend = get_backend()
+        self.changer.get_max_id.side_effect = lambda table: self.max_ids[table]
+        self.changer.GetKeySampler.side_effect = lambda table, refresh=False: {
+            "menu": KeySampler(1, 25), "barista": KeySampler(1, 3),
+            "guest": KeySampler.from_gaps(1, 50, [(10, 19)])}[table]
+
+    def test_batch_continues_ids(self):
+        """
+        Проверяет, что id продолжают MAX(id), связи ведут к новым позициям и заказам, а новые гости сразу
+        доступны для заказов.
+        """
+        random.seed(4)
+        simulator = AppendSimulator(self.changer, guest_share=0.5, basket_mean=2)
+        simulator.prepare()
+        rows, samplers = simulator.batch(40)
+        guests = [row[0] for row in rows["guest"]]
+        self.assertEqual(guests, list(range(51, 51 + len(guests))))
+        self.assertEqual(samplers["guest"].max_id, guests[-1])
+        self.assertEqual(simulator.samplers["guest"].max_id, 50)
+        self.assertEqual([row[0] for row in rows["orders"]], list(range(71, 111)))
+        self.assertTrue(all(not 10 <= row[3] <= 19 and row[3] <= guests[-1] for row in rows["orders"]))
+        links = rows["orders_has_order"]
+        self.assertEqual(len(links), len(rows["personal_order"]))
+        self.assertEqual(links[0][:2], (91, 81))
+        self.assertEqual([link[1] for link in links], [row[0] for row in rows["personal_order"]])
+        self.assertEqual({link[2] for link in links}, set(range(71, 111)))
+
+    def test_extended_sampler(self):
+        """
+        Проверяет, что расширенная выборка сохраняет пропуски и включает новые id.
+        """
+        random.seed(5)
+        sampler = KeySampler.from_gaps(1, 13, [(2, 12)]).extended(20)
+        self.assertEqual(set(sampler.sample(2000)), {1, 13, *range(14, 21)})
+        self.assertTrue(KeySampler(1, 5).extended(9).dense)
+
+    def test_run_respects_rate(self):
+        """
+        Проверяет, что прогон вставляет пачки одной транзакцией и не превышает целевую скорость.
+        """
+        random.seed(6)
+        self.changer.distributions = SKEWED
+        simulator = AppendSimulator(self.changer, interval=0.02)
+        self.assertEqual(simulator.basket_mean, SKEWED["orders_has_order.orders_id"].mean)
+        result = simulator.run(rate=5000, duration=0.2)
+        self.assertEqual(result.errors, 0)
+        self.assertGreater(result.total_rows, 0)
+        self.assertLessEqual(result.total_rows, 5000 * 0.2 + 200)
+        self.assertEqual(self.changer.conn.commit.call_count, result.batches.count)
+        self.assertEqual(simulator.max_ids["orders"], 70 + result.rows["orders"])
+        inserted = sum(len(args[0][1]) for args in self.changer.cursor.executemany.call_args_list)
+        self.assertEqual(inserted, result.total_rows)
+
+    def test_failed_batch_is_rolled_back(self):
+        """
+        Проверяет, что ошибочная пачка откатывается, учитывается в ошибках, а MAX(id) перечитываются.
+        """
+        self.changer.cursor.executemany.side_effect = Exception("Duplicate entry")
+        result = AppendSimulator(self.changer, interval=0.01).run(rate=1000, duration=0.03)
+        self.assertGreater(result.errors, 0)
+        self.assertEqual(result.total_rows, 0)
+        self.changer.conn.rollback.assert_called()
+        self.assertGreater(self.changer.get_max_id.call_count, 4)
+        self.assertIsInstance(str(result), str)
+
+    def test_invalid_parameters(self):
+        """
+        Проверяет ошибки неверных параметров и пустой родительской таблицы.
+        """
+        with self.assertRaises(ValueError):
+            AppendSimulator(self.changer, guest_share=2)
+        with self.assertRaises(ValueError):
+            AppendSimulator(self.changer).run(rate=0, duration=1)
+        self.changer.GetKeySampler.side_effect = lambda table, refresh=False: None
+        with self.assertRaises(ValueError):
+            AppendSimulator(self.changer).run(rate=10, duration=1)
+        self.assertEqual(AppendResult(10).throughput, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
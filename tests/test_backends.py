@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+from lib.backends import MySQLBackend, SQLiteBackend, get_backend
+from lib.db_creator import DatabaseCreator
+from lib.db_data_changer import DatabaseDataChanger
+from lib.db_data_pusher import DatabaseDataPusher
+from lib.db_sandbox_creator import SandboxCreator
+from lib.orm_classes import Index
+
+
+class TestBackends(unittest.TestCase):
+    """
+    Юнит-тесты для модуля backends. Тесты SQLite работают с настоящими файлами баз данных во временном каталоге.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.backend = SQLiteBackend(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_get_backend(self):
+        """
+        Проверяет выбор движка по имени, передачу готового экземпляра и ошибку для неизвестного движка.
+        """
+        self.assertIsInstance(get_backend(), MySQLBackend)
+        self.assertIs(get_backend(self.backend), self.backend)
+        self.assertEqual(get_backend("sqlite", directory="data").directory, "data")
+        with self.assertRaises(ValueError):
+            get_backend("oracle")
+
+    def test_sqlite_create_table_sql(self):
+        """
+        Проверяет перевод DDL: INT AUTO_INCREMENT -> INTEGER, индексы - отдельными CREATE INDEX.
+        """
+        statements = self.backend.create_table_sql(
+            "visit", ["id INT AUTO_INCREMENT", "menu_id INT", "PRIMARY KEY (id)", "INDEX (menu_id)"],
+            indexes=[Index("idx_visit_menu", ["menu_id", "id"], unique=True)]
+        )
+
+        self.assertEqual(statements, [
+            "CREATE TABLE IF NOT EXISTS visit (\n    id INTEGER,\n    menu_id INT,\n    PRIMARY KEY (id)\n)",
+            "CREATE INDEX IF NOT EXISTS idx_visit_menu_id ON visit (menu_id)",
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_visit_menu ON visit (menu_id, id)"
+        ])
+
+    def test_sqlite_translate(self):
+        """
+        Проверяет перевод DELETE ... LIMIT и INSERT ... VALUES ... LIMIT, остальные запросы не изменяются.
+        """
+        self.assertEqual(self.backend.translate("DELETE FROM menu WHERE prices > 250 LIMIT 10"),
+                         "DELETE FROM menu WHERE rowid IN (SELECT rowid FROM menu WHERE prices > 250 LIMIT 10)")
+        self.assertEqual(self.backend.translate("DELETE FROM menu LIMIT 5"),
+                         "DELETE FROM menu WHERE rowid IN (SELECT rowid FROM menu LIMIT 5)")
+        self.assertEqual(self.backend.translate("INSERT INTO menu (name) VALUES ('a') LIMIT 1"),
+                         "INSERT INTO menu (name) VALUES ('a')")
+        self.assertEqual(self.backend.translate("SELECT * FROM menu LIMIT 3"), "SELECT * FROM menu LIMIT 3")
+
+    def test_sqlite_pipeline(self):
+        """
+        Проверяет полный цикл на SQLite: создание схемы, заполнение данными, запросы через DatabaseDataChanger
+        и песочницу - копию файла базы.
+        """
+        with DatabaseCreator("coffee", "root", "123456", backend=self.backend) as db_creator:
+            db_creator.Database_Creation()
+        with DatabaseDataPusher("localhost", "root", "123456", "coffee", 20, backend=self.backend) as pusher:
+            pusher.PushGenerateData()
+
+        with DatabaseDataChanger("localhost", "root", "123456", "coffee", 20, backend=self.backend) as changer:
+            (menu_count,), = changer.execute_query("SELECT COUNT(*) FROM menu")
+            (oho_count,), = changer.execute_query("SELECT COUNT(*) FROM orders_has_order")
+            changer.execute_query("DELETE FROM orders_has_order LIMIT 5")
+            self.assertEqual(changer.execute_query("SELECT COUNT(*) FROM orders_has_order"), [(oho_count - 5,)])
+
+        with SandboxCreator("localhost", "root", "123456", "coffee", "coffee_sandbox", backend=self.backend) as sandbox:
+            sandbox.cursor.execute("DELETE FROM menu")
+            sandbox.conn.commit()
+            self.assertTrue(sandbox.sandbox_exists())
+            sandbox.reset_sandbox()
+            sandbox.connect("coffee_sandbox")
+            sandbox.cursor.execute("SELECT COUNT(*) FROM menu")
+            self.assertEqual(sandbox.cursor.fetchone(), (menu_count,))
+            sandbox.drop_sandbox()
+        self.assertFalse(os.path.exists(self.backend.path("coffee_sandbox")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from lib.benchmark import percentile, reject_outliers, confidence_interval, benchmark, BenchmarkResult, \
+    incomplete_beta, welch_t_test, measure_memory, current_rss
+
+
+class TestBenchmark(unittest.TestCase):
+    """
+    Юнит-тесты для модуля benchmark.
+    """
+
+    def test_percentile(self):
+        """
+        Проверяет расчет перцентилей с линейной интерполяцией.
+        """
+        values = [1, 2, 3, 4, 5]
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertEqual(percentile(values, 50), 3)
+        self.assertEqual(percentile(values, 100), 5)
+        self.assertAlmostEqual(percentile(values, 95), 4.8)
+        self.assertEqual(percentile([7], 99), 7)
+
+    def test_reject_outliers(self):
+        """
+        Проверяет, что выбросы отбрасываются по правилу Тьюки.
+        """
+        self.assertEqual(reject_outliers([10, 11, 10, 12, 11, 100]), [10, 11, 10, 12, 11])
+        self.assertEqual(reject_outliers([10, 100, 1000]), [10, 100, 1000])
+
+    def test_confidence_interval(self):
+        """
+        Проверяет 95% доверительный интервал по t-распределению.
+        """
+        low, high = confidence_interval([1.0, 2.0, 3.0])
+        self.assertAlmostEqual(low, 2.0 - 4.303 / 3 ** 0.5)
+        self.assertAlmostEqual(high, 2.0 + 4.303 / 3 ** 0.5)
+        self.assertEqual(confidence_interval([5.0]), (5.0, 5.0))
+
+    @patch('time.perf_counter_ns')
+    def test_benchmark(self, mock_counter):
+        """
+        Проверяет, что прогревочные запуски не учитываются, а teardown вызывается после каждого запуска.
+        """
+        mock_counter.side_effect = [0, 50, 100, 110, 200, 220, 300, 330]
+        func = MagicMock()
+        teardown = MagicMock()
+
+        result = benchmark(func, 'query', warmup=1, repeat=3, teardown=teardown)
+
+        self.assertEqual(func.call_count, 4)
+        func.assert_called_with('query')
+        self.assertEqual(teardown.call_count, 4)
+        self.assertEqual(result.raw_samples_ns, [10, 20, 30])
+        self.assertAlmostEqual(result.median, 20e-9)
+        self.assertAlmostEqual(result.min, 10e-9)
+
+    def test_benchmark_invalid_repeat(self):
+        """
+        Проверяет, что repeat меньше 1 вызывает ValueError.
+        """
+        with self.assertRaises(ValueError):
+            benchmark(lambda: None, repeat=0)
+
+    def test_result_statistics(self):
+        """
+        Проверяет статистики BenchmarkResult и учет выбросов.
+        """
+        result = BenchmarkResult([10, 11, 10, 12, 11, 100], warmup=0, repeat=6)
+
+        self.assertEqual(result.outliers, 1)
+        self.assertAlmostEqual(result.median, 11e-9)
+        self.assertAlmostEqual(result.max, 12e-9)
+        stats = result.to_dict()
+        self.assertEqual(stats['repeat'], 6)
+        self.assertIn('p99', stats)
+
+
+    def test_incomplete_beta(self):
+        """
+        Проверяет граничные и симметричные значения неполной бета-функции.
+        """
+        self.assertEqual(incomplete_beta(2, 3, 0), 0.0)
+        self.assertEqual(incomplete_beta(2, 3, 1), 1.0)
+        self.assertAlmostEqual(incomplete_beta(2, 2, 0.5), 0.5)
+        self.assertAlmostEqual(incomplete_beta(1, 1, 0.3), 0.3)
+
+    def test_welch_t_test(self):
+        """
+        Проверяет t-статистику и p-value t-теста Уэлча.
+        """
+        t, p_value = welch_t_test([1, 2, 3, 4, 5], [3, 4, 5, 6, 7])
+        self.assertAlmostEqual(t, -2.0)
+        self.assertAlmostEqual(p_value, 0.0805, places=4)
+        self.assertEqual(welch_t_test([5, 5, 5], [5, 5, 5]), (0.0, 1.0))
+        self.assertEqual(welch_t_test([5, 5, 5], [6, 6, 6])[1], 0.0)
+
+
+    def test_measure_memory(self):
+        """
+        Проверяет, что пиковая память учитывает временно выделенные объекты.
+        """
+        peak, rss_delta = measure_memory(lambda: bytearray(8 * 2 ** 20))
+
+        self.assertGreaterEqual(peak, 8 * 2 ** 20)
+        if current_rss() is not None:
+            self.assertIsInstance(rss_delta, int)
+
+    def test_benchmark_memory(self):
+        """
+        Проверяет, что при memory=True память измеряется в отдельном запуске, а без него не измеряется.
+        """
+        func = MagicMock()
+
+        result = benchmark(func, warmup=1, repeat=2, memory=True)
+
+        self.assertEqual(func.call_count, 4)
+        self.assertEqual(len(result.raw_samples_ns), 2)
+        self.assertIsNotNone(result.peak_memory)
+        self.assertIn("peak_memory", str(result))
+        self.assertIsNone(benchmark(func, repeat=1).peak_memory)
+
+
+if __name__ == '__main__':
+    unittest.main()
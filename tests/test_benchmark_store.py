@@ -0,0 +1,82 @@
+import unittest
+from unittest.mock import patch
+from lib.benchmark import BenchmarkResult
+from lib.benchmark_store import BenchmarkStore, main
+
+
+class TestBenchmarkStore(unittest.TestCase):
+    """
+    Юнит-тесты для класса BenchmarkStore.
+    """
+
+    def setUp(self):
+        """
+        Создает хранилище в памяти с фиксированными ревизией git и отпечатком машины.
+        """
+        patcher_revision = patch('lib.benchmark_store.git_revision', return_value='abc123')
+        patcher_machine = patch('lib.benchmark_store.machine_fingerprint', return_value='machine')
+        patcher_revision.start()
+        patcher_machine.start()
+        self.addCleanup(patcher_revision.stop)
+        self.addCleanup(patcher_machine.stop)
+        self.store = BenchmarkStore(':memory:')
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_start_run_and_list_runs(self):
+        """
+        Проверяет, что запуск сохраняется с ревизией git и отпечатком машины.
+        """
+        run_id = self.store.start_run('select_menu')
+
+        runs = self.store.list_runs()
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(runs[0][0], run_id)
+        self.assertEqual(runs[0][1], 'select_menu')
+        self.assertEqual(runs[0][3:], ('abc123', 'machine'))
+
+    def test_record_and_get_samples(self):
+        """
+        Проверяет, что сохраняются все замеры вместе с текстом запроса и количеством строк.
+        """
+        run_id = self.store.start_run('select_menu')
+        self.store.record(run_id, 'SELECT * FROM menu', 'SELECT * FROM menu LIMIT 10', 10,
+                          BenchmarkResult([100, 110, 120], warmup=1, repeat=3))
+
+        samples = self.store.get_samples(run_id)
+
+        self.assertEqual(samples, {('SELECT * FROM menu', 'SELECT * FROM menu LIMIT 10', 10): [100, 110, 120]})
+
+    def test_compare(self):
+        """
+        Проверяет, что значимое замедление помечается как регрессия, а шум - как отсутствие изменений.
+        """
+        base = self.store.start_run('base')
+        new = self.store.start_run('new')
+        self.store.record(base, 'menu', 'q1', 10, BenchmarkResult([100, 101, 99, 100, 102], 1, 5))
+        self.store.record(new, 'menu', 'q1', 10, BenchmarkResult([150, 151, 149, 150, 152], 1, 5))
+        self.store.record(base, 'guest', 'q2', 10, BenchmarkResult([100, 120, 80, 110, 90], 1, 5))
+        self.store.record(new, 'guest', 'q2', 10, BenchmarkResult([101, 121, 79, 111, 91], 1, 5))
+
+        comparison = {row['name']: row for row in self.store.compare(base, new)}
+
+        self.assertEqual(comparison['menu']['status'], 'regression')
+        self.assertAlmostEqual(comparison['menu']['change'], 0.5)
+        self.assertEqual(comparison['guest']['status'], 'unchanged')
+
+    @patch('lib.benchmark_store.BenchmarkStore')
+    def test_main_compare_exit_code(self, mock_store):
+        """
+        Проверяет, что команда compare возвращает 1 при найденной регрессии.
+        """
+        store = mock_store.return_value.__enter__.return_value
+        store.compare.return_value = [{'name': 'menu', 'query': 'q1', 'rows': 10, 'base_median': 1.0,
+                                       'new_median': 2.0, 'change': 1.0, 'p_value': 0.001, 'status': 'regression'}]
+
+        self.assertEqual(main(['--db', 'x.sqlite3', 'compare', '1', '2']), 1)
+        store.compare.assert_called_once_with(1, 2, 0.05, 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
+import random
 import unittest
-from lib.data_generator import DataGenerator
+from datetime import date
+from lib.data_generator import DataGenerator, DATES_START, DATES_STOP
 from unittest.mock import patch
 
 class TestDataGenerator(unittest.TestCase):
@@ -99,5 +101,30 @@ class TestDataGenerator(unittest.TestCase):
         with self.assertRaises(TypeError):
             DataGenerator(200, OrdersCount="200")
 
+    def test_native_dates(self):
+        """
+        Тест генерации дат для колонки DATE.
+        Проверяет, что даты - объекты date в диапазоне [DATES_START, DATES_STOP) и воспроизводимы при random.seed.
+        """
+        generator = DataGenerator(100, NativeDates=True)
+        random.seed(42)
+        orders = generator.OrdersGenerator(500)
+        random.seed(42)
+        again = generator.OrdersGenerator(500)
+
+        self.assertTrue(all(isinstance(order.OrderData, date) for order in orders))
+        self.assertTrue(all(DATES_START <= order.OrderData < DATES_STOP for order in orders))
+        self.assertEqual([order.OrderData for order in orders], [order.OrderData for order in again])
+        self.assertIsInstance(DataGenerator(100).OrdersGenerator(1)[0].OrderData, str)
+
+    def test_ordinal_dates_range(self):
+        """
+        Тест векторной генерации номеров дней в заданном диапазоне.
+        """
+        days = DataGenerator(10).OrdinalDatesGenerator(1000, start=date(2024, 2, 28), stop=date(2024, 3, 1))
+
+        self.assertEqual(str(days.dtype), 'datetime64[D]')
+        self.assertEqual(set(days.tolist()), {date(2024, 2, 28), date(2024, 2, 29)})
+
 if __name__ == '__main__':
     unittest.main()
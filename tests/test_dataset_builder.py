@@ -0,0 +1,85 @@
+import csv
+import os
+import random
+import tempfile
+import unittest
+from datetime import date
+from lib.data_generator import DataGenerator
+from lib.dataset_builder import build_dataset, format_value, load_manifest
+from lib.distributions import SKEWED
+
+
+class TestDatasetBuilder(unittest.TestCase):
+    """
+    Юнит-тесты для модуля dataset_builder. Наборы пишутся во временный каталог.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read_table(self, directory, table):
+        """
+        Читает строки таблицы из всех файлов частей в порядке манифеста.
+        """
+        rows = []
+        for entry in next(item for item in load_manifest(directory)["tables"] if item["name"] == table)["files"]:
+            with open(os.path.join(directory, entry["path"]), encoding="utf-8", newline="") as file:
+                rows.extend(csv.reader(file, delimiter="\t"))
+        return rows
+
+    def test_manifest_and_shards(self):
+        """
+        Проверяет манифест, количество строк по частям и сквозную нумерацию id.
+        """
+        generator = DataGenerator(100, NativeDates=True)
+        manifest = build_dataset(self.directory.name, generator, shard_rows=40, workers=1)
+        self.assertEqual(manifest, load_manifest(self.directory.name))
+        self.assertEqual([table["name"] for table in manifest["tables"]],
+                         ["menu", "barista", "guest", "personal_order", "orders", "orders_has_order"])
+        self.assertTrue(any(query.startswith("CREATE TABLE") and "order_date DATE" in query
+                            for query in manifest["schema"]))
+        guest = manifest["tables"][2]
+        self.assertEqual([entry["rows"] for entry in guest["files"]], [40, 40, 20])
+        self.assertEqual([entry["first_id"] for entry in guest["files"]], [1, 41, 81])
+        self.assertIn("INTO TABLE guest", guest["files"][0]["load_sql"])
+        rows = self.read_table(self.directory.name, "orders")
+        self.assertEqual([int(row[0]) for row in rows], list(range(1, 101)))
+        self.assertRegex(rows[0][1], r"^\d{4}-\d{2}-\d{2}$")
+        self.assertTrue(all(1 <= int(row[2]) <= generator.BaristaCount for row in rows))
+
+    def test_parallel_matches_sequential(self):
+        """
+        Проверяет, что файлы не зависят от количества процессов и состояния модуля random.
+        """
+        generator = DataGenerator(60, Distributions=SKEWED)
+        random.seed(1)
+        sequential = build_dataset(os.path.join(self.directory.name, "a"), generator, shard_rows=25, workers=1)
+        random.seed(2)
+        parallel = build_dataset(os.path.join(self.directory.name, "b"), generator, shard_rows=25, workers=2)
+        self.assertEqual([[entry["sha256"] for entry in table["files"]] for table in sequential["tables"]],
+                         [[entry["sha256"] for entry in table["files"]] for table in parallel["tables"]])
+        self.assertEqual(parallel["params"]["distributions"]["personal_order.menu_id"]["type"], "Zipf")
+
+    def test_format_value(self):
+        """
+        Проверяет, что в TSV None записывается как \\N, а служебные символы экранируются, как ждет LOAD DATA.
+        """
+        self.assertEqual(format_value(None, "tsv"), "\\N")
+        self.assertEqual(format_value("a\\b\tc\nd", "tsv"), "a\\\\b\\tc\\nd")
+        self.assertEqual(format_value(date(2024, 6, 16), "tsv"), "2024-06-16")
+        self.assertEqual(format_value(7, "tsv"), "7")
+        self.assertIsNone(format_value(None))
+
+    def test_invalid_format(self):
+        """
+        Проверяет ошибку при неизвестном формате файлов.
+        """
+        with self.assertRaises(ValueError):
+            build_dataset(self.directory.name, DataGenerator(10), file_format="parquet")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import random
+import tempfile
+import time
+import unittest
+from datetime import date
+from unittest.mock import patch
+import numpy as np
+from lib.data_generator import DataGenerator
+from lib.dataset_cache import DatasetCache
+from lib.distributions import Zipf
+from lib.schema import GenerationContext
+
+
+class TestDatasetCache(unittest.TestCase):
+    """
+    Юнит-тесты для модуля dataset_cache. Наборы сохраняются во временный каталог.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = DatasetCache(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load_is_reproducible_and_memory_mapped(self):
+        """
+        Проверяет, что повторная загрузка не генерирует набор заново, а колонки отображены в память.
+        """
+        context = GenerationContext(counts={"barista": 5, "guest": 50}, native_dates=True)
+        first = self.cache.load("orders", 100, context, seed=3)
+        with patch("lib.schema.Table.generate_columns") as generate_columns:
+            second = self.cache.load("orders", 100, context, seed=3)
+            generate_columns.assert_not_called()
+        self.assertIsInstance(second["guest_id"], np.memmap)
+        for name in first:
+            self.assertTrue(np.array_equal(first[name], second[name]))
+        rows = list(self.cache.iter_rows("orders", 100, context, seed=3, chunk_size=30))
+        self.assertEqual(len(rows), 100)
+        self.assertEqual(rows[0][0], 1)
+        self.assertIsInstance(rows[0][1], date)
+
+    def test_key_depends_on_parameters(self):
+        """
+        Проверяет, что ключ меняется вместе с seed, количеством строк, параметрами генерации и версией генераторов.
+        """
+        context = GenerationContext(counts={"menu": 25})
+        key = self.cache.key("personal_order", 10, context, seed=1)
+        self.assertEqual(key, self.cache.key("personal_order", 10, GenerationContext(counts={"menu": 25}), seed=1))
+        self.assertNotEqual(key, self.cache.key("personal_order", 10, context, seed=2))
+        self.assertNotEqual(key, self.cache.key("personal_order", 11, context, seed=1))
+        self.assertNotEqual(key, self.cache.key("personal_order", 10, GenerationContext(counts={"menu": 26}), seed=1))
+        skewed = GenerationContext(counts={"menu": 25}, distributions={"personal_order.menu_id": Zipf(1.1)})
+        self.assertNotEqual(key, self.cache.key("personal_order", 10, skewed, seed=1))
+        with patch("lib.dataset_cache.GENERATOR_VERSION", 999):
+            self.assertNotEqual(key, self.cache.key("personal_order", 10, context, seed=1))
+
+    def test_random_state_restored(self):
+        """
+        Проверяет, что генерация через кэш не меняет состояние модуля random.
+        """
+        random.seed(5)
+        expected = random.random()
+        random.seed(5)
+        self.cache.load("menu", 10)
+        self.assertEqual(random.random(), expected)
+
+    def test_lru_eviction(self):
+        """
+        Проверяет, что при превышении размера удаляется давно не использованный набор, а только что
+        сохраненный остается.
+        """
+        self.cache.load("menu", 200, seed=1)
+        self.cache.load("menu", 200, seed=2)
+        old = os.path.join(self.directory.name, self.cache.key("menu", 200, seed=1))
+        os.utime(os.path.join(old, "meta.json"), (time.time() - 100, time.time() - 100))
+        self.cache.max_bytes = self.cache.size() - 1
+        self.cache.load("menu", 200, seed=3)
+        names = os.listdir(self.directory.name)
+        self.assertNotIn(os.path.basename(old), names)
+        self.assertIn(self.cache.key("menu", 200, seed=3), names)
+        self.cache.clear()
+        self.assertEqual(self.cache.entries(), [])
+
+    def test_data_generator_uses_cache(self):
+        """
+        Проверяет, что DataGenerator с кэшем возвращает одинаковые данные независимо от random.seed.
+        """
+        random.seed(1)
+        first = [guest.to_turple() for guest in DataGenerator(20, Cache=self.cache, Seed=7).GuestGenerator()]
+        random.seed(2)
+        second = [guest.to_turple() for guest in DataGenerator(20, Cache=self.cache, Seed=7).GuestGenerator()]
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.cache.entries()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
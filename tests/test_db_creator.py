@@ -4,6 +4,7 @@ from unittest.mock import patch, MagicMock
 import mysql.connector
 from mysql.connector import errorcode
 from lib.db_creator import DatabaseCreator
+from lib.orm_classes import Index, RangePartition
 
 
 class TestDatabaseCreator(unittest.TestCase):
@@ -101,6 +102,70 @@ class TestDatabaseCreator(unittest.TestCase):
             db_creator.Database_Creation()
             self.assertEqual(mock_cursor.execute.call_count, 6+1)
 
+    @patch('mysql.connector.connect')
+    def test_indexes_and_partitioning(self, mock_connect):
+        """
+        Тест вторичных индексов и секционирования.
+        Проверяет, что индексы добавляются в CREATE TABLE, секционирование пропускается для колонки без типа DATE,
+        а внешние ключи на секционированную таблицу заменяются индексами.
+        """
+        mock_cursor = mock_connect.return_value.cursor.return_value
+        partition = RangePartition('order_date', by='month', start='2024-01', stop='2024-03')
+
+        with DatabaseCreator('test_db', 'root', '123456', indexes={'menu': [Index('idx_menu_prices', ['prices'])]},
+                             partitioning={'orders': partition}) as db_creator:
+            db_creator.MenuGenerator()
+            db_creator.OrdersGenerator()
+            self.assertEqual(db_creator.partitioned_tables, set())
+
+            db_creator.create_table('orders', ['id INT AUTO_INCREMENT', 'order_date DATE NOT NULL',
+                                               'guest_id INT NOT NULL'], foreign_keys=[('guest_id', 'guest')])
+            db_creator.Orders_has_OrderGenerator()
+
+        queries = [c.args[0] for c in mock_cursor.execute.call_args_list]
+        self.assertIn("INDEX idx_menu_prices (prices)", queries[1])
+        self.assertNotIn("PARTITION", queries[2])
+        self.assertIn("FOREIGN KEY(barista_id) REFERENCES barista(id)", queries[2])
+        self.assertIn("PRIMARY KEY (id, order_date)", queries[3])
+        self.assertIn("INDEX (guest_id)", queries[3])
+        self.assertTrue(queries[3].endswith(partition.clause()))
+        self.assertIn("INDEX (orders_id)", queries[4])
+        self.assertIn("FOREIGN KEY(order_id) REFERENCES personal_order(id)", queries[4])
+
+    @patch('mysql.connector.connect')
+    def test_native_dates(self, mock_connect):
+        """
+        Тест режима DATE: orders.order_date создается с типом DATE, и таблицу можно секционировать по месяцам.
+        """
+        mock_cursor = mock_connect.return_value.cursor.return_value
+        partition = RangePartition('order_date', by='month', start='2024-01', stop='2025-01')
+
+        with DatabaseCreator('test_db', 'root', '123456', partitioning={'orders': partition},
+                             native_dates=True) as db_creator:
+            db_creator.OrdersGenerator()
+            self.assertEqual(db_creator.partitioned_tables, {'orders'})
+
+        query = mock_cursor.execute.call_args[0][0]
+        self.assertIn("order_date DATE NOT NULL", query)
+        self.assertIn("PARTITION p202412 VALUES LESS THAN (202501)", query)
+
+    @patch('mysql.connector.connect')
+    def test_schema_sql(self, mock_connect):
+        """
+        Тест построения запросов всех таблиц без соединения: порядок создания и те же запросы, что выполняются.
+        """
+        queries = DatabaseCreator('test_db', 'root', '123456', native_dates=True).schema_sql()
+        mock_connect.assert_not_called()
+        self.assertEqual(len(queries), 6)
+        self.assertTrue(queries[0].startswith("CREATE TABLE IF NOT EXISTS menu"))
+        self.assertIn("order_date DATE NOT NULL", queries[4])
+
+        mock_cursor = mock_connect.return_value.cursor.return_value
+        with DatabaseCreator('test_db', 'root', '123456', native_dates=True) as db_creator:
+            db_creator.Database_Creation()
+        executed = [call[0][0] for call in mock_cursor.execute.call_args_list]
+        self.assertEqual(executed[-6:], queries)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,6 +2,8 @@ import unittest
 from unittest.mock import MagicMock, patch, call
 from lib.db_data_pusher import DatabaseDataPusher
 from lib.db_data_changer import DatabaseDataChanger
+from lib.backends import get_backend
+from lib.data_generator import DataGenerator
 
 
 class TestDatabaseDataChanger(unittest.TestCase):
@@ -20,6 +22,7 @@ class TestDatabaseDataChanger(unittest.TestCase):
             self.changer = DatabaseDataChanger('host', 'root', '123456', 'db_name', 10)
             self.changer.cursor = MagicMock()
             self.changer.conn = MagicMock()
+            self.changer.key_samplers = {}
 
     def test_clear_table(self):
         """
@@ -56,6 +59,93 @@ class TestDatabaseDataChanger(unittest.TestCase):
         self.changer.get_method_lambda.assert_called_once_with(table_name)
         self.changer.get_method_lambda(table_name)(count)
 
+    def test_replace_table_data_swap(self):
+        """
+        Тестирует замену данных через теневую таблицу.
+        Проверяет, что данные вставляются в копию без вторичных индексов, индексы и внешние ключи строятся
+        после загрузки, таблица подменяется одним RENAME TABLE, а внешние ключи дочерних таблиц пересоздаются.
+        """
+        self.changer.targets = {}
+        self.changer.cursor.fetchall.side_effect = [
+            [("idx_menu_prices", 1, "prices")],
+            [("personal_order_ibfk_1", "personal_order", "menu_id", "menu", "id")],
+        ]
+        self.changer.cursor.fetchone.return_value = (5,)
+        targets = []
+        self.changer.get_method_lambda = MagicMock(
+            return_value=lambda count: targets.append(dict(self.changer.targets)))
+
+        self.changer.replace_table_data("menu", 5, swap=True)
+
+        self.assertEqual(targets, [{"menu": "menu__shadow"}])
+        self.assertEqual(self.changer.targets, {})
+        queries = [args[0][0] for args in self.changer.cursor.execute.call_args_list][2:]
+        self.assertEqual(queries, [
+            "DROP TABLE IF EXISTS menu__shadow, menu__old",
+            "CREATE TABLE menu__shadow LIKE menu",
+            "ALTER TABLE menu__shadow DROP INDEX idx_menu_prices",
+            "SELECT COUNT(*) FROM menu__shadow",
+            "ALTER TABLE menu__shadow ADD INDEX idx_menu_prices (prices)",
+            "SET FOREIGN_KEY_CHECKS = 0",
+            "RENAME TABLE menu TO menu__old, menu__shadow TO menu",
+            "ALTER TABLE personal_order DROP FOREIGN KEY personal_order_ibfk_1, "
+            "ADD FOREIGN KEY (menu_id) REFERENCES menu(id)",
+            "DROP TABLE menu__old",
+            "SET FOREIGN_KEY_CHECKS = 1",
+        ])
+        self.changer.conn.commit.assert_called_once()
+
+    def test_replace_table_data_swap_insert_failure(self):
+        """
+        Тестирует ошибку вставки в теневую таблицу.
+        Проверяет, что ошибка executemany прерывает подмену: копия удаляется, исходная таблица
+        не переименовывается и не удаляется.
+        """
+        self.changer.targets = {}
+        self.changer.data = DataGenerator(10)
+        self.changer.cursor.fetchall.side_effect = [[], []]
+        self.changer.cursor.executemany.side_effect = Exception("Duplicate entry '1' for key 'PRIMARY'")
+
+        self.changer.replace_table_data("menu", 5, swap=True)
+
+        self.assertTrue(self.changer.cursor.executemany.call_args[0][0].startswith("INSERT INTO menu__shadow "))
+        queries = [args[0][0] for args in self.changer.cursor.execute.call_args_list]
+        self.assertIn("DROP TABLE IF EXISTS menu__shadow", queries)
+        self.assertFalse(any(query.startswith("RENAME TABLE") for query in queries))
+        self.assertNotIn("DROP TABLE menu__old", queries)
+        self.assertEqual(self.changer.targets, {})
+
+    def test_replace_table_data_swap_empty_shadow(self):
+        """
+        Тестирует загрузку, которая без ошибки ничего не вставила (например, связи при пустой orders).
+        Проверяет, что пустая копия не подменяет таблицу.
+        """
+        self.changer.targets = {}
+        self.changer.cursor.fetchall.side_effect = [[], []]
+        self.changer.cursor.fetchone.return_value = (0,)
+        self.changer.get_method_lambda = MagicMock(return_value=lambda count: None)
+
+        self.changer.replace_table_data("orders_has_order", swap=True)
+
+        queries = [args[0][0] for args in self.changer.cursor.execute.call_args_list]
+        self.assertIn("DROP TABLE IF EXISTS orders_has_order__shadow", queries)
+        self.assertFalse(any(query.startswith("RENAME TABLE") for query in queries))
+
+    @patch('lib.db_data_changer.DatabaseDataChanger.swap_table_data')
+    def test_replace_table_data_swap_unsupported(self, mock_swap):
+        """
+        Тестирует замену с swap=True на движке без подмены таблиц.
+        Проверяет, что таблица очищается и заполняется на месте.
+        """
+        self.changer.backend = get_backend("sqlite")
+        self.changer.clear_table = MagicMock()
+        self.changer.get_method_lambda = MagicMock(return_value=lambda count: None)
+
+        self.changer.replace_table_data("menu", swap=True)
+
+        mock_swap.assert_not_called()
+        self.changer.clear_table.assert_called_once_with("menu")
+
     def test_get_method_lambda(self):
         """
         Тестирует метод get_method_lambda.
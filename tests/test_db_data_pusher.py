@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import MagicMock, patch, call
 import mysql.connector
 from lib.db_data_pusher import DatabaseDataPusher
+from lib.schema import KeySampler
 
 
 class TestDatabaseDataPusher(unittest.TestCase):
@@ -74,6 +75,16 @@ class TestDatabaseDataPusher(unittest.TestCase):
         )
         self.pusher.conn.commit.assert_called_once()
 
+    def test_push_rows_target(self):
+        """
+        Тестирует перенаправление вставки через targets.
+        Проверяет, что строки таблицы реестра вставляются в указанную таблицу с колонками исходной.
+        """
+        self.pusher.targets = {"menu": "menu__shadow"}
+        self.pusher.PushRows("menu", [(1, "latte", 200)])
+        self.pusher.cursor.executemany.assert_called_once_with(
+            "INSERT INTO menu__shadow (id, name, prices) VALUES (%s, %s, %s)", [(1, "latte", 200)])
+
     def test_push_generate_data(self):
         """
         Тестирует метод PushGenerateData.
@@ -166,15 +177,50 @@ class TestDatabaseDataPusher(unittest.TestCase):
         Проверяет, что данные связей заказов правильно генерируются и вставляются в таблицу.
         """
         with patch.object(self.pusher, 'PushData') as mock_push_data:
-            self.pusher.GetExistingOrderIDs = MagicMock(return_value=[1, 2, 3])
+            sampler = KeySampler(1, 3)
+            self.pusher.GetKeySampler = MagicMock(return_value=sampler)
             self.pusher.data.Orders_has_OrderGenerator = MagicMock(return_value=[MagicMock() for _ in range(5)])
 
             self.pusher.PushGenerateOrders_has_orderData(5)
 
-            self.pusher.GetExistingOrderIDs.assert_called_once()
-            self.pusher.data.Orders_has_OrderGenerator.assert_called_once_with(5, [1, 2, 3])
+            self.pusher.GetKeySampler.assert_called_once_with("orders")
+            self.pusher.data.Orders_has_OrderGenerator.assert_called_once_with(5, sampler)
             mock_push_data.assert_called_once_with('orders_has_order', self.pusher.data.Orders_has_OrderGenerator.return_value)
 
+    def test_get_key_sampler(self):
+        """
+        Тестирует метод GetKeySampler.
+        Проверяет, что для плотных id читается только диапазон, а для id с пропусками - только границы пропусков.
+        """
+        self.pusher.cursor.fetchone = MagicMock(return_value=(100, 1, 100))
+        sampler = self.pusher.GetKeySampler("orders")
+        self.assertTrue(sampler.dense)
+        self.pusher.cursor.execute.assert_called_once_with("SELECT COUNT(*), MIN(id), MAX(id) FROM orders")
+
+        self.pusher.cursor.execute.reset_mock()
+        self.pusher.cursor.fetchone = MagicMock(return_value=(7, 1, 10))
+        self.pusher.cursor.fetchall = MagicMock(side_effect=[[(3,)], [(5,)]])
+        sampler = self.pusher.GetKeySampler("orders", refresh=True)
+        self.assertEqual(self.pusher.cursor.execute.call_count, 3)
+        self.assertEqual(set(sampler.sample(200)), {1, 2, 6, 7, 8, 9, 10})
+
+        self.pusher.cursor.fetchone = MagicMock(return_value=(0, None, None))
+        self.assertIsNone(self.pusher.GetKeySampler("orders", refresh=True))
+
+    def test_get_key_sampler_cached(self):
+        """
+        Тестирует кэширование GetKeySampler.
+        Проверяет, что повторный вызов не выполняет запросов, а вставка в таблицу сбрасывает выборку.
+        """
+        self.pusher.cursor.fetchone = MagicMock(return_value=(100, 1, 100))
+        sampler = self.pusher.GetKeySampler("orders")
+        self.assertIs(self.pusher.GetKeySampler("orders"), sampler)
+        self.assertEqual(self.pusher.cursor.execute.call_count, 1)
+
+        self.pusher.PushRows("orders", [(101, "01-01-2024", 1, 1)])
+        self.pusher.cursor.fetchone = MagicMock(return_value=(101, 1, 101))
+        self.assertEqual(self.pusher.GetKeySampler("orders").max_id, 101)
+
     def test_get_existing_order_ids(self):
         """
         Тестирует метод GetExistingOrderIDs.
@@ -201,5 +247,17 @@ class TestDatabaseDataPusher(unittest.TestCase):
             method(5)
             mock_push_menu.assert_called_once_with(5)
 
+    @patch('lib.db_data_pusher.DataGenerator')
+    def test_data_is_lazy(self, mock_generator):
+        """
+        Тестирует, что DataGenerator создается только при первом обращении к data и один раз.
+        """
+        pusher = DatabaseDataPusher('host', 'root', '123456', 'db_name', 10)
+        mock_generator.assert_not_called()
+
+        self.assertIs(pusher.data, mock_generator.return_value)
+        self.assertIs(pusher.data, mock_generator.return_value)
+        mock_generator.assert_called_once_with(10, NativeDates=False, Distributions=None)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,276 @@
+import unittest
+from unittest.mock import MagicMock, patch, call
+from mysql.connector import errorcode
+from lib.backends import MySQLBackend
+from lib.db_sandbox_creator import SandboxCreator
+
+
+class TestSandboxCreator(unittest.TestCase):
+    """
+    Юнит-тесты для класса SandboxCreator.
+    """
+
+    def setUp(self):
+        """
+        Создает экземпляр SandboxCreator с замоканными cursor и conn.
+        """
+        self.creator = SandboxCreator('host', 'root', '123456', 'orig_db', 'sandbox_db')
+        self.creator.conn = MagicMock()
+        self.creator.cursor = MagicMock()
+
+    def test_get_foreign_keys(self):
+        """
+        Тестирует метод get_foreign_keys.
+        Проверяет, что метаданные внешних ключей читаются одним запросом к information_schema.
+        """
+        self.creator.cursor.fetchall.return_value = [('personal_order', 'menu_id', 'menu', 'id')]
+
+        result = self.creator.get_foreign_keys()
+
+        self.creator.cursor.execute.assert_called_once()
+        query, params = self.creator.cursor.execute.call_args[0]
+        self.assertIn("information_schema.KEY_COLUMN_USAGE", query)
+        self.assertEqual(params, ('orig_db',))
+        self.assertEqual(result, [('personal_order', 'menu_id', 'menu', 'id')])
+
+    def test_get_table_dependencies(self):
+        """
+        Тестирует метод get_table_dependencies.
+        Проверяет, что зависимости строятся только по внешним ключам, без ложных совпадений имен таблиц.
+        """
+        self.creator.cursor.fetchall.side_effect = [
+            [('orders',), ('orders_has_order',), ('personal_order',), ('menu',)],
+            [('orders_has_order', 'orders_id', 'orders', 'id'),
+             ('orders_has_order', 'order_id', 'personal_order', 'id'),
+             ('personal_order', 'menu_id', 'menu', 'id')]
+        ]
+
+        result = self.creator.get_table_dependencies()
+
+        self.assertEqual(result, {
+            'orders': [],
+            'orders_has_order': ['orders', 'personal_order'],
+            'personal_order': ['menu'],
+            'menu': []
+        })
+
+    def test_copy_tables(self):
+        """
+        Тестирует метод copy_tables.
+        Проверяет, что таблицы создаются при отключенной проверке внешних ключей и заполняются через INSERT ... SELECT.
+        """
+        self.creator.get_table_dependencies = MagicMock(return_value={'menu': [], 'personal_order': ['menu']})
+        self.creator.cursor.fetchone.side_effect = [('menu', 'CREATE TABLE menu'),
+                                                    ('personal_order', 'CREATE TABLE personal_order')]
+
+        self.creator.copy_tables()
+
+        self.creator.cursor.assert_has_calls([
+            call.execute("SET FOREIGN_KEY_CHECKS = 0"),
+            call.execute("SHOW CREATE TABLE orig_db.menu"),
+            call.fetchone(),
+            call.execute("SHOW CREATE TABLE orig_db.personal_order"),
+            call.fetchone(),
+            call.execute("CREATE TABLE menu"),
+            call.execute("CREATE TABLE personal_order"),
+            call.execute("INSERT INTO sandbox_db.menu SELECT * FROM orig_db.menu"),
+            call.execute("INSERT INTO sandbox_db.personal_order SELECT * FROM orig_db.personal_order"),
+            call.execute("SET FOREIGN_KEY_CHECKS = 1")
+        ])
+        self.assertEqual(self.creator.conn.database, 'sandbox_db')
+        self.creator.conn.commit.assert_called_once()
+
+    @patch('mysql.connector.connect')
+    def test_copy_tables_parallel(self, mock_connect):
+        """
+        Тестирует метод copy_tables с несколькими потоками.
+        Проверяет, что каждая таблица копируется в отдельном соединении, которое затем закрывается.
+        """
+        self.creator.get_table_dependencies = MagicMock(return_value={'menu': [], 'guest': []})
+        self.creator.cursor.fetchone.return_value = ('t', 'CREATE TABLE t')
+
+        self.creator.copy_tables(workers=2)
+
+        self.assertEqual(mock_connect.call_count, 2)
+        self.assertEqual(mock_connect.return_value.close.call_count, 2)
+
+    def test_copy_subset(self):
+        """
+        Тестирует метод copy_subset на схеме кафе с корневой таблицей orders.
+        Проверяет, что выбираются строки orders, их позиции и все строки, на которые они ссылаются.
+        """
+        self.creator.sample_percent = 10
+        self.creator.sample_roots = ['orders']
+        self.creator.seed = 42
+        ordered_tables = ['menu', 'guest', 'barista', 'orders', 'personal_order', 'orders_has_order']
+        foreign_keys = [
+            ('personal_order', 'menu_id', 'menu', 'id'),
+            ('orders', 'barista_id', 'barista', 'id'),
+            ('orders', 'guest_id', 'guest', 'id'),
+            ('orders_has_order', 'order_id', 'personal_order', 'id'),
+            ('orders_has_order', 'orders_id', 'orders', 'id')
+        ]
+
+        self.creator.copy_subset(ordered_tables, foreign_keys)
+
+        queries = [c.args[0] for c in self.creator.cursor.execute.call_args_list]
+        self.assertEqual(queries, [
+            "INSERT INTO sandbox_db.orders SELECT * FROM orig_db.orders WHERE RAND(42) < 0.1",
+            "INSERT INTO sandbox_db.orders_has_order SELECT * FROM orig_db.orders_has_order "
+            "WHERE orders_id IN (SELECT id FROM sandbox_db.orders)",
+            "INSERT IGNORE INTO sandbox_db.personal_order SELECT * FROM orig_db.personal_order "
+            "WHERE id IN (SELECT order_id FROM sandbox_db.orders_has_order)",
+            "INSERT IGNORE INTO sandbox_db.orders SELECT * FROM orig_db.orders "
+            "WHERE id IN (SELECT orders_id FROM sandbox_db.orders_has_order)",
+            "INSERT IGNORE INTO sandbox_db.menu SELECT * FROM orig_db.menu "
+            "WHERE id IN (SELECT menu_id FROM sandbox_db.personal_order)",
+            "INSERT IGNORE INTO sandbox_db.barista SELECT * FROM orig_db.barista "
+            "WHERE id IN (SELECT barista_id FROM sandbox_db.orders)",
+            "INSERT IGNORE INTO sandbox_db.guest SELECT * FROM orig_db.guest "
+            "WHERE id IN (SELECT guest_id FROM sandbox_db.orders)"
+        ])
+
+    def test_copy_subset_default_roots(self):
+        """
+        Тестирует выбор корневых таблиц по умолчанию: сущности guest и orders, каждая со своим seed.
+        Без этих таблиц корневые таблицы нужно указать явно.
+        """
+        self.creator.sample_percent = 50
+        self.creator.seed = 7
+        ordered_tables = ['menu', 'guest', 'barista', 'orders', 'personal_order', 'orders_has_order']
+        foreign_keys = [('orders', 'guest_id', 'guest', 'id'), ('orders_has_order', 'orders_id', 'orders', 'id')]
+
+        self.creator.copy_subset(ordered_tables, foreign_keys)
+
+        queries = [c.args[0] for c in self.creator.cursor.execute.call_args_list]
+        self.assertEqual(queries[:2], [
+            "INSERT INTO sandbox_db.guest SELECT * FROM orig_db.guest WHERE RAND(7) < 0.5",
+            "INSERT INTO sandbox_db.orders SELECT * FROM orig_db.orders WHERE RAND(8) < 0.5"
+        ])
+        with self.assertRaises(ValueError):
+            self.creator.copy_subset(['menu', 'personal_order'], [('personal_order', 'menu_id', 'menu', 'id')])
+
+    def test_reset_sandbox(self):
+        """
+        Тестирует метод reset_sandbox.
+        Проверяет, что указанные таблицы очищаются и заполняются заново из исходной базы данных.
+        """
+        self.creator.reset_sandbox(['menu'])
+
+        self.creator.cursor.assert_has_calls([
+            call.execute("SET FOREIGN_KEY_CHECKS = 0"),
+            call.execute("TRUNCATE TABLE sandbox_db.menu"),
+            call.execute("INSERT INTO sandbox_db.menu SELECT * FROM orig_db.menu"),
+            call.execute("SET FOREIGN_KEY_CHECKS = 1")
+        ])
+        self.creator.conn.commit.assert_called_once()
+
+    def test_resolve_dependency_levels(self):
+        """
+        Тестирует метод resolve_dependency_levels на схеме кафе.
+        Проверяет, что таблицы разбиваются на независимые уровни.
+        """
+        dependencies = {
+            'orders_has_order': ['orders', 'personal_order'],
+            'orders': ['barista', 'guest'],
+            'personal_order': ['menu'],
+            'menu': [],
+            'guest': [],
+            'barista': []
+        }
+
+        levels = self.creator.resolve_dependency_levels(dependencies)
+
+        self.assertEqual(levels, [['menu', 'guest', 'barista'], ['orders', 'personal_order'], ['orders_has_order']])
+        self.assertEqual(self.creator.resolve_dependencies(dependencies),
+                         ['menu', 'guest', 'barista', 'orders', 'personal_order', 'orders_has_order'])
+
+    def test_resolve_dependencies_ignores_self_reference(self):
+        """
+        Тестирует, что ссылка таблицы на саму себя не считается циклом.
+        """
+        self.assertEqual(self.creator.resolve_dependencies({'employee': ['employee']}), ['employee'])
+
+    def test_resolve_dependencies_cycle(self):
+        """
+        Тестирует, что при циклической зависимости выбрасывается исключение.
+        """
+        with self.assertRaises(Exception):
+            self.creator.resolve_dependencies({'a': ['b'], 'b': ['a'], 'c': []})
+
+    @patch('mysql.connector.connect')
+    def test_connect_closes_previous_connection(self, mock_connect):
+        """
+        Тестирует метод connect.
+        Проверяет, что предыдущее соединение закрывается при повторном подключении.
+        """
+        old_conn = self.creator.conn
+        old_cursor = self.creator.cursor
+
+        self.creator.connect('orig_db')
+
+        old_cursor.close.assert_called_once()
+        old_conn.close.assert_called_once()
+        self.assertIs(self.creator.conn, mock_connect.return_value)
+
+    def fake_driver_backend(self):
+        """
+        Возвращает движок MySQL с драйвером-заглушкой, исключения которого не наследуют mysql.connector.Error.
+        """
+        class DriverError(Exception):
+            pass
+
+        backend = MySQLBackend()
+        backend.driver = MagicMock(Error=DriverError, error_code=lambda err: err.args[0])
+        return backend
+
+    def test_create_sandbox_exists_with_other_driver(self):
+        """
+        Тестирует create_sandbox с драйвером, отличным от mysql.connector.
+        Проверяет, что ошибка "база уже существует" распознается через движок и таблицы все равно копируются.
+        """
+        self.creator.backend = self.fake_driver_backend()
+        self.creator.cursor.execute.side_effect = self.creator.backend.Error(errorcode.ER_DB_CREATE_EXISTS,
+                                                                             "database exists")
+        self.creator.copy_tables = MagicMock()
+
+        self.creator.create_sandbox()
+
+        self.creator.copy_tables.assert_called_once_with(1)
+
+    def test_copy_in_new_connection_uses_backend(self):
+        """
+        Тестирует copy_table_data_in_new_connection.
+        Проверяет, что параллельное соединение открывается через выбранный драйвер движка.
+        """
+        backend = self.fake_driver_backend()
+        self.creator.backend = backend
+        self.creator.copy_table_data = MagicMock()
+
+        self.creator.copy_table_data_in_new_connection('menu')
+
+        backend.driver.connect.assert_called_once_with(host='host', user='root', password='123456')
+        conn = backend.driver.connect.return_value
+        conn.cursor.return_value.execute.assert_called_once_with("SET FOREIGN_KEY_CHECKS = 0")
+        self.creator.copy_table_data.assert_called_once_with('menu', conn.cursor.return_value)
+        conn.close.assert_called_once()
+
+    def test_switch_to_sandbox_with_other_driver(self):
+        """
+        Тестирует __enter__ и copy_tables с драйвером pymysql.
+        Проверяет, что текущая база переключается на песочницу через select_db, а не атрибутом соединения.
+        """
+        self.creator.backend = MySQLBackend(driver="pymysql")
+        self.creator.connect = MagicMock()
+        self.creator.create_sandbox = MagicMock()
+        self.creator.get_table_dependencies = MagicMock(return_value={'menu': []})
+        self.creator.cursor.fetchone.return_value = ('menu', 'CREATE TABLE menu')
+
+        self.creator.__enter__()
+        self.creator.copy_tables()
+
+        self.creator.conn.select_db.assert_has_calls([call('sandbox_db'), call('sandbox_db')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+from unittest.mock import patch
+from lib.db_sandbox_pool import SandboxPool
+
+
+class TestSandboxPool(unittest.TestCase):
+    """
+    Юнит-тесты для класса SandboxPool.
+    """
+
+    def setUp(self):
+        """
+        Патчит SandboxCreator, чтобы избежать реального подключения к базе данных.
+        """
+        patcher = patch('lib.db_sandbox_pool.SandboxCreator')
+        self.mock_creator_cls = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_creator = self.mock_creator_cls.return_value
+        self.pool = SandboxPool('host', 'root', '123456', 'my_database', size=2)
+
+    def test_default_names(self):
+        """
+        Проверяет имена шаблона и песочниц по умолчанию.
+        """
+        self.assertEqual(self.pool.template_db_name, 'my_database_template')
+        self.assertEqual(self.pool.sandboxes, ['my_database_sandbox_0', 'my_database_sandbox_1'])
+
+    def test_prepare_creates_missing_template_and_sandboxes(self):
+        """
+        Проверяет, что отсутствующие шаблон и песочницы создаются копированием.
+        """
+        self.mock_creator.sandbox_exists.return_value = False
+
+        self.pool.prepare()
+
+        self.assertEqual(self.mock_creator.create_sandbox.call_count, 3)
+        self.mock_creator_cls.assert_any_call('host', 'root', '123456', 'my_database', 'my_database_template', workers=1)
+        self.mock_creator_cls.assert_any_call('host', 'root', '123456', 'my_database_template', 'my_database_sandbox_0',
+                                              workers=1)
+
+    def test_prepare_reuses_existing_template_and_sandboxes(self):
+        """
+        Проверяет, что существующие шаблон и песочницы переиспользуются без полного копирования.
+        """
+        self.mock_creator.sandbox_exists.return_value = True
+
+        self.pool.prepare()
+
+        self.mock_creator.create_sandbox.assert_not_called()
+        self.assertEqual(self.mock_creator.reset_sandbox.call_count, 2)
+
+    def test_lease_and_release(self):
+        """
+        Проверяет выдачу песочницы и ее восстановление при возврате в пул.
+        """
+        self.mock_creator.sandbox_exists.return_value = True
+        self.pool.prepare()
+        self.mock_creator.reset_sandbox.reset_mock()
+
+        with self.pool.sandbox(dirty_tables=['menu']) as sandbox_db:
+            self.assertEqual(sandbox_db, 'my_database_sandbox_0')
+
+        self.mock_creator.reset_sandbox.assert_called_once_with(['menu'])
+        self.assertEqual(self.pool.lease(), 'my_database_sandbox_1')
+        self.assertEqual(self.pool.lease(), 'my_database_sandbox_0')
+
+    def test_release_without_changes(self):
+        """
+        Проверяет, что песочница без изменений возвращается в пул без восстановления данных.
+        """
+        self.pool.release('my_database_sandbox_0', dirty_tables=[])
+
+        self.mock_creator.reset_sandbox.assert_not_called()
+        self.assertEqual(self.pool.lease(), 'my_database_sandbox_0')
+
+    def test_lease_timeout(self):
+        """
+        Проверяет, что при отсутствии свободных песочниц выбрасывается TimeoutError.
+        """
+        with self.assertRaises(TimeoutError):
+            self.pool.lease(timeout=0.01)
+
+    def test_reset(self):
+        """
+        Проверяет, что reset восстанавливает таблицы из шаблона, не возвращая песочницу в очередь свободных.
+        """
+        self.pool.reset('my_database_sandbox_0', dirty_tables=['menu'])
+
+        self.mock_creator.reset_sandbox.assert_called_once_with(['menu'])
+        self.mock_creator.close.assert_called_once()
+        with self.assertRaises(TimeoutError):
+            self.pool.lease(timeout=0.01)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import random
+import unittest
+from collections import Counter
+from datetime import date
+import numpy as np
+from lib.data_generator import DataGenerator
+from lib.distributions import SKEWED, Basket, Repeat, Seasonality, Uniform, Zipf
+from lib.schema import SCHEMA, GenerationContext, KeySampler
+
+
+class TestDistributions(unittest.TestCase):
+    """
+    Юнит-тесты для модуля distributions.
+    """
+
+    def setUp(self):
+        self.rng = np.random.default_rng(42)
+
+    def test_offsets_in_range(self):
+        """
+        Проверяет, что все распределения возвращают смещения в [0, span).
+        """
+        for distribution in (Uniform(), Zipf(0.5), Zipf(1), Zipf(1.5, scatter=True), Repeat(), Basket(3)):
+            offsets = distribution.offsets(self.rng, 97, 5000, start=1000)
+            self.assertEqual(len(offsets), 5000)
+            self.assertTrue(((offsets >= 0) & (offsets < 97)).all(), type(distribution).__name__)
+
+    def test_zipf_is_skewed(self):
+        """
+        Проверяет, что у Zipf первый ранг самый популярный, а scatter переставляет ранги без потерь.
+        """
+        counts = Counter(Zipf(1.1).offsets(self.rng, 1000, 20000).tolist())
+        self.assertEqual(counts.most_common(1)[0][0], 0)
+        self.assertGreater(counts[0], 20 * counts.get(500, 1))
+        scattered = Counter(Zipf(1.1, scatter=True).offsets(self.rng, 1000, 20000).tolist())
+        self.assertNotEqual(scattered.most_common(1)[0][0], 0)
+
+    def test_repeat_share(self):
+        """
+        Проверяет, что доля значений из группы постоянных гостей близка к rate + (1 - rate) * regulars.
+        """
+        offsets = Repeat(rate=0.5, regulars=0.1).offsets(self.rng, 1000, 50000)
+        self.assertAlmostEqual((offsets < 100).mean(), 0.55, delta=0.02)
+
+    def test_basket_groups(self):
+        """
+        Проверяет, что строки идут группами подряд со средним размером mean и продолжают нумерацию по start.
+        """
+        offsets = Basket(mean=3).offsets(self.rng, 10 ** 6, 30000)
+        self.assertTrue((np.diff(offsets) >= 0).all())
+        self.assertAlmostEqual(30000 / len(np.unique(offsets)), 3, delta=0.1)
+        self.assertEqual(Basket(mean=3).offsets(self.rng, 10 ** 6, 5, start=300)[0], 100)
+
+    def test_basket_continues_across_chunks(self):
+        """
+        Проверяет, что при генерации порциями заказы идут подряд без пропусков на границах порций,
+        а недобранная корзина дополняется в следующей порции.
+        """
+        random.seed(7)
+        basket = Basket(mean=1.15)
+        context = GenerationContext(counts={"orders": 10 ** 6, "personal_order": 10 ** 6},
+                                    distributions={"orders_has_order.orders_id": basket})
+        orders_ids = [row[2] for row in SCHEMA["orders_has_order"].iter_rows(20000, context, chunk_size=997)]
+        steps = set(np.diff(orders_ids).tolist())
+        self.assertEqual(steps, {0, 1})
+        self.assertEqual(orders_ids[0], 1)
+        sizes = np.bincount(orders_ids)[1:]
+        self.assertEqual(sizes.min(), 1)
+        self.assertAlmostEqual(20000 / len(sizes), 1.15, delta=0.03)
+        self.assertEqual(context.state[basket][0], 20000)
+
+    def test_seasonality_weights(self):
+        """
+        Проверяет, что дни с нулевым весом не выбираются, а даты лежат в заданном диапазоне.
+        """
+        days = Seasonality(weekdays=(1, 1, 1, 1, 1, 0, 0)).days(self.rng, date(2024, 1, 1), date(2024, 3, 1), 5000)
+        values = days.tolist()
+        self.assertTrue(all(date(2024, 1, 1) <= day < date(2024, 3, 1) for day in values))
+        self.assertTrue(all(day.weekday() < 5 for day in values))
+        with self.assertRaises(ValueError):
+            Seasonality(weekdays=(1, 1))
+
+    def test_columns_with_distributions(self):
+        """
+        Проверяет генерацию колонок реестра с распределениями и проверку неподдерживаемых распределений.
+        """
+        random.seed(1)
+        context = GenerationContext(counts={"menu": 25}, distributions=SKEWED)
+        menu_ids = SCHEMA["personal_order"].generate_column("menu_id", 5000, context)
+        self.assertEqual(Counter(menu_ids).most_common(1)[0][0], 1)
+        self.assertTrue(set(menu_ids) <= set(range(1, 26)))
+        gaps = KeySampler.from_gaps(1, 20, [(1, 1), (5, 15)])
+        self.assertTrue(set(gaps.sample(500, Zipf(1.5))) <= {2, 3, 4, 16, 17, 18, 19, 20})
+        with self.assertRaises(ValueError):
+            DataGenerator(10, Distributions={"menu.prices": Zipf()})
+
+    def test_data_generator_dates(self):
+        """
+        Проверяет, что с Seasonality даты строками корректны в обоих режимах.
+        """
+        random.seed(2)
+        strings = DataGenerator(50, Distributions=SKEWED).OrdersGenerator()
+        self.assertTrue(all(order.OrderData.endswith("-2024") for order in strings))
+        dates = DataGenerator(50, NativeDates=True, Distributions=SKEWED).OrdersGenerator()
+        self.assertTrue(all(isinstance(order.OrderData, date) for order in dates))
+
+
+if __name__ == '__main__':
+    unittest.main()
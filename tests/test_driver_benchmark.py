@@ -0,0 +1,53 @@
+import unittest
+from unittest.mock import MagicMock, call, patch
+from lib.driver_benchmark import INSERT_SQL, POINT_SELECT_SQL, benchmark_driver, compare_drivers
+
+
+class TestDriverBenchmark(unittest.TestCase):
+    """
+    Юнит-тесты для модуля driver_benchmark.
+    """
+
+    @patch('mysql.connector.connect')
+    def test_benchmark_driver(self, mock_connect):
+        """
+        Проверяет, что вставка идет пакетами, точечные запросы выполняются по первичному ключу,
+        а служебная таблица удаляется в конце.
+        """
+        cursor = mock_connect.return_value.cursor.return_value
+        cursor.fetchall.return_value = []
+
+        report = benchmark_driver("connector", "localhost", "root", "123456", "sandbox", rows=10, batch=4,
+                                  point_queries=3, warmup=0, repeat=2)
+
+        self.assertEqual(report["driver"], "connector")
+        self.assertEqual(report["counts"], {"insert": 10, "select": 10, "point": 3})
+        self.assertEqual([len(c.args[1]) for c in cursor.executemany.call_args_list], [4, 4, 2] * 2)
+        self.assertEqual(cursor.executemany.call_args.args[0], INSERT_SQL)
+        self.assertIn(call(POINT_SELECT_SQL, (3,)), cursor.execute.call_args_list)
+        self.assertEqual(cursor.execute.call_args.args[0], "DROP TABLE IF EXISTS driver_benchmark")
+        self.assertGreater(report["throughput"]["insert"], 0)
+        mock_connect.return_value.close.assert_called_once()
+
+    @patch('lib.driver_benchmark.benchmark_driver')
+    def test_compare_drivers_skips_missing(self, mock_benchmark_driver):
+        """
+        Проверяет, что неустановленные драйверы пропускаются, а результаты остальных записываются в хранилище.
+        """
+        result = MagicMock()
+        mock_benchmark_driver.return_value = {"driver": "connector", "results": {"insert": result},
+                                              "counts": {"insert": 100}, "throughput": {"insert": 1000.0}}
+        store = MagicMock()
+        store.start_run.return_value = 7
+
+        with patch('lib.drivers.PyMySQLDriver.available', return_value=False):
+            reports = compare_drivers(["connector", "pymysql"], store=store, host="localhost", user="root",
+                                      password="123456", db_name="sandbox")
+
+        self.assertEqual(len(reports), 1)
+        self.assertEqual(mock_benchmark_driver.call_count, 1)
+        store.record.assert_called_once_with(7, "connector", "insert", 100, result)
+
+
+if __name__ == '__main__':
+    unittest.main()
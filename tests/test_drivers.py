@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import mysql.connector
+from lib.backends import MySQLBackend
+from lib.drivers import ConnectorDriver, PyMySQLDriver, get_driver
+
+
+class TestDrivers(unittest.TestCase):
+    """
+    Юнит-тесты для модуля drivers.
+    """
+
+    def test_get_driver(self):
+        """
+        Проверяет выбор драйвера по имени и ошибку для неизвестного драйвера.
+        """
+        self.assertEqual(get_driver().name, "connector")
+        self.assertEqual(get_driver("connector-c").use_pure, False)
+        self.assertIsInstance(get_driver("pymysql"), PyMySQLDriver)
+        with self.assertRaises(ValueError):
+            get_driver("odbc")
+
+    @patch('mysql.connector.connect')
+    def test_connector_use_pure(self, mock_connect):
+        """
+        Проверяет, что use_pure передается коннектору только при явном выборе реализации протокола.
+        """
+        ConnectorDriver().connect(host="localhost", user="root")
+        ConnectorDriver(use_pure=True).connect(host="localhost", user="root")
+
+        self.assertEqual(mock_connect.call_args_list[0].kwargs, {"host": "localhost", "user": "root"})
+        self.assertEqual(mock_connect.call_args_list[1].kwargs, {"host": "localhost", "user": "root", "use_pure": True})
+
+    def test_error_code(self):
+        """
+        Проверяет извлечение кода ошибки MySQL из исключений разных драйверов.
+        """
+        self.assertEqual(ConnectorDriver().error_code(mysql.connector.Error(errno=1049)), 1049)
+        self.assertEqual(PyMySQLDriver().error_code(Exception(1049, "Unknown database")), 1049)
+        self.assertIsNone(PyMySQLDriver().error_code(Exception("no code")))
+
+    def test_missing_driver(self):
+        """
+        Проверяет, что неустановленный драйвер помечается недоступным, а при использовании сообщает, что установить.
+        """
+        driver = PyMySQLDriver()
+        driver.module_name = "lib.no_such_driver"
+
+        self.assertFalse(driver.available())
+        with self.assertRaisesRegex(ImportError, "pip install PyMySQL"):
+            driver.connect(host="localhost")
+
+    def test_backend_uses_driver(self):
+        """
+        Проверяет, что MySQLBackend подключается, переключает базу и разбирает результат через драйвер.
+        """
+        driver = PyMySQLDriver()
+        driver.connect = MagicMock()
+        driver.use_database = MagicMock()
+        backend = MySQLBackend(driver=driver)
+        cursor = MagicMock(description=[("id",), ("name",)])
+        cursor.fetchall.return_value = [(1, "Latte")]
+
+        conn = backend.connect("localhost", "root", "123456", "my_database")
+        backend.use_database(conn, "my_sandbox_database")
+
+        driver.connect.assert_called_once_with(host="localhost", user="root", password="123456", database="my_database")
+        driver.use_database.assert_called_once_with(conn, "my_sandbox_database")
+        self.assertEqual(backend.fetch_result(cursor), ([(1, "Latte")], ["id", "name"]))
+        self.assertEqual(backend.label, "mysql/pymysql")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from datetime import date
 from lib.helper_classes import Guest, Barista, Orders, Orders_has_Order, Order, Menu
 
 class TestGuest(unittest.TestCase):
@@ -137,6 +138,13 @@ class TestOrders(unittest.TestCase):
         order = Orders(1, '6-16-2024', 5, 5)
         self.assertEqual(order.to_turple(), (1, '6-16-2024', 5, 5))
 
+    def test_native_date(self):
+        """
+        Тестирует инициализацию класса Orders с датой datetime.date для колонки DATE.
+        """
+        order = Orders(1, date(2024, 6, 16), 5, 5)
+        self.assertEqual(order.to_turple(), (1, date(2024, 6, 16), 5, 5))
+
     def test_invalid_id_type(self):
         """
         Тестирует инициализацию класса Orders с некорректным типом ID.
@@ -0,0 +1,168 @@
+import unittest
+import mysql.connector
+from unittest.mock import MagicMock, patch
+from lib.backends import MySQLBackend
+from lib.index_advisor import IndexCandidate, IndexAdvisor, predicate_columns, join_columns, list_columns, \
+    propose_indexes
+
+
+class TestIndexAdvisor(unittest.TestCase):
+    """
+    Юнит-тесты для модуля index_advisor.
+    """
+
+    def test_predicate_columns(self):
+        """
+        Проверяет классификацию предикатов: равенства, диапазоны и LIKE с ведущим %, который индекс не сужает.
+        """
+        conditions = 'name LIKE "%a%" AND Orders.order_date LIKE "6%" AND prices > 250 AND barista_id IN (1, 2)'
+
+        self.assertEqual(predicate_columns(conditions, "Menu"), [
+            ("Menu", "name", "scan"), ("Orders", "order_date", "range"),
+            ("Menu", "prices", "range"), ("Menu", "barista_id", "eq")
+        ])
+        self.assertEqual(predicate_columns(None, "Menu"), [])
+
+    def test_join_and_list_columns(self):
+        """
+        Проверяет извлечение колонок из условий JOIN и списков GROUP BY/ORDER BY.
+        """
+        self.assertEqual(join_columns(["Personal_order", "Menu.id = Personal_order.menu_id"]),
+                         [("Menu", "id"), ("Personal_order", "menu_id")])
+        self.assertEqual(list_columns("Menu.id, prices DESC", "Menu"), [("Menu", "id"), ("Menu", "prices")])
+
+    def test_propose_indexes(self):
+        """
+        Проверяет порядок колонок (равенства, затем диапазон) и покрывающий индекс для перечисленных колонок SELECT.
+        """
+        spec = {"type": "SELECT Orders.order_date", "table": "Orders",
+                "conditions": 'order_date LIKE "6%" AND barista_id = 5'}
+
+        self.assertEqual(propose_indexes(spec), [IndexCandidate("Orders", ["barista_id", "order_date"])])
+        self.assertEqual(propose_indexes({"type": "SELECT", "table": "Menu", "conditions": "prices > 250"}),
+                         [IndexCandidate("Menu", ["prices"])])
+        self.assertEqual(propose_indexes({"type": "SELECT", "table": "Menu", "conditions": 'name LIKE "%a%"'}), [])
+
+    def test_index_candidate_sql(self):
+        """
+        Проверяет запросы создания и удаления индекса.
+        """
+        candidate = IndexCandidate("Menu", ["prices", "name"])
+
+        self.assertEqual(candidate.create_sql, "CREATE INDEX idx_menu_prices_name ON Menu (prices, name)")
+        self.assertEqual(candidate.drop_sql, "DROP INDEX idx_menu_prices_name ON Menu")
+
+    @patch('mysql.connector.connect')
+    def test_advise_filters_existing(self, mock_connect):
+        """
+        Проверяет, что при полном просмотре предлагаются только индексы, которых еще нет и которые не начинаются
+        с первичного ключа.
+        """
+        cursor = mock_connect.return_value.cursor.return_value
+        cursor.description = [("id",), ("type",), ("key",), ("Extra",)]
+        cursor.fetchall.side_effect = [
+            [(1, "ALL", None, "Using where")],
+            [("id",), ("prices",), ("name",)],
+            [("id",), ("prices",), ("name",)],
+            [("id",), ("menu_id",)],
+        ]
+        spec = {"type": "SELECT", "table": "Menu", "conditions": "prices > 250 AND id > 10",
+                "join": ["Personal_order", "Menu.id = Personal_order.menu_id"]}
+
+        with IndexAdvisor('localhost', 'root', '123456', 'sandbox') as advisor:
+            advisor.existing_indexes = MagicMock(side_effect=[{"PRIMARY": ["id"]}, {"PRIMARY": ["id"]},
+                                                              {"PRIMARY": ["id"], "menu_id": ["menu_id"]}])
+            candidates = advisor.advise(spec)
+
+        self.assertEqual(candidates, [IndexCandidate("Menu", ["prices"])])
+
+    @patch('mysql.connector.connect')
+    def test_evaluate(self, mock_connect):
+        """
+        Проверяет, что evaluate замеряет запрос до и после создания индексов и удаляет их в конце.
+        """
+        cursor = mock_connect.return_value.cursor.return_value
+        spec = {"type": "SELECT", "table": "Menu", "conditions": "prices > 250"}
+        candidate = IndexCandidate("Menu", ["prices"])
+
+        with IndexAdvisor('localhost', 'root', '123456', 'sandbox') as advisor:
+            advisor.measure = MagicMock(side_effect=[0.02, 0.005])
+            advisor.advise = MagicMock(return_value=[candidate])
+            advisor.explain = MagicMock(return_value=[{"key": candidate.name}])
+            report = advisor.evaluate([spec, {"type": "INSERT", "table": "Menu"}], num_rows=10)
+
+        self.assertEqual(len(report), 1)
+        self.assertEqual(report[0]["query"], "SELECT * FROM Menu WHERE prices > 250 LIMIT 10")
+        self.assertAlmostEqual(report[0]["speedup"], 4.0)
+        self.assertEqual(report[0]["used"], [candidate.name])
+        queries = [c.args[0] for c in cursor.execute.call_args_list]
+        self.assertEqual(queries, [candidate.create_sql, candidate.drop_sql])
+
+    @patch('mysql.connector.connect')
+    def test_evaluate_skips_failing_spec(self, mock_connect):
+        """
+        Проверяет, что запрос с ошибкой MySQL пропускается, а остальные запросы попадают в отчет.
+        """
+        def measure(query, warmup, repeat):
+            if "Orders_has_personal_order" in query:
+                raise mysql.connector.Error("Table 'sandbox.Orders_has_personal_order' doesn't exist")
+            return 0.01
+
+        specs = [{"type": "SELECT", "table": "Orders", "join": ["Orders_has_personal_order", "Orders.id = x.id"]},
+                 {"type": "SELECT", "table": "Menu", "conditions": "prices > 250"}]
+        with IndexAdvisor('localhost', 'root', '123456', 'sandbox') as advisor:
+            advisor.measure = MagicMock(side_effect=measure)
+            advisor.advise = MagicMock(return_value=[])
+            advisor.explain = MagicMock(return_value=[])
+            report = advisor.evaluate(specs, num_rows=10)
+
+        self.assertEqual([entry["query"] for entry in report], ["SELECT * FROM Menu WHERE prices > 250 LIMIT 10"])
+        mock_connect.return_value.rollback.assert_called()
+
+    @patch('mysql.connector.connect')
+    def test_measure_delete_without_fk_checks(self, mock_connect):
+        """
+        Проверяет, что DELETE замеряется с отключенной проверкой внешних ключей и откатывается.
+        """
+        cursor = mock_connect.return_value.cursor.return_value
+        with IndexAdvisor('localhost', 'root', '123456', 'sandbox') as advisor:
+            advisor.measure("DELETE FROM Menu LIMIT 10", warmup=0, repeat=1)
+
+        queries = [c.args[0] for c in cursor.execute.call_args_list]
+        self.assertEqual(queries, ["SET FOREIGN_KEY_CHECKS = 0", "DELETE FROM Menu LIMIT 10",
+                                   "SET FOREIGN_KEY_CHECKS = 1"])
+        mock_connect.return_value.rollback.assert_called()
+
+    def test_other_driver(self):
+        """
+        Проверяет, что советник подключается через драйвер движка, перехватывает его исключения
+        и не читает результат запросов, которые не возвращают строк.
+        """
+        class DriverError(Exception):
+            pass
+
+        backend = MySQLBackend()
+        backend.driver = MagicMock(Error=DriverError, has_rows=lambda cursor: cursor.description is not None)
+        conn = backend.driver.connect.return_value
+        conn.cursor.return_value.description = None
+
+        def measure(query, warmup, repeat):
+            if "Guest" in query:
+                raise DriverError(1146, "Table 'sandbox.Guest' doesn't exist")
+            return advisor.execute_query(query) or 0.01
+
+        specs = [{"type": "SELECT", "table": "Guest"}, {"type": "DELETE", "table": "Menu"}]
+        with IndexAdvisor('localhost', 'root', '123456', 'sandbox', backend=backend) as advisor:
+            advisor.measure = MagicMock(side_effect=measure)
+            advisor.advise = MagicMock(return_value=[])
+            advisor.explain = MagicMock(return_value=[])
+            report = advisor.evaluate(specs, num_rows=10)
+
+        backend.driver.connect.assert_called_once_with(host='localhost', user='root', password='123456',
+                                                       database='sandbox')
+        self.assertEqual([entry["query"] for entry in report], ["DELETE FROM Menu LIMIT 10"])
+        conn.cursor.return_value.fetchall.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+import unittest
+from unittest.mock import patch
+import mysql.connector
+from lib.load_generator import LatencyHistogram, LoadResult, LoadGenerator, run_client, ID_STRIDE
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """
+    Юнит-тесты для класса LatencyHistogram.
+    """
+
+    def test_percentiles(self):
+        """
+        Проверяет, что перцентили попадают в корзину с погрешностью не больше ширины корзины.
+        """
+        histogram = LatencyHistogram()
+        for value in range(1, 1001):
+            histogram.record(value * 1000)
+
+        self.assertEqual(histogram.count, 1000)
+        self.assertAlmostEqual(histogram.mean, 500.5e-6)
+        self.assertLessEqual(abs(histogram.percentile(50) - 500e-6) / 500e-6, 0.19)
+        self.assertLessEqual(abs(histogram.percentile(99) - 990e-6) / 990e-6, 0.19)
+        self.assertEqual(histogram.percentile(100), 1e-3)
+        self.assertEqual(LatencyHistogram().percentile(50), 0.0)
+
+    def test_merge(self):
+        """
+        Проверяет объединение гистограмм разных клиентов.
+        """
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(1000)
+        second.record(3000)
+        second.record(5000)
+
+        first.merge(second)
+
+        self.assertEqual(first.count, 3)
+        self.assertEqual(first.min_ns, 1000)
+        self.assertEqual(first.max_ns, 5000)
+        self.assertEqual(first.total_ns, 9000)
+
+
+class TestLoadGenerator(unittest.TestCase):
+    """
+    Юнит-тесты для генератора нагрузки.
+    """
+
+    def test_load_result(self):
+        """
+        Проверяет пропускную способность и долю ошибок.
+        """
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.record(1000)
+        result = LoadResult(clients=2, duration=3.0)
+
+        result.add_client({'SELECT Menu': histogram}, {'SELECT Menu': 10})
+
+        self.assertEqual(result.throughput, 30.0)
+        self.assertAlmostEqual(result.error_rate, 0.1)
+        self.assertIn("Клиентов: 2", str(result))
+
+    @patch('mysql.connector.connect')
+    def test_run_client(self, mock_connect):
+        """
+        Проверяет, что клиент выполняет смесь запросов, откатывает изменения и считает ошибки отдельно.
+        """
+        cursor = mock_connect.return_value.cursor.return_value
+        cursor.fetchone.return_value = (41,)
+        cursor.with_rows = False
+        calls = []
+
+        def execute(query):
+            calls.append(query)
+            if query.startswith('DELETE'):
+                raise mysql.connector.Error("lock wait timeout")
+
+        cursor.execute.side_effect = execute
+        mix = [{'type': 'INSERT', 'table': 'Menu', 'num_rows': 1, 'values': [{'name': 'Latte', 'prices': 200}]},
+               {'type': 'DELETE', 'table': 'Guest'}]
+
+        histograms, errors = run_client({'database': 'db'}, mix, duration=0.2, client_index=1, seed=1)
+
+        self.assertEqual(calls[0], "SELECT MAX(id) FROM Menu")
+        self.assertIn(f"INSERT INTO Menu (id, name, prices) VALUES ({41 + ID_STRIDE + 1}, 'Latte', 200) LIMIT 1",
+                      calls)
+        self.assertGreater(histograms['INSERT Menu'].count, 0)
+        self.assertGreater(errors['DELETE Guest'], 0)
+        mock_connect.return_value.commit.assert_not_called()
+        mock_connect.return_value.close.assert_called_once()
+
+    @patch('mysql.connector.connect')
+    def test_run_client_commit_advances_ids(self, mock_connect):
+        """
+        Проверяет, что при фиксации каждая вставка нумерует строки после уже зафиксированных.
+        """
+        cursor = mock_connect.return_value.cursor.return_value
+        cursor.fetchone.return_value = (41,)
+        cursor.with_rows = False
+        mix = [{'type': 'INSERT', 'table': 'Menu', 'num_rows': 2,
+                'values': [{'name': 'Latte', 'prices': 200}, {'name': 'Mocha', 'prices': 250}]}]
+
+        run_client({'database': 'db'}, mix, duration=0.2, seed=1, commit=True)
+
+        inserts = [c.args[0] for c in cursor.execute.call_args_list if c.args[0].startswith('INSERT')]
+        self.assertGreater(len(inserts), 1)
+        self.assertEqual(len(set(inserts)), len(inserts))
+        self.assertTrue(inserts[1].startswith("INSERT INTO Menu (id, name, prices) VALUES (44, 'Latte', 200)"))
+        self.assertEqual(mock_connect.return_value.commit.call_count, len(inserts))
+
+    @patch('lib.load_generator.run_client')
+    def test_run_threads(self, mock_run_client):
+        """
+        Проверяет, что при запуске создается заданное количество клиентов, а их результаты объединяются.
+        """
+        histogram = LatencyHistogram()
+        histogram.record(1000)
+        mock_run_client.return_value = ({'SELECT Menu': histogram}, {})
+        generator = LoadGenerator('host', 'root', '123456', 'db', [{'type': 'SELECT', 'table': 'Menu'}], duration=1)
+
+        result = generator.run(3)
+
+        self.assertEqual(mock_run_client.call_count, 3)
+        self.assertEqual(result.total.count, 3)
+        self.assertEqual([c.args[3] for c in mock_run_client.call_args_list], [0, 1, 2])
+
+    def test_invalid_arguments(self):
+        """
+        Проверяет ошибки для пустой смеси и неизвестного режима.
+        """
+        with self.assertRaises(ValueError):
+            LoadGenerator('host', 'root', '123456', 'db', [])
+        with self.assertRaises(ValueError):
+            LoadGenerator('host', 'root', '123456', 'db', [{'type': 'SELECT', 'table': 'Menu'}], mode='fiber')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,9 @@
 import unittest
 from unittest.mock import patch, MagicMock
 import mysql.connector
-from lib.orm_classes import Field, IntegerField, CharField, FloatField, ForeignKey, ManyToManyField, Model, ModelMeta
+from datetime import date
+from lib.orm_classes import Field, IntegerField, CharField, FloatField, ForeignKey, ManyToManyField, Model, ModelMeta, \
+    Index, RangePartition, DateField
 
 
 class TestField(unittest.TestCase):
@@ -118,6 +120,50 @@ class TestModelMeta(unittest.TestCase):
         self.assertIn('related_model', TestModel._meta['columns'])
         self.assertIn('related_models', [field_name for field_name, _ in TestModel._meta['many_to_many']])
 
+    def test_model_meta_indexes_and_partitioning(self):
+        """
+        Тестирует разбор индексов и секционирования из docstring модели.
+        """
+        class PartitionedModel(Model):
+            """
+            id: IntegerField(primary_key=True)
+            order_date: CharField(max_length=10)
+            idx_date: Index(order_date, id)
+            uq_id: UniqueIndex(id)
+            by_month: RangePartition(order_date, by=month, start=2024-11, stop=2025-01)
+            """
+
+        indexes = PartitionedModel._meta['indexes']
+        self.assertTrue(all(isinstance(index, Index) for index in indexes))
+        self.assertEqual([index.definition() for index in indexes],
+                         ['INDEX idx_date (order_date, id)', 'UNIQUE INDEX uq_id (id)'])
+        partitioning = PartitionedModel._meta['partitioning']
+        self.assertEqual(partitioning.bounds(), [('p202411', 202412), ('p202412', 202501)])
+        self.assertEqual(partitioning.expression(), 'YEAR(order_date) * 100 + MONTH(order_date)')
+
+    @patch('mysql.connector.connect')
+    def test_create_partitioned_table(self, mock_connect):
+        """
+        Тестирует DDL секционированной таблицы: индексы, колонка секционирования в первичном ключе, без внешних ключей.
+        """
+        class Visit(Model):
+            """
+            id: IntegerField(primary_key=True)
+            guest_id: ForeignKey(to=Guest)
+            idx_guest: Index(guest_id)
+            by_year: RangePartition(visit_date, by=year, start=2023, stop=2025)
+            """
+
+        Visit.create_table()
+
+        query = mock_connect.return_value.cursor.return_value.execute.call_args[0][0]
+        self.assertEqual(query, "CREATE TABLE IF NOT EXISTS visit (\n    id INTEGER,\n    guest_id INTEGER,\n    "
+                                "PRIMARY KEY (id, visit_date),\n    INDEX idx_guest (guest_id)\n) "
+                                "PARTITION BY RANGE (YEAR(visit_date)) (PARTITION p2023 VALUES LESS THAN (2024), "
+                                "PARTITION p2024 VALUES LESS THAN (2025), PARTITION pmax VALUES LESS THAN MAXVALUE)")
+        with self.assertRaises(ValueError):
+            RangePartition('visit_date', by='week')
+
 
 class TestModel(unittest.TestCase):
     """
@@ -147,6 +193,22 @@ class TestModel(unittest.TestCase):
         self.assertEqual(instance._data['name'], 'John Doe')
         self.assertEqual(instance._data['age'], 30)
 
+    def test_model_date_field(self):
+        """
+        Тестирует поле DateField: тип DATE и проверку значения.
+        """
+        class DatedModel(Model):
+            """
+            id: IntegerField(primary_key=True)
+            order_date: DateField()
+            """
+
+        self.assertIsInstance(DatedModel._meta['columns']['order_date'], DateField)
+        self.assertEqual(DatedModel._meta['columns']['order_date'].field_type, 'DATE')
+        self.assertEqual(DatedModel(id=1, order_date=date(2024, 6, 16)).order_date, date(2024, 6, 16))
+        with self.assertRaises(ValueError):
+            DatedModel(id=1, order_date='6-16-2024')
+
     def test_model_invalid_attribute(self):
         """
         Тестирует создание модели с недопустимым атрибутом.
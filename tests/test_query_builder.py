@@ -0,0 +1,70 @@
+import unittest
+from lib.query_builder import build_query, query_label
+
+
+class TestQueryBuilder(unittest.TestCase):
+    """
+    Юнит-тесты для функций построения запросов query_graph.
+    """
+
+    def test_select(self):
+        """
+        Проверяет SELECT с JOIN, WHERE, GROUP BY, HAVING и ORDER BY.
+        """
+        query = build_query('SELECT Menu.name AS Dish, COUNT(Personal_order.id) AS C', 'Menu', 10,
+                            conditions='Menu.prices > 100', join=['Personal_order', 'Menu.id = Personal_order.menu_id'],
+                            group_by='Menu.id', having='C < 5', order_by='C DESC')
+
+        self.assertEqual(query, "SELECT Menu.name AS Dish, COUNT(Personal_order.id) AS C FROM Menu "
+                                "JOIN Personal_order ON Menu.id = Personal_order.menu_id WHERE Menu.prices > 100 "
+                                "GROUP BY Menu.id HAVING C < 5 ORDER BY C DESC LIMIT 10")
+        self.assertEqual(build_query('SELECT', 'Guest', 5), "SELECT * FROM Guest LIMIT 5")
+
+    def test_insert_values(self):
+        """
+        Проверяет INSERT со значениями: id нумеруются после max_id, вставляется не больше num_rows строк.
+        """
+        values = [{'name': 'Latte', 'prices': 200}, {'name': 'Mocha', 'prices': 250}, {'name': 'Tea', 'prices': 100}]
+
+        query = build_query('INSERT', 'Menu', 2, values=values, max_id=41)
+
+        self.assertEqual(query, "INSERT INTO Menu (id, name, prices) VALUES (42, 'Latte', 200), (43, 'Mocha', 250) LIMIT 2")
+
+    def test_insert_select(self):
+        """
+        Проверяет INSERT ... SELECT с условием.
+        """
+        insert_select = {'target_columns': ['name', 'prices'], 'source_columns': ['name', 'prices'],
+                         'source_table': 'Menu', 'conditions': 'prices > 250'}
+
+        query = build_query('INSERT', 'Menu', 10, insert_select=insert_select, max_id=100)
+
+        self.assertEqual(query, "INSERT INTO Menu (id, name, prices) SELECT 100 + ROW_NUMBER() OVER (), name, prices "
+                                "FROM Menu WHERE prices > 250 LIMIT 10")
+
+    def test_delete(self):
+        """
+        Проверяет DELETE с условием и без него.
+        """
+        self.assertEqual(build_query('DELETE', 'Menu', 10, conditions='id>10000'),
+                         "DELETE FROM Menu WHERE id>10000 LIMIT 10")
+        self.assertEqual(build_query('DELETE', 'Menu', 10), "DELETE FROM Menu LIMIT 10")
+
+    def test_errors(self):
+        """
+        Проверяет ошибки для INSERT без значений и неизвестного типа запроса.
+        """
+        with self.assertRaises(ValueError):
+            build_query('INSERT', 'Menu', 10)
+        with self.assertRaises(ValueError):
+            build_query('UPDATE', 'Menu', 10)
+
+    def test_query_label(self):
+        """
+        Проверяет, что из подписи убирается LIMIT.
+        """
+        self.assertEqual(query_label("SELECT * FROM Menu LIMIT 1500", 1500), "SELECT * FROM Menu")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from lib.scenarios import Scenario, load_scenarios, select_scenarios
+
+SCENARIOS_TOML = '''
+[[scenario]]
+name = "select"
+tags = ["select"]
+num_rows = { start = 10, stop = 31, step = 10 }
+repeat = 3
+
+[[scenario.query]]
+type = "SELECT"
+table = "Menu"
+conditions = "prices > 250"
+
+[[scenario.query]]
+type = "SELECT"
+table = "Guest"
+
+[[scenario]]
+name = "insert"
+tags = ["insert"]
+
+[[scenario.query]]
+type = "INSERT"
+table = "Menu"
+values = { generator = "Menu", count = 2 }
+'''
+
+
+class TestScenarios(unittest.TestCase):
+    """
+    Юнит-тесты для загрузки и выбора сценариев замеров.
+    """
+
+    def setUp(self):
+        """
+        Создает временный TOML-файл со сценариями.
+        """
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'suite.toml')
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write(SCENARIOS_TOML)
+
+    def test_load_scenarios(self):
+        """
+        Проверяет загрузку сценариев и преобразование диапазона строк в список.
+        """
+        scenarios = load_scenarios([os.path.join(os.path.dirname(self.path), '*.toml')])
+
+        self.assertEqual([scenario.name for scenario in scenarios], ['select', 'insert'])
+        self.assertEqual(scenarios[0].num_rows, [10, 20, 30])
+        self.assertEqual(scenarios[0].repeat, 3)
+        self.assertEqual(scenarios[1].warmup, 1)
+        self.assertEqual(scenarios[0].source, self.path)
+
+    def test_query_graph_kwargs(self):
+        """
+        Проверяет, что запросы превращаются в параллельные списки query_graph с None для отсутствующих полей.
+        """
+        kwargs = load_scenarios([self.path])[0].query_graph_kwargs()
+
+        self.assertEqual(kwargs['name'], 'select')
+        self.assertEqual(kwargs['query_type'], ['SELECT', 'SELECT'])
+        self.assertEqual(kwargs['table'], ['Menu', 'Guest'])
+        self.assertEqual(kwargs['conditions'], ['prices > 250', None])
+        self.assertIsNone(kwargs['join'])
+        self.assertEqual(kwargs['num_rows_list'], [10, 20, 30])
+
+    @patch.dict('lib.scenarios.VALUE_GENERATORS', {'Menu': lambda count: [{'name': 'Latte', 'prices': 200}] * count})
+    def test_generated_values(self):
+        """
+        Проверяет, что значения для INSERT создаются генератором из описания сценария.
+        """
+        kwargs = load_scenarios([self.path])[1].query_graph_kwargs()
+
+        self.assertEqual(kwargs['values'], [[{'name': 'Latte', 'prices': 200}] * 2])
+
+    def test_select_scenarios(self):
+        """
+        Проверяет выбор сценариев по названию и тегам.
+        """
+        scenarios = load_scenarios([self.path])
+
+        self.assertEqual([s.name for s in select_scenarios(scenarios, tags=['insert'])], ['insert'])
+        self.assertEqual([s.name for s in select_scenarios(scenarios, names=['select'])], ['select'])
+        self.assertEqual(len(select_scenarios(scenarios)), 2)
+
+    def test_tables_and_mutating(self):
+        """
+        Проверяет список таблиц сценария и признак изменения данных.
+        """
+        select, insert = load_scenarios([self.path])
+
+        self.assertEqual(select.tables, ['Menu', 'Guest'])
+        self.assertFalse(select.mutating)
+        self.assertTrue(insert.mutating)
+        self.assertFalse(Scenario('join', [{'type': 'SELECT Menu.name', 'table': 'Menu'}]).mutating)
+
+    @patch.dict('lib.scenarios.VALUE_GENERATORS', {'Menu': lambda count: [{'name': 'Latte', 'prices': 200}] * count})
+    def test_load_mix(self):
+        """
+        Проверяет преобразование сценария в смесь запросов для нагрузочного теста.
+        """
+        mix = load_scenarios([self.path])[1].load_mix(num_rows=5)
+
+        self.assertEqual(mix, [{'type': 'INSERT', 'table': 'Menu', 'values': [{'name': 'Latte', 'prices': 200}] * 2,
+                                'num_rows': 5, 'label': 'insert: INSERT Menu'}])
+
+    def test_invalid_scenarios(self):
+        """
+        Проверяет ошибки для сценария без запросов, запроса без таблицы и неизвестного генератора.
+        """
+        with self.assertRaises(ValueError):
+            Scenario('empty', [])
+        with self.assertRaises(ValueError):
+            Scenario('no table', [{'type': 'SELECT'}])
+        with self.assertRaises(ValueError):
+            Scenario('typo', [{'type': 'SELECT', 'table': 'Menu', 'condition': 'id > 1'}])
+        with self.assertRaises(ValueError):
+            Scenario.generate_values({'generator': 'Unknown'})
+
+
+if __name__ == '__main__':
+    unittest.main()
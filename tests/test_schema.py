@@ -0,0 +1,129 @@
+import random
+import unittest
+from datetime import date
+from lib.db_creator import DatabaseCreator
+from lib.orm_classes import DateField, ForeignKey, Menu, Model, Orders_has_Order
+from lib.schema import SCHEMA, GenerationContext, KeySampler, Reference, Serial
+
+
+class TestSchema(unittest.TestCase):
+    """
+    Юнит-тесты для модуля schema.
+    """
+
+    def test_tables_in_creation_order(self):
+        """
+        Проверяет, что каждая таблица реестра идет после таблиц, на которые ссылаются ее внешние ключи.
+        """
+        seen = set()
+        for table in SCHEMA:
+            for _, reference in table.foreign_keys:
+                self.assertIn(reference, seen)
+            seen.add(table.name)
+        self.assertEqual(len(SCHEMA), 6)
+
+    def test_definitions_and_insert_sql(self):
+        """
+        Проверяет DDL колонок, режим DATE и запрос вставки с явным списком колонок.
+        """
+        orders = SCHEMA["orders"]
+        self.assertEqual(orders.definitions(), ['id INT AUTO_INCREMENT', 'order_date VARCHAR(255) NOT NULL',
+                                                'barista_id INT NOT NULL', 'guest_id INT NOT NULL'])
+        self.assertEqual(orders.definitions(native_dates=True)[1], 'order_date DATE NOT NULL')
+        self.assertEqual(orders.foreign_keys, [('barista_id', 'barista'), ('guest_id', 'guest')])
+        self.assertEqual(orders.insert_sql("?"),
+                         "INSERT INTO orders (id, order_date, barista_id, guest_id) VALUES (?, ?, ?, ?)")
+
+    def test_generate_rows_respects_references(self):
+        """
+        Проверяет, что строки идут в порядке колонок, а внешние ключи не выходят за размеры таблиц из контекста.
+        """
+        random.seed(7)
+        context = GenerationContext(counts={"barista": 3, "guest": 5}, native_dates=True)
+        rows = SCHEMA["orders"].generate_rows(50, context)
+        self.assertEqual(len(rows), 50)
+        self.assertEqual([row[0] for row in rows], list(range(1, 51)))
+        self.assertTrue(all(isinstance(row[1], date) for row in rows))
+        self.assertTrue(all(1 <= row[2] <= 3 and 1 <= row[3] <= 5 for row in rows))
+
+    def test_iter_rows_in_chunks(self):
+        """
+        Проверяет, что потоковая генерация порциями продолжает id между порциями и отдает ровно count строк.
+        """
+        rows = list(SCHEMA["menu"].iter_rows(25, chunk_size=10))
+        self.assertEqual([row[0] for row in rows], list(range(1, 26)))
+        context = GenerationContext(counts={"menu": 3}, start_id=100)
+        rows = list(SCHEMA["personal_order"].iter_rows(5, context, chunk_size=2))
+        self.assertEqual([row[0] for row in rows], [100, 101, 102, 103, 104])
+        self.assertEqual(context.start_id, 100)
+
+    def test_reference_sources(self):
+        """
+        Проверяет выбор id из явного списка и ошибку при неизвестном размере таблицы.
+        """
+        self.assertEqual(set(Reference("orders").generate(20, GenerationContext(ids={"orders": [7]}))), {7})
+        with self.assertRaises(ValueError):
+            Reference("orders").generate(1, GenerationContext())
+        self.assertEqual(Serial().generate(3, GenerationContext(start_id=10)), [10, 11, 12])
+
+    def test_key_sampler(self):
+        """
+        Проверяет выборку id по диапазону: плотные id, пропуски из списка границ и из явного списка id.
+        """
+        random.seed(3)
+        dense = KeySampler(5, 9)
+        self.assertTrue(dense.dense)
+        self.assertEqual(set(dense.sample(500)), {5, 6, 7, 8, 9})
+        gaps = KeySampler.from_gaps(1, 40, [(3, 12), (20, 20), (30, 39)])
+        expected = {1, 2, *range(13, 20), *range(21, 30), 40}
+        self.assertEqual(set(gaps.sample(2000)), expected)
+        from_ids = KeySampler.from_ids(sorted(expected))
+        self.assertEqual(set(from_ids.sample(2000)), expected)
+        self.assertEqual(gaps.sample(0), [])
+        self.assertTrue(KeySampler.from_ids([3, 1, 2]).dense)
+        sampled = Reference("orders").generate(10, GenerationContext(ids={"orders": gaps}))
+        self.assertTrue(set(sampled) <= expected)
+
+    def test_models_match_tables(self):
+        """
+        Проверяет, что модели ORM построены по реестру: те же колонки, внешние ключи и имя таблицы.
+        """
+        for table in SCHEMA:
+            model = table.model(Model)
+            self.assertEqual(list(model._meta["columns"]), table.column_names)
+            self.assertEqual(model.__name__.lower(), table.name)
+        self.assertIsInstance(Orders_has_Order._meta["columns"]["order_id"], ForeignKey)
+        self.assertEqual([index.name for index in Menu._meta["indexes"]], ["idx_menu_prices"])
+        self.assertIsInstance(SCHEMA["orders"].model(Model, native_dates=True)._meta["columns"]["order_date"],
+                              DateField)
+
+    def test_model_from_row(self):
+        """
+        Проверяет создание модели из кортежа значений в порядке колонок.
+        """
+        menu = Menu.from_row((1, "Латте", 200))
+        self.assertEqual((menu.id, menu.name, menu.prices), (1, "Латте", 200))
+        self.assertEqual(menu._data, Menu(id=1, name="Латте", prices=200)._data)
+
+    def test_model_repr(self):
+        """
+        Проверяет общие __repr__ и __str__ моделей.
+        """
+        menu = Menu(id=1, name="Латте", prices=200)
+        self.assertEqual(repr(menu), "Menu(id=1, name='Латте', prices=200)")
+        self.assertEqual(str(menu), 'Menu:\n[\n\t"id": 1,\n\t"name": Латте,\n\t"prices": 200\n]')
+
+    def test_creator_uses_schema(self):
+        """
+        Проверяет, что DatabaseCreator создает таблицы по реестру.
+        """
+        creator = DatabaseCreator('test_db', 'root', '123456')
+        calls = []
+        creator.create_table = lambda *args: calls.append(args)
+        creator.Orders_has_OrderGenerator()
+        table = SCHEMA["orders_has_order"]
+        self.assertEqual(calls, [(table.name, table.definitions(), table.foreign_keys)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+from unittest.mock import MagicMock
+from lib.server_metrics import ServerMetrics, parse_explain_analyze, handler_status, collect_server_metrics, \
+    HANDLER_STATUS_QUERY, STATEMENT_HISTORY_QUERY
+
+
+class TestServerMetrics(unittest.TestCase):
+    """
+    Юнит-тесты для модуля server_metrics.
+    """
+
+    def test_parse_explain_analyze(self):
+        """
+        Проверяет извлечение времени корневого узла плана с учетом количества циклов.
+        """
+        plan = ("-> Limit: 10 row(s)  (cost=1.25 rows=10) (actual time=0.0312..0.5 rows=10 loops=2)\n"
+                "    -> Table scan on menu  (cost=1.25 rows=10) (actual time=0.03..0.04 rows=10 loops=1)")
+
+        self.assertAlmostEqual(parse_explain_analyze(plan), 0.001)
+        self.assertIsNone(parse_explain_analyze("-> Table scan on menu"))
+
+    def test_handler_status(self):
+        """
+        Проверяет, что счетчики Handler_% возвращаются словарем чисел.
+        """
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [('Handler_read_next', '5'), ('Handler_write', '0')]
+
+        self.assertEqual(handler_status(cursor), {'Handler_read_next': 5, 'Handler_write': 0})
+        cursor.execute.assert_called_once_with(HANDLER_STATUS_QUERY)
+
+    def test_collect_server_metrics(self):
+        """
+        Проверяет сбор метрик: вычитание собственного вклада SHOW STATUS, данные performance_schema и EXPLAIN ANALYZE.
+        """
+        cursor = MagicMock()
+        cursor.fetchall.side_effect = [
+            [('Handler_read_rnd_next', '100')],
+            [('Handler_read_rnd_next', '110')],
+            [(1,)],
+            [('Handler_read_rnd_next', '1130')],
+            [("-> Table scan on menu  (actual time=0.01..2.5 rows=1000 loops=1)",)]
+        ]
+        cursor.fetchone.return_value = (3_000_000_000, 1_000_000, 1000, 10, 0, 0, 0, 1)
+
+        metrics = collect_server_metrics(cursor, "SELECT * FROM menu LIMIT 10")
+
+        self.assertEqual(metrics.handlers, {'Handler_read_rnd_next': 1010})
+        self.assertAlmostEqual(metrics.server_time, 0.003)
+        self.assertAlmostEqual(metrics.lock_time, 0.000001)
+        self.assertEqual(metrics.rows_examined, 1000)
+        self.assertEqual(metrics.rows_sent, 10)
+        self.assertTrue(metrics.no_index_used)
+        self.assertAlmostEqual(metrics.explain_time, 0.0025)
+        queries = [c.args[0] for c in cursor.execute.call_args_list]
+        self.assertEqual(queries, [HANDLER_STATUS_QUERY, HANDLER_STATUS_QUERY, "SELECT * FROM menu LIMIT 10",
+                                   HANDLER_STATUS_QUERY, STATEMENT_HISTORY_QUERY,
+                                   "EXPLAIN ANALYZE SELECT * FROM menu LIMIT 10"])
+
+    def test_collect_server_metrics_other_driver(self):
+        """
+        Проверяет, что с курсором без атрибута with_rows (pymysql, mysqlclient) результат изменяющего запроса
+        не читается, а счетчики собираются.
+        """
+        cursor = MagicMock(spec=["execute", "fetchall", "fetchone", "description"])
+        cursor.description = None
+        cursor.fetchall.side_effect = [
+            [('Handler_delete', '0')],
+            [('Handler_delete', '0')],
+            [('Handler_delete', '10')],
+        ]
+        cursor.fetchone.return_value = None
+
+        metrics = collect_server_metrics(cursor, "DELETE FROM menu LIMIT 10")
+
+        self.assertEqual(metrics.handlers, {'Handler_delete': 10})
+        self.assertEqual(cursor.fetchall.call_count, 3)
+
+    def test_collect_server_metrics_error(self):
+        """
+        Проверяет, что при недоступной performance_schema метрики остаются пустыми, а EXPLAIN не выполняется для DELETE.
+        """
+        cursor = MagicMock()
+        cursor.execute.side_effect = Exception("performance_schema disabled")
+
+        metrics = collect_server_metrics(cursor, "DELETE FROM menu LIMIT 10")
+
+        self.assertIsNone(metrics.server_time)
+        self.assertIsNone(metrics.explain)
+        self.assertEqual(cursor.execute.call_count, 1)
+        self.assertEqual(str(metrics), "нет серверных метрик")
+
+    def test_str(self):
+        """
+        Проверяет строковое представление метрик.
+        """
+        metrics = ServerMetrics()
+        metrics.server_time, metrics.lock_time = 0.5, 0.0
+        metrics.rows_examined, metrics.rows_sent, metrics.rows_affected = 10, 5, 0
+        metrics.handlers = {'Handler_read_key': 5}
+
+        self.assertIn("examined=10", str(metrics))
+        self.assertIn("Handler_read_key=5", str(metrics))
+
+
+if __name__ == '__main__':
+    unittest.main()
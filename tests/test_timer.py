@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import patch, MagicMock
 import timeit
-from lib.timer import query_time, generate_time
+from lib.timer import query_time, generate_time, query_benchmark, generate_benchmark
 
 class TestTimeMeasure(unittest.TestCase):
     """
@@ -46,5 +46,47 @@ class TestTimeMeasure(unittest.TestCase):
         mock_timeit.assert_called_once()
         self.assertEqual(result, '2.3456789012')
 
+    def test_query_benchmark(self):
+        """
+        Тестирует функцию query_benchmark: запрос выполняется warmup + repeat раз.
+        """
+        mock_generation_func = MagicMock()
+        query = "SELECT * FROM table"
+
+        result = query_benchmark(mock_generation_func, query, warmup=2, repeat=3)
+
+        self.assertEqual(mock_generation_func.call_count, 5)
+        mock_generation_func.assert_called_with(query)
+        self.assertEqual(len(result.raw_samples_ns), 3)
+
+    def test_generate_benchmark(self):
+        """
+        Тестирует функцию generate_benchmark: генератор полностью потребляется в каждом запуске.
+        """
+        consumed = []
+
+        def generation_func(model, n, **kwargs):
+            for i in range(n):
+                consumed.append(i)
+                yield i
+
+        result = generate_benchmark(generation_func, MagicMock(), 4, warmup=1, repeat=2, MenuCount=5)
+
+        self.assertEqual(len(consumed), 12)
+        self.assertEqual(result.repeat, 2)
+
+    def test_generate_benchmark_memory(self):
+        """
+        Тестирует функцию generate_benchmark с измерением памяти.
+        """
+        def generation_func(model, n, **kwargs):
+            data = [bytearray(1024) for _ in range(n)]
+            yield from data
+
+        result = generate_benchmark(generation_func, MagicMock(), 1000, warmup=0, repeat=1, memory=True)
+
+        self.assertGreaterEqual(result.peak_memory, 1000 * 1024)
+
+
 if __name__ == '__main__':
     unittest.main()